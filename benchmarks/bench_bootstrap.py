@@ -0,0 +1,67 @@
+#!/usr/bin/python
+# coding: utf-8
+"""
+Worker start on an existing schema: create_table called for every database model,
+versus bootstrap_schema, which checks the stored schema fingerprint only.
+
+Usage:
+    python benchmarks/bench_bootstrap.py [--database sqlite:///gitlab.db] [--repeat 5]
+"""
+import argparse
+import logging
+import os
+import sys
+import time
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+from sqlalchemy import create_engine, event
+
+from benchmarks.bench_upsert import create_session
+from gitlab_api.database import bootstrap_schema
+from gitlab_api.gitlab_db_models import BaseDBModel
+from gitlab_api.orm import create_table
+
+
+def start(database: str, function) -> tuple:
+    # A new engine per start, as in a new worker process
+    engine = create_engine(database)
+    statements = []
+    event.listen(
+        engine, "before_cursor_execute", lambda *args: statements.append(args[2])
+    )
+    started = time.perf_counter()
+    function(engine)
+    seconds = time.perf_counter() - started
+    engine.dispose()
+    return seconds, len(statements)
+
+
+def create_tables(engine):
+    for mapper in BaseDBModel.registry.mappers:
+        create_table(mapper.class_, engine)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--database", default="sqlite:////tmp/bench_bootstrap.db")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    for handler in logging.getLogger().handlers:
+        handler.setStream(open(os.devnull, "w"))
+
+    create_session(args.database).close()
+    first, first_statements = start(args.database, bootstrap_schema)
+    print(f"{'start':<26}{'ms':>10}{'statements':>12}")
+    print(f"{'bootstrap_schema, first':<26}{first * 1000:>10.1f}{first_statements:>12}")
+    for name, function in (
+        ("create_table per model", create_tables),
+        ("bootstrap_schema, warm", bootstrap_schema),
+    ):
+        runs = [start(args.database, function) for _ in range(args.repeat)]
+        seconds = min(run[0] for run in runs)
+        print(f"{name:<26}{seconds * 1000:>10.1f}{runs[0][1]:>12}")
+
+
+if __name__ == "__main__":
+    main()
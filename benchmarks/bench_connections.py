@@ -0,0 +1,80 @@
+#!/usr/bin/python
+# coding: utf-8
+"""
+TCP connections (TLS handshakes against a real GitLab) opened per 1000 requests
+when one Api, or two Api sharing a ConnectionPool, are used from many threads.
+
+Usage:
+    python benchmarks/bench_connections.py [--threads 16] [--requests 1000]
+"""
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+from benchmarks.stub_server import StubGitLabServer
+from gitlab_api import Api
+from gitlab_api.transport import ConnectionPool
+
+
+def run(server, clients, threads: int, requests: int):
+    server.reset()
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        list(
+            executor.map(
+                lambda number: clients[number % len(clients)].get_project(
+                    project_id=number % 250 + 1
+                ),
+                range(requests),
+            )
+        )
+    elapsed = time.perf_counter() - start
+    return server.connections * 1000 / requests, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--threads", type=int, default=16)
+    parser.add_argument("--requests", type=int, default=1000)
+    args = parser.parse_args()
+
+    with StubGitLabServer() as server:
+        shared_pool = ConnectionPool(pool_maxsize=args.threads)
+        scenarios = {
+            "pool_maxsize=10 (requests default)": lambda: [
+                Api(url=server.url, token="token", pool_maxsize=10)
+            ],
+            f"pool_maxsize={args.threads}": lambda: [
+                Api(url=server.url, token="token", pool_maxsize=args.threads)
+            ],
+            "pool_maxsize=10, pool_block": lambda: [
+                Api(url=server.url, token="token", pool_maxsize=10, pool_block=True)
+            ],
+            "keep_alive=False": lambda: [
+                Api(url=server.url, token="token", keep_alive=False)
+            ],
+            f"2 clients, own pools of {args.threads}": lambda: [
+                Api(url=server.url, token="token", pool_maxsize=args.threads),
+                Api(url=server.url, token="token", pool_maxsize=args.threads),
+            ],
+            f"2 clients, one shared pool of {args.threads}": lambda: [
+                Api(url=server.url, token="token", connection_pool=shared_pool),
+                Api(url=server.url, token="token", connection_pool=shared_pool),
+            ],
+        }
+        print(f"{'scenario':<40}{'handshakes/1000':>16}{'seconds':>10}")
+        for name, create_clients in scenarios.items():
+            clients = create_clients()
+            handshakes, elapsed = run(server, clients, args.threads, args.requests)
+            for client in clients:
+                client.close()
+            print(f"{name:<40}{handshakes:>16.0f}{elapsed:>10.2f}")
+        shared_pool.close()
+
+
+if __name__ == "__main__":
+    main()
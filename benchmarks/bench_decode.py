@@ -0,0 +1,78 @@
+#!/usr/bin/python
+# coding: utf-8
+"""
+Per-page decode time of trial-and-error dispatch versus endpoint-typed decoding.
+
+Usage:
+    python benchmarks/bench_decode.py [--per-page 100] [--repeat 20]
+"""
+import argparse
+import json
+import logging
+import os
+import sys
+import time
+from typing import List
+
+import requests
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+from benchmarks.payloads import make_page
+from gitlab_api.gitlab_response_models import Job, MergeRequest, Project, Response
+from gitlab_api.utils import process_response
+
+MODELS = {
+    "project": Project,
+    "job": Job,
+    "merge_request": MergeRequest,
+}
+
+
+def build_response(payload: list) -> requests.Response:
+    response = requests.Response()
+    response.status_code = 200
+    response._content = json.dumps(payload).encode()
+    response.headers["Content-Type"] = "application/json"
+    return response
+
+
+def time_per_page(function, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    timings.sort()
+    return timings[len(timings) // 2] * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--per-page", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+    for handler in logging.getLogger().handlers:
+        handler.setStream(open(os.devnull, "w"))
+
+    print(f"{'model':<15}{'trial (ms)':>14}{'typed (ms)':>14}{'speedup':>10}")
+    for kind, model in MODELS.items():
+        payload = make_page(kind, count=args.per_page)
+        http_response = build_response(payload)
+        process_response(response=http_response, response_model=List[model])
+
+        trial = time_per_page(
+            lambda: Response(data=http_response.json(), status_code=200),
+            args.repeat,
+        )
+        typed = time_per_page(
+            lambda: process_response(
+                response=http_response, response_model=List[model]
+            ),
+            args.repeat,
+        )
+        print(f"{model.__name__:<15}{trial:>14.2f}{typed:>14.2f}{trial / typed:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
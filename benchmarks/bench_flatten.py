@@ -0,0 +1,82 @@
+#!/usr/bin/python
+# coding: utf-8
+"""
+Models per second turned into table rows: the recursive path, pydantic_to_sqlalchemy
+building SQLAlchemy models whose rows upsert then collects, versus flatten writing
+the pydantic models straight to rows.
+
+Usage:
+    python benchmarks/bench_flatten.py [--count 500] [--repeat 3]
+"""
+import argparse
+import logging
+import os
+import sys
+import time
+from typing import List
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+from benchmarks.payloads import make_page
+from gitlab_api.gitlab_response_models import (
+    Job,
+    Pipeline,
+    Response,
+    User,
+    get_type_adapter,
+)
+from gitlab_api.orm import _UpsertPlan, flatten, pydantic_to_sqlalchemy
+
+MODELS = {"job": Job, "user": User, "pipeline": Pipeline}
+
+
+def recursive_rows(response: Response) -> dict:
+    plan = _UpsertPlan()
+    for item in response.data:
+        plan.add(pydantic_to_sqlalchemy(schema=Response(data=[item]))["data"][0])
+    rows = {}
+    for table in plan.tables():
+        plan.resolve(table)
+        rows[table.name] = plan.rows.get(table, []) + plan.association_rows(table)
+    return rows
+
+
+def best_of(function, response: Response, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function(response)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    for handler in logging.getLogger().handlers:
+        handler.setStream(open(os.devnull, "w"))
+
+    print(
+        f"{'model':<10}{'count':>8}{'recursive/s':>14}{'flatten/s':>12}{'speedup':>10}"
+    )
+    for name, model in MODELS.items():
+        items = get_type_adapter(List[model]).validate_python(
+            make_page(name, count=args.count)
+        )
+        response = Response(data=items, status_code=200)
+        # Row for row, except for dates flatten parses from strings
+        assert {name: len(rows) for name, rows in flatten(response).items()} == {
+            name: len(rows) for name, rows in recursive_rows(response).items()
+        }
+        recursive = best_of(recursive_rows, response, args.repeat)
+        flattened = best_of(flatten, response, args.repeat)
+        print(
+            f"{name:<10}{args.count:>8}{args.count / recursive:>14.0f}"
+            f"{args.count / flattened:>12.0f}{recursive / flattened:>9.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+#!/usr/bin/python
+# coding: utf-8
+"""
+Rows written for a dump of merge requests whose authors, assignees, reviewers and
+mergers come from a small pool of users, as in a real project: every nested user,
+each page deduplicated on its own, and the whole load sharing one identity map.
+
+Usage:
+    python benchmarks/bench_identity.py [--merge-requests 2000] [--users 40] [--per-page 100]
+"""
+import argparse
+import logging
+import os
+import random
+import sys
+import time
+from typing import List
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+from benchmarks.bench_upsert import create_session
+from benchmarks.payloads import USER, make_page
+from gitlab_api.gitlab_response_models import MergeRequest, Response, get_type_adapter
+from gitlab_api.orm import upsert
+
+
+def make_user(user_id: int) -> dict:
+    return {
+        "id": user_id,
+        "username": f"user{user_id}",
+        "name": f"User {user_id}",
+        "state": "active",
+        "avatar_url": USER["avatar_url"],
+        "web_url": f"http://gitlab.dev/user{user_id}",
+    }
+
+
+def build_pages(count: int, users: int, per_page: int) -> List[Response]:
+    generator = random.Random(0)
+    payloads = make_page("merge_request", count=count)
+    for payload in payloads:
+        payload["author"] = make_user(generator.randint(1, users))
+        payload["assignees"] = [
+            make_user(user_id)
+            for user_id in generator.sample(
+                range(1, users + 1), generator.randint(1, 3)
+            )
+        ]
+        payload["assignee"] = payload["assignees"][0]
+        payload["reviewers"] = [make_user(generator.randint(1, users))]
+        payload["merged_by"] = payload["merge_user"] = make_user(
+            generator.randint(1, users)
+        )
+    merge_requests = get_type_adapter(List[MergeRequest]).validate_python(payloads)
+    return [
+        Response(data=merge_requests[start : start + per_page], status_code=200)
+        for start in range(0, count, per_page)
+    ]
+
+
+def load(pages: List[Response], database: str, identity_map) -> tuple:
+    session = create_session(database)
+    tables = {}
+    duplicates = {}
+    start = time.perf_counter()
+    for page in pages:
+        statistics = upsert(
+            model=page,
+            session=session,
+            identity_map=identity_map() if identity_map else None,
+        )
+        for name, count in statistics["tables"].items():
+            tables[name] = tables.get(name, 0) + count
+        for name, count in statistics["duplicates"].items():
+            duplicates[name] = duplicates.get(name, 0) + count
+    seconds = time.perf_counter() - start
+    session.close()
+    return tables, duplicates, seconds
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--merge-requests", type=int, default=2000)
+    parser.add_argument("--users", type=int, default=40)
+    parser.add_argument("--per-page", type=int, default=100)
+    parser.add_argument("--database", default="sqlite://")
+    args = parser.parse_args()
+    for handler in logging.getLogger().handlers:
+        handler.setStream(open(os.devnull, "w"))
+
+    pages = build_pages(args.merge_requests, args.users, args.per_page)
+    per_page, duplicates, page_seconds = load(pages, args.database, None)
+    shared = {}
+    per_load, _, load_seconds = load(pages, args.database, lambda: shared)
+    occurrences = {
+        name: per_page.get(name, 0) + duplicates.get(name, 0) for name in per_page
+    }
+
+    print(f"{'table':<26}{'models':>10}{'per page':>10}{'per load':>10}")
+    for name in sorted(per_page):
+        print(
+            f"{name:<26}{occurrences[name]:>10}{per_page[name]:>10}"
+            f"{per_load.get(name, 0):>10}"
+        )
+    print(
+        f"{'total':<26}{sum(occurrences.values()):>10}{sum(per_page.values()):>10}"
+        f"{sum(per_load.values()):>10}"
+    )
+    print(f"{'seconds':<26}{'':>10}{page_seconds:>10.2f}{load_seconds:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
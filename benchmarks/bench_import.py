@@ -0,0 +1,63 @@
+#!/usr/bin/python
+# coding: utf-8
+"""
+Seconds to import gitlab_api in a fresh interpreter, for the package alone, the
+API client, the database helpers and everything the package exports.
+
+Usage:
+    python benchmarks/bench_import.py [--repeat 5]
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+STATEMENTS = {
+    "package": "import gitlab_api",
+    "api client": "from gitlab_api import Api, Project",
+    "database": "from gitlab_api import upsert, ProjectDBModel",
+    "everything": "from gitlab_api import *",
+}
+MEASURE = """
+import json, sys, time
+start = time.perf_counter()
+exec(sys.argv[1])
+seconds = time.perf_counter() - start
+print(json.dumps({"seconds": seconds, "modules": sorted(sys.modules)}))
+"""
+
+
+def measure(statement: str) -> dict:
+    """
+    Seconds statement takes in a new interpreter, and the modules it leaves imported.
+    """
+    output = subprocess.run(
+        [sys.executable, "-c", MEASURE, statement],
+        cwd=ROOT,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return json.loads(output.splitlines()[-1])
+
+
+def best_of(statement: str, repeat: int) -> float:
+    return min(measure(statement)["seconds"] for _ in range(repeat))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'import':<14}{'ms':>10}{'modules':>10}  statement")
+    for name, statement in STATEMENTS.items():
+        modules = len(measure(statement)["modules"])
+        seconds = best_of(statement, args.repeat)
+        print(f"{name:<14}{seconds * 1000:>10.1f}{modules:>10}  {statement}")
+
+
+if __name__ == "__main__":
+    main()
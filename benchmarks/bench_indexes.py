@@ -0,0 +1,187 @@
+#!/usr/bin/python
+# coding: utf-8
+"""
+Dashboard queries on generated merge requests, pipelines and jobs, timed on
+tables without indexes and again after apply_indexes created the declared ones.
+
+Usage:
+    python benchmarks/bench_indexes.py [--merge-requests 100000] [--jobs 200000]
+        [--database sqlite://]
+"""
+import argparse
+import logging
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+from sqlalchemy import func, insert, select
+
+from benchmarks.bench_upsert import create_session
+from gitlab_api.database import apply_indexes
+from gitlab_api.gitlab_db_models import (
+    JobDBModel,
+    MergeRequestDBModel,
+    PipelineDBModel,
+    ProjectConfigDBModel,
+    ProjectDBModel,
+)
+
+TABLES = [
+    ProjectDBModel.__table__,
+    ProjectConfigDBModel.__table__,
+    PipelineDBModel.__table__,
+    JobDBModel.__table__,
+    MergeRequestDBModel.__table__,
+]
+START = datetime(2024, 1, 1)
+SINCE = START + timedelta(days=300)
+QUERIES = {
+    "open merge requests of a project": select(MergeRequestDBModel.id)
+    .where(
+        MergeRequestDBModel.project_id == 7,
+        MergeRequestDBModel.state == "opened",
+        MergeRequestDBModel.updated_at >= SINCE,
+    )
+    .order_by(MergeRequestDBModel.updated_at.desc())
+    .limit(50),
+    "merge request by project and iid": select(MergeRequestDBModel.id).where(
+        MergeRequestDBModel.project_id == 7, MergeRequestDBModel.iid == 123
+    ),
+    "merge requests of an author": select(func.count()).where(
+        MergeRequestDBModel.author_id == 3
+    ),
+    "jobs of a pipeline": select(JobDBModel.id).where(JobDBModel.pipeline_id == 42),
+    "failed jobs of a project": select(JobDBModel.id).where(
+        JobDBModel.project_id == 7,
+        JobDBModel.status == "failed",
+        JobDBModel.created_at >= SINCE,
+    ),
+    "pipelines of a branch": select(PipelineDBModel.id)
+    .where(PipelineDBModel.project_id == 7, PipelineDBModel.ref == "main")
+    .order_by(PipelineDBModel.id.desc())
+    .limit(20),
+    "project by path": select(ProjectDBModel.id).where(
+        ProjectDBModel.path_with_namespace == "group/project-7"
+    ),
+}
+
+
+def generate(session, projects: int, pipelines: int, jobs: int, merge_requests: int):
+    generator = random.Random(0)
+
+    def when() -> datetime:
+        return START + timedelta(minutes=generator.randint(0, 60 * 24 * 365))
+
+    def write(table, rows, chunk: int = 10000):
+        for start in range(0, len(rows), chunk):
+            session.execute(insert(table), rows[start : start + chunk])
+
+    write(
+        ProjectDBModel.__table__,
+        [
+            {"id": project, "path_with_namespace": f"group/project-{project}"}
+            for project in range(1, projects + 1)
+        ],
+    )
+    write(
+        ProjectConfigDBModel.__table__,
+        [{"primary_id": project, "id": project} for project in range(1, projects + 1)],
+    )
+    write(
+        PipelineDBModel.__table__,
+        [
+            {
+                "id": pipeline,
+                "project_id": generator.randint(1, projects),
+                "ref": generator.choice(["main", "develop", f"feature-{pipeline}"]),
+                "status": generator.choice(["success", "failed", "running"]),
+                "updated_at": when(),
+            }
+            for pipeline in range(1, pipelines + 1)
+        ],
+    )
+    write(
+        JobDBModel.__table__,
+        [
+            {
+                "id": job,
+                "project_id": generator.randint(1, projects),
+                "pipeline_id": generator.randint(1, pipelines),
+                "status": generator.choice(["success", "success", "failed", "skipped"]),
+                "created_at": when(),
+            }
+            for job in range(1, jobs + 1)
+        ],
+    )
+    write(
+        MergeRequestDBModel.__table__,
+        [
+            {
+                "id": merge_request,
+                "iid": merge_request // projects + 1,
+                "project_id": merge_request % projects + 1,
+                "author_id": generator.randint(1, 500),
+                "state": generator.choice(["opened", "closed", "merged", "merged"]),
+                "updated_at": when(),
+            }
+            for merge_request in range(1, merge_requests + 1)
+        ],
+    )
+    session.commit()
+
+
+def time_queries(session, repeat: int) -> dict:
+    session.connection().exec_driver_sql("ANALYZE")
+    timings = {}
+    for name, query in QUERIES.items():
+        session.execute(query).all()
+        start = time.perf_counter()
+        for _ in range(repeat):
+            session.execute(query).all()
+        timings[name] = (time.perf_counter() - start) / repeat
+    session.commit()
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--projects", type=int, default=200)
+    parser.add_argument("--pipelines", type=int, default=20000)
+    parser.add_argument("--jobs", type=int, default=200000)
+    parser.add_argument("--merge-requests", type=int, default=100000)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--database", default="sqlite://")
+    args = parser.parse_args()
+    for handler in logging.getLogger().handlers:
+        handler.setStream(open(os.devnull, "w"))
+
+    session = create_session(args.database)
+    engine = session.get_bind()
+    with engine.begin() as connection:
+        for table in TABLES:
+            for index in table.indexes:
+                index.drop(connection)
+    generate(session, args.projects, args.pipelines, args.jobs, args.merge_requests)
+    without = time_queries(session, args.repeat)
+    session.close()
+    start = time.perf_counter()
+    created = apply_indexes(engine)
+    seconds = time.perf_counter() - start
+    indexed = time_queries(session, args.repeat)
+    session.close()
+
+    print(f"{len(created)} indexes created in {seconds:.2f}s")
+    print(f"{'query':<36}{'without ms':>12}{'with ms':>10}{'speedup':>10}")
+    for name in QUERIES:
+        print(
+            f"{name:<36}{without[name] * 1000:>12.2f}{indexed[name] * 1000:>10.2f}"
+            f"{without[name] / indexed[name]:>9.0f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+#!/usr/bin/python
+# coding: utf-8
+"""
+Per-page decode time of typed responses with each JSON decoder installed, keeping
+the decoded payload in json_output, and validated straight from the body bytes
+without it (retain="models").
+
+Usage:
+    python benchmarks/bench_json.py [--per-page 100] [--repeat 20]
+"""
+import argparse
+import logging
+import os
+import sys
+from typing import List
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+from benchmarks.bench_decode import build_response, time_per_page
+from benchmarks.payloads import make_page
+from gitlab_api.decoders import JSON_DECODERS, get_json_decoder, set_json_decoder
+from gitlab_api.gitlab_response_models import Job, Project
+from gitlab_api.utils import process_response
+
+MODELS = {"job": Job, "project": Project}
+
+
+def installed_decoders() -> List[str]:
+    decoders = []
+    for name in reversed(JSON_DECODERS):
+        try:
+            get_json_decoder(name)
+        except ImportError:
+            continue
+        decoders.append(name)
+    return decoders
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--per-page", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+    for handler in logging.getLogger().handlers:
+        handler.setStream(open(os.devnull, "w"))
+
+    # (decoder, retain): without json_output pydantic parses the bytes itself
+    scenarios = [(name, "all") for name in installed_decoders()] + [
+        ("pydantic", "models")
+    ]
+    print(f"{'model':<10}{'decoder':<12}{'json_output':<14}{'ms':>8}{'speedup':>10}")
+    for kind, model in MODELS.items():
+        http_response = build_response(make_page(kind, count=args.per_page))
+        response_model = List[model]
+        baseline = None
+        for name, retain in scenarios:
+            set_json_decoder(name if retain == "all" else None)
+
+            def decode():
+                return process_response(
+                    response=http_response,
+                    response_model=response_model,
+                    retain=retain,
+                )
+
+            decode()
+            milliseconds = time_per_page(decode, args.repeat)
+            baseline = baseline or milliseconds
+            kept = "kept" if retain == "all" else "dropped"
+            print(
+                f"{model.__name__:<10}{name:<12}{kept:<14}{milliseconds:>8.2f}"
+                f"{baseline / milliseconds:>9.2f}x"
+            )
+    set_json_decoder()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+#!/usr/bin/python
+# coding: utf-8
+"""
+Peak and retained memory of a project crawl against the local stand-in server,
+for each retain mode. Each crawl runs in a fresh interpreter traced by tracemalloc.
+
+Usage:
+    python benchmarks/bench_memory.py [--projects 10000] [--per-page 100]
+"""
+import argparse
+import json
+import logging
+import os
+import subprocess
+import sys
+import tracemalloc
+from typing import List
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+from benchmarks.payloads import make_page
+from benchmarks.stub_server import StubGitLabServer
+from gitlab_api.decoders import RETAIN_MODES
+
+# get_projects keeps the first page's payload, iter_pages every page's
+CRAWLS = ("get_projects", "iter_pages")
+
+
+def crawl(url: str, name: str, retain: str, per_page: int) -> dict:
+    import gitlab_api
+    from gitlab_api.gitlab_response_models import Project
+
+    client = gitlab_api.Api(url=url, token="token", retain=retain)
+    tracemalloc.start()
+    if name == "get_projects":
+        result = client.get_projects(per_page=per_page)
+        items = len(result.data)
+    else:
+        result = list(
+            client.iter_pages(
+                path="/projects",
+                params={"per_page": per_page},
+                response_model=List[Project],
+            )
+        )
+        items = sum(len(page.data) for page in result)
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    client.close()
+    return {"items": items, "retained": retained, "peak": peak}
+
+
+def measure(url: str, name: str, retain: str, per_page: int) -> dict:
+    output = subprocess.run(
+        [sys.executable, __file__, "--crawl", url, name, retain, str(per_page)],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return json.loads(output.splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--projects", type=int, default=10000)
+    parser.add_argument("--per-page", type=int, default=100)
+    parser.add_argument("--crawl", nargs=4, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    for handler in logging.getLogger().handlers:
+        handler.setStream(open(os.devnull, "w"))
+
+    if args.crawl:
+        url, name, retain, per_page = args.crawl
+        print(json.dumps(crawl(url, name, retain, int(per_page))))
+        return
+
+    collections = {"/projects": make_page("project", count=args.projects)}
+    megabyte = 1024 * 1024
+    print(f"{'crawl':<14}{'retain':<8}{'items':>8}{'peak MB':>10}{'retained MB':>13}")
+    with StubGitLabServer(collections=collections) as server:
+        for name in CRAWLS:
+            for retain in RETAIN_MODES:
+                result = measure(server.url, name, retain, args.per_page)
+                print(
+                    f"{name:<14}{retain:<8}{result['items']:>8}"
+                    f"{result['peak'] / megabyte:>10.1f}"
+                    f"{result['retained'] / megabyte:>13.1f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
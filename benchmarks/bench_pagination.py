@@ -0,0 +1,42 @@
+#!/usr/bin/python
+# coding: utf-8
+"""
+Wall time of a full project crawl with sequential and concurrent page fetching
+against the local stand-in server with simulated network latency.
+
+Usage:
+    python benchmarks/bench_pagination.py [--latency 0.05] [--per-page 20]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+from benchmarks.stub_server import StubGitLabServer
+from gitlab_api import Api
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--per-page", type=int, default=20)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    args = parser.parse_args()
+
+    with StubGitLabServer(latency=args.latency) as server:
+        print(f"{'workers':<10}{'pages':>8}{'items':>8}{'seconds':>10}")
+        for workers in args.workers:
+            client = Api(url=server.url, token="token", max_workers=workers)
+            server.reset()
+            start = time.perf_counter()
+            response = client.get_projects(per_page=args.per_page)
+            elapsed = time.perf_counter() - start
+            client.close()
+            pages = len(server.requests_for("/projects"))
+            print(f"{workers:<10}{pages:>8}{len(response.data):>8}{elapsed:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+#!/usr/bin/python
+# coding: utf-8
+"""
+Cold start of a worker that fetches one page of projects: importing the API client,
+optionally warming up the models it uses, and decoding its first responses, in a
+fresh interpreter, with validators built at import and with GITLAB_API_DEFER_BUILD=1.
+
+Usage:
+    python benchmarks/bench_startup.py [--repeat 5]
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+WORKER = """
+import json, sys, time
+started = time.perf_counter()
+from typing import List
+from gitlab_api import Project, warm_up
+from gitlab_api.utils import process_response
+imported = time.perf_counter()
+if sys.argv[1] == "warm":
+    warm_up(List[Project], response=False)
+warmed = time.perf_counter()
+sys.path.append(".")
+from benchmarks.bench_decode import build_response
+from benchmarks.payloads import make_page
+responses = [build_response(make_page("project", count=20)) for _ in range(2)]
+first = time.perf_counter()
+process_response(responses[0], response_model=List[Project])
+second = time.perf_counter()
+process_response(responses[1], response_model=List[Project])
+done = time.perf_counter()
+print(json.dumps({
+    "import": imported - started,
+    "warm up": warmed - imported,
+    "first": second - first,
+    "second": done - second,
+    "total": (second - started) - (first - warmed),
+}))
+"""
+SCENARIOS = {
+    "eager": ("0", "cold"),
+    "deferred": ("1", "cold"),
+    "deferred, warm up": ("1", "warm"),
+}
+
+
+def start(defer_build: str, warm: str) -> dict:
+    environment = dict(os.environ, GITLAB_API_DEFER_BUILD=defer_build)
+    output = subprocess.run(
+        [sys.executable, "-c", WORKER, warm],
+        cwd=ROOT,
+        env=environment,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return json.loads(output.splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    phases = ["import", "warm up", "first", "second", "total"]
+    print(f"{'ms':<20}" + "".join(f"{phase:>10}" for phase in phases))
+    for name, (defer_build, warm) in SCENARIOS.items():
+        runs = [start(defer_build, warm) for _ in range(args.repeat)]
+        best = min(runs, key=lambda run: run["total"])
+        print(
+            f"{name:<20}" + "".join(f"{best[phase] * 1000:>10.1f}" for phase in phases)
+        )
+
+
+if __name__ == "__main__":
+    main()
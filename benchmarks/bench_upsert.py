@@ -0,0 +1,106 @@
+#!/usr/bin/python
+# coding: utf-8
+"""
+Jobs per second written by upsert, bulk INSERT ... ON CONFLICT versus one
+session.merge per job, and on PostgreSQL by copy_load through COPY. The bulk
+paths also report every row they wrote, related and association rows included.
+
+Usage:
+    python benchmarks/bench_upsert.py [--jobs 2000] [--batch-size 1000] [--database sqlite://]
+"""
+import argparse
+import logging
+import os
+import sys
+import time
+from typing import List
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+from benchmarks.payloads import make_page
+from gitlab_api.gitlab_db_models import BaseDBModel
+from gitlab_api.gitlab_response_models import Job, Response, get_type_adapter
+from gitlab_api.loader import copy_load, supports_copy
+from gitlab_api.orm import UPSERT_DIALECTS, pydantic_to_sqlalchemy, upsert
+
+
+def build_jobs(count: int) -> list:
+    jobs = get_type_adapter(List[Job]).validate_python(make_page("job", count=count))
+    return [
+        pydantic_to_sqlalchemy(schema=Response(data=[job], status_code=200))["data"][0]
+        for job in jobs
+    ]
+
+
+def create_session(database: str) -> Session:
+    engine = create_engine(database)
+    tables = BaseDBModel.metadata.sorted_tables
+    if engine.dialect.name == "postgresql":
+        # The foreign keys of the schema form cycles, which drop_all cannot order
+        with engine.begin() as connection:
+            for table in tables:
+                connection.exec_driver_sql(
+                    f'DROP TABLE IF EXISTS "{table.name}" CASCADE'
+                )
+    else:
+        BaseDBModel.metadata.drop_all(engine, tables=tables)
+    BaseDBModel.metadata.create_all(engine, tables=tables)
+    return Session(engine)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--jobs", type=int, default=2000)
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument("--database", default="sqlite://")
+    args = parser.parse_args()
+    for handler in logging.getLogger().handlers:
+        handler.setStream(open(os.devnull, "w"))
+
+    print(f"{'path':<10}{'jobs':>10}{'seconds':>10}{'jobs/s':>12}{'rows/s':>12}")
+    session = create_session(args.database)
+    jobs = build_jobs(args.jobs)
+    statistics = upsert(
+        model={"data": jobs},
+        session=session,
+        batch_size=args.batch_size,
+    )
+    print(
+        f"{'bulk':<10}{args.jobs:>10}{statistics['seconds']:>10.2f}"
+        f"{args.jobs / statistics['seconds']:>12.0f}"
+        f"{statistics['rows_per_second']:>12.0f}"
+    )
+    session.close()
+
+    session = create_session(args.database)
+    if supports_copy(session):
+        jobs = build_jobs(args.jobs)
+        statistics = copy_load(
+            pages=[jobs], session=session, batch_size=args.batch_size
+        )
+        print(
+            f"{'copy':<10}{args.jobs:>10}{statistics['seconds']:>10.2f}"
+            f"{args.jobs / statistics['seconds']:>12.0f}"
+            f"{statistics['rows_per_second']:>12.0f}"
+        )
+        session.close()
+        session = create_session(args.database)
+
+    jobs = build_jobs(args.jobs)
+    dialect = session.get_bind().dialect.name
+    insert = UPSERT_DIALECTS.pop(dialect)
+    try:
+        start = time.perf_counter()
+        upsert(model={"data": jobs}, session=session)
+        seconds = time.perf_counter() - start
+    finally:
+        UPSERT_DIALECTS[dialect] = insert
+    print(f"{'merge':<10}{args.jobs:>10}{seconds:>10.2f}{args.jobs / seconds:>12.0f}")
+    session.close()
+
+
+if __name__ == "__main__":
+    main()
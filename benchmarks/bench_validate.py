@@ -0,0 +1,70 @@
+#!/usr/bin/python
+# coding: utf-8
+"""
+Per-page decode time of list payloads validated into models, built with
+model_construct (validate="construct") or left as dictionaries (validate=False),
+with every field and projected to a few (fields=[...]).
+
+Usage:
+    python benchmarks/bench_validate.py [--per-page 100] [--repeat 20]
+"""
+import argparse
+import logging
+import os
+import sys
+from typing import List
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+from benchmarks.bench_decode import build_response, time_per_page
+from benchmarks.payloads import make_page
+from gitlab_api.gitlab_response_models import Job, Pipeline, Project
+from gitlab_api.utils import process_response
+
+MODELS = {"job": Job, "pipeline": Pipeline, "project": Project}
+
+# The fields a dashboard reads
+FIELDS = ["id", "name", "status", "duration"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--per-page", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+    for handler in logging.getLogger().handlers:
+        handler.setStream(open(os.devnull, "w"))
+
+    scenarios = [
+        (validate, fields)
+        for fields in (None, FIELDS)
+        for validate in (True, "construct", False)
+    ]
+    print(f"{'model':<10}{'validate':<11}{'fields':<8}{'ms':>8}{'speedup':>10}")
+    for kind, model in MODELS.items():
+        http_response = build_response(make_page(kind, count=args.per_page))
+        response_model = List[model]
+        baseline = None
+        for validate, fields in scenarios:
+
+            def decode():
+                return process_response(
+                    response=http_response,
+                    response_model=response_model,
+                    retain="models",
+                    validate=validate,
+                    fields=fields,
+                )
+
+            decode()
+            milliseconds = time_per_page(decode, args.repeat)
+            baseline = baseline or milliseconds
+            projected = "all" if fields is None else str(len(fields))
+            print(
+                f"{model.__name__:<10}{str(validate):<11}{projected:<8}"
+                f"{milliseconds:>8.2f}{baseline / milliseconds:>9.2f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,418 @@
+#!/usr/bin/python
+# coding: utf-8
+"""
+Realistic GitLab API payloads used by the benchmarks and the local stand-in server.
+
+The samples are taken from the GitLab API documentation examples that the model
+tests in test/test_gitlab_models.py validate against.
+"""
+import copy
+
+PROJECT = {
+    "id": 4,
+    "description": "Lorem ipsum dolor sit amet, consectetur adipiscing elit.",
+    "description_html": '<p data-sourcepos="1:1-1:56" dir="auto">Lorem ipsum dolor sit amet, '
+    "consectetur adipiscing elit.</p>",
+    "name": "Diaspora Client",
+    "name_with_namespace": "Diaspora / Diaspora Client",
+    "path": "diaspora-client",
+    "path_with_namespace": "diaspora/diaspora-client",
+    "created_at": "2013-09-30T13:46:02Z",
+    "updated_at": "2013-09-30T13:46:02Z",
+    "default_branch": "main",
+    "tag_list": ["example", "disapora client"],
+    "topics": ["example", "disapora client"],
+    "ssh_url_to_repo": "git@gitlab.example.com:diaspora/diaspora-client.git",
+    "http_url_to_repo": "https://gitlab.example.com/diaspora/diaspora-client.git",
+    "web_url": "https://gitlab.example.com/diaspora/diaspora-client",
+    "readme_url": "https://gitlab.example.com/diaspora/diaspora-client/blob/main/README.md",
+    "avatar_url": "https://gitlab.example.com/uploads/project/avatar/4/uploads/avatar.png",
+    "forks_count": 0,
+    "star_count": 0,
+    "last_activity_at": "2022-06-24T17:11:26.841Z",
+    "namespace": {
+        "id": 3,
+        "name": "Diaspora",
+        "path": "diaspora",
+        "kind": "group",
+        "full_path": "diaspora",
+        "parent_id": None,
+        "avatar_url": "https://gitlab.example.com/uploads/project/avatar/6/uploads/avatar.png",
+        "web_url": "https://gitlab.example.com/diaspora",
+    },
+    "container_registry_image_prefix": "registry.gitlab.example.com/diaspora/diaspora-client",
+    "_links": {
+        "self": "https://gitlab.example.com/api/v4/projects/4",
+        "issues": "https://gitlab.example.com/api/v4/projects/4/issues",
+        "merge_requests": "https://gitlab.example.com/api/v4/projects/4/merge_requests",
+        "repo_branches": "https://gitlab.example.com/api/v4/projects/4/repository/branches",
+        "labels": "https://gitlab.example.com/api/v4/projects/4/labels",
+        "events": "https://gitlab.example.com/api/v4/projects/4/events",
+        "members": "https://gitlab.example.com/api/v4/projects/4/members",
+        "cluster_agents": "https://gitlab.example.com/api/v4/projects/4/cluster_agents",
+    },
+    "packages_enabled": True,
+    "empty_repo": False,
+    "archived": False,
+    "visibility": "public",
+    "resolve_outdated_diff_discussions": False,
+    "container_expiration_policy": {
+        "cadence": "1month",
+        "enabled": True,
+        "keep_n": 1,
+        "older_than": "14d",
+        "name_regex": "",
+        "name_regex_keep": ".*-main",
+        "next_run_at": "2022-06-25T17:11:26.865Z",
+    },
+    "issues_enabled": True,
+    "merge_requests_enabled": True,
+    "wiki_enabled": True,
+    "jobs_enabled": True,
+    "snippets_enabled": True,
+    "container_registry_enabled": True,
+    "service_desk_enabled": True,
+    "can_create_merge_request_in": True,
+    "issues_access_level": "enabled",
+    "repository_access_level": "enabled",
+    "merge_requests_access_level": "enabled",
+    "forking_access_level": "enabled",
+    "wiki_access_level": "enabled",
+    "builds_access_level": "enabled",
+    "snippets_access_level": "enabled",
+    "pages_access_level": "enabled",
+    "analytics_access_level": "enabled",
+    "container_registry_access_level": "enabled",
+    "security_and_compliance_access_level": "private",
+    "emails_disabled": None,
+    "emails_enabled": None,
+    "shared_runners_enabled": True,
+    "group_runners_enabled": True,
+    "lfs_enabled": True,
+    "creator_id": 1,
+    "import_url": None,
+    "import_type": None,
+    "import_status": "none",
+    "import_error": None,
+    "open_issues_count": 0,
+    "ci_default_git_depth": 20,
+    "ci_forward_deployment_enabled": True,
+    "ci_allow_fork_pipelines_to_run_in_parent_project": True,
+    "ci_job_token_scope_enabled": False,
+    "ci_separated_caches": True,
+    "public_jobs": True,
+    "build_timeout": 3600,
+    "auto_cancel_pending_pipelines": "enabled",
+    "ci_config_path": "",
+    "shared_with_groups": [],
+    "only_allow_merge_if_pipeline_succeeds": False,
+    "allow_merge_on_skipped_pipeline": None,
+    "restrict_user_defined_variables": False,
+    "request_access_enabled": True,
+    "only_allow_merge_if_all_discussions_are_resolved": False,
+    "remove_source_branch_after_merge": True,
+    "printing_merge_request_link_enabled": True,
+    "merge_method": "merge",
+    "squash_option": "default_off",
+    "enforce_auth_checks_on_uploads": True,
+    "suggestion_commit_message": None,
+    "merge_commit_template": None,
+    "squash_commit_template": None,
+    "auto_devops_enabled": False,
+    "auto_devops_deploy_strategy": "continuous",
+    "autoclose_referenced_issues": True,
+    "keep_latest_artifact": True,
+    "external_authorization_classification_label": "",
+    "requirements_enabled": False,
+    "requirements_access_level": "enabled",
+    "security_and_compliance_enabled": False,
+    "compliance_frameworks": [],
+    "permissions": {"project_access": None, "group_access": None},
+}
+
+USER = {
+    "id": 1,
+    "name": "Administrator",
+    "username": "root",
+    "state": "active",
+    "avatar_url": "http://www.gravatar.com/avatar/e64c7d89f26bd1972efa854d13d7dd61?s=80&d=identicon",
+    "web_url": "http://gitlab.dev/root",
+    "created_at": "2015-12-21T13:14:24.077Z",
+    "bio": None,
+    "location": None,
+    "public_email": "",
+    "skype": "",
+    "linkedin": "",
+    "twitter": "",
+    "website_url": "",
+    "organization": "",
+}
+
+JOB = {
+    "commit": {
+        "author_email": "admin@example.com",
+        "author_name": "Administrator",
+        "created_at": "2015-12-24T16:51:14.000+01:00",
+        "id": "0ff3ae198f8601a285adcf5c0fff204ee6fba5fd",
+        "message": "Test the CI integration.",
+        "short_id": "0ff3ae19",
+        "title": "Test the CI integration.",
+    },
+    "coverage": None,
+    "archived": False,
+    "allow_failure": False,
+    "created_at": "2015-12-24T15:51:21.802Z",
+    "started_at": "2015-12-24T17:54:27.722Z",
+    "finished_at": "2015-12-24T17:54:27.895Z",
+    "erased_at": None,
+    "duration": 0.173,
+    "queued_duration": 0.010,
+    "artifacts_file": {"filename": "artifacts.zip", "size": 1000},
+    "artifacts": [
+        {
+            "file_type": "archive",
+            "size": 1000,
+            "filename": "artifacts.zip",
+            "file_format": "zip",
+        },
+        {
+            "file_type": "metadata",
+            "size": 186,
+            "filename": "metadata.gz",
+            "file_format": "gzip",
+        },
+        {
+            "file_type": "trace",
+            "size": 1500,
+            "filename": "job.log",
+            "file_format": "raw",
+        },
+    ],
+    "artifacts_expire_at": "2016-01-23T17:54:27.895Z",
+    "tag_list": ["docker runner", "ubuntu18"],
+    "id": 7,
+    "name": "teaspoon",
+    "pipeline": {
+        "id": 6,
+        "project_id": 1,
+        "ref": "main",
+        "sha": "0ff3ae198f8601a285adcf5c0fff204ee6fba5fd",
+        "status": "pending",
+    },
+    "ref": "main",
+    "runner": {
+        "id": 32,
+        "description": "",
+        "ip_address": None,
+        "active": True,
+        "paused": False,
+        "is_shared": True,
+        "runner_type": "instance_type",
+        "name": None,
+        "online": False,
+        "status": "offline",
+    },
+    "runner_manager": {
+        "id": 1,
+        "system_id": "s_89e5e9956577",
+        "version": "16.11.1",
+        "revision": "535ced5f",
+        "platform": "linux",
+        "architecture": "amd64",
+        "created_at": "2024-05-01T10:12:02.507Z",
+        "contacted_at": "2024-05-07T06:30:09.355Z",
+        "ip_address": "127.0.0.1",
+        "status": "offline",
+    },
+    "stage": "test",
+    "status": "failed",
+    "failure_reason": "script_failure",
+    "tag": False,
+    "web_url": "https://example.com/foo/bar/-/jobs/7",
+    "project": {"ci_job_token_scope_enabled": False},
+    "user": USER,
+}
+
+MERGE_REQUEST = {
+    "id": 1,
+    "iid": 1,
+    "project_id": 3,
+    "title": "test1",
+    "description": "fixed login page css paddings",
+    "state": "merged",
+    "imported": False,
+    "imported_from": "none",
+    "merged_by": {
+        "id": 87854,
+        "name": "Douwe Maan",
+        "username": "DouweM",
+        "state": "active",
+        "avatar_url": "https://gitlab.example.com/uploads/-/system/user/avatar/87854/avatar.png",
+        "web_url": "https://gitlab.com/DouweM",
+    },
+    "merge_user": {
+        "id": 87854,
+        "name": "Douwe Maan",
+        "username": "DouweM",
+        "state": "active",
+        "avatar_url": "https://gitlab.example.com/uploads/-/system/user/avatar/87854/avatar.png",
+        "web_url": "https://gitlab.com/DouweM",
+    },
+    "merged_at": "2018-09-07T11:16:17.520Z",
+    "prepared_at": "2018-09-04T11:16:17.520Z",
+    "closed_by": None,
+    "closed_at": None,
+    "created_at": "2017-04-29T08:46:00Z",
+    "updated_at": "2017-04-29T08:46:00Z",
+    "target_branch": "main",
+    "source_branch": "test1",
+    "upvotes": 0,
+    "downvotes": 0,
+    "author": {
+        "id": 1,
+        "name": "Administrator",
+        "username": "admin",
+        "state": "active",
+        "avatar_url": None,
+        "web_url": "https://gitlab.example.com/admin",
+    },
+    "assignee": {
+        "id": 1,
+        "name": "Administrator",
+        "username": "admin",
+        "state": "active",
+        "avatar_url": None,
+        "web_url": "https://gitlab.example.com/admin",
+    },
+    "assignees": [
+        {
+            "name": "Miss Monserrate Beier",
+            "username": "axel.block",
+            "id": 12,
+            "state": "active",
+            "avatar_url": "http://www.gravatar.com/avatar/46f6f7dc858ada7be1853f7fb96e81da?s=80&d=identicon",
+            "web_url": "https://gitlab.example.com/axel.block",
+        }
+    ],
+    "reviewers": [],
+    "source_project_id": 2,
+    "target_project_id": 3,
+    "labels": ["Community contribution", "Manage"],
+    "draft": False,
+    "work_in_progress": False,
+    "milestone": {
+        "id": 5,
+        "iid": 1,
+        "project_id": 3,
+        "title": "v2.0",
+        "description": "Assumenda aut placeat expedita exercitationem labore sunt enim earum.",
+        "state": "closed",
+        "created_at": "2015-02-02T19:49:26.013Z",
+        "updated_at": "2015-02-02T19:49:26.013Z",
+        "due_date": "2018-09-22",
+        "start_date": "2018-08-08",
+        "web_url": "https://gitlab.example.com/my-group/my-project/milestones/1",
+    },
+    "merge_when_pipeline_succeeds": True,
+    "merge_status": "can_be_merged",
+    "detailed_merge_status": "not_open",
+    "sha": "8888888888888888888888888888888888888888",
+    "merge_commit_sha": None,
+    "squash_commit_sha": None,
+    "user_notes_count": 1,
+    "discussion_locked": None,
+    "should_remove_source_branch": True,
+    "force_remove_source_branch": False,
+    "allow_collaboration": False,
+    "allow_maintainer_to_push": False,
+    "web_url": "http://gitlab.example.com/my-group/my-project/merge_requests/1",
+    "references": {
+        "short": "!1",
+        "relative": "my-group/my-project!1",
+        "full": "my-group/my-project!1",
+    },
+    "time_stats": {
+        "time_estimate": 0,
+        "total_time_spent": 0,
+        "human_time_estimate": None,
+        "human_total_time_spent": None,
+    },
+    "squash": False,
+    "task_completion_status": {"count": 0, "completed_count": 0},
+}
+
+PIPELINE = {
+    "id": 47,
+    "iid": 12,
+    "project_id": 1,
+    "status": "pending",
+    "source": "push",
+    "ref": "new-pipeline",
+    "sha": "a91957a858320c0e17f3a0eca7cfacbff50ea29a",
+    "name": "Build pipeline",
+    "web_url": "https://example.com/foo/bar/pipelines/47",
+    "created_at": "2016-08-11T11:28:34.085Z",
+    "updated_at": "2016-08-11T11:32:35.169Z",
+}
+
+GROUP = {
+    "id": 1,
+    "name": "Foobar Group",
+    "path": "foo-bar",
+    "description": "An interesting group",
+    "visibility": "public",
+    "share_with_group_lock": False,
+    "require_two_factor_authentication": False,
+    "two_factor_grace_period": 48,
+    "project_creation_level": "developer",
+    "auto_devops_enabled": None,
+    "subgroup_creation_level": "owner",
+    "emails_disabled": None,
+    "emails_enabled": None,
+    "mentions_disabled": None,
+    "lfs_enabled": True,
+    "default_branch": None,
+    "default_branch_protection": 2,
+    "avatar_url": "http://localhost:3000/uploads/group/avatar/1/foo.jpg",
+    "web_url": "http://localhost:3000/groups/foo-bar",
+    "request_access_enabled": False,
+    "repository_storage": "default",
+    "full_name": "Foobar Group",
+    "full_path": "foo-bar",
+    "file_template_project_id": 1,
+    "parent_id": None,
+    "created_at": "2020-01-15T12:36:29.590Z",
+    "ip_restriction_ranges": None,
+}
+
+SAMPLES = {
+    "project": PROJECT,
+    "user": USER,
+    "job": JOB,
+    "merge_request": MERGE_REQUEST,
+    "pipeline": PIPELINE,
+    "group": GROUP,
+}
+
+
+def make_item(kind: str, item_id: int) -> dict:
+    """
+    Build one payload of the given kind with a unique id.
+    """
+    item = copy.deepcopy(SAMPLES[kind])
+    item["id"] = item_id
+    if "iid" in item:
+        item["iid"] = item_id
+    if kind == "project":
+        item["path"] = f"project-{item_id}"
+        item["path_with_namespace"] = f"diaspora/project-{item_id}"
+    if kind == "user":
+        item["username"] = f"user{item_id}"
+    return item
+
+
+def make_page(kind: str, count: int = 100, start: int = 1) -> list:
+    """
+    Build a page of ``count`` payloads of the given kind with ids starting at ``start``.
+    """
+    return [make_item(kind, item_id) for item_id in range(start, start + count)]
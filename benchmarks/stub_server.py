@@ -0,0 +1,438 @@
+#!/usr/bin/python
+# coding: utf-8
+"""
+Local stand-in for the GitLab REST API used by the tests and benchmarks.
+
+Serves paginated collections with the same pagination headers GitLab sends
+(X-Page, X-Per-Page, X-Next-Page, X-Total, X-Total-Pages and Link), answers
+pagination=keyset requests with id_after/id_before cursors in the Link header,
+filters collections with updated_after, last_activity_after and the like,
+orders offset paginated collections by order_by and sort,
+sends a weak ETag with every 200 and answers a matching If-None-Match with 304,
+and records every request it receives so callers can assert on request counts.
+
+Usage:
+    python benchmarks/stub_server.py [--port 8080] [--latency 0.05] [--rate-limit 600]
+"""
+import argparse
+import hashlib
+import json
+import math
+import os
+import socket
+import sys
+import threading
+import time
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+from benchmarks.payloads import make_page
+
+API_PREFIX = "/api/v4"
+
+# Query parameters filtering collections: (item field, whether items are at or after)
+DATE_FILTERS = {
+    "created_after": ("created_at", True),
+    "created_before": ("created_at", False),
+    "updated_after": ("updated_at", True),
+    "updated_before": ("updated_at", False),
+    "last_activity_after": ("last_activity_at", True),
+    "last_activity_before": ("last_activity_at", False),
+}
+
+
+def parse_date(value: str) -> datetime:
+    """
+    Parse an ISO 8601 date as GitLab sends it, as UTC when it has no offset.
+    """
+    date = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    return date if date.tzinfo else date.replace(tzinfo=timezone.utc)
+
+
+def default_collections() -> Dict[str, List[dict]]:
+    """
+    Collections served by a default stand-in server, keyed by API path.
+    """
+    groups = make_page("group", count=3, start=2)
+    return {
+        "/projects": make_page("project", count=250),
+        "/users": make_page("user", count=120),
+        "/merge_requests": make_page("merge_request", count=150),
+        "/projects/1/jobs": make_page("job", count=230),
+        "/projects/1/pipelines": make_page("pipeline", count=40),
+        "/groups": groups,
+        "/groups/2/descendant_groups": groups[1:],
+        "/groups/3/descendant_groups": [],
+        "/groups/4/descendant_groups": [],
+        "/groups/2/projects": make_page("project", count=30, start=1000),
+        "/groups/3/projects": make_page("project", count=120, start=2000),
+        "/groups/4/projects": make_page("project", count=5, start=3000),
+    }
+
+
+class StubGitLabServer:
+    """
+    Threaded HTTP server answering a subset of the GitLab API from in-memory collections.
+
+    latency adds a fixed delay to every request, max_in_flight records the
+    highest number of requests handled at the same time, and connections counts
+    the connections accepted (a TLS server would handshake once for each). rate_limit allows that
+    many requests per rate_limit_window seconds, sending GitLab's RateLimit
+    headers and answering 429 with Retry-After beyond it. not_modified counts the
+    304 answers to If-None-Match. fail() makes the next
+    requests for a path fail with an error status or a dropped connection.
+    Collections of more than max_counted items are sent without X-Total and
+    X-Total-Pages, as GitLab does beyond 10,000 items.
+
+    Usage:
+        with StubGitLabServer() as server:
+            client = Api(url=server.url, token="token")
+    """
+
+    def __init__(
+        self,
+        collections: Optional[Dict[str, List[dict]]] = None,
+        default_per_page: int = 20,
+        max_per_page: int = 100,
+        latency: float = 0.0,
+        rate_limit: Optional[int] = None,
+        rate_limit_window: float = 1.0,
+        port: int = 0,
+        max_counted: int = 10000,
+    ):
+        self.collections = (
+            collections if collections is not None else default_collections()
+        )
+        self.default_per_page = default_per_page
+        self.max_per_page = max_per_page
+        self.latency = latency
+        self.rate_limit = rate_limit
+        self.rate_limit_window = rate_limit_window
+        self.port = port
+        self.max_counted = max_counted
+        self.throttled = 0
+        self.not_modified = 0
+        self.failures = {}
+        self._window_start = None
+        self._window_count = 0
+        self.requests = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.connections = 0
+        self._lock = threading.Lock()
+        self._server = None
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}{API_PREFIX}"
+
+    def start(self) -> "StubGitLabServer":
+        self._server = ThreadingHTTPServer(
+            ("127.0.0.1", self.port), self._handler_class()
+        )
+        self._server.daemon_threads = True
+        self._server.handle_error = lambda request, client_address: None
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self) -> "StubGitLabServer":
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def requests_for(self, path: str) -> List[dict]:
+        """
+        Requests received for an API path, excluding the query string.
+        """
+        with self._lock:
+            return [request for request in self.requests if request["path"] == path]
+
+    def reset(self):
+        with self._lock:
+            self.requests.clear()
+            self.max_in_flight = 0
+            self.throttled = 0
+            self.not_modified = 0
+            self.connections = 0
+
+    def revalidated(self):
+        with self._lock:
+            self.not_modified += 1
+
+    def connected(self):
+        with self._lock:
+            self.connections += 1
+
+    def fail(self, path: str, status: int = 503, times: int = 1):
+        """
+        Fail the next requests for a path.
+
+        Args:
+            path: API path, excluding the query string.
+            status: Status to answer with, or 0 to close the connection without a response.
+            times: Number of requests to fail.
+        """
+        with self._lock:
+            self.failures.setdefault(path, []).extend([status] * times)
+
+    def next_failure(self, path: str) -> Optional[int]:
+        with self._lock:
+            failures = self.failures.get(path)
+            return failures.pop(0) if failures else None
+
+    def take_token(self):
+        """
+        Count a request against the fixed rate limit window.
+
+        Returns:
+            Whether the request is allowed, and the RateLimit headers to send.
+        """
+        with self._lock:
+            now = time.time()
+            window_start = (
+                math.floor(now / self.rate_limit_window) * self.rate_limit_window
+            )
+            if window_start != self._window_start:
+                self._window_start = window_start
+                self._window_count = 0
+            self._window_count += 1
+            reset = window_start + self.rate_limit_window
+            headers = {
+                "RateLimit-Limit": str(self.rate_limit),
+                "RateLimit-Remaining": str(
+                    max(self.rate_limit - self._window_count, 0)
+                ),
+                "RateLimit-Reset": str(math.ceil(reset)),
+            }
+            allowed = self._window_count <= self.rate_limit
+            if not allowed:
+                self.throttled += 1
+                headers["Retry-After"] = str(math.ceil(reset - now))
+            return allowed, headers
+
+    def begin(self):
+        with self._lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+
+    def end(self):
+        with self._lock:
+            self.in_flight -= 1
+
+    def record(self, method: str, path: str, query: dict, headers: dict):
+        with self._lock:
+            self.requests.append(
+                {"method": method, "path": path, "query": query, "headers": headers}
+            )
+
+    def find(self, path: str) -> Optional[object]:
+        """
+        Resolve an API path to a collection or a single item of a collection.
+        """
+        if path in self.collections:
+            return self.collections[path]
+        parent, _, item_id = path.rpartition("/")
+        for item in self.collections.get(parent, []):
+            if str(item.get("id")) == item_id:
+                return item
+        return None
+
+    def filter(self, items: List[dict], query: dict) -> List[dict]:
+        """
+        Items matching the date filters of the query, "after" bounds included.
+        """
+        for parameter, (field, after) in DATE_FILTERS.items():
+            if parameter not in query:
+                continue
+            bound = parse_date(query[parameter])
+            items = [
+                item
+                for item in items
+                if item.get(field)
+                and (
+                    parse_date(item[field]) >= bound
+                    if after
+                    else parse_date(item[field]) < bound
+                )
+            ]
+        return items
+
+    def paginate_keyset(self, path: str, items: List[dict], query: dict):
+        """
+        Keyset pagination ordered by id. Only a Link header is sent, as GitLab does.
+        """
+        per_page = int(query.get("per_page") or self.default_per_page)
+        per_page = min(max(per_page, 1), self.max_per_page)
+        descending = query.get("sort", "desc") == "desc"
+        items = sorted(items, key=lambda item: item["id"], reverse=descending)
+        if "id_after" in query:
+            items = [item for item in items if item["id"] > int(query["id_after"])]
+        if "id_before" in query:
+            items = [item for item in items if item["id"] < int(query["id_before"])]
+        body = items[:per_page]
+        headers = {"X-Per-Page": str(per_page)}
+        if len(items) > per_page:
+            cursor = "id_before" if descending else "id_after"
+            link_query = {
+                key: value
+                for key, value in query.items()
+                if key not in ("id_after", "id_before")
+            }
+            link_query[cursor] = body[-1]["id"]
+            headers["Link"] = f'<{self.url}{path}?{urlencode(link_query)}>; rel="next"'
+        return body, headers
+
+    def paginate(self, path: str, items: List[dict], query: dict):
+        if query.get("pagination") == "keyset":
+            return self.paginate_keyset(path, items, query)
+        if query.get("order_by"):
+            items = sorted(
+                items,
+                key=lambda item: str(item.get(query["order_by"]) or ""),
+                reverse=query.get("sort", "desc") == "desc",
+            )
+        page = max(int(query.get("page") or 1), 1)
+        per_page = int(query.get("per_page") or self.default_per_page)
+        per_page = min(max(per_page, 1), self.max_per_page)
+        total = len(items)
+        total_pages = max((total + per_page - 1) // per_page, 1)
+        body = items[(page - 1) * per_page : page * per_page]
+        next_page = page + 1 if page < total_pages else None
+        prev_page = page - 1 if page > 1 else None
+        headers = {
+            "X-Page": str(page),
+            "X-Per-Page": str(per_page),
+            "X-Total": str(total),
+            "X-Total-Pages": str(total_pages),
+            "X-Next-Page": str(next_page or ""),
+            "X-Prev-Page": str(prev_page or ""),
+        }
+        if total > self.max_counted:
+            del headers["X-Total"], headers["X-Total-Pages"]
+        links = []
+        for rel, target in (
+            ("prev", prev_page),
+            ("next", next_page),
+            ("first", 1),
+            ("last", total_pages if total <= self.max_counted else None),
+        ):
+            if target:
+                link_query = dict(query, page=target, per_page=per_page)
+                links.append(f'<{self.url}{path}?{urlencode(link_query)}>; rel="{rel}"')
+        headers["Link"] = ", ".join(links)
+        return body, headers
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, format, *args):
+                pass
+
+            def setup(self):
+                super().setup()
+                self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                server.connected()
+
+            def do_GET(self):
+                server.begin()
+                try:
+                    self.handle_get()
+                finally:
+                    server.end()
+
+            def handle_get(self):
+                split = urlsplit(self.path)
+                path = split.path[len(API_PREFIX) :].rstrip("/") or "/"
+                query = dict(parse_qsl(split.query))
+                server.record("GET", path, query, dict(self.headers))
+                if server.latency:
+                    time.sleep(server.latency)
+                failure = server.next_failure(path)
+                if failure == 0:
+                    self.close_connection = True
+                    return
+                if failure:
+                    self.send_json(failure, {"message": f"{failure} Server Error"})
+                    return
+                rate_limit_headers = {}
+                if server.rate_limit:
+                    allowed, rate_limit_headers = server.take_token()
+                    if not allowed:
+                        self.send_json(
+                            429,
+                            {"message": "429 Too Many Requests"},
+                            rate_limit_headers,
+                        )
+                        return
+                found = server.find(path)
+                if found is None:
+                    self.send_json(
+                        404, {"message": "404 Not Found"}, rate_limit_headers
+                    )
+                elif isinstance(found, list):
+                    body, headers = server.paginate(
+                        path, server.filter(found, query), query
+                    )
+                    self.send_json(200, body, dict(headers, **rate_limit_headers))
+                else:
+                    self.send_json(200, found, rate_limit_headers)
+
+            def send_json(self, status: int, payload, headers: dict = None):
+                content = json.dumps(payload).encode()
+                if status == 200:
+                    etag = f'W/"{hashlib.md5(content).hexdigest()}"'
+                    headers = dict(headers or {}, ETag=etag)
+                    if self.headers.get("If-None-Match") == etag:
+                        server.revalidated()
+                        self.send_response(304)
+                        for name, value in headers.items():
+                            self.send_header(name, value)
+                        self.end_headers()
+                        return
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(content)))
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(content)
+
+        return Handler
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--rate-limit", type=int, default=None)
+    args = parser.parse_args()
+
+    server = StubGitLabServer(
+        latency=args.latency, rate_limit=args.rate_limit, port=args.port
+    ).start()
+    print(f"Serving {', '.join(sorted(server.collections))} at {server.url}")
+    try:
+        server._thread.join()
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
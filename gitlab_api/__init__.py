@@ -1,164 +1,8 @@
 #!/usr/bin/env python
 # coding: utf-8
+import importlib
+
 from gitlab_api.version import __version__, __author__, __credits__
-from gitlab_api.gitlab_api import Api
-from gitlab_api.gitlab_input_models import (
-    BranchModel,
-    CommitModel,
-    DeployTokenModel,
-    GroupModel,
-    JobModel,
-    MembersModel,
-    PackageModel,
-    PipelineModel,
-    ProjectModel,
-    ProtectedBranchModel,
-    MergeRequestModel,
-    MergeRequestRuleModel,
-    ReleaseModel,
-    RunnerModel,
-    UserModel,
-    WikiModel,
-)
-from gitlab_api.gitlab_response_models import (
-    DeployToken,
-    Rule,
-    AccessControl,
-    Source,
-    Link,
-    Assets,
-    Evidence,
-    ReleaseLinks,
-    Token,
-    ToDo,
-    WikiPage,
-    WikiAttachmentLink,
-    WikiAttachment,
-    Agent,
-    Agents,
-    Release,
-    Branch,
-    ApprovalRule,
-    MergeRequest,
-    GroupAccess,
-    DefaultBranchProtectionDefaults,
-    Group,
-    Webhook,
-    AccessLevel,
-    Project,
-    Runner,
-    Job,
-    Label,
-    Tag,
-    Topic,
-    Pipeline,
-    PackageLink,
-    PackageVersion,
-    Package,
-    Contributor,
-    CommitStats,
-    CommitSignature,
-    Comment,
-    Commit,
-    Membership,
-    IssueStats,
-    Milestone,
-    TimeStats,
-    TaskCompletionStatus,
-    References,
-    Artifact,
-    ArtifactsFile,
-    RunnerManager,
-    Configuration,
-    Iteration,
-    Identity,
-    GroupSamlIdentity,
-    User,
-    Namespace,
-    ContainerExpirationPolicy,
-    Statistics,
-    Diff,
-    DetailedStatus,
-)
-from gitlab_api.gitlab_db_models import (
-    BaseDBModel,
-    DeployTokenDBModel,
-    RuleDBModel,
-    AccessControlDBModel,
-    SourceDBModel,
-    LinkDBModel,
-    AssetsDBModel,
-    EvidenceDBModel,
-    ReleaseLinksDBModel,
-    TokenDBModel,
-    ToDoDBModel,
-    WikiPageDBModel,
-    WikiAttachmentLinkDBModel,
-    WikiAttachmentDBModel,
-    AgentDBModel,
-    AgentsDBModel,
-    ReleaseDBModel,
-    BranchDBModel,
-    ApprovalRuleDBModel,
-    MergeRequestDBModel,
-    MergeApprovalsDBModel,
-    TestCaseDBModel,
-    TestSuiteDBModel,
-    TestReportDBModel,
-    TestReportTotalDBModel,
-    GroupAccessDBModel,
-    DefaultBranchProtectionDefaultsDBModel,
-    GroupDBModel,
-    WebhookDBModel,
-    AccessLevelDBModel,
-    TagDBModel,
-    TopicDBModel,
-    LabelDBModel,
-    ProjectDBModel,
-    RunnerDBModel,
-    EpicDBModel,
-    IssueDBModel,
-    JobDBModel,
-    ParentIDDBModel,
-    PipelineDBModel,
-    PipelineVariableDBModel,
-    PackageLinkDBModel,
-    PackageVersionDBModel,
-    PackageDBModel,
-    ProjectConfigDBModel,
-    ContributorDBModel,
-    CommitStatsDBModel,
-    CommitSignatureDBModel,
-    CommentDBModel,
-    CommitDBModel,
-    MembershipDBModel,
-    IssueStatsDBModel,
-    MilestoneDBModel,
-    TimeStatsDBModel,
-    TaskCompletionStatusDBModel,
-    ReferencesDBModel,
-    ArtifactDBModel,
-    ArtifactsFileDBModel,
-    RunnerManagerDBModel,
-    ConfigurationDBModel,
-    IterationDBModel,
-    IdentityDBModel,
-    GroupSamlIdentityDBModel,
-    UserDBModel,
-    NamespaceDBModel,
-    ContainerExpirationPolicyDBModel,
-    PermissionsDBModel,
-    StatisticsDBModel,
-    DiffDBModel,
-    DetailedStatusDBModel,
-)
-from gitlab_api.utils import (
-    upsert,
-    create_table,
-    pydantic_to_sqlalchemy,
-    save_model,
-    load_model,
-)
 
 """
 GitLab API
@@ -170,11 +14,244 @@
 __author__ = __author__
 __credits__ = __credits__
 
+# Attributes of the package, imported from their module on first access, so that
+# importing gitlab_api, or using only the API client, does not load the models and
+# SQLAlchemy it does not need
+_LAZY_MODULES = {
+    "gitlab_api.gitlab_api": ("Api",),
+    "gitlab_api.gitlab_async_api": ("AsyncApi",),
+    "gitlab_api.rate_limit": ("RateLimitGovernor",),
+    "gitlab_api.retry": ("RetryPolicy",),
+    "gitlab_api.transport": ("ConnectionPool",),
+    "gitlab_api.instrumentation": (
+        "RequestEvent",
+        "HistogramAggregator",
+        "prometheus_text",
+    ),
+    "gitlab_api.cache": (
+        "ResponseCache",
+        "MemoryCache",
+        "DiskCache",
+    ),
+    "gitlab_api.gitlab_input_models": (
+        "BranchModel",
+        "CommitModel",
+        "DeployTokenModel",
+        "GroupModel",
+        "JobModel",
+        "MembersModel",
+        "PackageModel",
+        "PipelineModel",
+        "ProjectModel",
+        "ProtectedBranchModel",
+        "MergeRequestModel",
+        "MergeRequestRuleModel",
+        "ReleaseModel",
+        "RunnerModel",
+        "UserModel",
+        "WikiModel",
+    ),
+    "gitlab_api.gitlab_response_models": (
+        "DeployToken",
+        "Rule",
+        "AccessControl",
+        "Source",
+        "Link",
+        "Assets",
+        "Evidence",
+        "ReleaseLinks",
+        "Token",
+        "ToDo",
+        "WikiPage",
+        "WikiAttachmentLink",
+        "WikiAttachment",
+        "Agent",
+        "Agents",
+        "Release",
+        "Branch",
+        "ApprovalRule",
+        "MergeRequest",
+        "GroupAccess",
+        "DefaultBranchProtectionDefaults",
+        "Group",
+        "Webhook",
+        "AccessLevel",
+        "Project",
+        "Runner",
+        "Job",
+        "Label",
+        "Tag",
+        "Topic",
+        "Pipeline",
+        "PackageLink",
+        "PackageVersion",
+        "Package",
+        "Contributor",
+        "CommitStats",
+        "CommitSignature",
+        "Comment",
+        "Commit",
+        "Membership",
+        "IssueStats",
+        "Milestone",
+        "TimeStats",
+        "TaskCompletionStatus",
+        "References",
+        "Artifact",
+        "ArtifactsFile",
+        "RunnerManager",
+        "Configuration",
+        "Iteration",
+        "Identity",
+        "GroupSamlIdentity",
+        "User",
+        "Namespace",
+        "ContainerExpirationPolicy",
+        "Statistics",
+        "Diff",
+        "DetailedStatus",
+        "warm_up",
+    ),
+    "gitlab_api.gitlab_db_models": (
+        "BaseDBModel",
+        "DeployTokenDBModel",
+        "RuleDBModel",
+        "AccessControlDBModel",
+        "SourceDBModel",
+        "LinkDBModel",
+        "AssetsDBModel",
+        "EvidenceDBModel",
+        "ReleaseLinksDBModel",
+        "TokenDBModel",
+        "ToDoDBModel",
+        "WikiPageDBModel",
+        "WikiAttachmentLinkDBModel",
+        "WikiAttachmentDBModel",
+        "AgentDBModel",
+        "AgentsDBModel",
+        "ReleaseDBModel",
+        "BranchDBModel",
+        "ApprovalRuleDBModel",
+        "MergeRequestDBModel",
+        "MergeApprovalsDBModel",
+        "TestCaseDBModel",
+        "TestSuiteDBModel",
+        "TestReportDBModel",
+        "TestReportTotalDBModel",
+        "SyncStateDBModel",
+        "SchemaStateDBModel",
+        "GroupAccessDBModel",
+        "DefaultBranchProtectionDefaultsDBModel",
+        "GroupDBModel",
+        "WebhookDBModel",
+        "AccessLevelDBModel",
+        "TagDBModel",
+        "TopicDBModel",
+        "LabelDBModel",
+        "ProjectDBModel",
+        "RunnerDBModel",
+        "EpicDBModel",
+        "IssueDBModel",
+        "JobDBModel",
+        "ParentIDDBModel",
+        "PipelineDBModel",
+        "PipelineVariableDBModel",
+        "PackageLinkDBModel",
+        "PackageVersionDBModel",
+        "PackageDBModel",
+        "ProjectConfigDBModel",
+        "ContributorDBModel",
+        "CommitStatsDBModel",
+        "CommitSignatureDBModel",
+        "CommentDBModel",
+        "CommitDBModel",
+        "MembershipDBModel",
+        "IssueStatsDBModel",
+        "MilestoneDBModel",
+        "TimeStatsDBModel",
+        "TaskCompletionStatusDBModel",
+        "ReferencesDBModel",
+        "ArtifactDBModel",
+        "ArtifactsFileDBModel",
+        "RunnerManagerDBModel",
+        "ConfigurationDBModel",
+        "IterationDBModel",
+        "IdentityDBModel",
+        "GroupSamlIdentityDBModel",
+        "UserDBModel",
+        "NamespaceDBModel",
+        "ContainerExpirationPolicyDBModel",
+        "PermissionsDBModel",
+        "StatisticsDBModel",
+        "DiffDBModel",
+        "DetailedStatusDBModel",
+    ),
+    "gitlab_api.orm": (
+        "upsert",
+        "create_table",
+        "flatten",
+        "pydantic_to_sqlalchemy",
+    ),
+    "gitlab_api.utils": (
+        "save_model",
+        "load_model",
+    ),
+    "gitlab_api.decoders": (
+        "get_json_decoder",
+        "set_json_decoder",
+    ),
+    "gitlab_api.loader": ("copy_load",),
+    "gitlab_api.incremental": ("sync",),
+    "gitlab_api.database": (
+        "apply_indexes",
+        "bootstrap_schema",
+        "create_sqlite_engine",
+        "schema_fingerprint",
+    ),
+}
+_LAZY_ATTRIBUTES = {
+    name: module for module, names in _LAZY_MODULES.items() for name in names
+}
+
+
+def __getattr__(name: str):
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
+
+
 __all__ = [
     "upsert",
+    "copy_load",
+    "sync",
+    "create_sqlite_engine",
+    "apply_indexes",
+    "bootstrap_schema",
+    "schema_fingerprint",
     "create_table",
+    "flatten",
     "pydantic_to_sqlalchemy",
+    "warm_up",
+    "get_json_decoder",
+    "set_json_decoder",
     "Api",
+    "AsyncApi",
+    "RateLimitGovernor",
+    "RetryPolicy",
+    "ConnectionPool",
+    "RequestEvent",
+    "HistogramAggregator",
+    "prometheus_text",
+    "ResponseCache",
+    "MemoryCache",
+    "DiskCache",
     "BranchModel",
     "CommitModel",
     "DeployTokenModel",
@@ -313,6 +390,8 @@
     "TestSuiteDBModel",
     "TestReportDBModel",
     "TestReportTotalDBModel",
+    "SyncStateDBModel",
+    "SchemaStateDBModel",
     "NamespaceDBModel",
     "ContainerExpirationPolicyDBModel",
     "PermissionsDBModel",
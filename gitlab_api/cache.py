@@ -0,0 +1,217 @@
+#!/usr/bin/python
+# coding: utf-8
+
+import hashlib
+import os
+import pickle
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+# Headers describing the (empty) body of a 304 rather than the cached representation
+_BODY_HEADERS = (
+    "content-length",
+    "content-type",
+    "content-encoding",
+    "transfer-encoding",
+)
+
+
+class CacheEntry(object):
+    """
+    A cached GET response: its ETag, body and headers. Responses served from it are
+    decoded again, so callers never share the models of another call.
+    """
+
+    def __init__(
+        self, etag: str, content: bytes, headers: Dict[str, str], status_code: int = 200
+    ):
+        self.etag = etag
+        self.content = content
+        self.headers = headers
+        self.status_code = status_code
+
+    @property
+    def size(self) -> int:
+        return len(self.content)
+
+
+class ResponseCache(object):
+    """
+    Storage for CacheEntry objects. Subclasses implement get, set, delete and clear.
+
+    The cache is shared by every thread of a client, so implementations must be
+    thread safe.
+    """
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        raise NotImplementedError
+
+    def set(self, key: str, entry: CacheEntry):
+        raise NotImplementedError
+
+    def delete(self, key: str):
+        raise NotImplementedError
+
+    def clear(self):
+        raise NotImplementedError
+
+
+class MemoryCache(ResponseCache):
+    """
+    In-memory least recently used cache.
+
+    Args:
+    - max_entries: Maximum number of responses kept.
+    - max_bytes: Maximum total size of the cached bodies (None for no limit).
+    """
+
+    def __init__(self, max_entries: int = 1024, max_bytes: Optional[int] = None):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, entry: CacheEntry):
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.size -= previous.size
+            if self.max_bytes is not None and entry.size > self.max_bytes:
+                return
+            self._entries[key] = entry
+            self.size += entry.size
+            while len(self._entries) > self.max_entries or (
+                self.max_bytes is not None and self.size > self.max_bytes
+            ):
+                _, evicted = self._entries.popitem(last=False)
+                self.size -= evicted.size
+
+    def delete(self, key: str):
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self.size -= entry.size
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+
+class DiskCache(ResponseCache):
+    """
+    Cache keeping one pickle file per response in a directory, so cached
+    responses survive restarts and can be shared by processes.
+
+    Args:
+    - directory: Directory of the cache files, created if missing.
+    - max_entries: Maximum number of files kept; the least recently written are
+      removed first (None for no limit).
+    """
+
+    def __init__(self, directory: str, max_entries: Optional[int] = None):
+        self.directory = directory
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(
+            self.directory, f"{hashlib.sha256(key.encode()).hexdigest()}.pkl"
+        )
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        try:
+            with open(self._path(key), "rb") as cache_file:
+                return pickle.load(cache_file)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            return None
+
+    def set(self, key: str, entry: CacheEntry):
+        path = self._path(key)
+        temporary_path = f"{path}.{threading.get_ident()}.tmp"
+        with self._lock:
+            with open(temporary_path, "wb") as cache_file:
+                pickle.dump(entry, cache_file)
+            os.replace(temporary_path, path)
+            if self.max_entries is not None:
+                self._evict()
+
+    def _evict(self):
+        paths = [
+            os.path.join(self.directory, name)
+            for name in os.listdir(self.directory)
+            if name.endswith(".pkl")
+        ]
+        if len(paths) <= self.max_entries:
+            return
+        paths.sort(key=os.path.getmtime)
+        for path in paths[: len(paths) - self.max_entries]:
+            os.remove(path)
+
+    def delete(self, key: str):
+        try:
+            os.remove(self._path(key))
+        except FileNotFoundError:
+            pass
+
+    def clear(self):
+        with self._lock:
+            for name in os.listdir(self.directory):
+                if name.endswith(".pkl"):
+                    os.remove(os.path.join(self.directory, name))
+
+
+def get_cache_key(url: str, authorization: Optional[str] = None) -> str:
+    """
+    Cache key of a GET request. Clients with different credentials may see
+    different data, so the credentials are part of the key.
+    """
+    credentials = hashlib.sha256((authorization or "").encode()).hexdigest()[:16]
+    return f"{credentials}:{url}"
+
+
+def complete_conditional_response(
+    cache: ResponseCache,
+    key: str,
+    entry: Optional[CacheEntry],
+    response: requests.Response,
+) -> requests.Response:
+    """
+    Serve a 304 response from the cache entry it revalidated, or cache a 200
+    response that carries an ETag.
+    """
+    if response.status_code == 304 and entry is not None:
+        headers = CaseInsensitiveDict(entry.headers)
+        for name, value in response.headers.items():
+            if name.lower() not in _BODY_HEADERS:
+                headers[name] = value
+        response.headers = headers
+        response.status_code = entry.status_code
+        response._content = entry.content
+        response.from_cache = True
+    elif response.status_code == 200 and response.headers.get("ETag"):
+        entry = CacheEntry(
+            etag=response.headers["ETag"],
+            content=response.content,
+            headers=dict(response.headers),
+            status_code=response.status_code,
+        )
+        cache.set(key, entry)
+        response.from_cache = False
+    return response
@@ -0,0 +1,267 @@
+#!/usr/bin/python
+# coding: utf-8
+
+import hashlib
+import logging
+from datetime import datetime, timezone
+from typing import Dict, Iterable, List, Optional
+
+from sqlalchemy import (
+    MetaData,
+    create_engine,
+    delete,
+    event,
+    func,
+    insert,
+    inspect,
+    select,
+)
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.pool import StaticPool
+from sqlalchemy.schema import UniqueConstraint
+
+from gitlab_api.gitlab_db_models import BaseDBModel, SchemaStateDBModel
+
+
+def create_sqlite_engine(
+    path: Optional[str] = None,
+    wal: bool = True,
+    busy_timeout: float = 30.0,
+    **kwargs,
+) -> Engine:
+    """
+    Create an engine on a SQLite file, or in memory, for a local cache of GitLab state.
+
+    File databases use the WAL journal, so readers keep reading while a sync writes,
+    with synchronous=NORMAL, which is durable in WAL mode up to the last
+    checkpoint. Writers wait up to busy_timeout seconds for the lock instead of
+    failing. Without a path the database lives in memory, shared by every
+    connection of the engine.
+
+    Usage:
+        engine = create_sqlite_engine("gitlab.db")
+        BaseDBModel.metadata.create_all(engine)
+
+    Args:
+    - path: Database file, or None for an in-memory database.
+    - wal: Use the WAL journal for file databases.
+    - busy_timeout: Seconds to wait for a locked database.
+    - **kwargs: Further arguments of sqlalchemy.create_engine.
+
+    Returns:
+    - The engine.
+    """
+    connect_args = dict(kwargs.pop("connect_args", {}))
+    connect_args.setdefault("check_same_thread", False)
+    connect_args.setdefault("timeout", busy_timeout)
+    if path is None:
+        kwargs.setdefault("poolclass", StaticPool)
+        engine = create_engine("sqlite://", connect_args=connect_args, **kwargs)
+    else:
+        engine = create_engine(f"sqlite:///{path}", connect_args=connect_args, **kwargs)
+
+    @event.listens_for(engine, "connect")
+    def set_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        if path is not None and wal:
+            cursor.execute("PRAGMA journal_mode=WAL")
+            cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute(f"PRAGMA busy_timeout={int(busy_timeout * 1000)}")
+        cursor.close()
+
+    return engine
+
+
+def _missing_indexes(inspector, metadata: MetaData, tables: Iterable[str]) -> list:
+    existing = {
+        name: {index["name"] for index in indexes}
+        for (_, name), indexes in inspector.get_multi_indexes().items()
+    }
+    return [
+        index
+        for name in sorted(tables)
+        for index in sorted(metadata.tables[name].indexes, key=lambda index: index.name)
+        if index.name not in existing.get(name, ())
+    ]
+
+
+def apply_indexes(
+    engine: Engine, metadata: Optional[MetaData] = None, concurrently: bool = False
+) -> List[str]:
+    """
+    Create the indexes declared on the database models that an existing database
+    lacks. Tables created by create_all or bootstrap_schema get their indexes with
+    them; databases created before an index was declared are brought up to date
+    here. Tables that do not exist yet are left alone.
+
+    On PostgreSQL, concurrently builds every index with CREATE INDEX CONCURRENTLY,
+    outside a transaction, so writes to large tables are not blocked meanwhile.
+
+    Usage:
+        apply_indexes(engine)
+
+    Args:
+    - engine: SQLAlchemy engine.
+    - metadata: Metadata declaring the indexes, the database models by default.
+    - concurrently: Build the indexes without locking writes, on PostgreSQL.
+
+    Returns:
+    - The names of the indexes created.
+    """
+    metadata = BaseDBModel.metadata if metadata is None else metadata
+    inspector = inspect(engine)
+    tables = set(inspector.get_table_names()) & set(metadata.tables)
+    missing = _missing_indexes(inspector, metadata, tables)
+
+    concurrently = concurrently and engine.dialect.name == "postgresql"
+    connection = engine.connect()
+    if concurrently:
+        connection = connection.execution_options(isolation_level="AUTOCOMMIT")
+    with connection:
+        created = _create_indexes(connection, missing, concurrently=concurrently)
+        if not concurrently:
+            connection.commit()
+    return created
+
+
+def _create_indexes(connection, indexes: list, concurrently: bool = False) -> List[str]:
+    created = []
+    for index in indexes:
+        options = index.dialect_options["postgresql"]
+        declared = options["concurrently"]
+        options["concurrently"] = concurrently or declared
+        try:
+            index.create(connection)
+        finally:
+            options["concurrently"] = declared
+        logging.info(f"Index {index.name} created on {index.table.name}.")
+        created.append(index.name)
+    return created
+
+
+def schema_fingerprint(dialect, metadata: Optional[MetaData] = None) -> str:
+    """
+    SHA-256 of every table's columns, with their types as compiled for dialect,
+    nullability, keys and foreign keys, and of its unique constraints and indexes.
+    It changes whenever the declared schema does.
+    """
+    metadata = BaseDBModel.metadata if metadata is None else metadata
+    digest = hashlib.sha256()
+    for name in sorted(metadata.tables):
+        table = metadata.tables[name]
+        for column in table.columns:
+            foreign_keys = sorted(
+                (foreign_key.name or "", foreign_key.target_fullname)
+                for foreign_key in column.foreign_keys
+            )
+            digest.update(
+                repr(
+                    (
+                        name,
+                        column.name,
+                        column.type.compile(dialect=dialect),
+                        column.nullable,
+                        column.primary_key,
+                        foreign_keys,
+                    )
+                ).encode()
+            )
+        for constraint in sorted(
+            table.constraints, key=lambda constraint: constraint.name or ""
+        ):
+            if isinstance(constraint, UniqueConstraint):
+                digest.update(
+                    repr((name, constraint.name, constraint.columns.keys())).encode()
+                )
+        for index in sorted(table.indexes, key=lambda index: index.name):
+            digest.update(
+                repr((name, index.name, index.unique, index.columns.keys())).encode()
+            )
+    return digest.hexdigest()
+
+
+def _lock_key(name: str) -> int:
+    return int(hashlib.sha256(f"schema_state.{name}".encode()).hexdigest()[:15], 16)
+
+
+def _stored_fingerprint(connection, name: str) -> Optional[str]:
+    try:
+        with connection.begin_nested():
+            return connection.execute(
+                select(SchemaStateDBModel.fingerprint).where(
+                    SchemaStateDBModel.name == name
+                )
+            ).scalar()
+    except DBAPIError:
+        return None
+
+
+def bootstrap_schema(
+    engine: Engine, metadata: Optional[MetaData] = None, name: str = "gitlab_api"
+) -> Dict[str, List[str]]:
+    """
+    Create the tables and indexes of the database models that the database lacks,
+    at worker start.
+
+    The schema fingerprint, see schema_fingerprint, is stored in the schema_state
+    table. While it matches, bootstrap_schema costs a single query and reflects
+    nothing. Otherwise the tables are listed once, the missing ones created in
+    dependency order and the missing indexes of existing ones added, in one
+    transaction that also stores the new fingerprint. On PostgreSQL an advisory
+    lock serializes workers starting at the same time.
+
+    Usage:
+        engine = create_engine(url)
+        bootstrap_schema(engine)
+
+    Args:
+    - engine: SQLAlchemy engine.
+    - metadata: Metadata of the tables, the database models by default.
+    - name: Key of the fingerprint in schema_state, for databases holding more
+      than one metadata.
+
+    Returns:
+    - The names of the tables and of the indexes created.
+    """
+    metadata = BaseDBModel.metadata if metadata is None else metadata
+    fingerprint = schema_fingerprint(engine.dialect, metadata)
+    with engine.connect() as connection:
+        if _stored_fingerprint(connection, name) == fingerprint:
+            logging.debug(f"Schema {name} is up to date.")
+            return {"tables": [], "indexes": []}
+
+    with engine.begin() as connection:
+        if connection.dialect.name == "postgresql":
+            connection.execute(select(func.pg_advisory_xact_lock(_lock_key(name))))
+            if _stored_fingerprint(connection, name) == fingerprint:
+                return {"tables": [], "indexes": []}
+        inspector = inspect(connection)
+        existing = set(inspector.get_table_names())
+        tables = [
+            metadata.tables[table_name]
+            for table_name in sorted(metadata.tables)
+            if table_name not in existing
+        ]
+        metadata.create_all(connection, tables=tables, checkfirst=False)
+        state = SchemaStateDBModel.__table__
+        if state.name not in existing and state not in tables:
+            state.create(connection)
+        indexes = _create_indexes(
+            connection,
+            _missing_indexes(inspector, metadata, existing & set(metadata.tables)),
+        )
+        connection.execute(delete(state).where(state.c.name == name))
+        connection.execute(
+            insert(state).values(
+                name=name,
+                fingerprint=fingerprint,
+                bootstrapped_at=datetime.now(timezone.utc),
+            )
+        )
+    created = [table.name for table in tables]
+    logging.info(
+        f"Schema {name} bootstrapped: {len(created)} tables and "
+        f"{len(indexes)} indexes created."
+    )
+    return {"tables": created, "indexes": indexes}
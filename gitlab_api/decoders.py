@@ -0,0 +1,144 @@
+#!/usr/bin/python
+# coding: utf-8
+
+import json
+import os
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterable, Optional, Union
+
+try:
+    from gitlab_api.exceptions import ParameterError
+except ModuleNotFoundError:
+    from exceptions import ParameterError
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+# Backends in order of preference when none is chosen
+JSON_DECODERS = ("orjson", "msgspec", "json")
+
+# What a Response keeps besides the validated models, headers and status:
+# the decoded payload (json_output), the body bytes (raw_output), both or neither
+RETAIN_MODES = ("all", "json", "raw", "models")
+
+# How a payload with a response model becomes Response.data: validated models
+# (True), models built with model_construct without running validators
+# ("construct"), or the decoded dictionaries as they are (False)
+VALIDATE_MODES = (True, False, "construct")
+
+# Keyword arguments of the Api methods that choose how their responses are
+# decoded, rather than being sent to GitLab
+DECODE_OPTIONS = ("retain", "validate", "fields")
+
+# Decoding options of the Api call being made, set by require_auth from the
+# client's defaults and the method's keyword arguments
+CURRENT_DECODE_OPTIONS: ContextVar[Optional[Dict[str, Any]]] = ContextVar(
+    "gitlab_api_decode_options", default=None
+)
+
+
+def get_decode_option(name: str, default: Any = None) -> Any:
+    """
+    A decoding option of the Api call being made, see DECODE_OPTIONS.
+    """
+    options = CURRENT_DECODE_OPTIONS.get()
+    if options is None:
+        return default
+    return options.get(name, default)
+
+
+def check_decode_options(
+    retain: str = "all",
+    validate: Union[bool, str] = True,
+    fields: Optional[Iterable[str]] = None,
+) -> Dict[str, Any]:
+    """
+    The decoding options, see DECODE_OPTIONS, with fields as a tuple.
+
+    Raises:
+    - ParameterError: If an option has an invalid value.
+    """
+    if retain not in RETAIN_MODES:
+        raise ParameterError(
+            f"retain must be one of {', '.join(RETAIN_MODES)}, not {retain!r}"
+        )
+    if validate not in VALIDATE_MODES:
+        raise ParameterError(
+            f"validate must be True, False or 'construct', not {validate!r}"
+        )
+    if fields is not None:
+        if isinstance(fields, str) or not all(
+            isinstance(field, str) for field in fields
+        ):
+            raise ParameterError(
+                f"fields must be a list of field names, not {fields!r}"
+            )
+        fields = tuple(fields)
+    return {"retain": retain, "validate": validate, "fields": fields}
+
+
+def get_json_decoder(name: Optional[str] = None) -> Callable[[bytes], Any]:
+    """
+    A function decoding a JSON body into Python lists and dictionaries.
+
+    Args:
+    - name: "orjson", "msgspec" or "json" (the standard library). None, or "auto",
+      picks the first one installed in that order.
+
+    Raises:
+    - ValueError: If name is not a known backend.
+    - ImportError: If the backend named is not installed.
+    """
+    if name in (None, "auto"):
+        name = next(
+            backend
+            for backend in JSON_DECODERS
+            if backend == "json" or globals()[backend] is not None
+        )
+    if name not in JSON_DECODERS:
+        raise ValueError(
+            f"Unknown JSON decoder {name!r}, expected one of {', '.join(JSON_DECODERS)}"
+        )
+    if name == "orjson":
+        if orjson is None:
+            raise ImportError(
+                "The orjson JSON decoder requires: pip install gitlab-api[orjson]"
+            )
+        return orjson.loads
+    if name == "msgspec":
+        if msgspec is None:
+            raise ImportError("The msgspec JSON decoder requires: pip install msgspec")
+        return msgspec.json.Decoder().decode
+    return json.loads
+
+
+_decoder = get_json_decoder(os.environ.get("GITLAB_API_JSON_DECODER") or None)
+
+
+def set_json_decoder(decoder: Union[str, Callable[[bytes], Any], None] = None):
+    """
+    Choose how process_response decodes JSON bodies, for every client.
+
+    The default is the fastest backend installed, or the one named by the
+    GITLAB_API_JSON_DECODER environment variable.
+
+    Args:
+    - decoder: A backend name, see get_json_decoder(), or a function taking the
+      body bytes and returning the decoded payload.
+    """
+    global _decoder
+    _decoder = decoder if callable(decoder) else get_json_decoder(decoder)
+
+
+def decode_json(content: bytes) -> Any:
+    """
+    Decode a JSON body with the decoder chosen by set_json_decoder().
+    """
+    return _decoder(content)
@@ -2,23 +2,133 @@
 # coding: utf-8
 
 import functools
+import inspect
 
 try:
+    from gitlab_api.decoders import CURRENT_DECODE_OPTIONS, DECODE_OPTIONS
     from gitlab_api.exceptions import LoginRequiredError
+    from gitlab_api.instrumentation import CURRENT_ENDPOINT
 except ModuleNotFoundError:
+    from decoders import CURRENT_DECODE_OPTIONS, DECODE_OPTIONS
     from exceptions import LoginRequiredError
+    from instrumentation import CURRENT_ENDPOINT
+
+
+def _call_state(self, function, kwargs: dict, takes_kwargs: bool, deferred: bool):
+    """
+    Context variables to set while function runs: the endpoint being called, unless
+    an enclosing call already set it, and the decoding options of the client,
+    overridden by those passed in kwargs. The decoding options are removed from kwargs.
+
+    Generators and coroutines (deferred) also carry the state of the enclosing call,
+    since their body may run in another context, e.g. awaited by the event loop.
+    """
+    options = {name: kwargs.pop(name) for name in DECODE_OPTIONS if name in kwargs}
+    state = {}
+    endpoint = CURRENT_ENDPOINT.get()
+    if endpoint is None:
+        state[CURRENT_ENDPOINT] = (function.__name__, kwargs if takes_kwargs else {})
+        options = dict(getattr(self, "decode_options", None) or {}, **options)
+    elif deferred:
+        state[CURRENT_ENDPOINT] = endpoint
+    current_options = CURRENT_DECODE_OPTIONS.get()
+    if options:
+        state[CURRENT_DECODE_OPTIONS] = dict(current_options or {}, **options)
+    elif deferred and current_options is not None:
+        state[CURRENT_DECODE_OPTIONS] = current_options
+    return state
+
+
+def _enter(state: dict) -> list:
+    return [(variable, variable.set(value)) for variable, value in state.items()]
+
+
+def _exit(tokens: list):
+    for variable, token in reversed(tokens):
+        variable.reset(token)
+
+
+def _in_state(state: dict, generator):
+    """
+    Run each step of generator with the context variables of state set.
+    """
+    try:
+        while True:
+            tokens = _enter(state)
+            try:
+                item = next(generator)
+            except StopIteration:
+                return
+            finally:
+                _exit(tokens)
+            yield item
+    finally:
+        generator.close()
+
+
+async def _await_in_state(state: dict, coroutine):
+    tokens = _enter(state)
+    try:
+        return await coroutine
+    finally:
+        _exit(tokens)
+
+
+async def _async_in_state(state: dict, generator):
+    """
+    Run each step of an async generator with the context variables of state set.
+    """
+    try:
+        while True:
+            tokens = _enter(state)
+            try:
+                item = await generator.__anext__()
+            except StopAsyncIteration:
+                return
+            finally:
+                _exit(tokens)
+            yield item
+    finally:
+        await generator.aclose()
 
 
 def require_auth(function):
     """
     Wraps API calls in function that ensures headers are passed
     with a token
+
+    The outermost wrapped call is recorded as the current endpoint, so that
+    instrumentation hooks know which method made each request, along with the
+    decoding options (e.g. retain) process_response applies to its responses.
+    The state is captured when the method is called, and applied whenever its
+    body, generator steps or coroutine run.
     """
+    takes_kwargs = any(
+        parameter.kind is inspect.Parameter.VAR_KEYWORD
+        for parameter in inspect.signature(function).parameters.values()
+    )
+    if inspect.isgeneratorfunction(function):
+        run = _in_state
+    elif inspect.isasyncgenfunction(function):
+        run = _async_in_state
+    elif inspect.iscoroutinefunction(function):
+        run = _await_in_state
+    else:
+        run = None
 
     @functools.wraps(function)
     def wrapper(self, *args, **kwargs):
         if not self.headers:
             raise LoginRequiredError
-        return function(self, *args, **kwargs)
+        state = _call_state(self, function, kwargs, takes_kwargs, run is not None)
+        if not state:
+            return function(self, *args, **kwargs)
+        if run is not None:
+            return run(state, function(self, *args, **kwargs))
+        tokens = _enter(state)
+        try:
+            return function(self, *args, **kwargs)
+        finally:
+            _exit(tokens)
 
     return wrapper
@@ -1,11 +1,14 @@
 #!/usr/bin/python
 # coding: utf-8
 
-import json
+import itertools
+import threading
 import requests
 import urllib3
-from base64 import b64encode
-from typing import Union
+from requests.adapters import DEFAULT_POOLSIZE
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
 from pydantic import ValidationError
 
 from gitlab_api.gitlab_input_models import (
@@ -27,15 +30,49 @@
     UserModel,
     WikiModel,
 )
-from gitlab_api.gitlab_response_models import Response
+from gitlab_api.gitlab_response_models import (
+    Response,
+    ApprovalRule,
+    Branch,
+    Comment,
+    Commit,
+    Contributor,
+    DeployToken,
+    Diff,
+    Group,
+    Job,
+    MergeRequest,
+    Namespace,
+    Package,
+    Pipeline,
+    Project,
+    Release,
+    Runner,
+    Token,
+    User,
+    WikiAttachment,
+    WikiPage,
+)
+from gitlab_api.cache import ResponseCache
+from gitlab_api.decoders import check_decode_options
 from gitlab_api.decorators import require_auth
+from gitlab_api.instrumentation import Instrumentation, RequestEvent
+from gitlab_api.rate_limit import RateLimitGovernor
+from gitlab_api.retry import RetryPolicy
+from gitlab_api.transport import ConnectionPool, GitLabHTTPAdapter
 from gitlab_api.exceptions import (
-    AuthError,
-    UnauthorizedError,
     ParameterError,
     MissingParameterError,
 )
-from gitlab_api.utils import process_response
+from gitlab_api.utils import (
+    build_auth_headers,
+    check_auth_response,
+    process_response,
+    get_next_page,
+    get_total_pages,
+)
+
+DEFAULT_MAX_CONCURRENCY = 8
 
 
 class Api(object):
@@ -47,46 +84,349 @@ def __init__(
         password: str = None,
         token: str = None,
         verify: bool = True,
+        max_workers: int = 1,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        rate_limit: bool = True,
+        rate_limiter: Optional[RateLimitGovernor] = None,
+        retry: bool = True,
+        retry_policy: Optional[RetryPolicy] = None,
+        pool_connections: int = DEFAULT_POOLSIZE,
+        pool_maxsize: Optional[int] = None,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+        timeout: Optional[Union[float, Tuple[float, float]]] = None,
+        socket_options: Optional[List[Tuple[int, int, int]]] = None,
+        connection_pool: Optional[ConnectionPool] = None,
+        cache: Optional[ResponseCache] = None,
+        hooks: Optional[List[Callable[[RequestEvent], Any]]] = None,
+        retain: str = "all",
+        validate: Union[bool, str] = True,
     ):
+        """
+        Args:
+        - max_workers: Default number of pages fetched concurrently by paginated
+          list endpoints. 1 fetches pages one after another.
+        - max_concurrency: Cap on the page requests in flight at once across every
+          call made through this client, whatever max_workers a call asks for.
+        - rate_limit: Pace requests by GitLab's RateLimit headers and retry 429 responses.
+        - rate_limiter: Governor to use, e.g. one shared with other clients of the same
+          GitLab instance. A new RateLimitGovernor is created when omitted.
+        - retry: Retry connection errors, and server errors of idempotent requests.
+        - retry_policy: Attempts, backoff and retried statuses. The default RetryPolicy
+          is used when omitted.
+        - pool_connections: Number of hosts to keep a pool of connections for.
+        - pool_maxsize: Connections kept open per host (defaults to max_concurrency).
+        - pool_block: Wait for a pooled connection rather than opening an extra one.
+        - keep_alive: Reuse connections and send TCP keep-alive probes.
+        - timeout: Connect and read timeout in seconds, or a (connect, read) tuple.
+        - socket_options: Socket options for new connections, e.g. TCP options.
+        - connection_pool: ConnectionPool to use instead of creating one from the
+          options above, e.g. one shared with other clients of the same GitLab instance.
+        - cache: ResponseCache (MemoryCache, DiskCache) keeping GET responses by ETag.
+          Unchanged resources are revalidated with If-None-Match, and a 304 is
+          answered with the cached body, decoded again. No caching when omitted.
+        - hooks: Callables receiving a RequestEvent for every response the client
+          decodes: the Api method, HTTP verb, URL template, status, network, parse
+          and validation times, body size, page and retries. See HistogramAggregator
+          for a hook keeping latency histograms, and add_hook().
+        - retain: What each Response keeps besides its validated models, headers and
+          status: "all" (json_output and raw_output), "json", "raw" or "models".
+          Crawlers keeping many pages only need "models", which also validates each
+          body straight from bytes. Every method accepts retain=... for one call.
+        - validate: False leaves list and dictionary payloads unvalidated in
+          Response.data, and "construct" builds their models with model_construct,
+          skipping validators, for readers of a few plain fields. Every method
+          accepts validate=... for one call, and fields=[...] to keep only those
+          fields of each item, e.g. fields=["id", "name", "status"].
+        """
         if url is None:
             raise MissingParameterError
+        decode_options = check_decode_options(retain=retain, validate=validate)
 
-        self._session = requests.Session()
         self.url = url
         self.headers = None
         self.verify = verify
+        self.max_workers = max(int(max_workers or 1), 1)
+        self.max_concurrency = max(int(max_concurrency or 1), 1)
+        self.rate_limiter = None
+        if rate_limit:
+            self.rate_limiter = rate_limiter or RateLimitGovernor()
+        self.retry_policy = None
+        if retry:
+            self.retry_policy = retry_policy or RetryPolicy()
+        self._owns_connection_pool = connection_pool is None
+        if connection_pool is None:
+            connection_pool = ConnectionPool(
+                pool_connections=pool_connections,
+                pool_maxsize=pool_maxsize or self.max_concurrency,
+                pool_block=pool_block,
+                keep_alive=keep_alive,
+                timeout=timeout,
+                socket_options=socket_options,
+            )
+        self.connection_pool = connection_pool
+        self.cache = cache
+        self.decode_options = decode_options
+        self.instrumentation = Instrumentation(base_url=url, hooks=hooks)
+        self._session = self._create_session()
+        self._executor = None
+        self._executor_lock = threading.Lock()
+        self._local = threading.local()
+        self._worker_sessions = []
 
         if self.verify is False:
             urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
-        if token:
-            self.headers = {
-                "Authorization": f"Bearer {token}",
-                "Content-Type": "application/json",
-            }
-        elif username and password:
-            user_pass = f"{username}:{password}".encode()
-            user_pass_encoded = b64encode(user_pass).decode()
-            self.headers = {
-                "Authorization": f"Basic {user_pass_encoded}",
-                "Content-Type": "application/json",
-            }
-        else:
-            raise MissingParameterError
+        self.headers = build_auth_headers(
+            token=token, username=username, password=password
+        )
 
         response = self._session.get(
-            url=f"{self.url}/projects", headers=self.headers, verify=self.verify
+            url=f"{self.url}/projects",
+            params={"per_page": 1},
+            headers=self.headers,
+            verify=self.verify,
+        )
+        check_auth_response(response=response)
+
+    def _create_session(self) -> requests.Session:
+        """
+        Create a session drawing connections from the client's connection pool,
+        paced by its rate limiter and retrying by its retry policy.
+        """
+        session = requests.Session()
+        adapter = GitLabHTTPAdapter(
+            rate_limiter=self.rate_limiter,
+            retry_policy=self.retry_policy,
+            connection_pool=self.connection_pool,
+            cache=self.cache,
+            instrumentation=self.instrumentation,
         )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
 
-        if response.status_code == 403:
-            print(f"Unauthorized Error: {response.content}")
-            raise UnauthorizedError
-        elif response.status_code == 401:
-            print(f"Authentication Error: {response.content}")
-            raise AuthError
-        elif response.status_code == 404:
-            print(f"Parameter Error: {response.content}")
-            raise ParameterError
+    def _get_worker_session(self) -> requests.Session:
+        """
+        Session of the current page worker thread, created on first use.
+        """
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = self._create_session()
+            self._local.session = session
+            with self._executor_lock:
+                self._worker_sessions.append(session)
+        return session
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """
+        Thread pool shared by every concurrent pagination call of this client.
+        Its size is the global concurrency cap.
+        """
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_concurrency,
+                    thread_name_prefix="gitlab-api-page",
+                )
+            return self._executor
+
+    def add_hook(self, hook: Callable[[RequestEvent], Any]):
+        """
+        Call hook with the RequestEvent of every response decoded from now on.
+        """
+        self.instrumentation.add_hook(hook)
+
+    def remove_hook(self, hook: Callable[[RequestEvent], Any]):
+        self.instrumentation.remove_hook(hook)
+
+    def close(self):
+        """
+        Shut down the page worker threads and close every session of this client.
+        A connection pool passed in by the caller is left open.
+        """
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+            sessions, self._worker_sessions = self._worker_sessions, []
+        if executor is not None:
+            executor.shutdown(wait=True)
+        for session in sessions:
+            session.close()
+        self._session.close()
+        if self._owns_connection_pool:
+            self.connection_pool.close()
+
+    ####################################################################################################################
+    #                                                 Pagination                                                       #
+    ####################################################################################################################
+    @require_auth
+    def iter_pages(
+        self,
+        path: str,
+        params: Optional[Dict] = None,
+        response_model: Any = None,
+        max_pages: Optional[int] = None,
+        max_workers: Optional[int] = None,
+    ) -> Iterator[Union[Response, requests.Response]]:
+        """
+        Iterate over the pages of a paginated list endpoint.
+
+        Each page is requested only when the previous one has been consumed, so
+        callers can stop early without fetching the remaining pages. The next page
+        is taken from the ``Link: rel="next"`` header, or ``X-Next-Page`` when no
+        Link header is sent.
+
+        With more than one worker, once the first page reports ``X-Total-Pages``
+        the remaining pages are requested concurrently, at most max_workers at a
+        time, and still yielded in page order. Keyset paginated responses, and
+        collections too large for GitLab to count, are always walked in sequence.
+
+        Args:
+        - path: The endpoint path relative to the API url, e.g. "/projects".
+        - params: Query parameters for the first page.
+        - response_model: The model each page is validated against, e.g. List[Project].
+        - max_pages: Maximum number of pages to fetch (0 or None for all pages).
+        - max_workers: Number of pages fetched concurrently (defaults to the client's max_workers).
+
+        Yields:
+        - The Response for each page.
+        """
+        url = f"{self.url}{path}"
+        params = dict(params) if params else {}
+        max_workers = min(max_workers or self.max_workers, self.max_concurrency)
+        pages = 0
+        while url:
+            response = self._session.get(
+                url=url,
+                params=params,
+                headers=self.headers,
+                verify=self.verify,
+            )
+            next_url, next_params = get_next_page(
+                response=response, url=url, params=params
+            )
+            yield process_response(response=response, response_model=response_model)
+            pages = pages + 1
+            if max_pages and pages >= max_pages:
+                break
+            total_pages = get_total_pages(response=response)
+            if max_workers > 1 and next_url and total_pages:
+                page = int(response.headers["X-Page"])
+                last_page = total_pages
+                if max_pages:
+                    last_page = min(last_page, page + max_pages - pages)
+                yield from self._iter_pages_concurrently(
+                    url=url,
+                    params=params,
+                    page_numbers=range(page + 1, last_page + 1),
+                    response_model=response_model,
+                    max_workers=max_workers,
+                )
+                break
+            url, params = next_url, next_params
+
+    def _fetch_page(self, url: str, params: Dict) -> requests.Response:
+        return self._get_worker_session().get(
+            url=url,
+            params=params,
+            headers=self.headers,
+            verify=self.verify,
+        )
+
+    def _iter_pages_concurrently(
+        self,
+        url: str,
+        params: Dict,
+        page_numbers: range,
+        response_model: Any,
+        max_workers: int,
+    ) -> Iterator[Union[Response, requests.Response]]:
+        """
+        Fetch offset paginated pages on the shared thread pool, keeping at most
+        max_workers requests of this call in flight, and yield them in order.
+        """
+        executor = self._get_executor()
+        page_numbers = iter(page_numbers)
+        futures = deque()
+
+        def submit(count: int):
+            for page in itertools.islice(page_numbers, count):
+                futures.append(
+                    executor.submit(self._fetch_page, url, dict(params, page=page))
+                )
+
+        submit(max_workers)
+        try:
+            while futures:
+                response = futures.popleft().result()
+                submit(1)
+                yield process_response(response=response, response_model=response_model)
+        finally:
+            for future in futures:
+                future.cancel()
+
+    @require_auth
+    def iter_items(
+        self,
+        path: str,
+        params: Optional[Dict] = None,
+        response_model: Any = None,
+        max_pages: Optional[int] = None,
+        max_workers: Optional[int] = None,
+    ) -> Iterator[Any]:
+        """
+        Iterate over the items of a paginated list endpoint, one page at a time.
+
+        Args:
+        - path: The endpoint path relative to the API url, e.g. "/projects".
+        - params: Query parameters for the first page.
+        - response_model: The model each page is validated against, e.g. List[Project].
+        - max_pages: Maximum number of pages to fetch (0 or None for all pages).
+        - max_workers: Number of pages fetched concurrently (defaults to the client's max_workers).
+
+        Yields:
+        - Each item of each page.
+        """
+        for page in self.iter_pages(
+            path=path,
+            params=params,
+            response_model=response_model,
+            max_pages=max_pages,
+            max_workers=max_workers,
+        ):
+            data = getattr(page, "data", None)
+            if isinstance(data, list):
+                yield from data
+
+    @require_auth
+    def get_all_pages(
+        self,
+        path: str,
+        params: Optional[Dict] = None,
+        response_model: Any = None,
+        max_pages: Optional[int] = None,
+        max_workers: Optional[int] = None,
+    ) -> Union[Response, requests.Response]:
+        """
+        Fetch every page of a paginated list endpoint into a single Response.
+
+        The returned Response carries the status code and headers of the first page.
+        """
+        response = None
+        for page in self.iter_pages(
+            path=path,
+            params=params,
+            response_model=response_model,
+            max_pages=max_pages,
+            max_workers=max_workers,
+        ):
+            if response is None:
+                response = page
+            elif isinstance(getattr(response, "data", None), list) and isinstance(
+                getattr(page, "data", None), list
+            ):
+                response.data.extend(page.data)
+        return response
 
     ####################################################################################################################
     #                                                 Branches API                                                     #
@@ -115,7 +455,7 @@ def get_branches(self, **kwargs) -> Union[Response, requests.Response]:
 
         except ValidationError as e:
             raise ParameterError(f"Invalid parameters: {e.errors()}")
-        response = process_response(response=response)
+        response = process_response(response=response, response_model=List[Branch])
         return response
 
     @require_auth
@@ -141,7 +481,7 @@ def get_branch(self, **kwargs) -> Union[Response, requests.Response]:
             )
         except ValidationError as e:
             raise ParameterError(f"Invalid parameters: {e.errors()}")
-        response = process_response(response=response)
+        response = process_response(response=response, response_model=Branch)
         return response
 
     @require_auth
@@ -168,7 +508,7 @@ def create_branch(self, **kwargs) -> Union[Response, requests.Response]:
             )
         except ValidationError as e:
             raise ParameterError(f"Invalid parameters: {e.errors()}")
-        response = process_response(response=response)
+        response = process_response(response=response, response_model=Branch)
         return response
 
     @require_auth
@@ -251,7 +591,7 @@ def get_commits(self, **kwargs) -> Union[Response, requests.Response]:
             )
         except ValidationError as e:
             raise ParameterError(f"Invalid parameters: {e.errors()}")
-        response = process_response(response=response)
+        response = process_response(response=response, response_model=List[Commit])
         return response
 
     @require_auth
@@ -278,7 +618,7 @@ def get_commit(self, **kwargs) -> Union[Response, requests.Response]:
             )
         except ValidationError as e:
             raise ParameterError(f"Invalid parameters: {e.errors()}")
-        response = process_response(response=response)
+        response = process_response(response=response, response_model=Commit)
         return response
 
     @require_auth
@@ -333,7 +673,7 @@ def cherry_pick_commit(self, **kwargs) -> Union[Response, requests.Response]:
             )
         except ValidationError as e:
             raise ParameterError(f"Invalid parameters: {e.errors()}")
-        response = process_response(response=response)
+        response = process_response(response=response, response_model=Commit)
         return response
 
     @require_auth
@@ -360,7 +700,7 @@ def create_commit(self, **kwargs) -> Union[Response, requests.Response]:
             )
         except ValidationError as e:
             raise ParameterError(f"Invalid parameters: {e.errors()}")
-        response = process_response(response=response)
+        response = process_response(response=response, response_model=Commit)
         return response
 
     @require_auth
@@ -388,7 +728,7 @@ def revert_commit(self, **kwargs) -> Union[Response, requests.Response]:
             )
         except ValidationError as e:
             raise ParameterError(f"Invalid parameters: {e.errors()}")
-        response = process_response(response=response)
+        response = process_response(response=response, response_model=Commit)
         return response
 
     @require_auth
@@ -415,7 +755,7 @@ def get_commit_diff(self, **kwargs) -> Union[Response, requests.Response]:
             )
         except ValidationError as e:
             raise ParameterError(f"Invalid parameters: {e.errors()}")
-        response = process_response(response=response)
+        response = process_response(response=response, response_model=List[Diff])
         return response
 
     @require_auth
@@ -442,7 +782,7 @@ def get_commit_comments(self, **kwargs) -> Union[Response, requests.Response]:
             )
         except ValidationError as e:
             raise ParameterError(f"Invalid parameters: {e.errors()}")
-        response = process_response(response=response)
+        response = process_response(response=response, response_model=List[Comment])
         return response
 
     @require_auth
@@ -470,7 +810,7 @@ def create_commit_comment(self, **kwargs) -> Union[Response, requests.Response]:
             )
         except ValidationError as e:
             raise ParameterError(f"Invalid parameters: {e.errors()}")
-        response = process_response(response=response)
+        response = process_response(response=response, response_model=Comment)
         return response
 
     @require_auth
@@ -581,7 +921,9 @@ def get_commit_merge_requests(self, **kwargs) -> Union[Response, requests.Respon
             )
         except ValidationError as e:
             raise ParameterError(f"Invalid parameters: {e.errors()}")
-        response = process_response(response=response)
+        response = process_response(
+            response=response, response_model=List[MergeRequest]
+        )
         return response
 
     @require_auth
@@ -634,7 +976,7 @@ def get_deploy_tokens(self) -> Union[Response, requests.Response]:
             )
         except ValidationError as e:
             raise ParameterError(f"Invalid parameters: {e.errors()}")
-        response = process_response(response=response)
+        response = process_response(response=response, response_model=List[DeployToken])
         return response
 
     @require_auth
@@ -660,7 +1002,7 @@ def get_project_deploy_tokens(self, **kwargs) -> Union[Response, requests.Respon
             )
         except ValidationError as e:
             raise ParameterError(f"Invalid parameters: {e.errors()}")
-        response = process_response(response=response)
+        response = process_response(response=response, response_model=List[DeployToken])
         return response
 
     @require_auth
@@ -686,7 +1028,7 @@ def get_project_deploy_token(self, **kwargs) -> Union[Response, requests.Respons
             )
         except ValidationError as e:
             raise ParameterError(f"Invalid parameters: {e.errors()}")
-        response = process_response(response=response)
+        response = process_response(response=response, response_model=DeployToken)
         return response
 
     @require_auth
@@ -722,7 +1064,7 @@ def create_project_deploy_token(
             )
         except ValidationError as e:
             raise ParameterError(f"Invalid parameters: {e.errors()}")
-        response = process_response(response=response)
+        response = process_response(response=response, response_model=DeployToken)
         return response
 
     @require_auth
@@ -782,7 +1124,7 @@ def get_group_deploy_tokens(self, **kwargs) -> Union[Response, requests.Response
             )
         except ValidationError as e:
             raise ParameterError(f"Invalid parameters: {e.errors()}")
-        response = process_response(response=response)
+        response = process_response(response=response, response_model=List[DeployToken])
         return response
 
     @require_auth
@@ -812,7 +1154,7 @@ def get_group_deploy_token(self, **kwargs) -> Union[Response, requests.Response]
             )
         except ValidationError as e:
             raise ParameterError(f"Invalid parameters: {e.errors()}")
-        response = process_response(response=response)
+        response = process_response(response=response, response_model=DeployToken)
         return response
 
     @require_auth
@@ -846,7 +1188,7 @@ def create_group_deploy_token(self, **kwargs) -> Union[Response, requests.Respon
             )
         except ValidationError as e:
             raise ParameterError(f"Invalid parameters: {e.errors()}")
-        response = process_response(response=response)
+        response = process_response(response=response, response_model=DeployToken)
         return response
 
     @require_auth
@@ -905,7 +1247,7 @@ def get_groups(self, **kwargs) -> Union[Response, requests.Response]:
             )
         except ValidationError as e:
             raise ParameterError(f"Invalid parameters: {e.errors()}")
-        response = process_response(response=response)
+        response = process_response(response=response, response_model=List[Group])
         return response
 
     @require_auth
@@ -934,7 +1276,7 @@ def get_group(self, **kwargs) -> Union[Response, requests.Response]:
             )
         except ValidationError as e:
             raise ParameterError(f"Invalid parameters: {e.errors()}")
-        response = process_response(response=response)
+        response = process_response(response=response, response_model=Group)
         return response
 
     @require_auth
@@ -961,7 +1303,7 @@ def edit_group(self, **kwargs) -> Union[Response, requests.Response]:
             )
         except ValidationError as e:
             raise ParameterError(f"Invalid parameters: {e.errors()}")
-        response = process_response(response=response)
+        response = process_response(response=response, response_model=Group)
         return response
 
     @require_auth
@@ -990,7 +1332,7 @@ def get_group_subgroups(self, **kwargs) -> Union[Response, requests.Response]:
             )
         except ValidationError as e:
             raise ParameterError(f"Invalid parameters: {e.errors()}")
-        response = process_response(response=response)
+        response = process_response(response=response, response_model=List[Group])
         return response
 
     @require_auth
@@ -1021,7 +1363,7 @@ def get_group_descendant_groups(
             )
         except ValidationError as e:
             raise ParameterError(f"Invalid parameters: {e.errors()}")
-        response = process_response(response=response)
+        response = process_response(response=response, response_model=List[Group])
         return response
 
     @require_auth
@@ -1051,7 +1393,7 @@ def get_group_projects(self, **kwargs) -> Union[Response, requests.Response]:
             )
         except ValidationError as e:
             raise ParameterError(f"Invalid parameters: {e.errors()}")
-        response = process_response(response=response)
+        response = process_response(response=response, response_model=List[Project])
         return response
 
     @require_auth
@@ -1081,7 +1423,9 @@ def get_group_merge_requests(self, **kwargs) -> Union[Response, requests.Respons
             )
         except ValidationError as e:
             raise ParameterError(f"Invalid parameters: {e.errors()}")
-        response = process_response(response=response)
+        response = process_response(
+            response=response, response_model=List[MergeRequest]
+        )
         return response
 
     ####################################################################################################################
@@ -1106,37 +1450,15 @@ def get_project_jobs(self, **kwargs) -> Union[Response, requests.Response]:
         if job.project_id is None:
             raise MissingParameterError
         if not job.per_page:
-            per_page = 100
-        else:
-            per_page = job.per_page
-        response = self._session.get(
-            url=f"{self.url}/projects/{job.project_id}/jobs?per_page={per_page}",
-            headers=self.headers,
-            verify=self.verify,
-        )
-        job.total_pages = int(getattr(response.headers, "X-Total-Pages", 1))
-        response = None
-        if not job.max_pages:
-            max_pages = 0
-        else:
-            max_pages = job.max_pages
-        if max_pages == 0 or max_pages > job.total_pages:
-            job.max_pages = job.total_pages
-            max_pages = job.total_pages
-        for page in range(0, max_pages):
-            job.page = page
+            job.per_page = 100
             job.model_post_init(job)
-            temp_response = self._session.get(
-                url=f"{self.url}/projects/{job.project_id}/jobs",
-                headers=self.headers,
-                verify=self.verify,
-                params=job.api_parameters,
-            )
-            temp_response = process_response(response=temp_response)
-            if not response:
-                response = temp_response
-            else:
-                response = response.data + temp_response.data
+        response = self.get_all_pages(
+            path=f"/projects/{job.project_id}/jobs",
+            params=job.api_parameters,
+            response_model=List[Job],
+            max_pages=job.max_pages,
+            max_workers=job.max_workers,
+        )
         return response
 
     @require_auth
@@ -1166,7 +1488,7 @@ def get_project_job(self, **kwargs) -> Union[Response, requests.Response]:
             )
         except ValidationError as e:
             raise ParameterError(f"Invalid parameters: {e.errors()}")
-        response = process_response(response=response)
+        response = process_response(response=response, response_model=Job)
         return response
 
     @require_auth
@@ -1224,7 +1546,7 @@ def cancel_project_job(self, **kwargs) -> Union[Response, requests.Response]:
             )
         except ValidationError as e:
             raise ParameterError(f"Invalid parameters: {e.errors()}")
-        response = process_response(response=response)
+        response = process_response(response=response, response_model=Job)
         return response
 
     @require_auth
@@ -1253,7 +1575,7 @@ def retry_project_job(self, **kwargs) -> Union[Response, requests.Response]:
             )
         except ValidationError as e:
             raise ParameterError(f"Invalid parameters: {e.errors()}")
-        response = process_response(response=response)
+        response = process_response(response=response, response_model=Job)
         return response
 
     @require_auth
@@ -1282,7 +1604,7 @@ def erase_project_job(self, **kwargs) -> Union[Response, requests.Response]:
             )
         except ValidationError as e:
             raise ParameterError(f"Invalid parameters: {e.errors()}")
-        response = process_response(response=response)
+        response = process_response(response=response, response_model=Job)
         return response
 
     @require_auth
@@ -1313,7 +1635,7 @@ def run_project_job(self, **kwargs) -> Union[Response, requests.Response]:
             )
         except ValidationError as e:
             raise ParameterError(f"Invalid parameters: {e.errors()}")
-        response = process_response(response=response)
+        response = process_response(response=response, response_model=Job)
         return response
 
     @require_auth
@@ -1343,7 +1665,7 @@ def get_pipeline_jobs(self, **kwargs) -> Union[Response, requests.Response]:
             )
         except ValidationError as e:
             raise ParameterError(f"Invalid parameters: {e.errors()}")
-        response = process_response(response=response)
+        response = process_response(response=response, response_model=List[Job])
         return response
 
     ####################################################################################################################
@@ -1376,7 +1698,7 @@ def get_group_members(self, **kwargs) -> Union[Response, requests.Response]:
             )
         except ValidationError as e:
             raise ParameterError(f"Invalid parameters: {e.errors()}")
-        response = process_response(response=response)
+        response = process_response(response=response, response_model=List[User])
         return response
 
     @require_auth
@@ -1406,7 +1728,7 @@ def get_project_members(self, **kwargs) -> Union[Response, requests.Response]:
             )
         except ValidationError as e:
             raise ParameterError(f"Invalid parameters: {e.errors()}")
-        response = process_response(response=response)
+        response = process_response(response=response, response_model=List[User])
         return response
 
     ####################################################################################################################
@@ -1445,7 +1767,7 @@ def create_merge_request(self, **kwargs) -> Union[Response, requests.Response]:
             )
         except ValidationError as e:
             raise ParameterError(f"Invalid parameters: {e.errors()}")
-        response = process_response(response=response)
+        response = process_response(response=response, response_model=MergeRequest)
         return response
 
     @require_auth
@@ -1464,30 +1786,13 @@ def get_merge_requests(self, **kwargs) -> Union[Response, requests.Response]:
         - MissingParameterError: If required parameters are missing.
         """
         merge_request = MergeRequestModel(**kwargs)
-        try:
-            response = self._session.get(
-                url=f"{self.url}/merge_requests"
-                f"?per_page={merge_request.per_page}&x-total-pages",
-                headers=self.headers,
-                verify=self.verify,
-            )
-            total_pages = int(response.headers.get("X-Total-Pages", 1))
-            response = []
-            if merge_request.max_pages == 0 or merge_request.max_pages > total_pages:
-                merge_request.max_pages = total_pages
-            merge_request.model_post_init(merge_request)
-            for page in range(0, merge_request.max_pages):
-                response_page = self._session.get(
-                    url=f"{self.url}/merge_requests",
-                    params=merge_request.api_parameters,
-                    headers=self.headers,
-                    verify=self.verify,
-                )
-                response_page = json.loads(response_page.text.replace("'", '"'))
-                response = response + response_page
-        except ValidationError as e:
-            raise ParameterError(f"Invalid parameters: {e.errors()}")
-        response = process_response(response=response)
+        response = self.get_all_pages(
+            path="/merge_requests",
+            params=merge_request.api_parameters,
+            response_model=List[MergeRequest],
+            max_pages=merge_request.max_pages,
+            max_workers=merge_request.max_workers,
+        )
         return response
 
     @require_auth
@@ -1511,13 +1816,16 @@ def get_project_merge_requests(
         try:
             response = self._session.get(
                 url=f"{self.url}/projects/{merge_request.project_id}/merge_requests",
+                params=merge_request.api_parameters,
                 headers=self.headers,
                 verify=self.verify,
             )
 
         except ValidationError as e:
             raise ParameterError(f"Invalid parameters: {e.errors()}")
-        response = process_response(response=response)
+        response = process_response(
+            response=response, response_model=List[MergeRequest]
+        )
         return response
 
     @require_auth
@@ -1547,7 +1855,7 @@ def get_project_merge_request(self, **kwargs) -> Union[Response, requests.Respon
             )
         except ValidationError as e:
             raise ParameterError(f"Invalid parameters: {e.errors()}")
-        response = process_response(response=response)
+        response = process_response(response=response, response_model=MergeRequest)
         return response
 
     ####################################################################################################################
@@ -1576,7 +1884,9 @@ def get_project_level_rules(self, **kwargs) -> Union[Response, requests.Response
             )
         except ValidationError as e:
             raise ParameterError(f"Invalid parameters: {e.errors()}")
-        response = process_response(response=response)
+        response = process_response(
+            response=response, response_model=List[ApprovalRule]
+        )
         return response
 
     @require_auth
@@ -1603,7 +1913,7 @@ def get_project_level_rule(self, **kwargs) -> Union[Response, requests.Response]
 
         except ValidationError as e:
             raise ParameterError(f"Invalid parameters: {e.errors()}")
-        response = process_response(response=response)
+        response = process_response(response=response, response_model=ApprovalRule)
         return response
 
     @require_auth
@@ -1631,7 +1941,7 @@ def create_project_level_rule(self, **kwargs) -> Union[Response, requests.Respon
 
         except ValidationError as e:
             raise ParameterError(f"Invalid parameters: {e.errors()}")
-        response = process_response(response=response)
+        response = process_response(response=response, response_model=ApprovalRule)
         return response
 
     @require_auth
@@ -1659,7 +1969,7 @@ def update_project_level_rule(self, **kwargs) -> Union[Response, requests.Respon
             )
         except ValidationError as e:
             raise ParameterError(f"Invalid parameters: {e.errors()}")
-        response = process_response(response=response)
+        response = process_response(response=response, response_model=ApprovalRule)
         return response
 
     @require_auth
@@ -1719,7 +2029,7 @@ def merge_request_level_approvals(
             )
         except ValidationError as e:
             raise ParameterError(f"Invalid parameters: {e.errors()}")
-        response = process_response(response=response)
+        response = process_response(response=response, response_model=MergeRequest)
         return response
 
     @require_auth
@@ -1751,7 +2061,7 @@ def get_approval_state_merge_requests(
             )
         except ValidationError as e:
             raise ParameterError(f"Invalid parameters: {e.errors()}")
-        response = process_response(response=response)
+        response = process_response(response=response, response_model=MergeRequest)
         return response
 
     @require_auth
@@ -1783,7 +2093,9 @@ def get_merge_request_level_rules(
             )
         except ValidationError as e:
             raise ParameterError(f"Invalid parameters: {e.errors()}")
-        response = process_response(response=response)
+        response = process_response(
+            response=response, response_model=List[ApprovalRule]
+        )
         return response
 
     @require_auth
@@ -1813,7 +2125,7 @@ def approve_merge_request(self, **kwargs) -> Union[Response, requests.Response]:
             )
         except ValidationError as e:
             raise ParameterError(f"Invalid parameters: {e.errors()}")
-        response = process_response(response=response)
+        response = process_response(response=response, response_model=MergeRequest)
         return response
 
     @require_auth
@@ -1843,7 +2155,7 @@ def unapprove_merge_request(self, **kwargs) -> Union[Response, requests.Response
             )
         except ValidationError as e:
             raise ParameterError(f"Invalid parameters: {e.errors()}")
-        response = process_response(response=response)
+        response = process_response(response=response, response_model=MergeRequest)
         return response
 
     ####################################################################################################################
@@ -1874,7 +2186,7 @@ def get_repository_packages(self, **kwargs) -> Union[Response, requests.Response
             )
         except ValidationError as e:
             raise ParameterError(f"Invalid parameters: {e.errors()}")
-        response = process_response(response=response)
+        response = process_response(response=response, response_model=List[Package])
         return response
 
     def publish_repository_package(
@@ -1981,7 +2293,7 @@ def get_pipelines(self, **kwargs) -> Union[Response, requests.Response]:
             )
         except ValidationError as e:
             raise ParameterError(f"Invalid parameters: {e.errors()}")
-        response = process_response(response=response)
+        response = process_response(response=response, response_model=List[Pipeline])
         return response
 
     @require_auth
@@ -2011,7 +2323,7 @@ def get_pipeline(self, **kwargs) -> Union[Response, requests.Response]:
             )
         except ValidationError as e:
             raise ParameterError(f"Invalid parameters: {e.errors()}")
-        response = process_response(response=response)
+        response = process_response(response=response, response_model=Pipeline)
         return response
 
     @require_auth
@@ -2047,7 +2359,7 @@ def run_pipeline(self, **kwargs) -> Union[Response, requests.Response]:
                 headers=self.headers,
                 verify=self.verify,
             )
-        response = process_response(response=response)
+        response = process_response(response=response, response_model=Pipeline)
         return response
 
     ####################################################################################################################
@@ -2069,40 +2381,15 @@ def get_projects(self, **kwargs) -> Union[Response, requests.Response]:
         """
         project = ProjectModel(**kwargs)
         if not project.per_page:
-            per_page = 100
-        else:
-            per_page = project.per_page
-        response = self._session.get(
-            url=f"{self.url}/projects?per_page={per_page}&x-total-pages",
-            headers=self.headers,
-            verify=self.verify,
-        )
-        try:
-            project.total_pages = int(response.headers.get("X-Total-Pages", 1))
-        except ValueError:
-            project.total_pages = 1
-        response = None
-        if not project.max_pages:
-            max_pages = 0
-        else:
-            max_pages = project.max_pages
-        if max_pages == 0 or max_pages > project.total_pages:
-            project.max_pages = project.total_pages
-            max_pages = project.total_pages
-        for page in range(0, max_pages):
-            project.page = page
+            project.per_page = 100
             project.model_post_init(project)
-            temp_response = self._session.get(
-                url=f"{self.url}/projects",
-                headers=self.headers,
-                verify=self.verify,
-                params=project.api_parameters,
-            )
-            temp_response = process_response(response=temp_response)
-            if not response:
-                response = temp_response
-            else:
-                response = response.data + temp_response.data
+        response = self.get_all_pages(
+            path="/projects",
+            params=project.api_parameters,
+            response_model=List[Project],
+            max_pages=project.max_pages,
+            max_workers=project.max_workers,
+        )
         return response
 
     @require_auth
@@ -2129,13 +2416,26 @@ def get_project(self, **kwargs) -> Union[Response, requests.Response]:
             headers=self.headers,
             verify=self.verify,
         )
-        response = process_response(response=response)
+        response = process_response(response=response, response_model=Project)
         return response
 
     @require_auth
     def get_total_projects_in_group(
         self, **kwargs
     ) -> Union[Response, requests.Response]:
+        """
+        Get the first page of projects in a group, whose X-Total and X-Total-Pages
+        headers count the projects and pages of the group for per_page.
+
+        Args:
+        - **kwargs: Additional parameters for the request.
+
+        Returns:
+        - The response from the server.
+
+        Raises:
+        - MissingParameterError: If required parameters are missing.
+        """
         project = ProjectModel(**kwargs)
         per_page = 100
         if project.per_page:
@@ -2143,14 +2443,53 @@ def get_total_projects_in_group(
         if project.group_id is None:
             raise MissingParameterError
         response = self._session.get(
-            url=f"{self.url}"
-            f"/groups/{project.group_id}"
-            f"/projects?per_page={per_page}&x-total-pages",
+            url=f"{self.url}/groups/{project.group_id}/projects",
+            params={"per_page": per_page},
             headers=self.headers,
             verify=self.verify,
         )
         return response
 
+    @require_auth
+    def get_group_project_count(self, **kwargs) -> Optional[int]:
+        """
+        Get the number of projects in a group.
+
+        A single project is requested and the count read from X-Total. GitLab omits
+        X-Total for groups of more than 10,000 projects, whose pages are counted.
+
+        Args:
+        - **kwargs: Additional parameters for the request.
+
+        Returns:
+        - The number of projects, or None if the group's projects cannot be listed.
+
+        Raises:
+        - MissingParameterError: If required parameters are missing.
+        """
+        project = ProjectModel(**kwargs)
+        if project.group_id is None:
+            raise MissingParameterError
+        path = f"/groups/{project.group_id}/projects"
+        response = self._session.get(
+            url=f"{self.url}{path}",
+            params={"per_page": 1},
+            headers=self.headers,
+            verify=self.verify,
+        )
+        if not response.ok:
+            return None
+        total = response.headers.get("X-Total")
+        if total:
+            return int(total)
+        count = 0
+        for page in self.iter_pages(path=path, params={"per_page": 100}):
+            data = getattr(page, "data", None)
+            if page.status_code >= 400 or not isinstance(data, list):
+                return None
+            count += len(data)
+        return count
+
     @require_auth
     def get_nested_projects_by_group(
         self, **kwargs
@@ -2173,34 +2512,29 @@ def get_nested_projects_by_group(
         all_projects = []
         if project.group_id is None:
             raise MissingParameterError
-        project_group = self.get_group(group_id=project.group_id)
+        # The groups are only read for their ids, whatever the decoding options
+        project_group = self.get_group(
+            group_id=project.group_id, validate=True, fields=None
+        )
         if project_group.data:
             all_groups.append(project_group.data)
-        groups = self.get_group_descendant_groups(group_id=project.group_id)
+        groups = self.get_group_descendant_groups(
+            group_id=project.group_id, validate=True, fields=None
+        )
         if groups.data:
             all_groups.extend(groups.data)
         for group in all_groups:
-            pages_response = self.get_total_projects_in_group(
-                group_id=project.group_id, per_page=project.per_page
-            )
-            total_pages = int(pages_response.headers.get("X-Total-Pages", 1))
-            if (
-                not project.max_pages
-                or project.max_pages == 0
-                or project.max_pages > total_pages
-            ):
-                project.max_pages = total_pages
-            for page in range(0, project.max_pages):
-                projects = self.get_group_projects(
-                    group_id=group.id, per_page=project.per_page, page=page
+            all_projects.extend(
+                self.iter_items(
+                    path=f"/groups/{group.id}/projects",
+                    params={"per_page": project.per_page or 100},
+                    response_model=List[Project],
+                    max_pages=project.max_pages,
+                    max_workers=project.max_workers,
                 )
-                if (
-                    isinstance(projects.data, list)
-                    and projects.data
-                    and len(projects.data) > 0
-                ):
-                    all_projects = all_projects + projects.data
-        response = Response(data=all_projects, status_code=200)
+            )
+        # The projects were decoded page by page, as the decoding options asked
+        response = Response.model_construct(data=all_projects, status_code=200)
         return response
 
     @require_auth
@@ -2226,7 +2560,7 @@ def get_project_contributors(self, **kwargs) -> Union[Response, requests.Respons
             headers=self.headers,
             verify=self.verify,
         )
-        response = process_response(response=response)
+        response = process_response(response=response, response_model=List[Contributor])
         return response
 
     @require_auth
@@ -2252,7 +2586,7 @@ def get_project_statistics(self, **kwargs) -> Union[Response, requests.Response]
             headers=self.headers,
             verify=self.verify,
         )
-        response = process_response(response=response)
+        response = process_response(response=response, response_model=Project)
         return response
 
     @require_auth
@@ -2279,7 +2613,7 @@ def edit_project(self, **kwargs) -> Union[Response, requests.Response]:
             )
         except ValidationError as e:
             raise ParameterError(f"Invalid parameters: {e.errors()}")
-        response = process_response(response=response)
+        response = process_response(response=response, response_model=Project)
         return response
 
     @require_auth
@@ -2305,7 +2639,7 @@ def get_project_groups(self, **kwargs) -> Union[Response, requests.Response]:
             )
         except ValidationError as e:
             raise ParameterError(f"Invalid parameters: {e.errors()}")
-        response = process_response(response=response)
+        response = process_response(response=response, response_model=List[Group])
         return response
 
     @require_auth
@@ -2331,7 +2665,7 @@ def archive_project(self, **kwargs) -> Union[Response, requests.Response]:
             )
         except ValidationError as e:
             raise ParameterError(f"Invalid parameters: {e.errors()}")
-        response = process_response(response=response)
+        response = process_response(response=response, response_model=Project)
         return response
 
     @require_auth
@@ -2357,7 +2691,7 @@ def unarchive_project(self, **kwargs) -> Union[Response, requests.Response]:
             headers=self.headers,
             verify=self.verify,
         )
-        response = process_response(response=response)
+        response = process_response(response=response, response_model=Project)
         return response
 
     @require_auth
@@ -2442,7 +2776,7 @@ def get_protected_branches(self, **kwargs) -> Union[Response, requests.Response]
             headers=self.headers,
             verify=self.verify,
         )
-        response = process_response(response=response)
+        response = process_response(response=response, response_model=List[Branch])
         return response
 
     @require_auth
@@ -2468,7 +2802,7 @@ def get_protected_branch(self, **kwargs) -> Union[Response, requests.Response]:
             headers=self.headers,
             verify=self.verify,
         )
-        response = process_response(response=response)
+        response = process_response(response=response, response_model=Branch)
         return response
 
     @require_auth
@@ -2504,7 +2838,7 @@ def protect_branch(self, **kwargs) -> Union[Response, requests.Response]:
                 headers=self.headers,
                 verify=self.verify,
             )
-        response = process_response(response=response)
+        response = process_response(response=response, response_model=Branch)
         return response
 
     @require_auth
@@ -2555,7 +2889,7 @@ def require_code_owner_approvals_single_branch(
             headers=self.headers,
             verify=self.verify,
         )
-        response = process_response(response=response)
+        response = process_response(response=response, response_model=Branch)
         return response
 
     ####################################################################################################################
@@ -2584,7 +2918,7 @@ def get_releases(self, **kwargs) -> Union[Response, requests.Response]:
             )
         except ValidationError as e:
             raise ParameterError(f"Invalid parameters: {e.errors()}")
-        response = process_response(response=response)
+        response = process_response(response=response, response_model=List[Release])
         return response
 
     @require_auth
@@ -2612,7 +2946,7 @@ def get_latest_release(self, **kwargs) -> Union[Response, requests.Response]:
             )
         except ValidationError as e:
             raise ParameterError(f"Invalid parameters: {e.errors()}")
-        response = process_response(response=response)
+        response = process_response(response=response, response_model=Release)
         return response
 
     @require_auth
@@ -2697,7 +3031,7 @@ def get_group_releases(self, **kwargs) -> Union[Response, requests.Response]:
             )
         except ValidationError as e:
             raise ParameterError(f"Invalid parameters: {e.errors()}")
-        response = process_response(response=response)
+        response = process_response(response=response, response_model=List[Release])
         return response
 
     @require_auth
@@ -2753,7 +3087,7 @@ def get_release_by_tag(self, **kwargs) -> Union[Response, requests.Response]:
             )
         except ValidationError as e:
             raise ParameterError(f"Invalid parameters: {e.errors()}")
-        response = process_response(response=response)
+        response = process_response(response=response, response_model=Release)
         return response
 
     @require_auth
@@ -2780,7 +3114,7 @@ def create_release(self, **kwargs) -> Union[Response, requests.Response]:
             )
         except ValidationError as e:
             raise ParameterError(f"Invalid parameters: {e.errors()}")
-        response = process_response(response=response)
+        response = process_response(response=response, response_model=Release)
         return response
 
     @require_auth
@@ -2836,7 +3170,7 @@ def update_release(self, **kwargs) -> Union[Response, requests.Response]:
             )
         except ValidationError as e:
             raise ParameterError(f"Invalid parameters: {e.errors()}")
-        response = process_response(response=response)
+        response = process_response(response=response, response_model=Release)
         return response
 
     @require_auth
@@ -2863,7 +3197,7 @@ def delete_release(self, **kwargs) -> Union[Response, requests.Response]:
             )
         except ValidationError as e:
             raise ParameterError(f"Invalid parameters: {e.errors()}")
-        response = process_response(response=response)
+        response = process_response(response=response, response_model=Release)
         return response
 
     ####################################################################################################################
@@ -2893,7 +3227,7 @@ def get_runners(self, **kwargs) -> Union[Response, requests.Response]:
             )
         except ValidationError as e:
             raise ParameterError(f"Invalid parameters: {e.errors()}")
-        response = process_response(response=response)
+        response = process_response(response=response, response_model=List[Runner])
         return response
 
     @require_auth
@@ -2922,7 +3256,7 @@ def get_runner(self, **kwargs) -> Union[Response, requests.Response]:
             )
         except ValidationError as e:
             raise ParameterError(f"Invalid parameters: {e.errors()}")
-        response = process_response(response=response)
+        response = process_response(response=response, response_model=Runner)
         return response
 
     @require_auth
@@ -2952,7 +3286,7 @@ def update_runner_details(self, **kwargs) -> Union[Response, requests.Response]:
             )
         except ValidationError as e:
             raise ParameterError(f"Invalid parameters: {e.errors()}")
-        response = process_response(response=response)
+        response = process_response(response=response, response_model=Runner)
         return response
 
     @require_auth
@@ -2982,7 +3316,7 @@ def pause_runner(self, **kwargs) -> Union[Response, requests.Response]:
             )
         except ValidationError as e:
             raise ParameterError(f"Invalid parameters: {e.errors()}")
-        response = process_response(response=response)
+        response = process_response(response=response, response_model=Runner)
         return response
 
     @require_auth
@@ -3011,7 +3345,7 @@ def get_runner_jobs(self, **kwargs) -> Union[Response, requests.Response]:
             )
         except ValidationError as e:
             raise ParameterError(f"Invalid parameters: {e.errors()}")
-        response = process_response(response=response)
+        response = process_response(response=response, response_model=List[Job])
         return response
 
     @require_auth
@@ -3041,7 +3375,7 @@ def get_project_runners(self, **kwargs) -> Union[Response, requests.Response]:
             )
         except ValidationError as e:
             raise ParameterError(f"Invalid parameters: {e.errors()}")
-        response = process_response(response=response)
+        response = process_response(response=response, response_model=List[Runner])
         return response
 
     @require_auth
@@ -3072,7 +3406,7 @@ def enable_project_runner(self, **kwargs) -> Union[Response, requests.Response]:
             )
         except ValidationError as e:
             raise ParameterError(f"Invalid parameters: {e.errors()}")
-        response = process_response(response=response)
+        response = process_response(response=response, response_model=Runner)
         return response
 
     @require_auth
@@ -3132,7 +3466,7 @@ def get_group_runners(self, **kwargs) -> Union[Response, requests.Response]:
             )
         except ValidationError as e:
             raise ParameterError(f"Invalid parameters: {e.errors()}")
-        response = process_response(response=response)
+        response = process_response(response=response, response_model=List[Runner])
         return response
 
     @require_auth
@@ -3162,7 +3496,7 @@ def register_new_runner(self, **kwargs) -> Union[Response, requests.Response]:
             )
         except ValidationError as e:
             raise ParameterError(f"Invalid parameters: {e.errors()}")
-        response = process_response(response=response)
+        response = process_response(response=response, response_model=Token)
         return response
 
     @require_auth
@@ -3253,7 +3587,7 @@ def reset_gitlab_runner_token(self) -> Union[Response, requests.Response]:
             )
         except ValidationError as e:
             raise ParameterError(f"Invalid parameters: {e.errors()}")
-        response = process_response(response=response)
+        response = process_response(response=response, response_model=Token)
         return response
 
     @require_auth
@@ -3286,7 +3620,7 @@ def reset_project_runner_token(
             )
         except ValidationError as e:
             raise ParameterError(f"Invalid parameters: {e.errors()}")
-        response = process_response(response=response)
+        response = process_response(response=response, response_model=Token)
         return response
 
     @require_auth
@@ -3316,7 +3650,7 @@ def reset_group_runner_token(self, **kwargs) -> Union[Response, requests.Respons
             )
         except ValidationError as e:
             raise ParameterError(f"Invalid parameters: {e.errors()}")
-        response = process_response(response=response)
+        response = process_response(response=response, response_model=Token)
         return response
 
     @require_auth
@@ -3347,7 +3681,7 @@ def reset_token(self, **kwargs) -> Union[Response, requests.Response]:
             )
         except ValidationError as e:
             raise ParameterError(f"Invalid parameters: {e.errors()}")
-        response = process_response(response=response)
+        response = process_response(response=response, response_model=Token)
         return response
 
     ####################################################################################################################
@@ -3372,39 +3706,14 @@ def get_users(self, **kwargs) -> Union[Response, requests.Response]:
             user.per_page = 100
         if not user.page:
             user.page = 1
-
-        response = self._session.get(
-            url=f"{self.url}/users",
+        user.model_post_init(user)
+        response = self.get_all_pages(
+            path="/users",
             params=user.api_parameters,
-            headers=self.headers,
-            verify=self.verify,
+            response_model=List[User],
+            max_pages=user.max_pages,
+            max_workers=user.max_workers,
         )
-        response = process_response(response=response)
-        second_response = None
-        while (
-            second_response is None
-            or isinstance(second_response.data, list)
-            and len(second_response.data) > 1
-        ):
-            try:
-                user.page = user.page + 1
-                user.model_post_init(user)
-                second_response = self._session.get(
-                    url=f"{self.url}/users",
-                    params=user.api_parameters,
-                    headers=self.headers,
-                    verify=self.verify,
-                )
-                if user.max_pages and user.page > user.max_pages:
-                    break
-            except ValidationError or Exception as e:
-                raise e
-            second_response = process_response(response=second_response)
-            # Check if the list of users being returned is already inside the list of total users
-            if all(item in response.data for item in second_response.data):
-                break
-            else:
-                response.data.extend(second_response.data)
         return response
 
     @require_auth
@@ -3434,7 +3743,7 @@ def get_user(self, **kwargs) -> Union[Response, requests.Response]:
             )
         except ValidationError as e:
             raise ParameterError(f"Invalid parameters: {e.errors()}")
-        response = process_response(response=response)
+        response = process_response(response=response, response_model=List[User])
         return response
 
     ####################################################################################################################
@@ -3467,7 +3776,7 @@ def get_wiki_list(self, **kwargs) -> Union[Response, requests.Response]:
             )
         except ValidationError as e:
             raise ParameterError(f"Invalid parameters: {e.errors()}")
-        response = process_response(response=response)
+        response = process_response(response=response, response_model=List[WikiPage])
         return response
 
     @require_auth
@@ -3497,7 +3806,7 @@ def get_wiki_page(self, **kwargs) -> Union[Response, requests.Response]:
             )
         except ValidationError as e:
             raise ParameterError(f"Invalid parameters: {e.errors()}")
-        response = process_response(response=response)
+        response = process_response(response=response, response_model=WikiPage)
         return response
 
     @require_auth
@@ -3527,7 +3836,7 @@ def create_wiki_page(self, **kwargs) -> Union[Response, requests.Response]:
             )
         except ValidationError as e:
             raise ParameterError(f"Invalid parameters: {e.errors()}")
-        response = process_response(response=response)
+        response = process_response(response=response, response_model=WikiPage)
         return response
 
     @require_auth
@@ -3557,7 +3866,7 @@ def update_wiki_page(self, **kwargs) -> Union[Response, requests.Response]:
             )
         except ValidationError as e:
             raise ParameterError(f"Invalid parameters: {e.errors()}")
-        response = process_response(response=response)
+        response = process_response(response=response, response_model=WikiPage)
         return response
 
     @require_auth
@@ -3620,7 +3929,7 @@ def upload_wiki_page_attachment(
             )
         except ValidationError as e:
             raise ParameterError(f"Invalid parameters: {e.errors()}")
-        response = process_response(response=response)
+        response = process_response(response=response, response_model=WikiAttachment)
         return response
 
     ####################################################################################################################
@@ -3647,7 +3956,7 @@ def get_namespaces(self, **kwargs) -> Union[Response, requests.Response]:
             verify=self.verify,
             params=namespace.api_parameters,
         )
-        response = process_response(response=response)
+        response = process_response(response=response, response_model=List[Namespace])
         return response
 
     @require_auth
@@ -3674,5 +3983,5 @@ def get_namespace(self, **kwargs) -> Union[Response, requests.Response]:
             headers=self.headers,
             verify=self.verify,
         )
-        response = process_response(response=response)
+        response = process_response(response=response, response_model=Namespace)
         return response
@@ -0,0 +1,554 @@
+#!/usr/bin/python
+# coding: utf-8
+
+import asyncio
+import functools
+import sys
+from typing import Any, AsyncIterator, Dict, List, Optional, Union
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+try:
+    import httpx
+    from greenlet import getcurrent, greenlet
+except ImportError:
+    httpx = None
+    greenlet = object
+
+from gitlab_api.cache import (
+    ResponseCache,
+    complete_conditional_response,
+    get_cache_key,
+)
+from gitlab_api.decoders import check_decode_options
+from gitlab_api.decorators import require_auth
+from gitlab_api.exceptions import MissingParameterError
+from gitlab_api.gitlab_api import Api, DEFAULT_MAX_CONCURRENCY
+from gitlab_api.gitlab_response_models import Response
+from gitlab_api.rate_limit import RateLimitGovernor
+from gitlab_api.retry import RetryPolicy
+from gitlab_api.utils import (
+    build_auth_headers,
+    check_auth_response,
+    process_response,
+    get_next_page,
+    get_total_pages,
+)
+
+
+class _SyncContext(greenlet):
+    """
+    Greenlet running a blocking Api method on behalf of a coroutine.
+    """
+
+
+async def _run_sync(function, *args, **kwargs) -> Any:
+    """
+    Run a blocking Api method, awaiting every request it makes through await_only.
+    """
+    context = _SyncContext(function, getcurrent())
+    result = context.switch(*args, **kwargs)
+    while not context.dead:
+        try:
+            value = await result
+        except BaseException:
+            result = context.throw(*sys.exc_info())
+        else:
+            result = context.switch(value)
+    return result
+
+
+def _await_only(awaitable) -> Any:
+    """
+    Await a coroutine from the blocking code of a method started by _run_sync.
+    """
+    current = getcurrent()
+    if not isinstance(current, _SyncContext):
+        raise RuntimeError("AsyncApi requests can only be made from AsyncApi methods")
+    return current.parent.switch(awaitable)
+
+
+def _to_requests_response(response: "httpx.Response") -> requests.Response:
+    """
+    Convert an httpx response into the requests Response that process_response reads,
+    so both clients decode payloads and headers the same way.
+    """
+    converted = requests.Response()
+    converted.status_code = response.status_code
+    converted.reason = response.reason_phrase
+    converted.url = str(response.url)
+    converted._content = response.content
+    converted.encoding = response.encoding
+    headers = CaseInsensitiveDict()
+    for key, value in response.headers.raw:
+        key, value = key.decode("latin-1"), value.decode("latin-1")
+        headers[key] = f"{headers[key]}, {value}" if key in headers else value
+    converted.headers = headers
+    return converted
+
+
+def _encode_params(params: Optional[Dict]) -> Optional[Dict]:
+    """
+    Encode booleans the way requests does ("True"/"False") rather than httpx ("true"/"false").
+    """
+    if not params:
+        return params
+    return {
+        key: str(value) if isinstance(value, bool) else value
+        for key, value in params.items()
+    }
+
+
+class _AsyncSession(object):
+    """
+    requests.Session lookalike handed to the blocking Api methods. Every request is
+    sent through the AsyncApi and awaited by the calling coroutine.
+    """
+
+    def __init__(self, api: "AsyncApi"):
+        self._api = api
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict] = None,
+        headers: Optional[Dict] = None,
+        json: Any = None,
+        verify: bool = True,
+    ) -> requests.Response:
+        return _await_only(
+            self._api._request(method, url, params=params, headers=headers, json=json)
+        )
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        return self.request("POST", url, **kwargs)
+
+    def put(self, url: str, **kwargs) -> requests.Response:
+        return self.request("PUT", url, **kwargs)
+
+    def patch(self, url: str, **kwargs) -> requests.Response:
+        return self.request("PATCH", url, **kwargs)
+
+    def delete(self, url: str, **kwargs) -> requests.Response:
+        return self.request("DELETE", url, **kwargs)
+
+    def close(self):
+        pass
+
+
+class AsyncApi(object):
+    """
+    asyncio client with the same methods and input models as Api.
+
+    Every Api method is available as a coroutine taking the same keyword arguments
+    and returning the same Response. Requests share one pooled httpx.AsyncClient,
+    so independent calls can be run together with asyncio.gather.
+
+    Requires the async extra: pip install gitlab-api[async]
+
+    Usage:
+        async with AsyncApi(url=url, token=token) as client:
+            projects, users = await asyncio.gather(
+                client.get_projects(), client.get_users()
+            )
+    """
+
+    def __init__(
+        self,
+        url: str = None,
+        username: str = None,
+        password: str = None,
+        token: str = None,
+        verify: bool = True,
+        max_workers: int = 1,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        timeout: Optional[float] = None,
+        rate_limit: bool = True,
+        rate_limiter: Optional[RateLimitGovernor] = None,
+        retry: bool = True,
+        retry_policy: Optional[RetryPolicy] = None,
+        cache: Optional[ResponseCache] = None,
+        retain: str = "all",
+        validate: Union[bool, str] = True,
+    ):
+        """
+        Args:
+        - max_workers: Default number of pages fetched concurrently by paginated
+          list endpoints. 1 fetches pages one after another.
+        - max_concurrency: Cap on the requests in flight at once across every call
+          made through this client. It also sizes the connection pool.
+        - timeout: Request timeout in seconds (None waits indefinitely).
+        - rate_limit: Pace requests by GitLab's RateLimit headers and retry 429 responses.
+        - rate_limiter: Governor to use, e.g. one shared with an Api of the same
+          GitLab instance. A new RateLimitGovernor is created when omitted.
+        - retry: Retry connection errors, and server errors of idempotent requests.
+        - retry_policy: Attempts, backoff and retried statuses. The default RetryPolicy
+          is used when omitted.
+        - cache: ResponseCache keeping GET responses by ETag, see Api.
+        - retain: What each Response keeps besides its validated models, see Api.
+        - validate: Whether payloads are validated into models, see Api.
+        """
+        if httpx is None or greenlet is object:
+            raise ImportError(
+                "AsyncApi requires httpx and greenlet: pip install gitlab-api[async]"
+            )
+        if url is None:
+            raise MissingParameterError
+        decode_options = check_decode_options(retain=retain, validate=validate)
+
+        self.url = url
+        self.verify = verify
+        self.max_workers = max(int(max_workers or 1), 1)
+        self.max_concurrency = max(int(max_concurrency or 1), 1)
+        self.rate_limiter = None
+        if rate_limit:
+            self.rate_limiter = rate_limiter or RateLimitGovernor()
+        self.retry_policy = None
+        if retry:
+            self.retry_policy = retry_policy or RetryPolicy()
+        self.cache = cache
+        self.decode_options = decode_options
+        self.headers = build_auth_headers(
+            token=token, username=username, password=password
+        )
+        self._client = httpx.AsyncClient(
+            verify=verify,
+            timeout=timeout,
+            limits=httpx.Limits(
+                max_connections=self.max_concurrency,
+                max_keepalive_connections=self.max_concurrency,
+            ),
+        )
+        self._concurrency = asyncio.Semaphore(self.max_concurrency)
+        self._sync = self._create_sync_api()
+
+    def _create_sync_api(self) -> Api:
+        """
+        Api instance whose requests are sent through this client's httpx pool, and
+        whose pagination helpers run on the async page iterators below.
+        """
+        sync_api = Api.__new__(Api)
+        sync_api.url = self.url
+        sync_api.headers = self.headers
+        sync_api.verify = self.verify
+        sync_api.decode_options = self.decode_options
+        sync_api.max_workers = 1
+        sync_api.max_concurrency = 1
+        sync_api._session = _AsyncSession(self)
+        sync_api.get_all_pages = functools.partial(
+            self._await_from_sync, self.get_all_pages
+        )
+        sync_api.iter_items = functools.partial(
+            self._await_from_sync, self._collect_items
+        )
+        return sync_api
+
+    @staticmethod
+    def _await_from_sync(function, *args, **kwargs) -> Any:
+        return _await_only(function(*args, **kwargs))
+
+    async def authenticate(self):
+        """
+        Check the credentials against the server, as Api does when it is created.
+
+        Raises:
+        - AuthError: If the credentials are invalid.
+        - UnauthorizedError: If the credentials are not allowed to access the API.
+        - ParameterError: If the url does not point to the GitLab API.
+        """
+        response = await self._request(
+            "GET", f"{self.url}/projects", params={"per_page": 1}
+        )
+        check_auth_response(response=response)
+
+    async def close(self):
+        """
+        Close the connection pool of this client.
+        """
+        await self._client.aclose()
+
+    async def __aenter__(self) -> "AsyncApi":
+        await self.authenticate()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def _request(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict] = None,
+        headers: Optional[Dict] = None,
+        json: Any = None,
+    ) -> requests.Response:
+        headers = headers or self.headers
+        if self.cache is None or method.upper() != "GET":
+            return _to_requests_response(
+                await self._send(method, url, params, headers, json)
+            )
+        key = get_cache_key(
+            str(httpx.URL(url, params=_encode_params(params))),
+            headers.get("Authorization"),
+        )
+        entry = self.cache.get(key)
+        if entry is not None:
+            headers = dict(headers, **{"If-None-Match": entry.etag})
+        response = await self._send(method, url, params, headers, json)
+        return complete_conditional_response(
+            cache=self.cache,
+            key=key,
+            entry=entry,
+            response=_to_requests_response(response),
+        )
+
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict],
+        headers: Optional[Dict],
+        json: Any,
+    ) -> "httpx.Response":
+        attempt = 0
+        retries = 0
+        while True:
+            if self.rate_limiter is not None:
+                wait = self.rate_limiter.reserve()
+                if wait:
+                    await asyncio.sleep(wait)
+            try:
+                async with self._concurrency:
+                    response = await self._client.request(
+                        method,
+                        url,
+                        params=_encode_params(params),
+                        headers=headers,
+                        json=json,
+                    )
+            except httpx.TransportError as error:
+                connect = isinstance(error, (httpx.ConnectError, httpx.ConnectTimeout))
+                if self.retry_policy is None or not self.retry_policy.is_retryable(
+                    method, connect=connect
+                ):
+                    raise
+                if retries >= self.retry_policy.max_retries:
+                    self.retry_policy.record_exhausted(method)
+                    raise
+                retries = retries + 1
+                self.retry_policy.record_retry(method, error.__class__.__name__)
+                await asyncio.sleep(self.retry_policy.get_backoff(retries))
+                continue
+            if self.rate_limiter is not None:
+                self.rate_limiter.update(response.headers, response.status_code)
+                if (
+                    response.status_code == 429
+                    and attempt < self.rate_limiter.max_retries
+                ):
+                    attempt = attempt + 1
+                    continue
+            if self.retry_policy is not None and self.retry_policy.is_retryable(
+                method, status_code=response.status_code
+            ):
+                if retries >= self.retry_policy.max_retries:
+                    self.retry_policy.record_exhausted(method)
+                    break
+                retries = retries + 1
+                self.retry_policy.record_retry(method, response.status_code)
+                retry_after = None
+                if response.status_code == 503:
+                    retry_after = response.headers.get("Retry-After")
+                await asyncio.sleep(self.retry_policy.get_backoff(retries, retry_after))
+                continue
+            break
+        return response
+
+    ####################################################################################################################
+    #                                                 Pagination                                                       #
+    ####################################################################################################################
+    @require_auth
+    async def iter_pages(
+        self,
+        path: str,
+        params: Optional[Dict] = None,
+        response_model: Any = None,
+        max_pages: Optional[int] = None,
+        max_workers: Optional[int] = None,
+    ) -> AsyncIterator[Union[Response, requests.Response]]:
+        """
+        Iterate over the pages of a paginated list endpoint.
+
+        Pages are requested as they are consumed, following the same rules as
+        Api.iter_pages. With more than one worker, the remaining pages of an offset
+        paginated endpoint are requested concurrently once the first page reports
+        X-Total-Pages, and are still yielded in page order.
+
+        Args:
+        - path: The endpoint path relative to the API url, e.g. "/projects".
+        - params: Query parameters for the first page.
+        - response_model: The model each page is validated against, e.g. List[Project].
+        - max_pages: Maximum number of pages to fetch (0 or None for all pages).
+        - max_workers: Number of pages fetched concurrently (defaults to the client's max_workers).
+
+        Yields:
+        - The Response for each page.
+        """
+        url = f"{self.url}{path}"
+        params = dict(params) if params else {}
+        max_workers = min(max_workers or self.max_workers, self.max_concurrency)
+        pages = 0
+        while url:
+            response = await self._request("GET", url, params=params)
+            next_url, next_params = get_next_page(
+                response=response, url=url, params=params
+            )
+            yield process_response(response=response, response_model=response_model)
+            pages = pages + 1
+            if max_pages and pages >= max_pages:
+                break
+            total_pages = get_total_pages(response=response)
+            if max_workers > 1 and next_url and total_pages:
+                page = int(response.headers["X-Page"])
+                last_page = total_pages
+                if max_pages:
+                    last_page = min(last_page, page + max_pages - pages)
+                async for next_response in self._iter_pages_concurrently(
+                    url=url,
+                    params=params,
+                    page_numbers=range(page + 1, last_page + 1),
+                    response_model=response_model,
+                    max_workers=max_workers,
+                ):
+                    yield next_response
+                break
+            url, params = next_url, next_params
+
+    async def _iter_pages_concurrently(
+        self,
+        url: str,
+        params: Dict,
+        page_numbers: range,
+        response_model: Any,
+        max_workers: int,
+    ) -> AsyncIterator[Union[Response, requests.Response]]:
+        """
+        Request offset paginated pages as tasks, keeping at most max_workers
+        requests of this call in flight, and yield them in order.
+        """
+        page_numbers = iter(page_numbers)
+        tasks = []
+
+        def submit(count: int):
+            for _ in range(count):
+                page = next(page_numbers, None)
+                if page is None:
+                    return
+                tasks.append(
+                    asyncio.ensure_future(
+                        self._request("GET", url, params=dict(params, page=page))
+                    )
+                )
+
+        submit(max_workers)
+        try:
+            while tasks:
+                response = await tasks.pop(0)
+                submit(1)
+                yield process_response(response=response, response_model=response_model)
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    @require_auth
+    async def iter_items(
+        self,
+        path: str,
+        params: Optional[Dict] = None,
+        response_model: Any = None,
+        max_pages: Optional[int] = None,
+        max_workers: Optional[int] = None,
+    ) -> AsyncIterator[Any]:
+        """
+        Iterate over the items of a paginated list endpoint, one page at a time.
+
+        Args:
+        - path: The endpoint path relative to the API url, e.g. "/projects".
+        - params: Query parameters for the first page.
+        - response_model: The model each page is validated against, e.g. List[Project].
+        - max_pages: Maximum number of pages to fetch (0 or None for all pages).
+        - max_workers: Number of pages fetched concurrently (defaults to the client's max_workers).
+
+        Yields:
+        - Each item of each page.
+        """
+        async for page in self.iter_pages(
+            path=path,
+            params=params,
+            response_model=response_model,
+            max_pages=max_pages,
+            max_workers=max_workers,
+        ):
+            data = getattr(page, "data", None)
+            if isinstance(data, list):
+                for item in data:
+                    yield item
+
+    async def _collect_items(self, **kwargs) -> List[Any]:
+        return [item async for item in self.iter_items(**kwargs)]
+
+    @require_auth
+    async def get_all_pages(
+        self,
+        path: str,
+        params: Optional[Dict] = None,
+        response_model: Any = None,
+        max_pages: Optional[int] = None,
+        max_workers: Optional[int] = None,
+    ) -> Union[Response, requests.Response]:
+        """
+        Fetch every page of a paginated list endpoint into a single Response.
+
+        The returned Response carries the status code and headers of the first page.
+        """
+        response = None
+        async for page in self.iter_pages(
+            path=path,
+            params=params,
+            response_model=response_model,
+            max_pages=max_pages,
+            max_workers=max_workers,
+        ):
+            if response is None:
+                response = page
+            elif isinstance(getattr(response, "data", None), list) and isinstance(
+                getattr(page, "data", None), list
+            ):
+                response.data.extend(page.data)
+        return response
+
+
+def _async_method(name: str, function):
+    @functools.wraps(function)
+    async def method(self, *args, **kwargs):
+        return await _run_sync(getattr(self._sync, name), *args, **kwargs)
+
+    return method
+
+
+# Api methods of the client itself rather than of the GitLab API: AsyncApi
+# requests are not instrumented, so there are no hooks to add
+_CLIENT_METHODS = ("add_hook", "remove_hook")
+
+for _name, _function in vars(Api).items():
+    if (
+        not _name.startswith("_")
+        and callable(_function)
+        and _name not in vars(AsyncApi)
+        and _name not in _CLIENT_METHODS
+    ):
+        setattr(AsyncApi, _name, _async_method(_name, _function))
@@ -8,7 +8,7 @@
     level=logging.ERROR, format="%(asctime)s - %(levelname)s - %(message)s"
 )
 
-from sqlalchemy import String, DateTime, ForeignKey, Text, Table, Column
+from sqlalchemy import String, DateTime, ForeignKey, Text, Table, Column, Index
 from sqlalchemy.orm import mapped_column
 from sqlalchemy.orm import (
     relationship,
@@ -21,10 +21,49 @@
     Float,
     JSON,
 )
+from sqlalchemy.types import TypeDecorator
 
 BaseDBModel = declarative_base()
 
 
+class PortableArray(TypeDecorator):
+    """
+    ARRAY of item_type on PostgreSQL and a JSON list on other databases, such as
+    SQLite, so the schema can be created on either.
+    """
+
+    impl = JSON
+    cache_ok = True
+
+    def __init__(self, item_type):
+        super().__init__()
+        self.item_type = item_type
+
+    def load_dialect_impl(self, dialect):
+        if dialect.name == "postgresql":
+            return dialect.type_descriptor(ARRAY(self.item_type))
+        return dialect.type_descriptor(JSON())
+
+
+class PortableDateTime(TypeDecorator):
+    """
+    DateTime that also binds ISO 8601 strings, as some response models keep dates,
+    on databases that only accept datetime objects, such as SQLite.
+    """
+
+    impl = DateTime
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if isinstance(value, str):
+            # datetime.fromisoformat only takes 3 or 6 fractional digits before
+            # Python 3.11, pydantic parses any ISO 8601 date GitLab sends
+            from gitlab_api.gitlab_response_models import get_type_adapter
+
+            return get_type_adapter(datetime).validate_python(value)
+        return value
+
+
 # Evidence Model
 class EvidenceDBModel(BaseDBModel):
     __tablename__ = "evidences"
@@ -41,7 +80,7 @@ def __ne__(self, other):
     base_type: Mapped[str] = mapped_column(String, default="Evidence")
     sha: Mapped[str] = mapped_column(String, nullable=True)
     filepath: Mapped[str] = mapped_column(String, nullable=True)
-    collected_at: Mapped[datetime] = mapped_column(DateTime, nullable=True)
+    collected_at: Mapped[datetime] = mapped_column(PortableDateTime, nullable=True)
     releases: Mapped[List["ReleaseDBModel"]] = relationship(back_populates="evidences")
 
 
@@ -85,9 +124,9 @@ def __ne__(self, other):
     title: Mapped[str] = mapped_column(String, nullable=True)
     description: Mapped[str] = mapped_column(String, nullable=True)
     state: Mapped[str] = mapped_column(String, nullable=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=True)
-    updated_at: Mapped[datetime] = mapped_column(DateTime, nullable=True)
-    closed_at: Mapped[datetime] = mapped_column(DateTime, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(PortableDateTime, nullable=True)
+    updated_at: Mapped[datetime] = mapped_column(PortableDateTime, nullable=True)
+    closed_at: Mapped[datetime] = mapped_column(PortableDateTime, nullable=True)
     due_date: Mapped[str] = mapped_column(String, nullable=True)
     start_date: Mapped[str] = mapped_column(String, nullable=True)
     web_url: Mapped[str] = mapped_column(String, nullable=True)
@@ -96,6 +135,7 @@ def __ne__(self, other):
         Integer,
         ForeignKey(column="projects.id", name="fk_milestone_project_id"),
         nullable=True,
+        index=True,
     )
     project: Mapped["ProjectDBModel"] = relationship(back_populates="milestones")
 
@@ -103,6 +143,7 @@ def __ne__(self, other):
         Integer,
         ForeignKey(column="issue_stats.id", name="fk_milestone_issue_stats"),
         nullable=True,
+        index=True,
     )
     issue_stats: Mapped["IssueStatsDBModel"] = relationship(back_populates="milestones")
 
@@ -110,6 +151,7 @@ def __ne__(self, other):
         Integer,
         ForeignKey(column="releases.id", name="fk_milestone_release"),
         nullable=True,
+        index=True,
     )
     releases: Mapped["ReleaseDBModel"] = relationship(back_populates="milestones")
     issues: Mapped[List["IssueDBModel"]] = relationship(back_populates="milestone")
@@ -131,19 +173,20 @@ def __ne__(self, other):
     base_type: Mapped[str] = mapped_column(String, default="DeployToken")
     name: Mapped[str] = mapped_column(String, nullable=True)
     username: Mapped[str] = mapped_column(String, nullable=True)
-    expires_at: Mapped[datetime] = mapped_column(DateTime, nullable=True)
+    expires_at: Mapped[datetime] = mapped_column(PortableDateTime, nullable=True)
     token: Mapped[str] = mapped_column(String, nullable=True)
     revoked: Mapped[bool] = mapped_column(Boolean, nullable=True)
     expired: Mapped[bool] = mapped_column(Boolean, nullable=True)
-    scopes = mapped_column(ARRAY(String), nullable=True)
+    scopes = mapped_column(PortableArray(String), nullable=True)
     active: Mapped[bool] = mapped_column(Boolean, nullable=True)
-    last_used_at: Mapped[datetime] = mapped_column(DateTime, nullable=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=True)
+    last_used_at: Mapped[datetime] = mapped_column(PortableDateTime, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(PortableDateTime, nullable=True)
 
     user_id: Mapped[int] = mapped_column(
         Integer,
         ForeignKey(column="users.id", name="fk_deploy_token_user"),
         nullable=True,
+        index=True,
     )
     user: Mapped["UserDBModel"] = relationship(back_populates="deploy_tokens")
 
@@ -162,7 +205,7 @@ def __ne__(self, other):
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     base_type: Mapped[str] = mapped_column(String, default="Rule")
-    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(PortableDateTime, nullable=True)
     commit_committer_check: Mapped[bool] = mapped_column(Boolean, default=False)
     commit_committer_name_check: Mapped[bool] = mapped_column(Boolean, default=False)
     reject_unsigned_commits: Mapped[bool] = mapped_column(Boolean, default=False)
@@ -214,7 +257,10 @@ def __ne__(self, other):
     url: Mapped[str] = mapped_column(String, nullable=True)
 
     assets_id: Mapped[int] = mapped_column(
-        Integer, ForeignKey(column="assets.id", name="fk_sources_assets"), nullable=True
+        Integer,
+        ForeignKey(column="assets.id", name="fk_sources_assets"),
+        nullable=True,
+        index=True,
     )
     assets: Mapped["AssetsDBModel"] = relationship(back_populates="sources")
 
@@ -249,13 +295,17 @@ def __ne__(self, other):
     url: Mapped[str] = mapped_column(String, nullable=True)
     link_type: Mapped[str] = mapped_column(String, nullable=True)
     assets_id: Mapped[int] = mapped_column(
-        Integer, ForeignKey(column="assets.id", name="fk_links_assets"), nullable=True
+        Integer,
+        ForeignKey(column="assets.id", name="fk_links_assets"),
+        nullable=True,
+        index=True,
     )
     assets: Mapped["AssetsDBModel"] = relationship(back_populates="links")
     wiki_attachment_id: Mapped[int] = mapped_column(
         Integer,
         ForeignKey(column="wiki_attachments.id", name="fk_links_wiki_attachments"),
         nullable=True,
+        index=True,
     )
     wiki_attachment: Mapped["WikiAttachmentDBModel"] = relationship(
         back_populates="link"
@@ -332,7 +382,7 @@ def __ne__(self, other):
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     base_type: Mapped[str] = mapped_column(String, default="Token")
     token: Mapped[str] = mapped_column(String, nullable=True)
-    token_expires_at: Mapped[datetime] = mapped_column(DateTime, nullable=True)
+    token_expires_at: Mapped[datetime] = mapped_column(PortableDateTime, nullable=True)
 
 
 # ToDo Model
@@ -354,29 +404,39 @@ def __ne__(self, other):
     target_url: Mapped[str] = mapped_column(String, nullable=True)
     body: Mapped[str] = mapped_column(String, nullable=True)
     state: Mapped[str] = mapped_column(String, nullable=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(PortableDateTime, nullable=True)
 
     project_id: Mapped[int] = mapped_column(
         Integer,
         ForeignKey(column="projects.id", name="fk_todo_project_id"),
         nullable=True,
+        index=True,
     )
     project: Mapped["ProjectDBModel"] = relationship(
         "ProjectDBModel", back_populates="todos"
     )
 
     group_id: Mapped[int] = mapped_column(
-        Integer, ForeignKey(column="groups.id", name="fk_todo_group"), nullable=True
+        Integer,
+        ForeignKey(column="groups.id", name="fk_todo_group"),
+        nullable=True,
+        index=True,
     )
     group: Mapped["GroupDBModel"] = relationship(back_populates="todos")
 
     author_id: Mapped[int] = mapped_column(
-        Integer, ForeignKey(column="users.id", name="fk_todo_author"), nullable=True
+        Integer,
+        ForeignKey(column="users.id", name="fk_todo_author"),
+        nullable=True,
+        index=True,
     )
     author: Mapped["UserDBModel"] = relationship(back_populates="todos")
 
     target_id: Mapped[int] = mapped_column(
-        Integer, ForeignKey(column="issues.id", name="fk_todo_target"), nullable=True
+        Integer,
+        ForeignKey(column="issues.id", name="fk_todo_target"),
+        nullable=True,
+        index=True,
     )
     target: Mapped["IssueDBModel"] = relationship(
         back_populates="todos", remote_side="[IssueDBModel.id]"
@@ -463,6 +523,7 @@ def __ne__(self, other):
         Integer,
         ForeignKey(column="wiki_attachment_links.id", name="fk_wiki_attachment_links"),
         nullable=True,
+        index=True,
     )
     link: Mapped["LinkDBModel"] = relationship(back_populates="wiki_attachment")
 
@@ -486,6 +547,7 @@ def __ne__(self, other):
         Integer,
         ForeignKey(column="configurations.id", name="fk_agent_configurations"),
         nullable=True,
+        index=True,
     )
     config_project: Mapped["ConfigurationDBModel"] = relationship(
         back_populates="agent"
@@ -508,7 +570,7 @@ def __ne__(self, other):
     base_type: Mapped[str] = mapped_column(String, default="Agents")
 
     job_id: Mapped[int] = mapped_column(
-        Integer, ForeignKey("jobs.id", name="fk_agents_jobs"), nullable=True
+        Integer, ForeignKey("jobs.id", name="fk_agents_jobs"), nullable=True, index=True
     )
     job: Mapped["JobDBModel"] = relationship(
         "JobDBModel",
@@ -520,6 +582,7 @@ def __ne__(self, other):
         Integer,
         ForeignKey(column="pipelines.id", name="fk_agents_pipelines"),
         nullable=True,
+        index=True,
     )
     pipeline: Mapped["PipelineDBModel"] = relationship(back_populates="agents")
 
@@ -527,11 +590,15 @@ def __ne__(self, other):
         Integer,
         ForeignKey(column="projects.id", name="fk_agents_projects"),
         nullable=True,
+        index=True,
     )
     project: Mapped["ProjectDBModel"] = relationship(back_populates="agents")
 
     user_id: Mapped[int] = mapped_column(
-        Integer, ForeignKey(column="users.id", name="fk_agents_users"), nullable=True
+        Integer,
+        ForeignKey(column="users.id", name="fk_agents_users"),
+        nullable=True,
+        index=True,
     )
     user: Mapped["UserDBModel"] = relationship(back_populates="agents")
 
@@ -553,8 +620,8 @@ def __ne__(self, other):
     tag_name: Mapped[str] = mapped_column(String, nullable=True)
     description: Mapped[str] = mapped_column(String, nullable=True)
     name: Mapped[str] = mapped_column(String, nullable=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=True)
-    released_at: Mapped[datetime] = mapped_column(DateTime, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(PortableDateTime, nullable=True)
+    released_at: Mapped[datetime] = mapped_column(PortableDateTime, nullable=True)
     commit_path: Mapped[str] = mapped_column(String, nullable=True)
     tag_path: Mapped[str] = mapped_column(String, nullable=True)
     evidence_sha: Mapped[str] = mapped_column(String, nullable=True)
@@ -562,7 +629,10 @@ def __ne__(self, other):
     # Relationships (optional)
 
     author_id: Mapped[int] = mapped_column(
-        Integer, ForeignKey(column="users.id", name="fk_release_author"), nullable=True
+        Integer,
+        ForeignKey(column="users.id", name="fk_release_author"),
+        nullable=True,
+        index=True,
     )
     author: Mapped["UserDBModel"] = relationship(back_populates="releases")
 
@@ -570,6 +640,7 @@ def __ne__(self, other):
         String,
         ForeignKey(column="commits.id", name="fk_release_commits"),
         nullable=True,
+        index=True,
     )
     commit: Mapped["CommitDBModel"] = relationship(back_populates="releases")
     milestones: Mapped[List["MilestoneDBModel"]] = relationship(
@@ -580,11 +651,15 @@ def __ne__(self, other):
         Integer,
         ForeignKey(column="evidences.id", name="fk_release_evidences"),
         nullable=True,
+        index=True,
     )
     evidences: Mapped[List["EvidenceDBModel"]] = relationship(back_populates="releases")
 
     assets_id: Mapped[int] = mapped_column(
-        Integer, ForeignKey(column="assets.id", name="fk_release_assets"), nullable=True
+        Integer,
+        ForeignKey(column="assets.id", name="fk_release_assets"),
+        nullable=True,
+        index=True,
     )
     assets: Mapped[List["AssetsDBModel"]] = relationship(back_populates="releases")
 
@@ -592,6 +667,7 @@ def __ne__(self, other):
         Integer,
         ForeignKey(column="release_links.id", name="fk_release_links"),
         nullable=True,
+        index=True,
     )
     links: Mapped["ReleaseLinksDBModel"] = relationship(back_populates="releases")
 
@@ -618,6 +694,7 @@ def __ne__(self, other):
         Integer,
         ForeignKey(column="users.id", name="fk_access_level_users"),
         nullable=True,
+        index=True,
     )
     user: Mapped["UserDBModel"] = relationship(back_populates="access_levels")
 
@@ -625,6 +702,7 @@ def __ne__(self, other):
         Integer,
         ForeignKey(column="groups.id", name="fk_access_level_groups"),
         nullable=True,
+        index=True,
     )
     group: Mapped["GroupDBModel"] = relationship(
         back_populates="access_levels",
@@ -676,6 +754,7 @@ def __ne__(self, other):
         String,
         ForeignKey(column="commits.id", name="fk_branch_commits"),
         nullable=True,
+        index=True,
     )
     commit: Mapped["CommitDBModel"] = relationship(back_populates="branches")
 
@@ -683,6 +762,7 @@ def __ne__(self, other):
         Integer,
         ForeignKey(column="access_levels.id", name="fk_branch_push_access_levels"),
         nullable=True,
+        index=True,
     )
     push_access_levels: Mapped["AccessLevelDBModel"] = relationship(
         back_populates="branches_push_access",
@@ -693,6 +773,7 @@ def __ne__(self, other):
         Integer,
         ForeignKey(column="access_levels.id", name="fk_branch_merge_access_levels"),
         nullable=True,
+        index=True,
     )
     merge_access_levels: Mapped["AccessLevelDBModel"] = relationship(
         back_populates="branches_merge_access",
@@ -703,6 +784,7 @@ def __ne__(self, other):
         Integer,
         ForeignKey(column="access_levels.id", name="fk_branch_unprotect_access_levels"),
         nullable=True,
+        index=True,
     )
     unprotect_access_levels: Mapped["AccessLevelDBModel"] = relationship(
         back_populates="branches_unprotect_access",
@@ -719,7 +801,9 @@ def __ne__(self, other):
     Column(
         "merge_request_id", Integer, ForeignKey("merge_requests.id"), primary_key=True
     ),
-    Column("label_id", Integer, ForeignKey("labels.id"), primary_key=True),
+    Column(
+        "label_id", Integer, ForeignKey("labels.id"), primary_key=True, index=True
+    ),
 )
 
 
@@ -797,7 +881,9 @@ def __ne__(self, other):
         "ProjectDBModel", back_populates="tag_list"
     )
     runners: Mapped[List["RunnerDBModel"]] = relationship(back_populates="tag_list")
-    job_id: Mapped[int] = mapped_column(ForeignKey("jobs.id"), nullable=True)
+    job_id: Mapped[int] = mapped_column(
+        ForeignKey("jobs.id"), nullable=True, index=True
+    )
     job: Mapped["JobDBModel"] = relationship(back_populates="tag_list")
 
 
@@ -830,6 +916,7 @@ def __ne__(self, other):
         Integer,
         ForeignKey(column="users.id", name="fk_eligible_approvers_rules"),
         nullable=True,
+        index=True,
     )
     eligible_approvers: Mapped["UserDBModel"] = relationship(
         back_populates="approval_rules",
@@ -840,6 +927,7 @@ def __ne__(self, other):
         Integer,
         ForeignKey(column="users.id", name="fk_users_rules"),
         nullable=True,
+        index=True,
     )
     users: Mapped["UserDBModel"] = relationship(
         back_populates="approval_rules", foreign_keys="[ApprovalRuleDBModel.users_id]"
@@ -849,6 +937,7 @@ def __ne__(self, other):
         Integer,
         ForeignKey(column="users.id", name="fk_approval_rule_user_by_id"),
         nullable=True,
+        index=True,
     )
     approved_by: Mapped["UserDBModel"] = relationship(
         back_populates="approval_rules",
@@ -859,6 +948,7 @@ def __ne__(self, other):
         Integer,
         ForeignKey(column="groups.id", name="fk_groups_rules"),
         nullable=True,
+        index=True,
     )
     groups: Mapped["GroupDBModel"] = relationship(back_populates="approval_rules")
 
@@ -866,6 +956,7 @@ def __ne__(self, other):
         Integer,
         ForeignKey(column="branches.id", name="fk_protected_branches_rules"),
         nullable=True,
+        index=True,
     )
     protected_branches: Mapped["BranchDBModel"] = relationship(
         back_populates="approval_rules"
@@ -882,7 +973,9 @@ def __ne__(self, other):
     Column(
         "merge_requests_id", Integer, ForeignKey("merge_requests.id"), primary_key=True
     ),
-    Column("assignees_id", Integer, ForeignKey("users.id"), primary_key=True),
+    Column(
+        "assignees_id", Integer, ForeignKey("users.id"), primary_key=True, index=True
+    ),
 )
 
 merge_request_reviewers = Table(
@@ -891,13 +984,24 @@ def __ne__(self, other):
     Column(
         "merge_requests_id", Integer, ForeignKey("merge_requests.id"), primary_key=True
     ),
-    Column("reviewers_id", Integer, ForeignKey("users.id"), primary_key=True),
+    Column(
+        "reviewers_id", Integer, ForeignKey("users.id"), primary_key=True, index=True
+    ),
 )
 
 
 # MergeRequest Model
 class MergeRequestDBModel(BaseDBModel):
     __tablename__ = "merge_requests"
+    __table_args__ = (
+        Index("ix_merge_requests_project_id_iid", "project_id", "iid"),
+        Index(
+            "ix_merge_requests_project_id_state_updated_at",
+            "project_id",
+            "state",
+            "updated_at",
+        ),
+    )
 
     def __eq__(self, other):
         if isinstance(other, MergeRequestDBModel):
@@ -913,16 +1017,22 @@ def __ne__(self, other):
     title: Mapped[str] = mapped_column(String, nullable=True)
     description: Mapped[str] = mapped_column(String, nullable=True)
     state: Mapped[str] = mapped_column(String, nullable=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=True)
-    updated_at: Mapped[datetime] = mapped_column(DateTime, nullable=True)
-    closed_at: Mapped[datetime] = mapped_column(DateTime, nullable=True)
-    merged_at: Mapped[datetime] = mapped_column(DateTime, nullable=True)
-    latest_build_started_at: Mapped[datetime] = mapped_column(DateTime, nullable=True)
-    latest_build_finished_at: Mapped[datetime] = mapped_column(DateTime, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(PortableDateTime, nullable=True)
+    updated_at: Mapped[datetime] = mapped_column(
+        PortableDateTime, nullable=True, index=True
+    )
+    closed_at: Mapped[datetime] = mapped_column(PortableDateTime, nullable=True)
+    merged_at: Mapped[datetime] = mapped_column(PortableDateTime, nullable=True)
+    latest_build_started_at: Mapped[datetime] = mapped_column(
+        PortableDateTime, nullable=True
+    )
+    latest_build_finished_at: Mapped[datetime] = mapped_column(
+        PortableDateTime, nullable=True
+    )
     first_deployed_to_production_at: Mapped[datetime] = mapped_column(
-        DateTime, nullable=True
+        PortableDateTime, nullable=True
     )
-    prepared_at: Mapped[datetime] = mapped_column(DateTime, nullable=True)
+    prepared_at: Mapped[datetime] = mapped_column(PortableDateTime, nullable=True)
     target_branch: Mapped[str] = mapped_column(String, nullable=True)
     source_branch: Mapped[str] = mapped_column(String, nullable=True)
     upvotes: Mapped[int] = mapped_column(Integer, nullable=True)
@@ -961,7 +1071,7 @@ def __ne__(self, other):
     approval_rules_overwritten: Mapped[bool] = mapped_column(Boolean, nullable=True)
 
     tag_list_id: Mapped[int] = mapped_column(
-        Integer, ForeignKey(column="tags.id"), nullable=True
+        Integer, ForeignKey(column="tags.id"), nullable=True, index=True
     )
     tag_list: Mapped[List["TagDBModel"]] = relationship(back_populates="merge_requests")
 
@@ -972,7 +1082,7 @@ def __ne__(self, other):
     )
 
     references_id: Mapped[int] = mapped_column(
-        Integer, ForeignKey(column="references.id"), nullable=True
+        Integer, ForeignKey(column="references.id"), nullable=True, index=True
     )
 
     references: Mapped["ReferencesDBModel"] = relationship(
@@ -980,28 +1090,31 @@ def __ne__(self, other):
     )
 
     time_stats_id: Mapped[int] = mapped_column(
-        Integer, ForeignKey(column="time_stats.id"), nullable=True
+        Integer, ForeignKey(column="time_stats.id"), nullable=True, index=True
     )
     time_stats: Mapped["TimeStatsDBModel"] = relationship(
         back_populates="merge_requests"
     )
 
     task_completion_status_id: Mapped[int] = mapped_column(
-        Integer, ForeignKey(column="task_completion_status.id"), nullable=True
+        Integer,
+        ForeignKey(column="task_completion_status.id"),
+        nullable=True,
+        index=True,
     )
     task_completion_status: Mapped["TaskCompletionStatusDBModel"] = relationship(
         back_populates="merge_requests"
     )
 
     change_id: Mapped[int] = mapped_column(
-        Integer, ForeignKey(column="diffs.id"), nullable=True
+        Integer, ForeignKey(column="diffs.id"), nullable=True, index=True
     )
     changes: Mapped["DiffDBModel"] = relationship(
         "DiffDBModel", back_populates="merge_requests", foreign_keys=[change_id]
     )
 
     approval_rules_id: Mapped[int] = mapped_column(
-        Integer, ForeignKey(column="approval_rules.id"), nullable=True
+        Integer, ForeignKey(column="approval_rules.id"), nullable=True, index=True
     )
     approval_rules: Mapped["ApprovalRuleDBModel"] = relationship(
         back_populates="merge_requests"
@@ -1043,7 +1156,7 @@ def __ne__(self, other):
         back_populates="merge_requests",
     )
 
-    author_id: Mapped[int] = mapped_column(Integer, nullable=True)
+    author_id: Mapped[int] = mapped_column(Integer, nullable=True, index=True)
     assignee_id: Mapped[int] = mapped_column(Integer, nullable=True)
     assignees_id: Mapped[int] = mapped_column(Integer, nullable=True)
     merged_by_id: Mapped[int] = mapped_column(Integer, nullable=True)
@@ -1160,6 +1273,7 @@ def __ne__(self, other):
         Integer,
         ForeignKey(column="group_accesses.id", name="fk_default_rules_allow_push"),
         nullable=True,
+        index=True,
     )
     allowed_to_push: Mapped["GroupAccessDBModel"] = relationship(
         back_populates="push_branch_protection_defaults",
@@ -1170,6 +1284,7 @@ def __ne__(self, other):
         Integer,
         ForeignKey(column="group_accesses.id", name="fk_default_rules_allow_merge"),
         nullable=True,
+        index=True,
     )
     allowed_to_merge: Mapped["GroupAccessDBModel"] = relationship(
         back_populates="merge_branch_protection_defaults",
@@ -1184,15 +1299,18 @@ def __ne__(self, other):
     "project_groups",
     BaseDBModel.metadata,
     Column("project_id", Integer, ForeignKey("projects.id"), primary_key=True),
-    Column("group_id", Integer, ForeignKey("groups.id"), primary_key=True),
+    Column(
+        "group_id", Integer, ForeignKey("groups.id"), primary_key=True, index=True
+    ),
 )
 
 project_shared_with_groups = Table(
     "project_shared_with_groups",
     BaseDBModel.metadata,
-    Column("project_id", Integer, ForeignKey("projects.id")),
-    Column("group_id", Integer, ForeignKey("groups.id")),
-    Column("id", Integer, primary_key=True, autoincrement=True),
+    Column("project_id", Integer, ForeignKey("projects.id"), primary_key=True),
+    Column(
+        "group_id", Integer, ForeignKey("groups.id"), primary_key=True, index=True
+    ),
 )
 
 
@@ -1241,7 +1359,7 @@ def __ne__(self, other):
     full_name: Mapped[str] = mapped_column(String, nullable=True)
     full_path: Mapped[str] = mapped_column(String, nullable=True)
     file_template_project_id: Mapped[int] = mapped_column(Integer, nullable=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(PortableDateTime, nullable=True)
     wiki_access_level: Mapped[str] = mapped_column(String, nullable=True)
     duo_features_enabled: Mapped[bool] = mapped_column(Boolean, nullable=True)
     lock_duo_features_enabled: Mapped[bool] = mapped_column(Boolean, nullable=True)
@@ -1259,7 +1377,9 @@ def __ne__(self, other):
     extra_shared_runners_minutes_limit: Mapped[int] = mapped_column(
         Integer, nullable=True
     )
-    marked_for_deletion_on: Mapped[datetime] = mapped_column(DateTime, nullable=True)
+    marked_for_deletion_on: Mapped[datetime] = mapped_column(
+        PortableDateTime, nullable=True
+    )
     membership_lock: Mapped[bool] = mapped_column(Boolean, nullable=True)
     ldap_cn: Mapped[str] = mapped_column(String, nullable=True)
     ldap_access: Mapped[str] = mapped_column(String, nullable=True)
@@ -1272,6 +1392,7 @@ def __ne__(self, other):
             name="fk_group_default_branch_protection_defaults",
         ),
         nullable=True,
+        index=True,
     )
     default_branch_protection_defaults: Mapped[
         "DefaultBranchProtectionDefaultsDBModel"
@@ -1283,6 +1404,7 @@ def __ne__(self, other):
         Integer,
         ForeignKey(column="statistics.id", name="fk_group_statistics"),
         nullable=True,
+        index=True,
     )
     statistics: Mapped["StatisticsDBModel"] = relationship(back_populates="groups")
     projects = relationship(
@@ -1296,7 +1418,7 @@ def __ne__(self, other):
     )
 
     parent_id: Mapped[int] = mapped_column(
-        Integer, ForeignKey(column="groups.id"), nullable=True
+        Integer, ForeignKey(column="groups.id"), nullable=True, index=True
     )
     parent: Mapped["GroupDBModel"] = relationship(
         "GroupDBModel",
@@ -1364,14 +1486,17 @@ def __ne__(self, other):
     enable_ssl_verification: Mapped[bool] = mapped_column(Boolean, nullable=False)
     repository_update_events: Mapped[bool] = mapped_column(Boolean, default=False)
     alert_status: Mapped[str] = mapped_column(String, nullable=True)
-    disabled_until: Mapped[datetime] = mapped_column(DateTime, nullable=True)
+    disabled_until: Mapped[datetime] = mapped_column(PortableDateTime, nullable=True)
     url_variables: Mapped[str] = mapped_column(String, nullable=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(PortableDateTime, nullable=False)
     resource_access_token_events: Mapped[bool] = mapped_column(Boolean, nullable=False)
     custom_webhook_template: Mapped[str] = mapped_column(String, nullable=True)
 
     group_id: Mapped[int] = mapped_column(
-        Integer, ForeignKey(column="groups.id", name="fk_webhook_group"), nullable=False
+        Integer,
+        ForeignKey(column="groups.id", name="fk_webhook_group"),
+        nullable=False,
+        index=True,
     )
     group: Mapped["GroupDBModel"] = relationship(back_populates="webhooks")
 
@@ -1398,7 +1523,7 @@ def __ne__(self, other):
     locked: Mapped[bool] = mapped_column(Boolean, nullable=True)
     avatar_url: Mapped[str] = mapped_column(String, nullable=True)
     web_url: Mapped[str] = mapped_column(String, nullable=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(PortableDateTime, nullable=True)
     is_admin: Mapped[bool] = mapped_column(Boolean, nullable=True)
     bio: Mapped[str] = mapped_column(String, nullable=True)
     location: Mapped[str] = mapped_column(String, nullable=True)
@@ -1409,13 +1534,15 @@ def __ne__(self, other):
     website_url: Mapped[str] = mapped_column(String, nullable=True)
     organization: Mapped[str] = mapped_column(String, nullable=True)
     job_title: Mapped[str] = mapped_column(String, nullable=True)
-    last_sign_in_at: Mapped[datetime] = mapped_column(DateTime, nullable=True)
-    confirmed_at: Mapped[datetime] = mapped_column(DateTime, nullable=True)
+    last_sign_in_at: Mapped[datetime] = mapped_column(PortableDateTime, nullable=True)
+    confirmed_at: Mapped[datetime] = mapped_column(PortableDateTime, nullable=True)
     theme_id: Mapped[int] = mapped_column(Integer, nullable=True)
-    last_activity_on: Mapped[datetime] = mapped_column(DateTime, nullable=True)
+    last_activity_on: Mapped[datetime] = mapped_column(PortableDateTime, nullable=True)
     color_scheme_id: Mapped[int] = mapped_column(Integer, nullable=True)
     projects_limit: Mapped[int] = mapped_column(Integer, nullable=True)
-    current_sign_in_at: Mapped[datetime] = mapped_column(DateTime, nullable=True)
+    current_sign_in_at: Mapped[datetime] = mapped_column(
+        PortableDateTime, nullable=True
+    )
     note: Mapped[str] = mapped_column(String, nullable=True)
     can_create_group: Mapped[bool] = mapped_column(Boolean, nullable=True)
     can_create_project: Mapped[bool] = mapped_column(Boolean, nullable=True)
@@ -1424,8 +1551,10 @@ def __ne__(self, other):
     private_profile: Mapped[bool] = mapped_column(Boolean, nullable=True)
     current_sign_in_ip: Mapped[str] = mapped_column(String, nullable=True)
     last_sign_in_ip: Mapped[str] = mapped_column(String, nullable=True)
-    email_reset_offered_at: Mapped[datetime] = mapped_column(DateTime, nullable=True)
-    expires_at: Mapped[datetime] = mapped_column(DateTime, nullable=True)
+    email_reset_offered_at: Mapped[datetime] = mapped_column(
+        PortableDateTime, nullable=True
+    )
+    expires_at: Mapped[datetime] = mapped_column(PortableDateTime, nullable=True)
     access_level: Mapped[int] = mapped_column(Integer, nullable=True)
     approved: Mapped[bool] = mapped_column(Boolean, nullable=True)
     invited: Mapped[bool] = mapped_column(Boolean, nullable=True)
@@ -1443,12 +1572,10 @@ def __ne__(self, other):
     )
     membership_type: Mapped[str] = mapped_column(String, nullable=True)
     removable: Mapped[bool] = mapped_column(Boolean, nullable=True)
-    last_login_at: Mapped[datetime] = mapped_column(DateTime, nullable=True)
+    last_login_at: Mapped[datetime] = mapped_column(PortableDateTime, nullable=True)
 
     created_by_id: Mapped[int] = mapped_column(
-        Integer,
-        ForeignKey("users.id"),
-        nullable=True,
+        Integer, ForeignKey("users.id"), nullable=True, index=True
     )
     created_by: Mapped["UserDBModel"] = relationship(
         "UserDBModel", remote_side=[id], back_populates="created_users"
@@ -1468,6 +1595,7 @@ def __ne__(self, other):
             name="fk_user_namespace_id",
         ),
         nullable=True,
+        index=True,
     )
     namespace: Mapped["NamespaceDBModel"] = relationship(
         "NamespaceDBModel",
@@ -1604,7 +1732,7 @@ def __ne__(self, other):
     web_url: Mapped[str] = mapped_column(String, nullable=True)
     billable_members_count: Mapped[int] = mapped_column(Integer, nullable=True)
     plan: Mapped[str] = mapped_column(String, nullable=True)
-    trial_ends_on: Mapped[datetime] = mapped_column(DateTime, nullable=True)
+    trial_ends_on: Mapped[datetime] = mapped_column(PortableDateTime, nullable=True)
     trial: Mapped[bool] = mapped_column(Boolean, nullable=True)
 
     parent_id: Mapped[int] = mapped_column(
@@ -1642,9 +1770,9 @@ def __ne__(self, other):
     name: Mapped[str] = mapped_column(String, nullable=True)
     name_with_namespace: Mapped[str] = mapped_column(String, nullable=True)
     path: Mapped[str] = mapped_column(String, nullable=True)
-    path_with_namespace: Mapped[str] = mapped_column(String, nullable=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=True)
-    updated_at: Mapped[datetime] = mapped_column(DateTime, nullable=True)
+    path_with_namespace: Mapped[str] = mapped_column(String, nullable=True, index=True)
+    created_at: Mapped[datetime] = mapped_column(PortableDateTime, nullable=True)
+    updated_at: Mapped[datetime] = mapped_column(PortableDateTime, nullable=True)
     default_branch: Mapped[str] = mapped_column(String, nullable=True)
     topics: Mapped[dict] = mapped_column(JSON, nullable=True)
     ssh_url_to_repo: Mapped[str] = mapped_column(String, nullable=True)
@@ -1654,7 +1782,9 @@ def __ne__(self, other):
     avatar_url: Mapped[str] = mapped_column(String, nullable=True)
     forks_count: Mapped[int] = mapped_column(Integer, nullable=True)
     star_count: Mapped[int] = mapped_column(Integer, nullable=True)
-    last_activity_at: Mapped[datetime] = mapped_column(DateTime, nullable=True)
+    last_activity_at: Mapped[datetime] = mapped_column(
+        PortableDateTime, nullable=True, index=True
+    )
     container_registry_image_prefix: Mapped[str] = mapped_column(String, nullable=True)
     packages_enabled: Mapped[bool] = mapped_column(Boolean, nullable=True)
     empty_repo: Mapped[bool] = mapped_column(Boolean, nullable=True)
@@ -1801,12 +1931,18 @@ def __ne__(self, other):
     runners_token: Mapped[str] = mapped_column(String, nullable=True)
     repository_storage: Mapped[str] = mapped_column(String, nullable=True)
     service_desk_address: Mapped[str] = mapped_column(String, nullable=True)
-    marked_for_deletion_at: Mapped[datetime] = mapped_column(DateTime, nullable=True)
-    marked_for_deletion_on: Mapped[datetime] = mapped_column(DateTime, nullable=True)
+    marked_for_deletion_at: Mapped[datetime] = mapped_column(
+        PortableDateTime, nullable=True
+    )
+    marked_for_deletion_on: Mapped[datetime] = mapped_column(
+        PortableDateTime, nullable=True
+    )
     operations_access_level: Mapped[str] = mapped_column(String, nullable=True)
     ci_dockerfile: Mapped[str] = mapped_column(String, nullable=True)
     public: Mapped[bool] = mapped_column(Boolean, nullable=True)
-    ci_id_token_sub_claim_components = mapped_column(ARRAY(String), nullable=True)
+    ci_id_token_sub_claim_components = mapped_column(
+        PortableArray(String), nullable=True
+    )
     ci_pipeline_variables_minimum_override_role: Mapped[str] = mapped_column(
         String, nullable=True
     )
@@ -1815,7 +1951,7 @@ def __ne__(self, other):
     )
 
     tag_list_id: Mapped[int] = mapped_column(
-        Integer, ForeignKey(column="tags.id"), nullable=True
+        Integer, ForeignKey(column="tags.id"), nullable=True, index=True
     )
     # This may require processeing in the response model like the other tag lists
     tag_list: Mapped[List["TagDBModel"]] = relationship(back_populates="projects")
@@ -1849,23 +1985,23 @@ def __ne__(self, other):
         )
     )
     statistics_id: Mapped[int] = mapped_column(
-        Integer, ForeignKey(column="statistics.id"), nullable=True
+        Integer, ForeignKey(column="statistics.id"), nullable=True, index=True
     )
     statistics: Mapped["StatisticsDBModel"] = relationship(back_populates="projects")
     links_id: Mapped[int] = mapped_column(
-        Integer, ForeignKey(column="links.id"), nullable=True
+        Integer, ForeignKey(column="links.id"), nullable=True, index=True
     )
     links: Mapped["LinkDBModel"] = relationship(
         back_populates="projects_links", foreign_keys=[links_id]
     )
     additional_links_id: Mapped[int] = mapped_column(
-        Integer, ForeignKey(column="links.id"), nullable=True
+        Integer, ForeignKey(column="links.id"), nullable=True, index=True
     )
     additional_links: Mapped["LinkDBModel"] = relationship(
         back_populates="projects_additional_links", foreign_keys=[additional_links_id]
     )
     permissions_id: Mapped[int] = mapped_column(
-        Integer, ForeignKey(column="permissions.id"), nullable=True
+        Integer, ForeignKey(column="permissions.id"), nullable=True, index=True
     )
     permissions: Mapped["PermissionsDBModel"] = relationship(back_populates="projects")
 
@@ -1934,7 +2070,7 @@ def __ne__(self, other):
     name: Mapped[str] = mapped_column(String, nullable=True)
     online: Mapped[bool] = mapped_column(Boolean, nullable=True)
     status: Mapped[str] = mapped_column(String, nullable=True)
-    contacted_at: Mapped[datetime] = mapped_column(DateTime, nullable=True)
+    contacted_at: Mapped[datetime] = mapped_column(PortableDateTime, nullable=True)
     architecture: Mapped[str] = mapped_column(String, nullable=True)
     platform: Mapped[str] = mapped_column(String, nullable=True)
     revision: Mapped[str] = mapped_column(String, nullable=True)
@@ -1944,7 +2080,7 @@ def __ne__(self, other):
     maintenance_note: Mapped[str] = mapped_column(String, nullable=True)
 
     tag_list_id: Mapped[int] = mapped_column(
-        Integer, ForeignKey(column="tags.id"), nullable=True
+        Integer, ForeignKey(column="tags.id"), nullable=True, index=True
     )
 
     tag_list: Mapped[List["TagDBModel"]] = relationship(back_populates="runners")
@@ -1953,6 +2089,7 @@ def __ne__(self, other):
         Integer,
         ForeignKey(column="projects.id", name="fk_runner_project"),
         nullable=True,
+        index=True,
     )
     projects: Mapped[List["ProjectDBModel"]] = relationship(back_populates="runners")
     jobs: Mapped[List["JobDBModel"]] = relationship(back_populates="runner")
@@ -1961,6 +2098,11 @@ def __ne__(self, other):
 # Job Model
 class JobDBModel(BaseDBModel):
     __tablename__ = "jobs"
+    __table_args__ = (
+        Index(
+            "ix_jobs_project_id_status_created_at", "project_id", "status", "created_at"
+        ),
+    )
 
     def __eq__(self, other):
         if isinstance(other, JobDBModel):
@@ -1975,30 +2117,37 @@ def __ne__(self, other):
     coverage: Mapped[float] = mapped_column(Float, nullable=True)
     archived: Mapped[bool] = mapped_column(Boolean, nullable=True)
     allow_failure: Mapped[bool] = mapped_column(Boolean, nullable=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=True)
-    started_at: Mapped[datetime] = mapped_column(DateTime, nullable=True)
-    finished_at: Mapped[datetime] = mapped_column(DateTime, nullable=True)
-    erased_at: Mapped[datetime] = mapped_column(DateTime, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(PortableDateTime, nullable=True)
+    started_at: Mapped[datetime] = mapped_column(PortableDateTime, nullable=True)
+    finished_at: Mapped[datetime] = mapped_column(PortableDateTime, nullable=True)
+    erased_at: Mapped[datetime] = mapped_column(PortableDateTime, nullable=True)
     duration: Mapped[float] = mapped_column(Float, nullable=True)
     queued_duration: Mapped[float] = mapped_column(Float, nullable=True)
-    artifacts_expire_at: Mapped[datetime] = mapped_column(DateTime, nullable=True)
+    artifacts_expire_at: Mapped[datetime] = mapped_column(
+        PortableDateTime, nullable=True
+    )
     name: Mapped[str] = mapped_column(String, nullable=True)
     ref: Mapped[str] = mapped_column(String, nullable=True)
     stage: Mapped[str] = mapped_column(String, nullable=True)
-    status: Mapped[str] = mapped_column(String, nullable=True)
+    status: Mapped[str] = mapped_column(String, nullable=True, index=True)
     failure_reason: Mapped[str] = mapped_column(String, nullable=True)
     tag: Mapped[bool] = mapped_column(Boolean, nullable=True)
     web_url: Mapped[str] = mapped_column(String, nullable=True)
 
     tag_list: Mapped[List["TagDBModel"]] = relationship(back_populates="job")
 
-    commit_id: Mapped[str] = mapped_column(ForeignKey("commits.id"), nullable=True)
+    commit_id: Mapped[str] = mapped_column(
+        ForeignKey("commits.id"), nullable=True, index=True
+    )
     commit: Mapped["CommitDBModel"] = relationship(
         "CommitDBModel", back_populates="jobs"
     )
 
     runner_id = mapped_column(
-        Integer, ForeignKey("runners.id", name="fk_jobs_runners"), nullable=True
+        Integer,
+        ForeignKey("runners.id", name="fk_jobs_runners"),
+        nullable=True,
+        index=True,
     )
     runner: Mapped["RunnerDBModel"] = relationship(
         back_populates="jobs",
@@ -2006,7 +2155,7 @@ def __ne__(self, other):
     )
 
     runner_manager_id: Mapped[int] = mapped_column(
-        ForeignKey(column="runner_managers.id"), nullable=True
+        ForeignKey(column="runner_managers.id"), nullable=True, index=True
     )
     runner_manager: Mapped["RunnerManagerDBModel"] = relationship(back_populates="jobs")
 
@@ -2019,21 +2168,23 @@ def __ne__(self, other):
         primaryjoin="ProjectConfigDBModel.primary_id == foreign(JobDBModel.project_id)",
     )
 
-    user_id: Mapped[int] = mapped_column(ForeignKey(column="users.id"), nullable=True)
+    user_id: Mapped[int] = mapped_column(
+        ForeignKey(column="users.id"), nullable=True, index=True
+    )
     user: Mapped["UserDBModel"] = relationship(
         back_populates="jobs",
         primaryjoin="UserDBModel.id == foreign(JobDBModel.user_id)",
     )
 
     pipeline_id: Mapped[int] = mapped_column(
-        ForeignKey(column="pipelines.id"), nullable=True
+        ForeignKey(column="pipelines.id"), nullable=True, index=True
     )
     head_pipeline_id: Mapped[int] = mapped_column(
-        ForeignKey(column="pipelines.id"), nullable=True
+        ForeignKey(column="pipelines.id"), nullable=True, index=True
     )
 
     downstream_pipeline_id: Mapped[int] = mapped_column(
-        ForeignKey(column="pipelines.id"), nullable=True
+        ForeignKey(column="pipelines.id"), nullable=True, index=True
     )
     pipeline: Mapped["PipelineDBModel"] = relationship(
         "PipelineDBModel",
@@ -2052,7 +2203,7 @@ def __ne__(self, other):
     )
 
     artifacts_file_id: Mapped[int] = mapped_column(
-        ForeignKey(column="artifacts_files.id"), nullable=True
+        ForeignKey(column="artifacts_files.id"), nullable=True, index=True
     )
     artifacts_file: Mapped["ArtifactsFileDBModel"] = relationship(back_populates="jobs")
 
@@ -2063,6 +2214,15 @@ def __ne__(self, other):
 # Pipeline Model
 class PipelineDBModel(BaseDBModel):
     __tablename__ = "pipelines"
+    __table_args__ = (
+        Index(
+            "ix_pipelines_project_id_status_updated_at",
+            "project_id",
+            "status",
+            "updated_at",
+        ),
+        Index("ix_pipelines_project_id_ref", "project_id", "ref"),
+    )
 
     def __eq__(self, other):
         if isinstance(other, PipelineDBModel):
@@ -2076,7 +2236,7 @@ def __ne__(self, other):
     base_type: Mapped[str] = mapped_column(String, default="Pipeline")
     iid: Mapped[int] = mapped_column(Integer, nullable=True)
     ref: Mapped[str] = mapped_column(String, nullable=True)
-    sha: Mapped[str] = mapped_column(String, nullable=True)
+    sha: Mapped[str] = mapped_column(String, nullable=True, index=True)
     status: Mapped[str] = mapped_column(String, nullable=True)
     web_url: Mapped[str] = mapped_column(String, nullable=True)
     project_id: Mapped[int] = mapped_column(
@@ -2086,11 +2246,13 @@ def __ne__(self, other):
     before_sha: Mapped[str] = mapped_column(String, nullable=True)
     tag: Mapped[bool] = mapped_column(Boolean, nullable=True)
     yaml_errors: Mapped[str] = mapped_column(String, nullable=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=True)
-    updated_at: Mapped[datetime] = mapped_column(DateTime, nullable=True)
-    started_at: Mapped[datetime] = mapped_column(DateTime, nullable=True)
-    finished_at: Mapped[datetime] = mapped_column(DateTime, nullable=True)
-    committed_at: Mapped[datetime] = mapped_column(DateTime, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(PortableDateTime, nullable=True)
+    updated_at: Mapped[datetime] = mapped_column(
+        PortableDateTime, nullable=True, index=True
+    )
+    started_at: Mapped[datetime] = mapped_column(PortableDateTime, nullable=True)
+    finished_at: Mapped[datetime] = mapped_column(PortableDateTime, nullable=True)
+    committed_at: Mapped[datetime] = mapped_column(PortableDateTime, nullable=True)
     duration: Mapped[float] = mapped_column(Float, nullable=True)
     queued_duration: Mapped[float] = mapped_column(Float, nullable=True)
     coverage: Mapped[str] = mapped_column(String, nullable=True)
@@ -2098,7 +2260,10 @@ def __ne__(self, other):
     source: Mapped[str] = mapped_column(String, nullable=True)
 
     user_id: Mapped[int] = mapped_column(
-        Integer, ForeignKey(column="users.id", name="fk_pipeline_user"), nullable=True
+        Integer,
+        ForeignKey(column="users.id", name="fk_pipeline_user"),
+        nullable=True,
+        index=True,
     )
     user: Mapped["UserDBModel"] = relationship(back_populates="pipelines")
 
@@ -2106,6 +2271,7 @@ def __ne__(self, other):
         Integer,
         ForeignKey(column="detailed_status.id", name="fk_pipeline_detailed_status"),
         nullable=True,
+        index=True,
     )
     detailed_status: Mapped["DetailedStatusDBModel"] = relationship(
         back_populates="pipelines"
@@ -2156,12 +2322,13 @@ class PackageVersionDBModel(BaseDBModel):
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     base_type: Mapped[str] = mapped_column(String, default="PackageVersion")
     version: Mapped[str] = mapped_column(String, nullable=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(PortableDateTime, nullable=True)
 
     pipeline_id: Mapped[int] = mapped_column(
         Integer,
         ForeignKey(column="pipelines.id", name="fk_package_version_pipeline"),
         nullable=True,
+        index=True,
     )
     pipeline: Mapped["PipelineDBModel"] = relationship(
         back_populates="package_versions"
@@ -2170,6 +2337,7 @@ class PackageVersionDBModel(BaseDBModel):
         Integer,
         ForeignKey(column="packages.id", name="fk_package_version_package"),
         nullable=True,
+        index=True,
     )
     package: Mapped["PackageDBModel"] = relationship(
         back_populates="package_versions",  # Correct relationship direction
@@ -2186,8 +2354,10 @@ class PackageDBModel(BaseDBModel):
     name: Mapped[str] = mapped_column(String, nullable=True)
     version: Mapped[str] = mapped_column(String, nullable=True)
     package_type: Mapped[str] = mapped_column(String, nullable=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=True)
-    last_downloaded_at: Mapped[datetime] = mapped_column(DateTime, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(PortableDateTime, nullable=True)
+    last_downloaded_at: Mapped[datetime] = mapped_column(
+        PortableDateTime, nullable=True
+    )
     conan_package_name: Mapped[str] = mapped_column(String, nullable=True)
     size: Mapped[int] = mapped_column(Integer, nullable=True)
     file_name: Mapped[str] = mapped_column(String, nullable=True)
@@ -2199,6 +2369,7 @@ class PackageDBModel(BaseDBModel):
         Integer,
         ForeignKey(column="package_links.id", name="fk_package_links"),
         nullable=True,
+        index=True,
     )
     links: Mapped["PackageLinkDBModel"] = relationship(
         back_populates="packages", foreign_keys=[links_id]
@@ -2208,6 +2379,7 @@ class PackageDBModel(BaseDBModel):
         Integer,
         ForeignKey(column="pipelines.id", name="fk_package_pipeline"),
         nullable=True,
+        index=True,
     )
     pipelines: Mapped[List["PipelineDBModel"]] = relationship(back_populates="packages")
     package_versions: Mapped[List["PackageVersionDBModel"]] = relationship(
@@ -2261,6 +2433,7 @@ class CommitSignatureDBModel(BaseDBModel):
         String,
         ForeignKey(column="commits.id", name="fk_commit_signature_commit"),
         nullable=True,
+        index=True,
     )
     commit: Mapped["CommitDBModel"] = relationship(
         back_populates="commit_signatures", foreign_keys=[commit_id]
@@ -2277,8 +2450,8 @@ class CommentDBModel(BaseDBModel):
     body: Mapped[str] = mapped_column(String, nullable=True)
     note: Mapped[str] = mapped_column(String, nullable=True)
     attachment: Mapped[dict] = mapped_column(JSON, nullable=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=True)
-    updated_at: Mapped[datetime] = mapped_column(DateTime, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(PortableDateTime, nullable=True)
+    updated_at: Mapped[datetime] = mapped_column(PortableDateTime, nullable=True)
     system: Mapped[bool] = mapped_column(Boolean, nullable=True)
     noteable_id: Mapped[int] = mapped_column(Integer, nullable=True)
     noteable_type: Mapped[str] = mapped_column(String, nullable=True)
@@ -2291,7 +2464,10 @@ class CommentDBModel(BaseDBModel):
     line: Mapped[int] = mapped_column(Integer, nullable=True)
 
     author_id: Mapped[int] = mapped_column(
-        Integer, ForeignKey(column="users.id", name="fk_comment_author"), nullable=True
+        Integer,
+        ForeignKey(column="users.id", name="fk_comment_author"),
+        nullable=True,
+        index=True,
     )
     author: Mapped["UserDBModel"] = relationship(back_populates="comments")
 
@@ -2299,6 +2475,7 @@ class CommentDBModel(BaseDBModel):
         String,
         ForeignKey(column="commits.id", name="fk_commit_notes"),
         nullable=True,
+        index=True,
     )
     commit: Mapped["CommitDBModel"] = relationship(
         back_populates="notes", foreign_keys=[commit_id]
@@ -2311,7 +2488,9 @@ class ParentIDDBModel(BaseDBModel):
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     base_type: Mapped[str] = mapped_column(String, default="ParentID")
     parent_id: Mapped[str] = mapped_column(String, nullable=False)
-    commit_id: Mapped[str] = mapped_column(ForeignKey("commits.id"), nullable=True)
+    commit_id: Mapped[str] = mapped_column(
+        ForeignKey("commits.id"), nullable=True, index=True
+    )
     commit: Mapped["CommitDBModel"] = relationship(back_populates="parent_ids")
 
 
@@ -2330,18 +2509,18 @@ def __ne__(self, other):
     id: Mapped[str] = mapped_column(String, primary_key=True)
     base_type: Mapped[str] = mapped_column(String, default="Commit")
     short_id: Mapped[str] = mapped_column(String, nullable=True)
-    started_at: Mapped[datetime] = mapped_column(DateTime, nullable=True)
-    finished_at: Mapped[datetime] = mapped_column(DateTime, nullable=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=True)
+    started_at: Mapped[datetime] = mapped_column(PortableDateTime, nullable=True)
+    finished_at: Mapped[datetime] = mapped_column(PortableDateTime, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(PortableDateTime, nullable=True)
     title: Mapped[str] = mapped_column(String, nullable=True)
     description: Mapped[str] = mapped_column(String, nullable=True)
     message: Mapped[str] = mapped_column(String, nullable=True)
     author_name: Mapped[str] = mapped_column(String, nullable=True)
     author_email: Mapped[str] = mapped_column(String, nullable=True)
-    authored_date = mapped_column(DateTime, nullable=True)
+    authored_date = mapped_column(PortableDateTime, nullable=True)
     committer_name: Mapped[str] = mapped_column(String, nullable=True)
     committer_email: Mapped[str] = mapped_column(String, nullable=True)
-    committed_date = mapped_column(DateTime, nullable=True)
+    committed_date = mapped_column(PortableDateTime, nullable=True)
     name: Mapped[str] = mapped_column(String, nullable=True)
     web_url: Mapped[str] = mapped_column(String, nullable=True)
     trailers: Mapped[dict] = mapped_column(JSON, nullable=True)
@@ -2358,7 +2537,10 @@ def __ne__(self, other):
     coverage: Mapped[float] = mapped_column(Float, nullable=True)
 
     author_id: Mapped[int] = mapped_column(
-        Integer, ForeignKey(column="users.id", name="fk_commit_author"), nullable=True
+        Integer,
+        ForeignKey(column="users.id", name="fk_commit_author"),
+        nullable=True,
+        index=True,
     )
     author: Mapped["UserDBModel"] = relationship(back_populates="commits")
 
@@ -2366,6 +2548,7 @@ def __ne__(self, other):
         Integer,
         ForeignKey(column="commit_stats.id", name="fk_commit_stats"),
         nullable=True,
+        index=True,
     )
     stats: Mapped["CommitStatsDBModel"] = relationship(back_populates="commit")
 
@@ -2373,6 +2556,7 @@ def __ne__(self, other):
         Integer,
         ForeignKey(column="pipelines.id", name="fk_commit_last_pipeline"),
         nullable=True,
+        index=True,
     )
     last_pipeline: Mapped["PipelineDBModel"] = relationship(back_populates="commit")
     commit_signatures: Mapped[List["CommitSignatureDBModel"]] = relationship(
@@ -2400,14 +2584,20 @@ class MembershipDBModel(BaseDBModel):
     source_id: Mapped[int] = mapped_column(Integer, nullable=True)
     source_full_name: Mapped[str] = mapped_column(String, nullable=True)
     source_members_url: Mapped[str] = mapped_column(String, nullable=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=True)
-    expires_at: Mapped[datetime] = mapped_column(DateTime, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(PortableDateTime, nullable=True)
+    expires_at: Mapped[datetime] = mapped_column(PortableDateTime, nullable=True)
     access_level: Mapped[dict] = mapped_column(JSON, nullable=True)
 
 
 # Issue Model
 class IssueDBModel(BaseDBModel):
     __tablename__ = "issues"
+    __table_args__ = (
+        Index("ix_issues_project_id_iid", "project_id", "iid"),
+        Index(
+            "ix_issues_project_id_state_updated_at", "project_id", "state", "updated_at"
+        ),
+    )
 
     def __eq__(self, other):
         if isinstance(other, IssueDBModel):
@@ -2422,14 +2612,16 @@ def __ne__(self, other):
     state: Mapped[str] = mapped_column(String, nullable=True)
     description: Mapped[str] = mapped_column(String, nullable=True)
     type: Mapped[str] = mapped_column(String, nullable=True)
-    updated_at: Mapped[datetime] = mapped_column(DateTime, nullable=True)
-    closed_at: Mapped[datetime] = mapped_column(DateTime, nullable=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=True)
+    updated_at: Mapped[datetime] = mapped_column(
+        PortableDateTime, nullable=True, index=True
+    )
+    closed_at: Mapped[datetime] = mapped_column(PortableDateTime, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(PortableDateTime, nullable=True)
     changes_count: Mapped[str] = mapped_column(String, nullable=True)
     title: Mapped[str] = mapped_column(String, nullable=True)
     moved_to_id: Mapped[int] = mapped_column(Integer, nullable=True)
     iid: Mapped[int] = mapped_column(Integer, nullable=True)
-    labels = mapped_column(ARRAY(String), nullable=True)
+    labels = mapped_column(PortableArray(String), nullable=True)
     upvotes: Mapped[int] = mapped_column(Integer, nullable=True)
     downvotes: Mapped[int] = mapped_column(Integer, nullable=True)
     merge_requests_count: Mapped[int] = mapped_column(Integer, nullable=True)
@@ -2452,7 +2644,9 @@ def __ne__(self, other):
     blocking_issues_count: Mapped[int] = mapped_column(Integer, nullable=True)
 
     project_id: Mapped[int] = mapped_column(
-        Integer, ForeignKey(column="projects.id", name="fk_project"), nullable=True
+        Integer,
+        ForeignKey(column="projects.id", name="fk_project"),
+        nullable=True,
     )
     project: Mapped["ProjectDBModel"] = relationship(back_populates="issues")
 
@@ -2460,26 +2654,37 @@ def __ne__(self, other):
         Integer,
         ForeignKey(column="milestones.id", name="fk_issue_milestone"),
         nullable=True,
+        index=True,
     )
     milestone: Mapped["MilestoneDBModel"] = relationship(
         back_populates="issues", foreign_keys=[milestone_id]
     )
     author_id: Mapped[int] = mapped_column(
-        Integer, ForeignKey(column="users.id"), nullable=True, name="fk_issue_author"
+        Integer,
+        ForeignKey(column="users.id"),
+        nullable=True,
+        name="fk_issue_author",
+        index=True,
     )
     author: Mapped["UserDBModel"] = relationship(
         back_populates="issues", foreign_keys=[author_id]
     )
 
     assignee_id: Mapped[int] = mapped_column(
-        Integer, ForeignKey(column="users.id", name="fk_issue_assignee"), nullable=True
+        Integer,
+        ForeignKey(column="users.id", name="fk_issue_assignee"),
+        nullable=True,
+        index=True,
     )
     assignee: Mapped["UserDBModel"] = relationship(
         back_populates="issues", foreign_keys=[assignee_id]
     )
 
     closed_by_id: Mapped[int] = mapped_column(
-        Integer, ForeignKey(column="users.id", name="fk_issue_closed_by"), nullable=True
+        Integer,
+        ForeignKey(column="users.id", name="fk_issue_closed_by"),
+        nullable=True,
+        index=True,
     )
     closed_by: Mapped["UserDBModel"] = relationship(
         back_populates="issues", foreign_keys=[closed_by_id]
@@ -2488,12 +2693,16 @@ def __ne__(self, other):
         Integer,
         ForeignKey(column="iterations.id", name="fk_issue_iteration"),
         nullable=True,
+        index=True,
     )
     iteration: Mapped["IterationDBModel"] = relationship(
         back_populates="issues", foreign_keys="[IssueDBModel.iteration_id]"
     )
     epic_id: Mapped[int] = mapped_column(
-        Integer, ForeignKey(column="epics.id", name="fk_issue_epic"), nullable=True
+        Integer,
+        ForeignKey(column="epics.id", name="fk_issue_epic"),
+        nullable=True,
+        index=True,
     )
     epic: Mapped["EpicDBModel"] = relationship(back_populates="issues")
 
@@ -2554,7 +2763,9 @@ class ArtifactDBModel(BaseDBModel):
     size: Mapped[int] = mapped_column(Integer, nullable=True)
     filename: Mapped[str] = mapped_column(String, nullable=True)
     file_format: Mapped[str] = mapped_column(String, nullable=True)
-    job_id: Mapped[int] = mapped_column(ForeignKey("jobs.id"), nullable=True)
+    job_id: Mapped[int] = mapped_column(
+        ForeignKey("jobs.id"), nullable=True, index=True
+    )
     job: Mapped["JobDBModel"] = relationship(back_populates="artifacts")
 
 
@@ -2596,8 +2807,8 @@ def __ne__(self, other):
     revision: Mapped[str] = mapped_column(String, nullable=True)
     platform: Mapped[str] = mapped_column(String, nullable=True)
     architecture: Mapped[str] = mapped_column(String, nullable=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=True)
-    contacted_at: Mapped[datetime] = mapped_column(DateTime, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(PortableDateTime, nullable=True)
+    contacted_at: Mapped[datetime] = mapped_column(PortableDateTime, nullable=True)
     ip_address: Mapped[str] = mapped_column(String, nullable=True)
     status: Mapped[str] = mapped_column(String, nullable=True)
     jobs: Mapped[List["JobDBModel"]] = relationship(back_populates="runner_manager")
@@ -2650,8 +2861,8 @@ def __ne__(self, other):
     title: Mapped[str] = mapped_column(String, nullable=True)
     description: Mapped[str] = mapped_column(String, nullable=True)
     state: Mapped[int] = mapped_column(Integer, nullable=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=True)
-    updated_at: Mapped[datetime] = mapped_column(DateTime, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(PortableDateTime, nullable=True)
+    updated_at: Mapped[datetime] = mapped_column(PortableDateTime, nullable=True)
     start_date: Mapped[str] = mapped_column(String, nullable=True)
     due_date: Mapped[str] = mapped_column(String, nullable=True)
     web_url: Mapped[str] = mapped_column(String, nullable=True)
@@ -2660,6 +2871,7 @@ def __ne__(self, other):
         Integer,
         ForeignKey(column="groups.id", name="fk_iteration_group"),
         nullable=True,
+        index=True,
     )
     group: Mapped["GroupDBModel"] = relationship(back_populates="iterations")
 
@@ -2687,7 +2899,10 @@ def __ne__(self, other):
     extern_uid: Mapped[str] = mapped_column(String, nullable=True)
 
     user_id: Mapped[int] = mapped_column(
-        Integer, ForeignKey(column="users.id", name="fk_identity_user"), nullable=True
+        Integer,
+        ForeignKey(column="users.id", name="fk_identity_user"),
+        nullable=True,
+        index=True,
     )
     user: Mapped["UserDBModel"] = relationship(back_populates="identities")
 
@@ -2710,7 +2925,9 @@ def __ne__(self, other):
     provider: Mapped[str] = mapped_column(String, nullable=True)
     saml_provider_id: Mapped[int] = mapped_column(Integer, nullable=True)
 
-    user_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id"), nullable=True)
+    user_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("users.id"), nullable=True, index=True
+    )
 
     # Define the many-to-one relationship
     user: Mapped["UserDBModel"] = relationship(
@@ -2738,10 +2955,10 @@ def __ne__(self, other):
     older_than: Mapped[str] = mapped_column(String, nullable=True)
     name_regex: Mapped[str] = mapped_column(String, nullable=True)
     name_regex_keep: Mapped[str] = mapped_column(String, nullable=True)
-    next_run_at: Mapped[datetime] = mapped_column(DateTime, nullable=True)
+    next_run_at: Mapped[datetime] = mapped_column(PortableDateTime, nullable=True)
 
     project_id: Mapped[int] = mapped_column(
-        Integer, ForeignKey("projects.id"), nullable=True
+        Integer, ForeignKey("projects.id"), nullable=True, index=True
     )
 
     project: Mapped["ProjectDBModel"] = relationship(
@@ -2819,7 +3036,7 @@ def __ne__(self, other):
     head_commit_sha: Mapped[str] = mapped_column(String, nullable=True)
     base_commit_sha: Mapped[str] = mapped_column(String, nullable=True)
     start_commit_sha: Mapped[str] = mapped_column(String, nullable=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(PortableDateTime, nullable=True)
     state: Mapped[str] = mapped_column(String, nullable=True)
     real_size: Mapped[str] = mapped_column(String, nullable=True)
     patch_id_sha: Mapped[str] = mapped_column(String, nullable=True)
@@ -2869,6 +3086,7 @@ def __ne__(self, other):
         Integer,
         ForeignKey(column="users.id", name="fk_merge_approvals_approvers"),
         nullable=True,
+        index=True,
     )
     approvers: Mapped[List["UserDBModel"]] = relationship(
         back_populates="merge_request_approvers"
@@ -2878,6 +3096,7 @@ def __ne__(self, other):
         Integer,
         ForeignKey(column="groups.id", name="fk_merge_approvals_approver_groups"),
         nullable=True,
+        index=True,
     )
     approver_groups: Mapped["GroupDBModel"] = relationship(
         back_populates="merge_request_approver_groups",
@@ -2939,6 +3158,7 @@ def __ne__(self, other):
         Integer,
         ForeignKey(column="test_report_totals.id", name="fk_test_report_total"),
         nullable=True,
+        index=True,
     )
     total: Mapped["TestReportTotalDBModel"] = relationship(
         back_populates="test_reports"
@@ -2948,6 +3168,7 @@ def __ne__(self, other):
         Integer,
         ForeignKey("test_suites.id", name="fk_test_report_test_suite"),
         nullable=True,
+        index=True,
     )
     test_suites: Mapped[List["TestSuiteDBModel"]] = relationship(
         back_populates="test_reports"
@@ -2973,7 +3194,7 @@ def __ne__(self, other):
     name_with_namespace: Mapped[str] = mapped_column(String, nullable=True)
     path: Mapped[str] = mapped_column(String, nullable=True)
     path_with_namespace: Mapped[str] = mapped_column(String, nullable=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(PortableDateTime, nullable=True)
     ci_job_token_scope_enabled: Mapped[bool] = mapped_column(Boolean, nullable=True)
     jobs = relationship("JobDBModel", back_populates="project")
 
@@ -2997,7 +3218,10 @@ def __ne__(self, other):
     url: Mapped[str] = mapped_column(String, nullable=True)
 
     group_id: Mapped[int] = mapped_column(
-        Integer, ForeignKey(column="groups.id", name="fk_epic_group"), nullable=True
+        Integer,
+        ForeignKey(column="groups.id", name="fk_epic_group"),
+        nullable=True,
+        index=True,
     )
     groups: Mapped[List["GroupDBModel"]] = relationship(back_populates="epics")
     issues: Mapped[List["IssueDBModel"]] = relationship(
@@ -3027,7 +3251,7 @@ def __ne__(self, other):
     system_output: Mapped[str] = mapped_column(String, nullable=True)
     stack_trace: Mapped[str] = mapped_column(String, nullable=True)
     test_suite_id: Mapped[int] = mapped_column(
-        Integer, ForeignKey("test_suites.id"), nullable=True
+        Integer, ForeignKey("test_suites.id"), nullable=True, index=True
     )
 
     test_suites: Mapped["TestSuiteDBModel"] = relationship(
@@ -3094,3 +3318,24 @@ def __ne__(self, other):
     test_reports: Mapped[List["TestReportDBModel"]] = relationship(
         back_populates="total"
     )
+
+
+# SyncState Model
+class SyncStateDBModel(BaseDBModel):
+    __tablename__ = "sync_state"
+
+    resource: Mapped[str] = mapped_column(String, primary_key=True)
+    watermark: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=True)
+    synced_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=True)
+    rows: Mapped[int] = mapped_column(Integer, nullable=True)
+
+
+# SchemaState Model
+class SchemaStateDBModel(BaseDBModel):
+    __tablename__ = "schema_state"
+
+    name: Mapped[str] = mapped_column(String, primary_key=True)
+    fingerprint: Mapped[str] = mapped_column(String, nullable=True)
+    bootstrapped_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
@@ -754,6 +754,10 @@ class JobModel(BaseModel):
     - scope (List[str]): List of job scopes.
     - per_page (int): Number of items to display per page (default is 100).
     - page (int): Page number for pagination (default is 1).
+    - max_workers (int): Number of pages to fetch concurrently.
+    - pagination (str): Pagination method, "offset" or "keyset".
+    - order_by (str): Order jobs by "id" (required for keyset pagination).
+    - sort (str): Sort order, "asc" or "desc".
     - include_retried (bool): Flag indicating whether to include retried jobs.
     - job_variable_attributes (Dict): Dictionary of job variable attributes.
     - api_parameters (str): Additional API parameters for the job.
@@ -772,10 +776,18 @@ class JobModel(BaseModel):
     max_pages: Optional[int] = Field(
         description="Max amount of pages to retrieve", default=None
     )
+    max_workers: Optional[int] = Field(
+        description="Number of pages to fetch concurrently", default=None
+    )
     page: Optional[int] = Field(description="Page in multi-page response", default=None)
     per_page: Optional[int] = Field(
         description="Amount of items per page", default=None
     )
+    pagination: Optional[str] = Field(
+        description="Pagination method, offset or keyset", default=None
+    )
+    order_by: Optional[str] = None
+    sort: Optional[str] = None
     include_retried: Optional[bool] = None
     job_variable_attributes: Optional[Dict] = None
     api_parameters: Optional[Dict] = Field(description="API Parameters", default=None)
@@ -886,6 +898,68 @@ def model_post_init(self, __context):
             self.api_parameters["total_pages"] = self.total_pages
         if self.scope:
             self.api_parameters["scope[]"] = self.scope
+        if self.pagination:
+            self.api_parameters["pagination"] = self.pagination
+            if self.pagination == "keyset" and not self.order_by:
+                self.order_by = "id"
+        if self.order_by:
+            self.api_parameters["order_by"] = self.order_by
+        if self.sort:
+            self.api_parameters["sort"] = self.sort
+
+    @field_validator("pagination")
+    def validate_pagination(cls, value):
+        """
+        Validate pagination method.
+
+        Args:
+        - value: Pagination method to validate.
+
+        Returns:
+        - The validated pagination method.
+
+        Raises:
+        - ValueError: If the pagination method is not valid.
+        """
+        if value.lower() not in ["offset", "keyset"]:
+            raise ValueError("Invalid pagination")
+        return value.lower()
+
+    @field_validator("order_by")
+    def validate_order_by(cls, value):
+        """
+        Validate order_by attribute.
+
+        Args:
+        - value: Order_by attribute to validate.
+
+        Returns:
+        - The validated order_by attribute.
+
+        Raises:
+        - ValueError: If the order_by attribute is not valid.
+        """
+        if value.lower() not in ["id"]:
+            raise ValueError("Invalid order_by")
+        return value.lower()
+
+    @field_validator("sort")
+    def validate_sort(cls, value):
+        """
+        Validate sort attribute.
+
+        Args:
+        - value: Sort attribute to validate.
+
+        Returns:
+        - The validated sort attribute.
+
+        Raises:
+        - ValueError: If the sort attribute is not valid.
+        """
+        if value.lower() not in ["asc", "desc"]:
+            raise ValueError("Invalid sort value")
+        return value.lower()
 
 
 class MembersModel(BaseModel):
@@ -993,6 +1067,7 @@ class MergeRequestModel(BaseModel):
     - squash (bool): Squash commits on merge.
     - target_project_id (Union[int, str]): Identifier for the target project.
     - max_pages (int): Maximum number of pages to retrieve (default is 0).
+    - max_workers (int): Number of pages to fetch concurrently.
     - per_page (int): Number of items to display per page (default is 100).
     - api_parameters (str): Additional API parameters for the merge request.
     - data (Dict): Additional data for the merge request.
@@ -1032,7 +1107,7 @@ class MergeRequestModel(BaseModel):
     with_labels_details: Optional[bool] = None
     with_merge_status_recheck: Optional[bool] = None
     wip: Optional[str] = None
-    title: Optional[str]
+    title: Optional[str] = None
     allow_collaboration: Optional[bool] = None
     allow_maintainer_to_push: Optional[bool] = None
     approvals_before_merge: Optional[int] = None
@@ -1044,6 +1119,9 @@ class MergeRequestModel(BaseModel):
     squash: Optional[bool] = None
     target_project_id: Optional[Union[int, str]] = None
     max_pages: Optional[int] = Field(description="Maximum pages to return", default=0)
+    max_workers: Optional[int] = Field(
+        description="Number of pages to fetch concurrently", default=None
+    )
     per_page: Optional[int] = Field(description="Results per page", default=100)
     page: Optional[int] = Field(description="Pagination page", default=1)
     api_parameters: Optional[Dict] = Field(description="API Parameters", default=None)
@@ -1120,6 +1198,10 @@ def model_post_init(self, __context):
             self.api_parameters["with_merge_status_recheck"] = (
                 self.with_merge_status_recheck
             )
+        if self.page:
+            self.api_parameters["page"] = self.page
+        if self.per_page:
+            self.api_parameters["per_page"] = self.per_page
 
     @model_validator(mode="before")
     def build_data(cls, values):
@@ -1643,6 +1725,12 @@ class PipelineModel(BaseModel):
     - pipeline_id (Union[int, str]): The ID of the pipeline.
     - reference (str): Reference for the pipeline.
     - variables (Dict): Variables associated with the pipeline.
+    - updated_after (str): Return pipelines updated after the given date (ISO 8601).
+    - updated_before (str): Return pipelines updated before the given date (ISO 8601).
+    - created_after (str): Return pipelines created after the given date (ISO 8601).
+    - created_before (str): Return pipelines created before the given date (ISO 8601).
+    - order_by (str): Order pipelines by id, status, ref, updated_at or user_id.
+    - sort (str): Sort order, "asc" or "desc".
     - api_parameters (str): Additional API parameters.
 
     Examples:
@@ -1657,6 +1745,12 @@ class PipelineModel(BaseModel):
     pipeline_id: Optional[Union[int, str]] = None
     reference: Optional[str] = None
     variables: Optional[Dict] = None
+    updated_after: Optional[str] = None
+    updated_before: Optional[str] = None
+    created_after: Optional[str] = None
+    created_before: Optional[str] = None
+    order_by: Optional[str] = None
+    sort: Optional[str] = None
     api_parameters: Optional[Dict] = Field(description="API Parameters", default=None)
 
     def model_post_init(self, __context):
@@ -1670,6 +1764,18 @@ def model_post_init(self, __context):
             self.api_parameters["per_page"] = self.per_page
         if self.reference:
             self.api_parameters["ref"] = self.reference
+        if self.updated_after:
+            self.api_parameters["updated_after"] = self.updated_after
+        if self.updated_before:
+            self.api_parameters["updated_before"] = self.updated_before
+        if self.created_after:
+            self.api_parameters["created_after"] = self.created_after
+        if self.created_before:
+            self.api_parameters["created_before"] = self.created_before
+        if self.order_by:
+            self.api_parameters["order_by"] = self.order_by
+        if self.sort:
+            self.api_parameters["sort"] = self.sort
 
 
 class ProjectModel(BaseModel):
@@ -1686,6 +1792,14 @@ class ProjectModel(BaseModel):
     - analytics_access_level (str): Access level for analytics.
     - approvals_before_merge (int): Number of approvals required before merge.
     - auto_cancel_pending_pipelines (str): Auto-cancel pending pipelines.
+    - max_workers (int): Number of pages to fetch concurrently.
+    - pagination (str): Pagination method, "offset" or "keyset".
+    - order_by (str): Order projects by a specific field ("id" for keyset pagination by default).
+    - sort (str): Sort order, "asc" or "desc".
+    - last_activity_after (str): Return projects with activity after the given date (ISO 8601).
+    - last_activity_before (str): Return projects with activity before the given date (ISO 8601).
+    - updated_after (str): Return projects updated after the given date (ISO 8601).
+    - updated_before (str): Return projects updated before the given date (ISO 8601).
     - default=None (other attributes)
 
     Methods:
@@ -1733,6 +1847,8 @@ class ProjectModel(BaseModel):
     issues_access_level: Optional[str] = None
     issues_template: Optional[str] = None
     keep_latest_artifact: Optional[bool] = None
+    last_activity_after: Optional[str] = None
+    last_activity_before: Optional[str] = None
     lfs_enabled: Optional[bool] = None
     total_pages: Optional[int] = Field(
         description="Total number of pages", default=None
@@ -1740,6 +1856,9 @@ class ProjectModel(BaseModel):
     max_pages: Optional[int] = Field(
         description="Max amount of pages to retrieve", default=None
     )
+    max_workers: Optional[int] = Field(
+        description="Number of pages to fetch concurrently", default=None
+    )
     page: Optional[int] = Field(description="Page in multi-page response", default=None)
     per_page: Optional[int] = Field(
         description="Amount of items per page", default=None
@@ -1757,6 +1876,10 @@ class ProjectModel(BaseModel):
     mr_default_target_self: Optional[bool] = None
     name: Optional[str] = None
     order_by: Optional[str] = None
+    sort: Optional[str] = None
+    pagination: Optional[str] = Field(
+        description="Pagination method, offset or keyset", default=None
+    )
     only_allow_merge_if_all_discussions_are_resolved: Optional[bool] = None
     only_allow_merge_if_pipeline_succeeds: Optional[bool] = None
     only_mirror_protected_branches: Optional[bool] = None
@@ -1783,6 +1906,8 @@ class ProjectModel(BaseModel):
     suggestion_commit_message: Optional[str] = None
     tag_list: Optional[List[str]] = None
     topics: Optional[List[str]] = None
+    updated_after: Optional[str] = None
+    updated_before: Optional[str] = None
     visibility: Optional[str] = None
     wiki_access_level: Optional[str] = None
     api_parameters: Optional[Dict] = Field(description="API Parameters", default=None)
@@ -1795,6 +1920,14 @@ def model_post_init(self, __context):
         self.api_parameters = {}
         if self.group_id:
             self.api_parameters["group_id"] = self.group_id
+        if self.last_activity_after:
+            self.api_parameters["last_activity_after"] = self.last_activity_after
+        if self.last_activity_before:
+            self.api_parameters["last_activity_before"] = self.last_activity_before
+        if self.updated_after:
+            self.api_parameters["updated_after"] = self.updated_after
+        if self.updated_before:
+            self.api_parameters["updated_before"] = self.updated_before
         if self.group_access:
             self.api_parameters["group_access"] = self.group_access
         if self.expires_at:
@@ -1807,6 +1940,14 @@ def model_post_init(self, __context):
             self.api_parameters["per_page"] = self.per_page
         if self.total_pages:
             self.api_parameters["total_pages"] = self.total_pages
+        if self.pagination:
+            self.api_parameters["pagination"] = self.pagination
+            if self.pagination == "keyset" and not self.order_by:
+                self.order_by = "id"
+        if self.order_by:
+            self.api_parameters["order_by"] = self.order_by
+        if self.sort:
+            self.api_parameters["sort"] = self.sort
 
     @model_validator(mode="before")
     def build_data(cls, values):
@@ -1971,10 +2112,55 @@ def validate_order_by(cls, value):
         Raises:
         - ValueError: If the value is not a valid order_by.
         """
-        if value.lower() not in ["id", "name", "username", "created_at", "updated_at"]:
+        if value.lower() not in [
+            "id",
+            "name",
+            "path",
+            "username",
+            "created_at",
+            "updated_at",
+            "last_activity_at",
+            "star_count",
+        ]:
             raise ValueError("Invalid order_by")
         return value.lower()
 
+    @field_validator("sort")
+    def validate_sort(cls, value):
+        """
+        Validate sort value.
+
+        Args:
+        - value: Sort value to validate.
+
+        Returns:
+        - The validated sort value.
+
+        Raises:
+        - ValueError: If the value is not a valid sort.
+        """
+        if value.lower() not in ["asc", "desc"]:
+            raise ValueError("Invalid sort value")
+        return value.lower()
+
+    @field_validator("pagination")
+    def validate_pagination(cls, value):
+        """
+        Validate pagination value.
+
+        Args:
+        - value: Pagination value to validate.
+
+        Returns:
+        - The validated pagination value.
+
+        Raises:
+        - ValueError: If the value is not a valid pagination method.
+        """
+        if value.lower() not in ["offset", "keyset"]:
+            raise ValueError("Invalid pagination")
+        return value.lower()
+
     @field_validator("visibility")
     def validate_visibility(cls, value):
         """
@@ -2455,12 +2641,14 @@ class UserModel(BaseModel):
     - created_after (str): Filter users created after a specific date.
     - with_custom_attributes (str): Filter users with custom attributes.
     - sort (str): Sort order for the results.
-    - order_by (str): Order results by a specific field.
+    - order_by (str): Order results by a specific field ("id" for keyset pagination by default).
+    - pagination (str): Pagination method, "offset" or "keyset".
     - two_factor (str): Filter users by two-factor authentication status.
     - without_projects (bool): Flag indicating whether to exclude users with projects.
     - admins (bool): Flag indicating whether to filter only admin users.
     - saml_provider_id (str): SAML provider ID associated with the user.
     - max_pages (int): Maximum number of pages.
+    - max_workers (int): Number of pages to fetch concurrently.
     - page (int): Current page number.
     - per_page (int): Number of results per page.
     - sudo (bool): Flag indicating sudo user mode.
@@ -2492,6 +2680,9 @@ class UserModel(BaseModel):
     with_custom_attributes: Optional[str] = None
     sort: Optional[str] = None
     order_by: Optional[str] = None
+    pagination: Optional[str] = Field(
+        description="Pagination method, offset or keyset", default=None
+    )
     two_factor: Optional[str] = None
     without_projects: Optional[bool] = None
     admins: Optional[bool] = None
@@ -2502,6 +2693,9 @@ class UserModel(BaseModel):
     max_pages: Optional[int] = Field(
         description="Max amount of pages to retrieve", default=None
     )
+    max_workers: Optional[int] = Field(
+        description="Number of pages to fetch concurrently", default=None
+    )
     page: Optional[int] = Field(description="Page in multi-page response", default=None)
     per_page: Optional[int] = Field(
         description="Amount of items per page", default=None
@@ -2531,6 +2725,10 @@ def model_post_init(self, __context):
             self.api_parameters["exclude_external"] = self.exclude_external
         if self.without_project_bots:
             self.api_parameters["without_project_bots"] = self.without_project_bots
+        if self.pagination:
+            self.api_parameters["pagination"] = self.pagination
+            if self.pagination == "keyset" and not self.order_by:
+                self.order_by = "id"
         if self.order_by:
             self.api_parameters["order_by"] = self.order_by
         if self.sort:
@@ -2622,6 +2820,24 @@ def validate_two_factor(cls, value):
             raise ValueError("Invalid two_factor value")
         return value.lower()
 
+    @field_validator("pagination")
+    def validate_pagination(cls, value):
+        """
+        Validate pagination attribute.
+
+        Args:
+        - value: Pagination attribute to validate.
+
+        Returns:
+        - The validated pagination attribute.
+
+        Raises:
+        - ValueError: If the pagination attribute is not valid.
+        """
+        if value.lower() not in ["offset", "keyset"]:
+            raise ValueError("Invalid pagination")
+        return value.lower()
+
 
 class WikiModel(BaseModel):
     """
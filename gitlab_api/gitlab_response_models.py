@@ -1,12 +1,16 @@
 #!/usr/bin/python
 # coding: utf-8
 
+import functools
 import logging
+import os
 from typing import Union, List, Dict, Optional, Any
 from pydantic import (
     BaseModel,
     Field,
     ConfigDict,
+    TypeAdapter,
+    ValidationInfo,
     field_validator,
     model_validator,
     HttpUrl,
@@ -28,88 +32,41 @@
 except ModuleNotFoundError:
     pass
 
-from gitlab_api.gitlab_db_models import (
-    AccessControlDBModel,
-    AccessLevelDBModel,
-    AgentDBModel,
-    AgentsDBModel,
-    ApprovalRuleDBModel,
-    ArtifactDBModel,
-    ArtifactsFileDBModel,
-    AssetsDBModel,
-    BranchDBModel,
-    CommentDBModel,
-    CommitDBModel,
-    CommitSignatureDBModel,
-    CommitStatsDBModel,
-    ConfigurationDBModel,
-    ContainerExpirationPolicyDBModel,
-    ContributorDBModel,
-    DefaultBranchProtectionDefaultsDBModel,
-    DeployTokenDBModel,
-    DetailedStatusDBModel,
-    DiffDBModel,
-    EpicDBModel,
-    EvidenceDBModel,
-    GroupAccessDBModel,
-    GroupDBModel,
-    GroupSamlIdentityDBModel,
-    IdentityDBModel,
-    IssueDBModel,
-    IssueStatsDBModel,
-    IterationDBModel,
-    JobDBModel,
-    LabelDBModel,
-    LinkDBModel,
-    MembershipDBModel,
-    MergeApprovalsDBModel,
-    MergeRequestDBModel,
-    MilestoneDBModel,
-    NamespaceDBModel,
-    PackageDBModel,
-    PackageLinkDBModel,
-    PackageVersionDBModel,
-    ParentIDDBModel,
-    PermissionsDBModel,
-    PipelineDBModel,
-    PipelineVariableDBModel,
-    ProjectConfigDBModel,
-    ProjectDBModel,
-    ReferencesDBModel,
-    ReleaseDBModel,
-    ReleaseLinksDBModel,
-    RuleDBModel,
-    RunnerDBModel,
-    RunnerManagerDBModel,
-    SourceDBModel,
-    StatisticsDBModel,
-    TagDBModel,
-    TaskCompletionStatusDBModel,
-    TestCaseDBModel,
-    TestReportDBModel,
-    TestReportTotalDBModel,
-    TestSuiteDBModel,
-    TimeStatsDBModel,
-    ToDoDBModel,
-    TokenDBModel,
-    TopicDBModel,
-    UserDBModel,
-    WebhookDBModel,
-    WikiAttachmentDBModel,
-    WikiAttachmentLinkDBModel,
-    WikiPageDBModel,
-)
-
 logging.basicConfig(
     level=logging.ERROR, format="%(asctime)s - %(levelname)s - %(message)s"
 )
 
+# With GITLAB_API_DEFER_BUILD=1 the validators of the response models are built
+# on first use instead of at import, see warm_up
+DEFER_BUILD = os.environ.get("GITLAB_API_DEFER_BUILD", "").lower() in (
+    "1",
+    "true",
+    "yes",
+)
+
+
+class _DBModel(object):
+    """
+    A Meta.orm_model, imported from gitlab_db_models on first access, so the
+    response models load without SQLAlchemy.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __get__(self, instance, owner):
+        from gitlab_api import gitlab_db_models
+
+        orm_model = getattr(gitlab_db_models, self.name)
+        setattr(owner, "orm_model", orm_model)
+        return orm_model
+
 
 class IssueStats(BaseModel):
     class Meta:
-        orm_model = IssueStatsDBModel
+        orm_model = _DBModel("IssueStatsDBModel")
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=DEFER_BUILD)
     __hash__ = object.__hash__
     base_type: str = Field(default="IssueStats")
     total: Optional[int] = Field(default=None, description="Total number of issues")
@@ -119,9 +76,9 @@ class Meta:
 
 class Milestone(BaseModel):
     class Meta:
-        orm_model = MilestoneDBModel
+        orm_model = _DBModel("MilestoneDBModel")
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=DEFER_BUILD)
     __hash__ = object.__hash__
     base_type: str = Field(default="Milestone")
     id: Optional[int] = Field(
@@ -165,9 +122,9 @@ class Meta:
 
 class TimeStats(BaseModel):
     class Meta:
-        orm_model = TimeStatsDBModel
+        orm_model = _DBModel("TimeStatsDBModel")
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=DEFER_BUILD)
     __hash__ = object.__hash__
     base_type: str = Field(default="TimeStats")
     time_estimate: Optional[int] = Field(
@@ -188,9 +145,9 @@ class Meta:
 
 class TaskCompletionStatus(BaseModel):
     class Meta:
-        orm_model = TaskCompletionStatusDBModel
+        orm_model = _DBModel("TaskCompletionStatusDBModel")
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=DEFER_BUILD)
     __hash__ = object.__hash__
     base_type: str = Field(default="TaskCompletionStatus")
     count: Optional[int] = Field(
@@ -203,9 +160,9 @@ class Meta:
 
 class References(BaseModel):
     class Meta:
-        orm_model = ReferencesDBModel
+        orm_model = _DBModel("ReferencesDBModel")
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=DEFER_BUILD)
     __hash__ = object.__hash__
     base_type: str = Field(default="References")
     short: Optional[str] = Field(
@@ -221,9 +178,9 @@ class Meta:
 
 class Artifact(BaseModel):
     class Meta:
-        orm_model = ArtifactDBModel
+        orm_model = _DBModel("ArtifactDBModel")
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=DEFER_BUILD)
     __hash__ = object.__hash__
     base_type: str = Field(default="Artifact")
     file_type: Optional[str] = Field(
@@ -240,9 +197,9 @@ class Meta:
 
 class ArtifactsFile(BaseModel):
     class Meta:
-        orm_model = ArtifactsFileDBModel
+        orm_model = _DBModel("ArtifactsFileDBModel")
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=DEFER_BUILD)
     __hash__ = object.__hash__
     base_type: str = Field(default="ArtifactsFile")
     filename: Optional[str] = Field(
@@ -253,9 +210,9 @@ class Meta:
 
 class RunnerManager(BaseModel):
     class Meta:
-        orm_model = RunnerManagerDBModel
+        orm_model = _DBModel("RunnerManagerDBModel")
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=DEFER_BUILD)
     __hash__ = object.__hash__
     base_type: str = Field(default="RunnerManager")
     id: Optional[int] = Field(default=None, description="ID of the runner manager.")
@@ -291,9 +248,9 @@ class Meta:
 
 class Configuration(BaseModel):
     class Meta:
-        orm_model = ConfigurationDBModel
+        orm_model = _DBModel("ConfigurationDBModel")
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=DEFER_BUILD)
     __hash__ = object.__hash__
     base_type: str = Field(default="Configuration")
     approvals_before_merge: Optional[int] = Field(
@@ -322,9 +279,9 @@ class Meta:
 
 class Iteration(BaseModel):
     class Meta:
-        orm_model = IterationDBModel
+        orm_model = _DBModel("IterationDBModel")
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=DEFER_BUILD)
     __hash__ = object.__hash__
     base_type: str = Field(default="Iteration")
     id: Optional[int] = Field(default=None)
@@ -343,9 +300,9 @@ class Meta:
 
 class Identity(BaseModel):
     class Meta:
-        orm_model = IdentityDBModel
+        orm_model = _DBModel("IdentityDBModel")
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=DEFER_BUILD)
     __hash__ = object.__hash__
     base_type: str = Field(default="Identity")
     provider: Optional[str] = Field(default=None, description="The external provider.")
@@ -356,9 +313,9 @@ class Meta:
 
 class GroupSamlIdentity(BaseModel):
     class Meta:
-        orm_model = GroupSamlIdentityDBModel
+        orm_model = _DBModel("GroupSamlIdentityDBModel")
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=DEFER_BUILD)
     __hash__ = object.__hash__
     base_type: str = Field(default="GroupSamlIdentity")
     extern_uid: Optional[str] = Field(
@@ -374,9 +331,9 @@ class Meta:
 
 class User(BaseModel):
     class Meta:
-        orm_model = UserDBModel
+        orm_model = _DBModel("UserDBModel")
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=DEFER_BUILD)
     __hash__ = object.__hash__
     base_type: str = Field(default="User")
     id: Optional[int] = Field(default=None, description="The unique ID of the user.")
@@ -548,9 +505,9 @@ def validate_tags(cls, v):
 
 class Namespace(BaseModel):
     class Meta:
-        orm_model = NamespaceDBModel
+        orm_model = _DBModel("NamespaceDBModel")
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=DEFER_BUILD)
     __hash__ = object.__hash__
     base_type: str = Field(default="Namespace")
     id: Optional[int] = Field(default=None, description="The ID of the namespace.")
@@ -583,9 +540,9 @@ class Meta:
 
 class ContainerExpirationPolicy(BaseModel):
     class Meta:
-        orm_model = ContainerExpirationPolicyDBModel
+        orm_model = _DBModel("ContainerExpirationPolicyDBModel")
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=DEFER_BUILD)
     __hash__ = object.__hash__
     base_type: str = Field(default="ContainerExpirationPolicy")
     cadence: Optional[str] = Field(
@@ -609,9 +566,9 @@ class Meta:
 
 class Permissions(BaseModel):
     class Meta:
-        orm_model = PermissionsDBModel
+        orm_model = _DBModel("PermissionsDBModel")
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=DEFER_BUILD)
     __hash__ = object.__hash__
     base_type: str = Field(default="Permissions")
     project_access: Optional[Dict] = Field(
@@ -624,9 +581,9 @@ class Meta:
 
 class Statistics(BaseModel):
     class Meta:
-        orm_model = StatisticsDBModel
+        orm_model = _DBModel("StatisticsDBModel")
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=DEFER_BUILD)
     __hash__ = object.__hash__
     base_type: str = Field(default="Statistics")
     commit_count: Optional[int] = Field(
@@ -661,9 +618,9 @@ class Meta:
 
 class Diff(BaseModel):
     class Meta:
-        orm_model = DiffDBModel
+        orm_model = _DBModel("DiffDBModel")
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=DEFER_BUILD)
     __hash__ = object.__hash__
     base_type: str = Field(default="Diff")
     id: Optional[int] = Field(default=None, description="The ID of the Diff")
@@ -718,9 +675,9 @@ class Meta:
 
 class DetailedStatus(BaseModel):
     class Meta:
-        orm_model = DetailedStatusDBModel
+        orm_model = _DBModel("DetailedStatusDBModel")
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=DEFER_BUILD)
     __hash__ = object.__hash__
     base_type: str = Field(default="DetailedStatus")
     icon: Optional[str] = Field(
@@ -752,9 +709,9 @@ class Meta:
 
 class Pipeline(BaseModel):
     class Meta:
-        orm_model = PipelineDBModel
+        orm_model = _DBModel("PipelineDBModel")
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=DEFER_BUILD)
     __hash__ = object.__hash__
     base_type: str = Field(default="Pipeline")
     id: Optional[int] = Field(default=None, description="ID of the pipeline")
@@ -820,9 +777,9 @@ class Meta:
 
 class PackageLink(BaseModel):
     class Meta:
-        orm_model = PackageLinkDBModel
+        orm_model = _DBModel("PackageLinkDBModel")
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=DEFER_BUILD)
     __hash__ = object.__hash__
     base_type: str = Field(default="PackageLink")
     web_path: Optional[str] = Field(
@@ -835,9 +792,9 @@ class Meta:
 
 class PackageVersion(BaseModel):
     class Meta:
-        orm_model = PackageVersionDBModel
+        orm_model = _DBModel("PackageVersionDBModel")
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=DEFER_BUILD)
     __hash__ = object.__hash__
     base_type: str = Field(default="PackageVersion")
     id: Optional[int] = Field(default=None, description="Version ID of the package")
@@ -864,9 +821,9 @@ def validate_pipelines(cls, v):
 
 class Package(BaseModel):
     class Meta:
-        orm_model = PackageDBModel
+        orm_model = _DBModel("PackageDBModel")
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=DEFER_BUILD)
     __hash__ = object.__hash__
     base_type: str = Field(default="Package")
     id: Optional[int] = Field(default=None, description="Package ID")
@@ -929,9 +886,9 @@ def validate_pipelines(cls, v):
 
 class Contributor(BaseModel):
     class Meta:
-        orm_model = ContributorDBModel
+        orm_model = _DBModel("ContributorDBModel")
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=DEFER_BUILD)
     __hash__ = object.__hash__
     base_type: str = Field(default="Contributor")
     name: str = Field(default=None, description="The name of the contributor.")
@@ -947,9 +904,9 @@ class Meta:
 
 class CommitStats(BaseModel):
     class Meta:
-        orm_model = CommitStatsDBModel
+        orm_model = _DBModel("CommitStatsDBModel")
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=DEFER_BUILD)
     __hash__ = object.__hash__
     base_type: str = Field(default="CommitStats")
     additions: Optional[int] = Field(
@@ -965,9 +922,9 @@ class Meta:
 
 class CommitSignature(BaseModel):
     class Meta:
-        orm_model = CommitSignatureDBModel
+        orm_model = _DBModel("CommitSignatureDBModel")
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=DEFER_BUILD)
     __hash__ = object.__hash__
     base_type: str = Field(default="CommitSignature")
     signature_type: Optional[str] = Field(
@@ -1003,9 +960,9 @@ class Meta:
 
 class Comment(BaseModel):
     class Meta:
-        orm_model = CommentDBModel
+        orm_model = _DBModel("CommentDBModel")
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=DEFER_BUILD)
     __hash__ = object.__hash__
     base_type: str = Field(default="Comment")
     id: Optional[int] = Field(default=None, description="ID of the note")
@@ -1050,9 +1007,9 @@ class Meta:
 
 class ParentID(BaseModel):
     class Meta:
-        orm_model = ParentIDDBModel
+        orm_model = _DBModel("ParentIDDBModel")
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=DEFER_BUILD)
     __hash__ = object.__hash__
     base_type: str = Field(default="ParentID")
     parent_id: str = Field(default=None, description="Parent ID")
@@ -1060,9 +1017,9 @@ class Meta:
 
 class Commit(BaseModel):
     class Meta:
-        orm_model = CommitDBModel
+        orm_model = _DBModel("CommitDBModel")
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=DEFER_BUILD)
     __hash__ = object.__hash__
     base_type: str = Field(default="Commit")
     id: Optional[Union[str, int]] = Field(default=None, description="The commit ID.")
@@ -1179,9 +1136,9 @@ def validate_trailers(cls, v):
 
 class Membership(BaseModel):
     class Meta:
-        orm_model = MembershipDBModel
+        orm_model = _DBModel("MembershipDBModel")
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=DEFER_BUILD)
     __hash__ = object.__hash__
     base_type: str = Field(default="Membership")
     id: Optional[int] = Field(default=None, description="ID of the membership")
@@ -1207,9 +1164,9 @@ class Meta:
 
 class Label(BaseModel):
     class Meta:
-        orm_model = LabelDBModel
+        orm_model = _DBModel("LabelDBModel")
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=DEFER_BUILD)
     __hash__ = object.__hash__
     base_type: str = Field(default="Label")
     name: str = Field(default=None)
@@ -1217,9 +1174,9 @@ class Meta:
 
 class Tag(BaseModel):
     class Meta:
-        orm_model = TagDBModel
+        orm_model = _DBModel("TagDBModel")
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=DEFER_BUILD)
     __hash__ = object.__hash__
     base_type: str = Field(default="Tag")
     tag: str = Field(default=None)
@@ -1227,9 +1184,9 @@ class Meta:
 
 class Topic(BaseModel):
     class Meta:
-        orm_model = TopicDBModel
+        orm_model = _DBModel("TopicDBModel")
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=DEFER_BUILD)
     __hash__ = object.__hash__
     base_type: str = Field(default="Topic")
     topic: str = Field(default=None)
@@ -1237,9 +1194,9 @@ class Meta:
 
 class Link(BaseModel):
     class Meta:
-        orm_model = LinkDBModel
+        orm_model = _DBModel("LinkDBModel")
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=DEFER_BUILD)
     __hash__ = object.__hash__
     base_type: str = Field(default="Links")
     self_link: Optional[str] = Field(
@@ -1291,9 +1248,9 @@ class Meta:
 
 class Project(BaseModel):
     class Meta:
-        orm_model = ProjectDBModel
+        orm_model = _DBModel("ProjectDBModel")
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=DEFER_BUILD)
     __hash__ = object.__hash__
     base_type: str = Field(default="Project")
     id: Optional[int] = Field(default=None, description="The ID of the project.")
@@ -1735,9 +1692,9 @@ def validate_groups(cls, v):
 
 class Runner(BaseModel):
     class Meta:
-        orm_model = RunnerDBModel
+        orm_model = _DBModel("RunnerDBModel")
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=DEFER_BUILD)
     __hash__ = object.__hash__
     base_type: str = Field(default="Runner")
     id: Optional[int] = Field(default=None, description="ID of the runner.")
@@ -1808,9 +1765,9 @@ def validate_projects(cls, v):
 
 class ProjectConfig(BaseModel):
     class Meta:
-        orm_model = ProjectConfigDBModel
+        orm_model = _DBModel("ProjectConfigDBModel")
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=DEFER_BUILD)
     __hash__ = object.__hash__
     base_type: str = Field(default="ProjectConfig")
     id: int = Field(default=None, description="Project identifier")
@@ -1833,9 +1790,9 @@ class Meta:
 
 class Job(BaseModel):
     class Meta:
-        orm_model = JobDBModel
+        orm_model = _DBModel("JobDBModel")
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=DEFER_BUILD)
     __hash__ = object.__hash__
     base_type: str = Field(default="Job")
     id: Optional[int] = Field(default=None, description="ID of the job.")
@@ -1938,9 +1895,9 @@ def validate_artifacts(cls, v):
 
 class GroupAccess(BaseModel):
     class Meta:
-        orm_model = GroupAccessDBModel
+        orm_model = _DBModel("GroupAccessDBModel")
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=DEFER_BUILD)
     __hash__ = object.__hash__
     base_type: str = Field(default="GroupAccess")
     access_level: Optional[int] = Field(
@@ -1950,9 +1907,9 @@ class Meta:
 
 class DefaultBranchProtectionDefaults(BaseModel):
     class Meta:
-        orm_model = DefaultBranchProtectionDefaultsDBModel
+        orm_model = _DBModel("DefaultBranchProtectionDefaultsDBModel")
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=DEFER_BUILD)
     __hash__ = object.__hash__
     base_type: str = Field(default="DefaultBranchProtectionDefaults")
     allowed_to_push: Optional[List[GroupAccess]] = Field(
@@ -1980,9 +1937,9 @@ def validate_group_accesses(cls, v):
 
 class Group(BaseModel):
     class Meta:
-        orm_model = GroupDBModel
+        orm_model = _DBModel("GroupDBModel")
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=DEFER_BUILD)
     __hash__ = object.__hash__
     base_type: str = Field(default="Group")
     id: Optional[int] = Field(default=None, description="The ID of the group")
@@ -2165,9 +2122,9 @@ def validate_groups(cls, v):
 
 class Webhook(BaseModel):
     class Meta:
-        orm_model = WebhookDBModel
+        orm_model = _DBModel("WebhookDBModel")
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=DEFER_BUILD)
     __hash__ = object.__hash__
     base_type: str = Field(default="Webhook")
     id: int = Field(default=None, description="Unique identifier for the webhook")
@@ -2255,9 +2212,9 @@ class Meta:
 
 class AccessLevel(BaseModel):
     class Meta:
-        orm_model = AccessLevelDBModel
+        orm_model = _DBModel("AccessLevelDBModel")
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=DEFER_BUILD)
     __hash__ = object.__hash__
     base_type: str = Field(default="AccessLevel")
     id: Optional[int] = Field(default=None, description="Access level ID")
@@ -2274,9 +2231,9 @@ class Meta:
 
 class Branch(BaseModel):
     class Meta:
-        orm_model = BranchDBModel
+        orm_model = _DBModel("BranchDBModel")
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=DEFER_BUILD)
     __hash__ = object.__hash__
     base_type: str = Field(default="Branch")
     name: Optional[str] = Field(default=None, description="The name of the branch.")
@@ -2343,9 +2300,9 @@ def validate_access_levels(cls, v):
 
 class ApprovalRule(BaseModel):
     class Meta:
-        orm_model = ApprovalRuleDBModel
+        orm_model = _DBModel("ApprovalRuleDBModel")
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=DEFER_BUILD)
     __hash__ = object.__hash__
     base_type: str = Field(default="ApprovalRule")
     id: Optional[int] = Field(default=None, description="Approval rule ID")
@@ -2426,9 +2383,9 @@ def validate_groups(cls, v):
 
 class MergeRequest(BaseModel):
     class Meta:
-        orm_model = MergeRequestDBModel
+        orm_model = _DBModel("MergeRequestDBModel")
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=DEFER_BUILD)
     __hash__ = object.__hash__
     base_type: str = Field(default="MergeRequest")
     id: Optional[int] = Field(default=None, description="ID of the merge request")
@@ -2708,9 +2665,9 @@ def validate_approval_rules(cls, v):
 
 class Epic(BaseModel):
     class Meta:
-        orm_model = EpicDBModel
+        orm_model = _DBModel("EpicDBModel")
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=DEFER_BUILD)
     __hash__ = object.__hash__
     base_type: str = Field(default="Epic")
     id: Optional[int] = Field(
@@ -2730,9 +2687,9 @@ class Meta:
 
 class Issue(BaseModel):
     class Meta:
-        orm_model = IssueDBModel
+        orm_model = _DBModel("IssueDBModel")
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=DEFER_BUILD)
     __hash__ = object.__hash__
     base_type: str = Field(default="Issue")
     state: Optional[str] = Field(
@@ -2878,9 +2835,9 @@ def validate_labels(cls, v):
 
 class PipelineVariable(BaseModel):
     class Meta:
-        orm_model = PipelineVariableDBModel
+        orm_model = _DBModel("PipelineVariableDBModel")
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=DEFER_BUILD)
     __hash__ = object.__hash__
     base_type: str = Field(default="PipelineVariable")
     key: Optional[str] = Field(default=None, description="The key of the variable.")
@@ -2892,9 +2849,9 @@ class Meta:
 
 class TestCase(BaseModel):
     class Meta:
-        orm_model = TestCaseDBModel
+        orm_model = _DBModel("TestCaseDBModel")
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=DEFER_BUILD)
     __hash__ = object.__hash__
     base_type: str = Field(default="TestCase")
     status: Optional[str] = Field(
@@ -2917,9 +2874,9 @@ class Meta:
 
 class TestSuite(BaseModel):
     class Meta:
-        orm_model = TestSuiteDBModel
+        orm_model = _DBModel("TestSuiteDBModel")
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=DEFER_BUILD)
     __hash__ = object.__hash__
     base_type: str = Field(default="TestSuite")
     name: Optional[str] = Field(default=None, description="The name of the test suite.")
@@ -2965,9 +2922,9 @@ def validate_test_cases(cls, v):
 
 class TestReportTotal(BaseModel):
     class Meta:
-        orm_model = TestReportTotalDBModel
+        orm_model = _DBModel("TestReportTotalDBModel")
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=DEFER_BUILD)
     __hash__ = object.__hash__
     base_type: str = Field(default="TestReportTotal")
     time: Optional[int] = Field(
@@ -2995,9 +2952,9 @@ class Meta:
 
 class TestReport(BaseModel):
     class Meta:
-        orm_model = TestReportDBModel
+        orm_model = _DBModel("TestReportDBModel")
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=DEFER_BUILD)
     __hash__ = object.__hash__
     base_type: str = Field(default="TestReport")
     total: Optional[TestReportTotal] = Field(
@@ -3039,9 +2996,9 @@ def validate_test_suites(cls, v):
 
 class MergeApprovals(BaseModel):
     class Meta:
-        orm_model = MergeApprovalsDBModel
+        orm_model = _DBModel("MergeApprovalsDBModel")
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=DEFER_BUILD)
     __hash__ = object.__hash__
     base_type: str = Field(default="MergeApprovals")
     approvers: Optional[List[User]] = Field(
@@ -3095,9 +3052,9 @@ def validate_groups(cls, v):
 
 class DeployToken(BaseModel):
     class Meta:
-        orm_model = DeployTokenDBModel
+        orm_model = _DBModel("DeployTokenDBModel")
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=DEFER_BUILD)
     __hash__ = object.__hash__
     base_type: str = Field(default="DeployToken")
     id: Optional[int] = Field(
@@ -3132,9 +3089,9 @@ class Meta:
 
 class Rule(BaseModel):
     class Meta:
-        orm_model = RuleDBModel
+        orm_model = _DBModel("RuleDBModel")
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=DEFER_BUILD)
     __hash__ = object.__hash__
     base_type: str = Field(default="Rule")
     id: int = Field(default=None, description="Unique identifier for the rule")
@@ -3179,9 +3136,9 @@ class Meta:
 
 class AccessControl(BaseModel):
     class Meta:
-        orm_model = AccessControlDBModel
+        orm_model = _DBModel("AccessControlDBModel")
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=DEFER_BUILD)
     __hash__ = object.__hash__
     base_type: str = Field(default="AccessControl")
     name: str = Field(default=None, description="Name of the access group")
@@ -3195,9 +3152,9 @@ class Meta:
 
 class Source(BaseModel):
     class Meta:
-        orm_model = SourceDBModel
+        orm_model = _DBModel("SourceDBModel")
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=DEFER_BUILD)
     __hash__ = object.__hash__
     base_type: str = Field(default="Source")
     format: Optional[str] = Field(
@@ -3210,9 +3167,9 @@ class Meta:
 
 class Assets(BaseModel):
     class Meta:
-        orm_model = AssetsDBModel
+        orm_model = _DBModel("AssetsDBModel")
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=DEFER_BUILD)
     __hash__ = object.__hash__
     base_type: str = Field(default="Assets")
     count: Optional[int] = Field(default=None, description="Total count of assets")
@@ -3251,9 +3208,9 @@ def validate_links(cls, v):
 
 class Evidence(BaseModel):
     class Meta:
-        orm_model = EvidenceDBModel
+        orm_model = _DBModel("EvidenceDBModel")
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=DEFER_BUILD)
     __hash__ = object.__hash__
     base_type: str = Field(default="Evidence")
     sha: Optional[str] = Field(
@@ -3269,9 +3226,9 @@ class Meta:
 
 class ReleaseLinks(BaseModel):
     class Meta:
-        orm_model = ReleaseLinksDBModel
+        orm_model = _DBModel("ReleaseLinksDBModel")
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=DEFER_BUILD)
     __hash__ = object.__hash__
     base_type: str = Field(default="ReleaseLinks")
     closed_issues_url: Optional[Union[HttpUrl, str]] = Field(
@@ -3299,9 +3256,9 @@ class Meta:
 
 class Release(BaseModel):
     class Meta:
-        orm_model = ReleaseDBModel
+        orm_model = _DBModel("ReleaseDBModel")
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=DEFER_BUILD)
     __hash__ = object.__hash__
     base_type: str = Field(default="Release")
     tag_name: Optional[str] = Field(default=None, description="Tag name of the release")
@@ -3364,9 +3321,9 @@ def validate_evidences(cls, v):
 
 class Token(BaseModel):
     class Meta:
-        orm_model = TokenDBModel
+        orm_model = _DBModel("TokenDBModel")
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=DEFER_BUILD)
     __hash__ = object.__hash__
     base_type: str = Field(default="Token")
     id: Optional[int] = Field(None, description="Token ID")
@@ -3378,9 +3335,9 @@ class Meta:
 
 class ToDo(BaseModel):
     class Meta:
-        orm_model = ToDoDBModel
+        orm_model = _DBModel("ToDoDBModel")
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=DEFER_BUILD)
     __hash__ = object.__hash__
     base_type: str = Field(default="ToDo")
     id: int = Field(default=None, description="To-do identifier")
@@ -3405,9 +3362,9 @@ class Meta:
 
 class WikiPage(BaseModel):
     class Meta:
-        orm_model = WikiPageDBModel
+        orm_model = _DBModel("WikiPageDBModel")
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=DEFER_BUILD)
     __hash__ = object.__hash__
     base_type: str = Field(default="WikiPage")
     content: Optional[str] = Field(None, description="Content of the wiki page")
@@ -3425,9 +3382,9 @@ class Meta:
 
 class WikiAttachmentLink(BaseModel):
     class Meta:
-        orm_model = WikiAttachmentLinkDBModel
+        orm_model = _DBModel("WikiAttachmentLinkDBModel")
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=DEFER_BUILD)
     __hash__ = object.__hash__
     base_type: str = Field(default="WikiAttachmentLink")
     url: Optional[Union[HttpUrl, str]] = Field(
@@ -3440,9 +3397,9 @@ class Meta:
 
 class WikiAttachment(BaseModel):
     class Meta:
-        orm_model = WikiAttachmentDBModel
+        orm_model = _DBModel("WikiAttachmentDBModel")
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=DEFER_BUILD)
     __hash__ = object.__hash__
     base_type: str = Field(default="WikiAttachment")
     file_name: Optional[str] = Field(None, description="Name of the uploaded file")
@@ -3457,9 +3414,9 @@ class Meta:
 
 class Agent(BaseModel):
     class Meta:
-        orm_model = AgentDBModel
+        orm_model = _DBModel("AgentDBModel")
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=DEFER_BUILD)
     __hash__ = object.__hash__
     base_type: str = Field(default="Agent")
     id: int = Field(default=None, description="Agent identifier")
@@ -3470,9 +3427,9 @@ class Meta:
 
 class Agents(BaseModel):
     class Meta:
-        orm_model = AgentsDBModel
+        orm_model = _DBModel("AgentsDBModel")
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=DEFER_BUILD)
     __hash__ = object.__hash__
     base_type: str = Field(default="Agents")
     allowed_agents: list[Agent] = Field(
@@ -3489,7 +3446,7 @@ class Meta:
 
 
 class Response(BaseModel):
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=DEFER_BUILD)
     base_type: str = Field(default="Response")
     data: Optional[
         Union[
@@ -3567,7 +3524,16 @@ class Response(BaseModel):
     message: Optional[str] = Field(default=None, description="Any error messages")
 
     @field_validator("data")
-    def determine_model_type(cls, value):
+    def determine_model_type(cls, value, info: ValidationInfo):
+        """
+        Trial-and-error dispatch of untyped payloads against every known model.
+
+        This is the fallback path for payloads whose endpoint does not declare a
+        response model. Callers that already validated the data against a declared
+        model pass ``{"model_fallback": False}`` as the validation context to skip it.
+        """
+        if info.context and not info.context.get("model_fallback", True):
+            return value
         single_models = {
             "Agents": Agents,
             "Branch": Branch,
@@ -3619,21 +3585,54 @@ def determine_model_type(cls, value):
                             model(**item) if isinstance(item, dict) else item
                             for item in value
                         ]
-                        logging.info(f"{model_name} Validation Success: {temp_value}")
+                        logging.debug("%s Validation Success", model_name)
                         return temp_value
                     except Exception as e:
-                        logging.error(
-                            f"\n\n\n {model_name} Validation Failed: {value}\nError: {e}"
-                        )
+                        logging.debug("%s Validation Failed: %s", model_name, e)
             return value
         elif isinstance(value, dict):
             for model_name, model in single_models.items():
                 try:
                     temp_value = model(**value)
-                    logging.info(f"{model_name} Model Validation Success: {value}")
+                    logging.debug("%s Model Validation Success", model_name)
                     return temp_value
                 except Exception as e:
-                    logging.error(
-                        f"\n\n\n {model_name} Dict Validation Failed for  - {value}\nError: {e}"
-                    )
+                    logging.debug("%s Dict Validation Failed: %s", model_name, e)
         return value
+
+
+@functools.lru_cache(maxsize=None)
+def get_type_adapter(response_model: Any) -> TypeAdapter:
+    """
+    Return a cached TypeAdapter for a response model such as ``Project`` or ``List[Project]``.
+
+    Building the core schema of a TypeAdapter is expensive, so each declared
+    response type is compiled once per process and reused for every payload.
+    """
+    return TypeAdapter(response_model)
+
+
+def warm_up(*response_models: Any, response: bool = True) -> None:
+    """
+    Build the validators of the response models a service uses, and their cached
+    TypeAdapters, ahead of its first request.
+
+    With GITLAB_API_DEFER_BUILD=1 no validator is built at import; each model is
+    built the first time it validates. Warming up the models a worker requests,
+    while it starts, keeps that cost off the first requests without paying for
+    the models it never uses.
+
+    Usage:
+        warm_up(Project, List[Project], List[Job])
+
+    Args:
+    - *response_models: Response models as passed to the API, such as Project
+      or List[Project].
+    - response: Also build the Response model wrapping every payload.
+    """
+    for response_model in response_models:
+        if isinstance(response_model, type) and issubclass(response_model, BaseModel):
+            response_model.model_rebuild()
+        get_type_adapter(response_model)
+    if response:
+        Response.model_rebuild()
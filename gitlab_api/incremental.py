@@ -0,0 +1,181 @@
+#!/usr/bin/python
+# coding: utf-8
+
+import logging
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional
+
+from gitlab_api.exceptions import MissingParameterError, ParameterError
+from gitlab_api.gitlab_db_models import SyncStateDBModel
+from gitlab_api.gitlab_input_models import (
+    MergeRequestModel,
+    PipelineModel,
+    ProjectModel,
+)
+from gitlab_api.gitlab_response_models import (
+    MergeRequest,
+    Pipeline,
+    Project,
+    get_type_adapter,
+)
+from gitlab_api.loader import copy_load
+
+# Resource: (input model, response model, filter parameter, watermark field)
+SYNC_RESOURCES = {
+    "projects": (
+        ProjectModel,
+        List[Project],
+        "last_activity_after",
+        "last_activity_at",
+    ),
+    "merge_requests": (
+        MergeRequestModel,
+        List[MergeRequest],
+        "updated_after",
+        "updated_at",
+    ),
+    "pipelines": (PipelineModel, List[Pipeline], "updated_after", "updated_at"),
+}
+
+
+def _utc(value: Any) -> Optional[datetime]:
+    if value is None:
+        return None
+    if isinstance(value, str):
+        value = get_type_adapter(datetime).validate_python(value)
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def _has_next_page(page: Any) -> bool:
+    headers = {
+        name.lower(): value
+        for name, value in (getattr(page, "headers", None) or {}).items()
+    }
+    return bool(headers.get("x-next-page")) or 'rel="next"' in headers.get("link", "")
+
+
+def get_watermark(session, resource: str) -> Optional[datetime]:
+    """
+    Return the high-water mark recorded for a resource key, in UTC, or None.
+    """
+    SyncStateDBModel.__table__.create(session.connection(), checkfirst=True)
+    state = session.get(SyncStateDBModel, resource)
+    return _utc(state.watermark) if state else None
+
+
+def sync(
+    client,
+    session,
+    resource: str,
+    project_id: Optional[Any] = None,
+    full: bool = False,
+    batch_size: int = 10000,
+    **kwargs,
+) -> Dict[str, Any]:
+    """
+    Incrementally sync projects, merge requests or pipelines into the database models.
+
+    The newest last_activity_at of projects, and updated_at of merge requests and
+    pipelines, loaded by a run is recorded in the sync_state table. The next run
+    passes it as last_activity_after or updated_after, so only what changed since
+    is fetched. GitLab includes items updated at the watermark itself, which are
+    merged again rather than missed. Items are requested oldest first, ordered by
+    the watermark field. The watermark only advances once every page was fetched
+    and written: a run cut short by max_pages keeps the previous watermark.
+
+    Usage:
+        sync(client=client, session=session, resource="projects")
+        sync(client=client, session=session, resource="merge_requests", project_id=4)
+
+    Args:
+    - client: Api client.
+    - session: SQLAlchemy session.
+    - resource: "projects", "merge_requests" or "pipelines".
+    - project_id: Project of the merge requests or pipelines; required for pipelines.
+    - full: Fetch everything, ignoring the recorded watermark.
+    - batch_size: Models loaded, and committed, at a time, see copy_load.
+    - **kwargs: Further parameters of ProjectModel, MergeRequestModel or PipelineModel.
+      The order is set by sync.
+
+    Returns:
+    - The statistics of copy_load, with the resource key and the new watermark.
+
+    Raises:
+    - ParameterError: If the resource is not supported, or another order or keyset
+      pagination is asked for.
+    - MissingParameterError: If pipelines are synced without a project_id.
+    """
+    if resource not in SYNC_RESOURCES:
+        raise ParameterError(f"Unsupported sync resource: {resource}")
+    input_model, response_model, parameter, field = SYNC_RESOURCES[resource]
+    if resource == "pipelines" and project_id is None:
+        raise MissingParameterError
+    if project_id is None:
+        path = f"/{resource}"
+    else:
+        path = f"/projects/{project_id}/{resource}"
+    key = path.lstrip("/")
+    if kwargs.get("order_by", field) != field or kwargs.get("sort", "asc") != "asc":
+        raise ParameterError(f"Sync orders {key} by {field} ascending")
+    if kwargs.get("pagination") == "keyset":
+        raise ParameterError(f"Sync of {key} does not support keyset pagination")
+
+    watermark = None if full else get_watermark(session, key)
+    if watermark is not None:
+        kwargs[parameter] = watermark.isoformat()
+    kwargs.setdefault("per_page", 100)
+    model = input_model(project_id=project_id, **kwargs)
+    params = {
+        name: value
+        for name, value in model.api_parameters.items()
+        if name not in ("max_pages", "total_pages", "page")
+    }
+    # GitLab returns the newest items first by default: oldest first, a crawl
+    # never passes the watermark over items it has not fetched yet
+    params["order_by"] = field
+    params["sort"] = "asc"
+    max_pages = getattr(model, "max_pages", None)
+    pages = client.iter_pages(
+        path=path,
+        params=params,
+        response_model=response_model,
+        max_pages=max_pages,
+        max_workers=getattr(model, "max_workers", None),
+        # The database models are written from validated models, with every field
+        validate=True,
+        fields=None,
+    )
+    newest = {"watermark": watermark, "complete": True}
+
+    def track(pages: Iterable[Any]) -> Iterable[Any]:
+        for count, page in enumerate(pages, start=1):
+            if max_pages and count >= max_pages and _has_next_page(page):
+                logging.warning(f"Incomplete sync of {key}: stopped at {count} pages")
+                newest["complete"] = False
+            data = getattr(page, "data", None)
+            if getattr(page, "status_code", 500) >= 400 or not isinstance(data, list):
+                logging.error(f"Incomplete sync of {key}: {page}")
+                newest["complete"] = False
+                continue
+            for item in data:
+                value = _utc(getattr(item, field, None))
+                if value and (
+                    newest["watermark"] is None or value > newest["watermark"]
+                ):
+                    newest["watermark"] = value
+            yield page
+
+    statistics = copy_load(pages=track(pages), session=session, batch_size=batch_size)
+    if newest["complete"]:
+        state = session.get(SyncStateDBModel, key) or SyncStateDBModel(resource=key)
+        state.watermark = newest["watermark"]
+        state.synced_at = datetime.now(timezone.utc)
+        state.rows = statistics["rows"]
+        session.add(state)
+        session.commit()
+    statistics["resource"] = key
+    statistics["watermark"] = newest["watermark"] if newest["complete"] else watermark
+    logging.info(f"Synced {key} up to {statistics['watermark']}")
+    return statistics
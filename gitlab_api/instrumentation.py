@@ -0,0 +1,424 @@
+#!/usr/bin/python
+# coding: utf-8
+
+import bisect
+import logging
+import threading
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+from urllib.parse import parse_qsl, urlsplit
+
+# Name and keyword arguments of the outermost Api method being called, set by
+# require_auth, so every request it makes can be attributed to it
+CURRENT_ENDPOINT: ContextVar[Optional[Tuple[str, Dict[str, Any]]]] = ContextVar(
+    "gitlab_api_endpoint", default=None
+)
+
+PHASES = ("network", "parse", "validation")
+LATENCY_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+)
+SIZE_BUCKETS = (
+    1024,
+    4096,
+    16384,
+    65536,
+    262144,
+    1048576,
+    4194304,
+    16777216,
+)
+
+
+def url_template(path: str, arguments: Optional[Dict[str, Any]] = None) -> str:
+    """
+    The path of a request with its identifiers replaced by placeholders, e.g.
+    /projects/{project_id}/repository/branches/{branch}.
+
+    Segments matching the value of an argument of the Api method are named after
+    the argument, each argument at most once. Remaining numeric, or URL encoded,
+    segments become {id}.
+
+    Args:
+    - path: Path of the request, relative to the API url.
+    - arguments: Keyword arguments the Api method was called with.
+    """
+    segments = path.strip("/").split("/")
+    values = []
+    for name, value in (arguments or {}).items():
+        if isinstance(value, bool) or not isinstance(value, (int, str)):
+            continue
+        value = str(value)
+        if value and not value.startswith("/"):
+            values.append((value.strip("/").split("/"), name))
+    template = []
+    index = 0
+    while index < len(segments):
+        for parts, name in values:
+            if segments[index : index + len(parts)] == parts:
+                template.append(f"{{{name}}}")
+                values.remove((parts, name))
+                index = index + len(parts)
+                break
+        else:
+            segment = segments[index]
+            template.append("{id}" if segment.isdigit() or "%" in segment else segment)
+            index = index + 1
+    return "/" + "/".join(template)
+
+
+class RequestEvent(object):
+    """
+    One HTTP request made by an Api and the decoding of its response.
+
+    Attributes:
+    - method: Name of the Api method that made the request, e.g. "get_branch".
+    - verb: HTTP method of the request.
+    - url_template: Path relative to the API url with identifiers replaced, see url_template().
+    - url: The full URL requested, query string included.
+    - status_code: Status of the response.
+    - network_seconds: Time spent sending the request and reading the response,
+      retries and their backoff included.
+    - wait_seconds: Time the request waited for the RateLimitGovernor.
+    - parse_seconds: Time spent decoding the JSON body.
+    - validation_seconds: Time spent validating the payload into the Response model.
+    - response_bytes: Body bytes received. 0 for a 304 served from the ResponseCache.
+    - page: Page number of a paginated response, when known.
+    - retries: Times the request was retried, after errors or 429 responses.
+    - from_cache: The body was served from the ResponseCache.
+    """
+
+    def __init__(
+        self,
+        verb: str,
+        url: str,
+        status_code: int,
+        network_seconds: float = 0.0,
+        wait_seconds: float = 0.0,
+        response_bytes: int = 0,
+        page: Optional[int] = None,
+        retries: int = 0,
+        from_cache: bool = False,
+    ):
+        self.method = None
+        self.verb = verb
+        self.url_template = None
+        self.url = url
+        self.status_code = status_code
+        self.network_seconds = network_seconds
+        self.wait_seconds = wait_seconds
+        self.parse_seconds = 0.0
+        self.validation_seconds = 0.0
+        self.response_bytes = response_bytes
+        self.page = page
+        self.retries = retries
+        self.from_cache = from_cache
+
+    @property
+    def total_seconds(self) -> float:
+        return (
+            self.wait_seconds
+            + self.network_seconds
+            + self.parse_seconds
+            + self.validation_seconds
+        )
+
+    def as_dict(self) -> Dict[str, Any]:
+        return dict(vars(self), total_seconds=self.total_seconds)
+
+    def __repr__(self) -> str:
+        return (
+            f"RequestEvent({self.method} {self.verb} {self.url_template} "
+            f"{self.status_code} {self.total_seconds * 1000:.1f}ms)"
+        )
+
+
+def _page_number(response) -> Optional[int]:
+    page = response.headers.get("X-Page")
+    if not page:
+        query = urlsplit(response.request.url).query if response.request else ""
+        page = dict(parse_qsl(query)).get("page")
+    try:
+        return int(page)
+    except (TypeError, ValueError):
+        return None
+
+
+class Instrumentation(object):
+    """
+    Hooks called with a RequestEvent for every response an Api decodes.
+
+    The transport adapter measures each request and attaches its event to the
+    response, process_response adds the parse and validation times and emits it.
+    Hooks run in the thread that consumes the response. An exception raised by a
+    hook is logged and does not fail the request.
+
+    Args:
+    - base_url: The API url of the client, removed from the URL templates.
+    - hooks: Callables taking a RequestEvent.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        hooks: Optional[Sequence[Callable[[RequestEvent], Any]]] = None,
+    ):
+        self.base_path = urlsplit(base_url).path.rstrip("/")
+        self.hooks = list(hooks or [])
+
+    def add_hook(self, hook: Callable[[RequestEvent], Any]):
+        self.hooks.append(hook)
+
+    def remove_hook(self, hook: Callable[[RequestEvent], Any]):
+        self.hooks.remove(hook)
+
+    def track(
+        self,
+        response,
+        network_seconds: float,
+        wait_seconds: float = 0.0,
+        retries: int = 0,
+    ):
+        """
+        Attach the RequestEvent of a response received by the transport adapter.
+        """
+        from_cache = getattr(response, "from_cache", False)
+        response.request_event = RequestEvent(
+            verb=response.request.method,
+            url=response.request.url,
+            status_code=response.status_code,
+            network_seconds=network_seconds - wait_seconds,
+            wait_seconds=wait_seconds,
+            response_bytes=0 if from_cache else len(response.content or b""),
+            page=_page_number(response),
+            retries=retries,
+            from_cache=from_cache,
+        )
+        response.instrumentation = self
+
+    def emit(self, event: RequestEvent):
+        """
+        Name the event after the Api method being called and pass it to every hook.
+        """
+        endpoint = CURRENT_ENDPOINT.get()
+        method, arguments = endpoint if endpoint is not None else (None, None)
+        path = urlsplit(event.url).path
+        if self.base_path and path.startswith(self.base_path):
+            path = path[len(self.base_path) :]
+        event.method = method
+        event.url_template = url_template(path, arguments)
+        for hook in list(self.hooks):
+            try:
+                hook(event)
+            except Exception as hook_error:
+                logging.error(f"Instrumentation Hook Error: {hook_error}")
+
+
+class _Histogram(object):
+    """
+    Cumulative bucket counts, sum and count of observed values.
+    """
+
+    def __init__(self, buckets: Sequence[float]):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum = self.sum + value
+        self.count = self.count + 1
+
+    def cumulative(self) -> List[Tuple[str, int]]:
+        """
+        (upper bound, observations at or below it) pairs, ending with +Inf.
+        """
+        total = 0
+        pairs = []
+        for bound, count in zip(self.buckets + (float("inf"),), self.counts):
+            total = total + count
+            pairs.append(("+Inf" if bound == float("inf") else repr(bound), total))
+        return pairs
+
+
+class HistogramAggregator(object):
+    """
+    Instrumentation hook keeping latency and size histograms in memory, per Api
+    method, HTTP verb, URL template and status.
+
+    Usage:
+        histograms = HistogramAggregator()
+        client = Api(url=url, token=token, hooks=[histograms])
+        client.get_projects()
+        print(histograms.summary()[0])
+        print(prometheus_text(histograms))
+
+    Args:
+    - latency_buckets: Upper bounds, in seconds, of the latency buckets of each phase.
+    - size_buckets: Upper bounds, in bytes, of the response size buckets.
+    """
+
+    def __init__(
+        self,
+        latency_buckets: Sequence[float] = LATENCY_BUCKETS,
+        size_buckets: Sequence[int] = SIZE_BUCKETS,
+    ):
+        self.latency_buckets = tuple(sorted(latency_buckets))
+        self.size_buckets = tuple(sorted(size_buckets))
+        self._series = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, event: RequestEvent):
+        key = (
+            event.method or "",
+            event.verb,
+            event.url_template,
+            str(event.status_code),
+        )
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = {
+                    "latency": {
+                        phase: _Histogram(self.latency_buckets) for phase in PHASES
+                    },
+                    "size": _Histogram(self.size_buckets),
+                    "retries": 0,
+                    "cached": 0,
+                }
+                self._series[key] = series
+            series["latency"]["network"].observe(event.network_seconds)
+            series["latency"]["parse"].observe(event.parse_seconds)
+            series["latency"]["validation"].observe(event.validation_seconds)
+            series["size"].observe(event.response_bytes)
+            series["retries"] += event.retries
+            series["cached"] += int(event.from_cache)
+
+    def series(self) -> Dict[Tuple[str, str, str, str], Dict[str, Any]]:
+        """
+        A copy of the histograms, keyed by (method, verb, url_template, status).
+        """
+        with self._lock:
+            return {
+                key: {
+                    "latency": {
+                        phase: {
+                            "buckets": histogram.cumulative(),
+                            "sum": histogram.sum,
+                            "count": histogram.count,
+                        }
+                        for phase, histogram in series["latency"].items()
+                    },
+                    "size": {
+                        "buckets": series["size"].cumulative(),
+                        "sum": series["size"].sum,
+                        "count": series["size"].count,
+                    },
+                    "retries": series["retries"],
+                    "cached": series["cached"],
+                }
+                for key, series in self._series.items()
+            }
+
+    def summary(self) -> List[Dict[str, Any]]:
+        """
+        One row per series with its request count, mean seconds per phase, mean
+        response bytes and retries, the series taking the most time in total first.
+        """
+        rows = []
+        for (method, verb, template, status), series in self.series().items():
+            count = series["size"]["count"]
+            row = {
+                "method": method,
+                "verb": verb,
+                "url_template": template,
+                "status": status,
+                "count": count,
+                "total_seconds": sum(
+                    latency["sum"] for latency in series["latency"].values()
+                ),
+                "bytes": series["size"]["sum"] / count,
+                "retries": series["retries"],
+            }
+            for phase, latency in series["latency"].items():
+                row[f"{phase}_seconds"] = latency["sum"] / count
+            rows.append(row)
+        return sorted(rows, key=lambda row: row["total_seconds"], reverse=True)
+
+    def reset(self):
+        with self._lock:
+            self._series = {}
+
+
+def _labels(**labels) -> str:
+    escaped = (
+        (name, value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"))
+        for name, value in labels.items()
+    )
+    return ",".join(f'{name}="{value}"' for name, value in escaped)
+
+
+def prometheus_text(aggregator: HistogramAggregator, prefix: str = "gitlab_api") -> str:
+    """
+    The histograms of an aggregator in the Prometheus text exposition format,
+    ready to be served on a /metrics endpoint.
+
+    Exposes <prefix>_request_duration_seconds (a histogram with a phase label:
+    network, parse or validation), <prefix>_response_size_bytes and
+    <prefix>_request_retries_total, labelled with method, verb, url_template and status.
+    """
+    series = sorted(aggregator.series().items())
+    duration = f"{prefix}_request_duration_seconds"
+    size = f"{prefix}_response_size_bytes"
+    retries = f"{prefix}_request_retries_total"
+    lines = [
+        f"# HELP {duration} Time spent on a GitLab API request, by phase.",
+        f"# TYPE {duration} histogram",
+    ]
+    for (method, verb, template, status), values in series:
+        for phase, latency in values["latency"].items():
+            labels = _labels(
+                method=method,
+                verb=verb,
+                url_template=template,
+                status=status,
+                phase=phase,
+            )
+            for bound, count in latency["buckets"]:
+                lines.append(f'{duration}_bucket{{{labels},le="{bound}"}} {count}')
+            lines.append(f"{duration}_sum{{{labels}}} {latency['sum']!r}")
+            lines.append(f"{duration}_count{{{labels}}} {latency['count']}")
+    lines.extend(
+        [
+            f"# HELP {size} Body size of GitLab API responses.",
+            f"# TYPE {size} histogram",
+        ]
+    )
+    for (method, verb, template, status), values in series:
+        labels = _labels(method=method, verb=verb, url_template=template, status=status)
+        for bound, count in values["size"]["buckets"]:
+            lines.append(f'{size}_bucket{{{labels},le="{bound}"}} {count}')
+        lines.append(f"{size}_sum{{{labels}}} {values['size']['sum']!r}")
+        lines.append(f"{size}_count{{{labels}}} {values['size']['count']}")
+    lines.extend(
+        [
+            f"# HELP {retries} Retries of GitLab API requests.",
+            f"# TYPE {retries} counter",
+        ]
+    )
+    for (method, verb, template, status), values in series:
+        labels = _labels(method=method, verb=verb, url_template=template, status=status)
+        lines.append(f"{retries}{{{labels}}} {values['retries']}")
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,267 @@
+#!/usr/bin/python
+# coding: utf-8
+
+import logging
+import time
+from typing import Any, Dict, Iterable, List, Tuple
+
+from sqlalchemy import JSON, column, select, table as table_clause
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+
+try:
+    from psycopg.types.json import Json
+except ImportError:
+    Json = None
+
+from gitlab_api.orm import (
+    _UpsertPlan,
+    _bulk_write,
+    _delete_stale_links,
+    _models,
+    upsert,
+)
+from gitlab_api.utils import is_pydantic
+
+
+def _page_models(page: Any) -> List[Any]:
+    """
+    Models of a page: a Response model as yielded by Api.iter_pages, a single
+    pydantic model as yielded by Api.iter_items, a dictionary returned by
+    pydantic_to_sqlalchemy or a list of models. Pydantic models are flattened
+    into rows directly, without building SQLAlchemy models.
+    """
+    if isinstance(page, list):
+        return page
+    if not isinstance(page, dict) and not is_pydantic(page):
+        if getattr(page, "data", None) is None:
+            logging.error(f"Skipping page without data: {page}")
+            return []
+    return _models(page)
+
+
+def supports_copy(session) -> bool:
+    """
+    Whether the session's database is loaded with COPY: PostgreSQL through psycopg 3.
+    """
+    dialect = session.get_bind().dialect
+    return (
+        Json is not None
+        and dialect.name == "postgresql"
+        and dialect.driver == "psycopg"
+    )
+
+
+def _copy_value(table_column, value: Any) -> Any:
+    if value is not None and isinstance(table_column.type, JSON):
+        return Json(value)
+    return value
+
+
+def _copy_merge(session, table, rows: List[dict], merge: bool = True) -> int:
+    """
+    COPY rows into a temporary staging table with the columns of table, then
+    merge the staging table into table with a single INSERT ... SELECT ... ON
+    CONFLICT DO UPDATE. Rows setting the same columns are staged and merged together.
+
+    Rows without a primary key are inserted without ON CONFLICT (merge=False),
+    their key generated by the table.
+    """
+    connection = session.connection()
+    preparer = connection.dialect.identifier_preparer
+    staging_name = f"{table.name}_staging"
+    staging = preparer.quote(staging_name)
+    # Only the column types are copied: rows staged without their generated key
+    # must not meet the NOT NULL constraints, or the defaults, of the table
+    connection.exec_driver_sql(
+        f"CREATE TEMPORARY TABLE IF NOT EXISTS {staging} ON COMMIT DELETE ROWS "
+        f"AS SELECT * FROM {preparer.format_table(table)} WITH NO DATA"
+    )
+    primary_key = list(table.primary_key.columns)
+    primary_key_names = [table_column.key for table_column in primary_key]
+    defaults = {
+        table_column.key: table_column.default.arg
+        for table_column in table.columns
+        if table_column.default is not None and table_column.default.is_scalar
+    }
+    groups = {}
+    for row in rows:
+        columns = tuple(
+            sorted(
+                name
+                for name, value in row.items()
+                if merge or name not in primary_key_names or value is not None
+            )
+        )
+        groups.setdefault(columns, []).append(row)
+
+    written = 0
+    for columns, group in groups.items():
+        copied_columns = list(columns) + [
+            name for name in defaults if name not in columns
+        ]
+        table_columns = [table.columns[name] for name in copied_columns]
+        column_list = ", ".join(
+            preparer.quote(table_column.name) for table_column in table_columns
+        )
+        with connection.connection.driver_connection.cursor() as cursor:
+            with cursor.copy(f"COPY {staging} ({column_list}) FROM STDIN") as copy:
+                for row in group:
+                    copy.write_row(
+                        [
+                            _copy_value(
+                                table_column,
+                                row.get(
+                                    table_column.key, defaults.get(table_column.key)
+                                ),
+                            )
+                            for table_column in table_columns
+                        ]
+                    )
+        staging_table = table_clause(
+            staging_name, *[column(table_column.name) for table_column in table_columns]
+        )
+        statement = postgresql_insert(table).from_select(
+            table_columns, select(*staging_table.columns)
+        )
+        updated_columns = [name for name in columns if name not in primary_key_names]
+        if merge and updated_columns:
+            statement = statement.on_conflict_do_update(
+                index_elements=primary_key,
+                set_={name: statement.excluded[name] for name in updated_columns},
+            )
+        elif merge:
+            statement = statement.on_conflict_do_nothing(index_elements=primary_key)
+        connection.execute(statement)
+        connection.exec_driver_sql(f"TRUNCATE {staging}")
+        written += len(group)
+    return written
+
+
+def _load(
+    session, models: List[Any], batch_size: int, identity_map: dict
+) -> Tuple[Dict[str, int], Dict[str, int]]:
+    if not supports_copy(session):
+        statistics = upsert(
+            model={"data": models},
+            session=session,
+            batch_size=batch_size,
+            identity_map=identity_map,
+        )
+        return (
+            (statistics["tables"], statistics["duplicates"]) if statistics else ({}, {})
+        )
+    plan = _UpsertPlan(identity_map=identity_map)
+    for model in models:
+        plan.add(model, replace_links=True)
+    tables = {}
+    for table in plan.tables():
+        plan.resolve(table)
+        _delete_stale_links(session, plan, table, batch_size)
+        rows = plan.rows.get(table, []) + plan.association_rows(table)
+        primary_key_names = [table_column.key for table_column in table.primary_key]
+        keyed = [
+            row
+            for row in rows
+            if all(row.get(name) is not None for name in primary_key_names)
+        ]
+        generated = [
+            row
+            for row in rows
+            if any(row.get(name) is None for name in primary_key_names)
+        ]
+        referenced = plan.referenced()
+        written = _copy_merge(session=session, table=table, rows=keyed)
+        written += _copy_merge(
+            session=session,
+            table=table,
+            rows=[row for row in generated if id(row) not in referenced],
+            merge=False,
+        )
+        generated = [row for row in generated if id(row) in referenced]
+        if generated:
+            written += _bulk_write(
+                session=session,
+                insert=postgresql_insert,
+                table=table,
+                rows=generated,
+                batch_size=batch_size,
+            )
+        plan.remember(table)
+        tables[table.name] = written
+    session.commit()
+    duplicates = {
+        table.name: count for table, count in plan.duplicates.items() if count
+    }
+    return tables, duplicates
+
+
+def copy_load(pages: Iterable[Any], session, batch_size: int = 10000) -> Dict[str, Any]:
+    """
+    Load pages of models into the database models, for initial backfills.
+
+    On PostgreSQL with psycopg 3 the rows of every table are streamed through
+    COPY ... FROM STDIN into a temporary staging table and merged into the table
+    in one INSERT ... SELECT ... ON CONFLICT DO UPDATE, referenced tables first.
+    Rows without a primary key, whose generated key other rows need, are
+    inserted with RETURNING. The many-to-many collections of the loaded models
+    replace their stored links, as with upsert. Other databases are loaded with
+    upsert.
+
+    Pages are consumed lazily and written, and committed, every batch_size
+    models, so the page iterator is never materialized in full. Shared models,
+    such as the authors, projects and namespaces of many items, are written once
+    per load unless their values change.
+
+    Usage:
+        pages = client.iter_pages(path="/projects/1/jobs", response_model=List[Job])
+        copy_load(pages=pages, session=session)
+
+    Args:
+    - pages: Response models as yielded by Api.iter_pages, pydantic models as
+      yielded by Api.iter_items, dictionaries returned by pydantic_to_sqlalchemy
+      or lists of SQLAlchemy models. Pages must be decoded with validate=True.
+    - session: SQLAlchemy session.
+    - batch_size: Models loaded, and committed, at a time.
+
+    Returns:
+    - The rows written, per table and in total, the duplicate models not written
+      again, per table, the seconds taken and the rows per second.
+
+    Raises:
+    - ParameterError: If a page was decoded with validate=False or "construct".
+    """
+    started = time.perf_counter()
+    tables = {}
+    duplicates = {}
+    identity_map = {}
+    models = []
+
+    def flush():
+        written, skipped = _load(session, models, batch_size, identity_map)
+        for name, count in written.items():
+            tables[name] = tables.get(name, 0) + count
+        for name, count in skipped.items():
+            duplicates[name] = duplicates.get(name, 0) + count
+        models.clear()
+
+    for page in pages:
+        models.extend(_page_models(page))
+        if len(models) >= batch_size:
+            flush()
+    if models:
+        flush()
+
+    seconds = time.perf_counter() - started
+    rows = sum(tables.values())
+    rows_per_second = rows / seconds if seconds else float(rows)
+    logging.info(
+        f"Loaded {rows} rows into {len(tables)} tables in {seconds:.2f}s "
+        f"({rows_per_second:.0f} rows/s)"
+    )
+    return {
+        "rows": rows,
+        "seconds": seconds,
+        "rows_per_second": rows_per_second,
+        "tables": tables,
+        "duplicates": duplicates,
+    }
@@ -0,0 +1,673 @@
+#!/usr/bin/python
+# coding: utf-8
+import logging
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import JSON, delete, inspect, tuple_
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import MANYTOONE
+from pydantic_core import to_jsonable_python
+
+from gitlab_api.exceptions import ParameterError
+from gitlab_api.utils import UNMAPPED_FIELDS, is_pydantic, remove_none_values
+
+# Dialects upsert writes with INSERT ... ON CONFLICT DO UPDATE
+UPSERT_DIALECTS = {"postgresql": postgresql_insert, "sqlite": sqlite_insert}
+
+UNVALIDATED_ERROR = (
+    "Only validated models can be written to the database, decode the pages "
+    "with validate=True rather than validate=False or validate='construct'"
+)
+
+
+def _orm_model(schema, identity_map: Optional[dict] = None):
+    """
+    Build the Meta.orm_model of a pydantic schema. With an identity map, schemas
+    of the same model and id share one SQLAlchemy model, updated with the values
+    of every occurrence.
+    """
+    orm_model = schema.Meta.orm_model
+    values = pydantic_to_sqlalchemy(schema, identity_map=identity_map)
+    if identity_map is None or values.get("id") is None:
+        return orm_model(**values)
+    existing_model = identity_map.get((orm_model, values["id"]))
+    if existing_model is None:
+        existing_model = identity_map[(orm_model, values["id"])] = orm_model(**values)
+    else:
+        for attr, value in values.items():
+            setattr(existing_model, attr, value)
+    return existing_model
+
+
+def pydantic_to_sqlalchemy(schema, identity_map: Optional[dict] = None):
+    """
+    Iterates through pydantic schema and parses nested schemas
+    to a dictionary containing SQLAlchemy models.
+    Only works if nested schemas have specified the Meta.orm_model.
+
+    Pass the same identity_map dictionary across calls to build one SQLAlchemy
+    model per (Meta.orm_model, id), however often it is nested, such as the
+    author shared by many merge requests.
+    """
+    logging.debug(f"\n\nSchema: {schema}")
+    parsed_schema = dict(schema)
+    parsed_schema = remove_none_values(dictionary=parsed_schema)
+
+    logging.debug(f"\n\nCleaned Schema: {parsed_schema}")
+    for key, value in parsed_schema.items():
+        if not value:
+            continue
+        logging.debug(f"\n\n\nKEY: {key} VALUE: {value}")
+        try:
+            if isinstance(value, list) and len(value) and is_pydantic(value[0]):
+                logging.debug(f"\n\nUpdating: {key} {parsed_schema[key]}")
+                parsed_schemas = []
+                for item in value:
+                    logging.debug(f"\nGoing through Item: {item} in Value: {value}")
+                    new_model = _orm_model(item, identity_map=identity_map)
+                    logging.debug(
+                        f"\nNew model: {new_model}\n\tFor Item: {item}"  # \n\tIn Value: {value}"
+                    )
+                    parsed_schemas.append(new_model)
+                parsed_schema[key] = parsed_schemas
+            elif is_pydantic(value):
+                logging.debug(f"\n\nUpdating Nonlist: {key} {value}")
+                new_model = _orm_model(value, identity_map=identity_map)
+                logging.debug(
+                    f"\n\nNew Model: {new_model} for schema: {parsed_schema} in key: {key} of value: {value}"
+                )
+                parsed_schema[key] = new_model
+                logging.debug(f"\n\nFinished Updated Nonlist: {key} {value}")
+        except AttributeError as e:
+            logging.debug(
+                f"\n\nFound nested Pydantic model in {schema.__class__} but Meta.orm_model was not specified.\nExact Error: {e}"
+            )
+            raise (
+                f"\n\nFound nested Pydantic model in {schema.__class__} but Meta.orm_model was not specified.\nExact Error: {e}"
+            )
+    logging.debug(f"\n\nReturning parsed schema: {parsed_schema}")
+    return parsed_schema
+
+
+class _Flattener(object):
+    """
+    Writes a pydantic model class straight to table rows, without building the
+    SQLAlchemy models of pydantic_to_sqlalchemy.
+
+    Which fields are columns and which are relationships of Meta.orm_model is
+    worked out once per class; fields the database model does not map are skipped.
+    """
+
+    def __init__(self, model_class):
+        mapper = inspect(model_class.Meta.orm_model)
+        self.table = mapper.local_table
+        self.primary_key_names = [column.key for column in mapper.primary_key]
+        column_attrs = {
+            column_property.key: column_property.columns[0]
+            for column_property in mapper.column_attrs
+        }
+        relationships = {
+            relationship.key: relationship
+            for relationship in mapper.relationships
+            if not relationship.viewonly
+        }
+        self.columns = []
+        self.relationships = []
+        for name in model_class.model_fields:
+            if name in UNMAPPED_FIELDS:
+                continue
+            if name in column_attrs:
+                column = column_attrs[name]
+                convert = None
+                if isinstance(column.type, JSON):
+                    convert = to_jsonable_python
+                self.columns.append((name, column.key, convert))
+            elif name in relationships:
+                self.relationships.append((name, relationships[name]))
+
+    def flatten(
+        self, plan: "_UpsertPlan", instance: Any, replace_links: bool = False
+    ) -> dict:
+        fields = instance.__dict__
+        values = {}
+        for name, key, convert in self.columns:
+            value = fields.get(name)
+            if value is not None:
+                values[key] = convert(value) if convert else value
+        row = plan.add_row(instance, self.table, self.primary_key_names, values)
+
+        for name, relationship in self.relationships:
+            value = fields.get(name)
+            # The response models turn empty lists into None, so every collection
+            # of the payload counts, the fields left out of it do not
+            if (
+                replace_links
+                and relationship.secondary is not None
+                and name in instance.model_fields_set
+            ):
+                plan.replace(relationship, row, self.table)
+            if not value:
+                continue
+            related = value if isinstance(value, list) else [value]
+            for related_instance in related:
+                if not is_pydantic(related_instance):
+                    # Validated models hold models, or ids, in their relationships
+                    if isinstance(related_instance, (dict, str)):
+                        raise ParameterError(UNVALIDATED_ERROR)
+                    continue
+                related_row = plan.add(related_instance)
+                plan.link(
+                    relationship,
+                    row,
+                    self.table,
+                    related_row,
+                    get_flattener(related_instance.__class__).table,
+                )
+        return row
+
+
+_flatteners = {}
+
+
+def get_flattener(model_class) -> _Flattener:
+    """
+    Return the cached _Flattener of a pydantic model class with a Meta.orm_model.
+    """
+    flattener = _flatteners.get(model_class)
+    if flattener is None:
+        flattener = _flatteners[model_class] = _Flattener(model_class)
+    return flattener
+
+
+class _UpsertPlan(object):
+    """
+    Rows to write for a graph of SQLAlchemy or pydantic models, grouped by table.
+
+    Instances with the same primary key are written once, foreign keys are copied
+    from the related rows once those are written, and many-to-many relationships
+    become rows of their association table. Tables are written after the tables
+    their rows reference.
+
+    Many-to-many collections of the models being loaded replace the links stored
+    for them: their links are deleted before the current links are written, see
+    stale_links. Collections left unset keep their stored links.
+
+    identity_map, shared by the plans of one load, holds the shared rows already
+    written, those reached through many-to-one and many-to-many relationships such
+    as authors, projects and namespaces, keyed by (table, primary key). Instances
+    whose values were all written before are not written again.
+    """
+
+    def __init__(self, identity_map: Optional[dict] = None):
+        self.rows = {}
+        self.associations = {}
+        self.replaced = {}
+        self.links = {}
+        self.dependencies = {}
+        self.duplicates = {}
+        self.identity_map = identity_map
+        self._rows_by_key = {}
+        self._rows_by_instance = {}
+        self._instances = []
+        self._reused = set()
+        self._shared = set()
+        self._referenced = None
+
+    def add(self, instance: Any, replace_links: bool = False) -> dict:
+        """
+        Add the rows of a SQLAlchemy model, or of a pydantic model with a
+        Meta.orm_model, and of the models related to it.
+
+        With replace_links, the many-to-many collections instance holds replace
+        its stored links. Only the models being loaded are added with it: the
+        collections of related models are partial, such as those SQLAlchemy
+        back-populates.
+        """
+        row = self._rows_by_instance.get(id(instance))
+        if row is not None:
+            return row
+        if is_pydantic(instance):
+            return get_flattener(instance.__class__).flatten(
+                self, instance, replace_links
+            )
+        if isinstance(instance, dict):
+            raise ParameterError(UNVALIDATED_ERROR)
+        state = inspect(instance)
+        mapper = state.mapper
+        table = mapper.local_table
+        values = {}
+        for column_property in mapper.column_attrs:
+            if column_property.key in state.dict:
+                values[column_property.columns[0].key] = state.dict[column_property.key]
+        row = self.add_row(
+            instance, table, [column.key for column in mapper.primary_key], values
+        )
+
+        for relationship in mapper.relationships:
+            if relationship.viewonly or relationship.key not in state.dict:
+                continue
+            value = state.dict[relationship.key]
+            if (
+                replace_links
+                and value is not None
+                and relationship.secondary is not None
+            ):
+                self.replace(relationship, row, table)
+            if not value:
+                continue
+            related = value if isinstance(value, (list, set, tuple)) else [value]
+            for related_instance in related:
+                related_row = self.add(related_instance)
+                self.link(
+                    relationship,
+                    row,
+                    table,
+                    related_row,
+                    inspect(related_instance).mapper.local_table,
+                )
+        return row
+
+    def add_row(self, instance: Any, table, primary_key_names, values: dict) -> dict:
+        """
+        The row of instance: values, merged into the row already added with the
+        same primary key, if any, or the row written by an earlier plan with the
+        same values.
+        """
+        primary_key = tuple(values.get(name) for name in primary_key_names)
+        key = None if None in primary_key else (table, primary_key)
+        row = self._rows_by_key.get(key) if key else None
+        if row is None and key and self.identity_map is not None:
+            written = self.identity_map.get(key)
+            if written is not None and values.items() <= written.items():
+                row = self._rows_by_key[key] = written
+                self._reused.add(id(row))
+                self.rows.setdefault(table, [])
+        if row is None:
+            row = values
+            self.rows.setdefault(table, []).append(row)
+            if key:
+                self._rows_by_key[key] = row
+        else:
+            self.duplicates[table] = self.duplicates.get(table, 0) + 1
+            if id(row) in self._reused:
+                self._rewrite(table, row, values)
+            else:
+                row.update(values)
+        self._rows_by_instance[id(instance)] = row
+        self._instances.append(instance)
+        return row
+
+    def _rewrite(self, table, row: dict, values: dict):
+        """
+        Write again a row an earlier plan wrote, once values change it.
+        """
+        if values.items() <= row.items():
+            return
+        row.update(values)
+        self._reused.discard(id(row))
+        self.rows.setdefault(table, []).append(row)
+        self.duplicates[table] -= 1
+
+    def replace(self, relationship, row: dict, table):
+        """
+        Record that row holds the whole collection of a many-to-many relationship.
+        """
+        pairs = tuple(
+            (secondary.key, local.key)
+            for local, secondary in relationship.synchronize_pairs
+        )
+        self.replaced.setdefault(relationship.secondary, {}).setdefault(
+            pairs, []
+        ).append(row)
+        self.dependencies.setdefault(relationship.secondary, set()).add(table)
+
+    def link(self, relationship, row: dict, table, related_row: dict, related_table):
+        if relationship.secondary is not None:
+            association = {}
+            links = [
+                (association, secondary.key, row, local.key)
+                for local, secondary in relationship.synchronize_pairs
+            ]
+            links.extend(
+                (association, secondary.key, related_row, remote.key)
+                for remote, secondary in relationship.secondary_synchronize_pairs
+            )
+            self.associations.setdefault(relationship.secondary, []).append(
+                (association, links)
+            )
+            self._shared.add(id(related_row))
+            self.dependencies.setdefault(relationship.secondary, set()).update(
+                (table, related_table)
+            )
+        elif relationship.direction is MANYTOONE:
+            self.links.setdefault(table, []).extend(
+                (row, local.key, related_row, remote.key)
+                for local, remote in relationship.local_remote_pairs
+            )
+            self.dependencies.setdefault(table, set()).add(related_table)
+            self._shared.add(id(related_row))
+        else:
+            self.links.setdefault(related_table, []).extend(
+                (related_row, remote.key, row, local.key)
+                for local, remote in relationship.local_remote_pairs
+            )
+            self.dependencies.setdefault(related_table, set()).add(table)
+
+    def tables(self) -> list:
+        """
+        Tables in the order they are written: every table after the tables its
+        rows take keys from. Only the relationships being written count, so
+        cycles among the foreign keys of the schema do not matter.
+        """
+        ordered = []
+        visiting = set()
+
+        def visit(table):
+            if table in visiting or table in ordered:
+                return
+            visiting.add(table)
+            for dependency in sorted(
+                self.dependencies.get(table, ()), key=lambda item: item.name
+            ):
+                if dependency is not table:
+                    visit(dependency)
+            visiting.discard(table)
+            ordered.append(table)
+
+        for table in sorted(
+            set(self.rows) | set(self.associations) | set(self.replaced),
+            key=lambda item: item.name,
+        ):
+            visit(table)
+        return ordered
+
+    def resolve(self, table):
+        """
+        Copy the keys of the related rows, written by now, into the rows of table.
+        """
+        for row, key, source, source_key in self.links.get(table, []):
+            value = source.get(source_key)
+            if value is None:
+                continue
+            if id(row) in self._reused:
+                self._rewrite(table, row, {key: value})
+            else:
+                row[key] = value
+
+    def remember(self, table):
+        """
+        Record the written shared rows of table in the identity map.
+        """
+        if self.identity_map is None:
+            return
+        primary_key_names = [column.key for column in table.primary_key]
+        for row in self.rows.get(table, []):
+            if id(row) not in self._shared:
+                continue
+            primary_key = tuple(row.get(name) for name in primary_key_names)
+            if None not in primary_key:
+                self.identity_map[(table, primary_key)] = row
+
+    def referenced(self) -> set:
+        """
+        Ids of the rows other rows take keys from, which need their generated key.
+        """
+        if self._referenced is None:
+            self._referenced = {
+                id(source) for links in self.links.values() for _, _, source, _ in links
+            }
+            self._referenced.update(
+                id(source)
+                for associations in self.associations.values()
+                for _, links in associations
+                for _, _, source, _ in links
+            )
+        return self._referenced
+
+    def stale_links(self, table) -> List[Tuple[List[str], List[tuple]]]:
+        """
+        The columns of the association table, and the keys of the instances whose
+        links in table are replaced, once the tables of those instances are written.
+        """
+        stale = []
+        for pairs, rows in self.replaced.get(table, {}).items():
+            keys = {tuple(row.get(local_key) for _, local_key in pairs) for row in rows}
+            keys = [key for key in keys if None not in key]
+            if keys:
+                stale.append(([secondary_key for secondary_key, _ in pairs], keys))
+        return stale
+
+    def association_rows(self, table) -> List[dict]:
+        rows = {}
+        for association, links in self.associations.get(table, []):
+            for row, key, source, source_key in links:
+                row[key] = source.get(source_key)
+            if None not in association.values():
+                rows[tuple(sorted(association.items()))] = association
+        return list(rows.values())
+
+
+def _models(model: Any) -> List[Any]:
+    """
+    Models of a dictionary returned by pydantic_to_sqlalchemy, a Response model or
+    a single pydantic model with a Meta.orm_model.
+    """
+    if isinstance(model, dict):
+        data = model.get("data")
+    elif is_pydantic(model):
+        data = model
+    else:
+        data = getattr(model, "data", None)
+    if not data:
+        return []
+    return data if isinstance(data, list) else [data]
+
+
+def flatten(schema: Any) -> Dict[str, List[dict]]:
+    """
+    Flatten a Response model, or a pydantic model, into the rows of its database
+    tables, without building SQLAlchemy models.
+
+    Each row is a dictionary of column values, ready for a Core insert. Models with
+    the same primary key become one row, foreign keys are filled from the related
+    rows and many-to-many relationships become rows of their association table.
+    Keys the database generates, and the foreign keys taken from them, are missing.
+
+    Returns:
+    - The rows per table name, referenced tables first.
+    """
+    plan = _UpsertPlan()
+    for item in _models(schema):
+        plan.add(item)
+    rows = {}
+    for table in plan.tables():
+        plan.resolve(table)
+        rows[table.name] = plan.rows.get(table, []) + plan.association_rows(table)
+    return rows
+
+
+def _batches(rows: List[dict], batch_size: int):
+    for start in range(0, len(rows), batch_size):
+        yield rows[start : start + batch_size]
+
+
+def _group_by_columns(
+    rows: List[dict], exclude: Tuple[str, ...] = ()
+) -> Dict[Tuple[str, ...], List[dict]]:
+    groups = {}
+    for row in rows:
+        columns = tuple(sorted(key for key in row if key not in exclude))
+        groups.setdefault(columns, []).append(row)
+    return groups
+
+
+def _delete_stale_links(session, plan: _UpsertPlan, table, batch_size: int):
+    """
+    Delete the links of the many-to-many collections table holds that the plan
+    replaces, before their current links are written in the same transaction.
+    """
+    for columns, keys in plan.stale_links(table):
+        table_columns = [table.columns[name] for name in columns]
+        if len(table_columns) == 1:
+            target = table_columns[0]
+            keys = [key for (key,) in keys]
+        else:
+            target = tuple_(*table_columns)
+        for batch in _batches(keys, batch_size):
+            session.execute(delete(table).where(target.in_(batch)))
+
+
+def _bulk_write(session, insert, table, rows: List[dict], batch_size: int) -> int:
+    """
+    Write rows with INSERT ... ON CONFLICT DO UPDATE, in executemany batches of
+    rows setting the same columns. Rows without a primary key are inserted and
+    receive the generated key.
+    """
+    primary_key = list(table.primary_key.columns)
+    primary_key_names = tuple(column.key for column in primary_key)
+    keyed = []
+    generated = []
+    for row in rows:
+        if all(row.get(name) is not None for name in primary_key_names):
+            keyed.append(row)
+        else:
+            generated.append(row)
+    written = 0
+    for columns, group in _group_by_columns(keyed).items():
+        statement = insert(table)
+        updated_columns = [name for name in columns if name not in primary_key_names]
+        if updated_columns:
+            statement = statement.on_conflict_do_update(
+                index_elements=primary_key,
+                set_={name: statement.excluded[name] for name in updated_columns},
+            )
+        else:
+            statement = statement.on_conflict_do_nothing(index_elements=primary_key)
+        for batch in _batches(group, batch_size):
+            session.execute(statement, batch)
+            written += len(batch)
+    statement = insert(table).returning(*primary_key, sort_by_parameter_order=True)
+    for columns, group in _group_by_columns(generated, primary_key_names).items():
+        for batch in _batches(group, batch_size):
+            result = session.execute(
+                statement, [{name: row[name] for name in columns} for row in batch]
+            )
+            for row, key in zip(batch, result.all()):
+                row.update(zip(primary_key_names, key))
+            written += len(batch)
+    return written
+
+
+def _merge(data: List[Any], session) -> Dict[str, int]:
+    identity_map = {}
+    data = [
+        _orm_model(item, identity_map=identity_map) if is_pydantic(item) else item
+        for item in data
+    ]
+    item_ids = [item.id for item in data if item.id]
+    existing_items = (
+        session.query(data[0].__class__)
+        .filter(data[0].__class__.id.in_(item_ids))
+        .all()
+    )
+    existing_items_map = {item.id: item for item in existing_items}
+
+    for item in data:
+        logging.debug(f"Going through Item: {item}")
+        if item.id and item.id in existing_items_map:
+            existing_model = existing_items_map[item.id]
+            logging.debug(f"Found Existing Model: {existing_model}")
+            for attr, value in vars(item).items():
+                setattr(existing_model, attr, value)
+            session.merge(existing_model)
+        else:
+            session.merge(item)
+    return {data[0].__table__.name: len(data)}
+
+
+def upsert(
+    model: Any, session, batch_size: int = 1000, identity_map: Optional[dict] = None
+) -> Optional[Dict[str, Any]]:
+    """
+    Insert or update the models in model and the models related to them.
+
+    On PostgreSQL and SQLite the rows are written table by table, referenced tables
+    first, with INSERT ... ON CONFLICT DO UPDATE in executemany batches. Columns a
+    model leaves unset keep their stored value, and many-to-many relationships are
+    written to their association tables, replacing the links stored for the model.
+    Pydantic models are flattened into rows directly, see flatten. Other databases
+    merge model by model.
+
+    Models sharing a primary key, such as the author of many merge requests, are
+    written once. To also skip the shared rows written by earlier calls of the
+    same load, pass them the same identity_map dictionary.
+
+    Args:
+    - model: Response model, or dictionary with the SQLAlchemy models under "data",
+      see pydantic_to_sqlalchemy.
+    - session: SQLAlchemy session, committed once every row is written.
+    - batch_size: Rows sent per executemany batch.
+    - identity_map: Shared rows written so far in this load, updated as rows are written.
+
+    Returns:
+    - The rows written, per table and in total, the duplicate models not written
+      again, per table, the seconds taken and the rows per second.
+    """
+    data = _models(model)
+    if not data:
+        logging.debug(f"No data in model: {model}")
+        return
+
+    started = time.perf_counter()
+    insert = UPSERT_DIALECTS.get(session.get_bind().dialect.name)
+    duplicates = {}
+    if insert is None:
+        tables = _merge(data=data, session=session)
+    else:
+        plan = _UpsertPlan(identity_map=identity_map)
+        for item in data:
+            plan.add(item, replace_links=True)
+        tables = {}
+        for table in plan.tables():
+            plan.resolve(table)
+            _delete_stale_links(session, plan, table, batch_size)
+            rows = plan.rows.get(table, []) + plan.association_rows(table)
+            tables[table.name] = _bulk_write(
+                session=session,
+                insert=insert,
+                table=table,
+                rows=rows,
+                batch_size=batch_size,
+            )
+            plan.remember(table)
+        duplicates = {
+            table.name: count for table, count in plan.duplicates.items() if count
+        }
+    session.commit()
+
+    seconds = time.perf_counter() - started
+    rows = sum(tables.values())
+    rows_per_second = rows / seconds if seconds else float(rows)
+    logging.info(
+        f"Upserted {rows} rows into {len(tables)} tables in {seconds:.2f}s "
+        f"({rows_per_second:.0f} rows/s)"
+    )
+    return {
+        "rows": rows,
+        "seconds": seconds,
+        "rows_per_second": rows_per_second,
+        "tables": tables,
+        "duplicates": duplicates,
+    }
+
+
+def create_table(db_instance, engine):
+    """
+    Create the table of a single database model unless it exists. Use
+    database.bootstrap_schema to create every table at once.
+    """
+    table = db_instance.__table__
+    table.create(engine, checkfirst=True)
+    logging.debug(f"Table {table.name} is present.")
@@ -0,0 +1,190 @@
+#!/usr/bin/python
+# coding: utf-8
+
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Dict, Mapping, Optional
+
+
+def _parse_number(value: Optional[str]) -> Optional[float]:
+    if value is None or value == "":
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Seconds to wait from a Retry-After header, given either as seconds or an HTTP date.
+    """
+    seconds = _parse_number(value)
+    if seconds is not None:
+        return max(seconds, 0.0)
+    if not value:
+        return None
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+class RateLimitGovernor(object):
+    """
+    Token bucket shared by every session, thread and task of a client.
+
+    Requests take a token before they are sent. Tokens refill at the configured
+    rate, or at the pace GitLab's RateLimit headers allow: the remaining budget
+    spread over the time left until RateLimit-Reset. A 429 response, or an
+    exhausted budget, holds every request back until Retry-After or the reset.
+
+    reserve() returns the time the caller must wait instead of sleeping, so the
+    governor can pace blocking and asyncio clients alike.
+
+    Args:
+    - rate: Maximum requests per second (None to only follow the server's limit).
+    - burst: Requests that may be sent at once before pacing starts (defaults to one second of rate).
+    - max_retries: Times a request answered with 429 is retried.
+    - retry_wait: Seconds to wait after a 429 that carries no Retry-After or RateLimit-Reset.
+    - max_wait: Upper bound on any single wait, in seconds.
+    """
+
+    def __init__(
+        self,
+        rate: Optional[float] = None,
+        burst: Optional[int] = None,
+        max_retries: int = 3,
+        retry_wait: float = 1.0,
+        max_wait: float = 60.0,
+    ):
+        self.rate = rate
+        self.burst = burst
+        self.max_retries = max_retries
+        self.retry_wait = retry_wait
+        self.max_wait = max_wait
+        self.limit = None
+        self.remaining = None
+        self.reset = None
+        self.throttled = 0
+        self.waits = 0
+        self.wait_time = 0.0
+        self.total_wait_time = 0.0
+        self._server_rate = None
+        self._tokens = None
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def _current_rate(self) -> Optional[float]:
+        rates = [rate for rate in (self.rate, self._server_rate) if rate is not None]
+        return min(rates) if rates else None
+
+    def _capacity(self, rate: float) -> float:
+        return float(self.burst) if self.burst else max(rate, 1.0)
+
+    def _refill(self, now: float, rate: float):
+        capacity = self._capacity(rate)
+        if self._tokens is None:
+            self._tokens = capacity
+        else:
+            self._tokens = min(self._tokens + (now - self._updated) * rate, capacity)
+        self._updated = now
+
+    def reserve(self) -> float:
+        """
+        Take a token for one request.
+
+        Returns:
+        - Seconds the caller must wait before sending the request.
+        """
+        with self._lock:
+            now = time.monotonic()
+            wait = max(self._blocked_until - now, 0.0)
+            rate = self._current_rate()
+            if rate:
+                self._refill(now, rate)
+                self._tokens -= 1
+                if self._tokens < 0:
+                    wait = max(wait, -self._tokens / rate)
+            else:
+                self._updated = now
+            wait = min(wait, self.max_wait)
+            self.wait_time = wait
+            if wait:
+                self.waits += 1
+                self.total_wait_time += wait
+            return wait
+
+    def update(self, headers: Mapping[str, str], status_code: int = None):
+        """
+        Learn the server's budget from the RateLimit headers of a response.
+
+        Args:
+        - headers: Response headers.
+        - status_code: Response status code; 429 holds back every request until Retry-After.
+        """
+        limit = _parse_number(headers.get("RateLimit-Limit"))
+        remaining = _parse_number(headers.get("RateLimit-Remaining"))
+        reset = _parse_number(headers.get("RateLimit-Reset"))
+        retry_after = parse_retry_after(headers.get("Retry-After"))
+        with self._lock:
+            now = time.monotonic()
+            window = None
+            if reset is not None:
+                window = max(reset - time.time(), 0.0)
+            if limit is not None:
+                self.limit = int(limit)
+            if reset is not None:
+                self.reset = reset
+            if remaining is not None:
+                self.remaining = int(remaining)
+                if window:
+                    self._server_rate = max(remaining, 1.0) / window
+                if self._tokens is not None:
+                    self._tokens = min(self._tokens, remaining)
+                if remaining <= 0 and window:
+                    self._block(now, window)
+            if status_code == 429:
+                self.throttled += 1
+                if retry_after is None:
+                    retry_after = window if window else self.retry_wait
+                self._block(now, retry_after)
+            elif retry_after is not None:
+                self._block(now, retry_after)
+
+    def _block(self, now: float, seconds: float):
+        self._blocked_until = max(
+            self._blocked_until, now + min(seconds, self.max_wait)
+        )
+
+    def metrics(self) -> Dict[str, Optional[float]]:
+        """
+        Current budget and waits.
+
+        Returns:
+        - limit, remaining and reset as last reported by the server, the pacing
+          rate and available tokens, the last and total wait in seconds, the
+          number of paced requests and the number of 429 responses.
+        """
+        with self._lock:
+            rate = self._current_rate()
+            tokens = self._tokens
+            if rate and tokens is not None:
+                tokens = min(
+                    tokens + (time.monotonic() - self._updated) * rate,
+                    self._capacity(rate),
+                )
+            return {
+                "limit": self.limit,
+                "remaining": self.remaining,
+                "reset": self.reset,
+                "rate": rate,
+                "tokens": tokens,
+                "blocked_for": max(self._blocked_until - time.monotonic(), 0.0),
+                "wait_time": self.wait_time,
+                "total_wait_time": self.total_wait_time,
+                "waits": self.waits,
+                "throttled": self.throttled,
+            }
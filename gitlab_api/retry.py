@@ -0,0 +1,182 @@
+#!/usr/bin/python
+# coding: utf-8
+
+import random
+import threading
+from typing import Collection, Dict, Optional
+
+from urllib3.exceptions import MaxRetryError
+from urllib3.util.retry import Retry
+
+from gitlab_api.rate_limit import parse_retry_after
+
+IDEMPOTENT_METHODS = frozenset(["DELETE", "GET", "HEAD", "OPTIONS", "PUT", "TRACE"])
+RETRY_STATUS_CODES = frozenset([500, 502, 503, 504])
+
+
+class _CountingRetry(Retry):
+    """
+    urllib3 Retry that reports every retry, and every exhausted request, to its policy.
+    """
+
+    def __init__(self, *args, policy: "RetryPolicy" = None, **kwargs):
+        self.policy = policy
+        super().__init__(*args, **kwargs)
+
+    def new(self, **kwargs) -> "_CountingRetry":
+        kwargs.setdefault("policy", self.policy)
+        return super().new(**kwargs)
+
+    def is_retry(self, method, status_code, has_retry_after=False) -> bool:
+        if status_code == 429:
+            return False
+        return super().is_retry(method, status_code, has_retry_after=has_retry_after)
+
+    def increment(self, method=None, url=None, response=None, error=None, **kwargs):
+        reason = (
+            error.__class__.__name__ if error else getattr(response, "status", None)
+        )
+        try:
+            new_retry = super().increment(
+                method=method, url=url, response=response, error=error, **kwargs
+            )
+        except MaxRetryError:
+            if self.policy is not None:
+                self.policy.record_exhausted(method)
+            raise
+        if self.policy is not None:
+            self.policy.record_retry(method, reason)
+        return new_retry
+
+
+class RetryPolicy(object):
+    """
+    When and how often failed requests are retried.
+
+    Connection errors are retried for every method, since the request never
+    reached the server. Read errors and the statuses in status_forcelist are only
+    retried for idempotent methods. Waits grow exponentially with random jitter,
+    and a Retry-After header on a 503 is honoured. 429 responses are left to the
+    RateLimitGovernor.
+
+    Retries are counted, see metrics().
+
+    Args:
+    - max_retries: Retries per request (0 disables retrying).
+    - backoff_factor: Wait before the n-th consecutive retry is backoff_factor * 2 ** (n - 1) seconds. The first retry is immediate.
+    - backoff_max: Upper bound on a single wait, in seconds.
+    - jitter: Random extra wait of up to this many seconds.
+    - status_forcelist: Response statuses that are retried.
+    - allowed_methods: Methods retried on read errors and retry statuses.
+    """
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        backoff_factor: float = 0.5,
+        backoff_max: float = 30.0,
+        jitter: float = 0.5,
+        status_forcelist: Collection[int] = RETRY_STATUS_CODES,
+        allowed_methods: Collection[str] = IDEMPOTENT_METHODS,
+    ):
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.backoff_max = backoff_max
+        self.jitter = jitter
+        self.status_forcelist = frozenset(status_forcelist)
+        self.allowed_methods = frozenset(method.upper() for method in allowed_methods)
+        self.retries = 0
+        self.exhausted = 0
+        self.retries_by_reason = {}
+        self.retries_by_method = {}
+        self._lock = threading.Lock()
+
+    def urllib3_retry(self) -> Retry:
+        """
+        The policy as the urllib3 Retry mounted on the requests adapters of an Api.
+        """
+        return _CountingRetry(
+            total=self.max_retries,
+            connect=self.max_retries,
+            read=self.max_retries,
+            status=self.max_retries,
+            redirect=False,
+            other=0,
+            allowed_methods=self.allowed_methods,
+            status_forcelist=self.status_forcelist,
+            backoff_factor=self.backoff_factor,
+            backoff_max=self.backoff_max,
+            backoff_jitter=self.jitter,
+            raise_on_redirect=False,
+            raise_on_status=False,
+            respect_retry_after_header=True,
+            policy=self,
+        )
+
+    def is_retryable(
+        self, method: str, status_code: Optional[int] = None, connect: bool = False
+    ) -> bool:
+        """
+        Whether a request failing with this status, or error, may be retried.
+
+        Args:
+        - method: HTTP method of the request.
+        - status_code: Response status, or None when the request raised an error.
+        - connect: The error happened before the request was sent.
+        """
+        if connect:
+            return True
+        if method.upper() not in self.allowed_methods:
+            return False
+        return status_code is None or status_code in self.status_forcelist
+
+    def get_backoff(
+        self, retry_number: int, retry_after: Optional[str] = None
+    ) -> float:
+        """
+        Seconds to wait before a retry, the same schedule urllib3 follows for Api.
+
+        Args:
+        - retry_number: 1 for the first retry of a request, 2 for the second, ...
+        - retry_after: Retry-After header of the failed response, which takes precedence.
+        """
+        seconds = parse_retry_after(retry_after)
+        if seconds is not None:
+            return seconds
+        if retry_number <= 1:
+            return 0.0
+        backoff = self.backoff_factor * (2 ** (retry_number - 1))
+        if self.jitter:
+            backoff = backoff + random.random() * self.jitter
+        return max(0.0, min(self.backoff_max, backoff))
+
+    def record_retry(self, method: Optional[str], reason):
+        with self._lock:
+            self.retries += 1
+            self.retries_by_reason[str(reason)] = (
+                self.retries_by_reason.get(str(reason), 0) + 1
+            )
+            self.retries_by_method[str(method)] = (
+                self.retries_by_method.get(str(method), 0) + 1
+            )
+
+    def record_exhausted(self, method: Optional[str]):
+        with self._lock:
+            self.exhausted += 1
+
+    def metrics(self) -> Dict[str, object]:
+        """
+        Retry counts.
+
+        Returns:
+        - The total number of retries, retries by reason (status code or
+          exception name) and by method, and the requests that failed after
+          every retry was used.
+        """
+        with self._lock:
+            return {
+                "retries": self.retries,
+                "retries_by_reason": dict(self.retries_by_reason),
+                "retries_by_method": dict(self.retries_by_method),
+                "exhausted": self.exhausted,
+            }
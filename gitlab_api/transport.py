@@ -0,0 +1,206 @@
+#!/usr/bin/python
+# coding: utf-8
+
+import socket
+import time
+from typing import List, Optional, Tuple, Union
+
+import requests
+from requests.adapters import DEFAULT_POOLSIZE, HTTPAdapter
+from urllib3 import PoolManager
+from urllib3.connection import HTTPConnection
+
+from gitlab_api.cache import (
+    ResponseCache,
+    complete_conditional_response,
+    get_cache_key,
+)
+from gitlab_api.instrumentation import Instrumentation
+from gitlab_api.rate_limit import RateLimitGovernor
+from gitlab_api.retry import RetryPolicy
+
+
+def keep_alive_socket_options(interval: int = 60) -> List[Tuple[int, int, int]]:
+    """
+    Socket options enabling TCP keep-alive probes after interval idle seconds, on top
+    of urllib3's defaults (TCP_NODELAY). Options the platform lacks are skipped.
+    """
+    options = list(HTTPConnection.default_socket_options)
+    options.append((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1))
+    for name, value in (
+        ("TCP_KEEPIDLE", interval),
+        ("TCP_KEEPALIVE", interval),
+        ("TCP_KEEPINTVL", interval),
+        ("TCP_KEEPCNT", 3),
+    ):
+        if hasattr(socket, name):
+            options.append((socket.IPPROTO_TCP, getattr(socket, name), value))
+    return options
+
+
+class ConnectionPool(object):
+    """
+    Pooled connections used by every session of a client, and optionally shared by
+    several clients of the same GitLab instance.
+
+    Usage:
+        pool = ConnectionPool(pool_maxsize=32, timeout=(3.05, 30))
+        projects_client = Api(url=url, token=token, connection_pool=pool)
+        jobs_client = Api(url=url, token=other_token, connection_pool=pool)
+
+    Args:
+    - pool_connections: Number of hosts to keep a pool of connections for.
+    - pool_maxsize: Connections kept open per host. Requests beyond it open
+      connections that are discarded afterwards, unless pool_block is set.
+    - pool_block: Wait for a pooled connection rather than opening an extra one.
+    - keep_alive: Reuse connections across requests and send TCP keep-alive probes.
+      False closes the connection after every request.
+    - keep_alive_interval: Idle seconds before, and between, TCP keep-alive probes.
+    - timeout: Connect and read timeout in seconds, a (connect, read) tuple, or None to wait indefinitely.
+    - socket_options: Socket options for new connections, replacing the keep-alive defaults.
+    """
+
+    def __init__(
+        self,
+        pool_connections: int = DEFAULT_POOLSIZE,
+        pool_maxsize: int = DEFAULT_POOLSIZE,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+        keep_alive_interval: int = 60,
+        timeout: Optional[Union[float, Tuple[float, float]]] = None,
+        socket_options: Optional[List[Tuple[int, int, int]]] = None,
+    ):
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self.keep_alive = keep_alive
+        self.timeout = timeout
+        if socket_options is None:
+            socket_options = list(HTTPConnection.default_socket_options)
+            if keep_alive:
+                socket_options = keep_alive_socket_options(keep_alive_interval)
+        self.socket_options = socket_options
+        self.poolmanager = PoolManager(
+            num_pools=pool_connections,
+            maxsize=pool_maxsize,
+            block=pool_block,
+            socket_options=socket_options,
+        )
+
+    def close(self):
+        """
+        Close every pooled connection.
+        """
+        self.poolmanager.clear()
+
+
+class GitLabHTTPAdapter(HTTPAdapter):
+    """
+    HTTPAdapter mounted on every session of an Api.
+
+    Each request waits for the client's RateLimitGovernor before it is sent, every
+    response reports its RateLimit headers back to the governor, and responses
+    with status 429 are retried once the governor allows it. Connection errors and
+    server errors are retried by urllib3 as the client's RetryPolicy prescribes.
+    Connections come from the client's ConnectionPool.
+
+    With a ResponseCache, GET requests carry the ETag of their cached response
+    in If-None-Match, and a 304 answer is served from the cache.
+
+    When the client's Instrumentation has hooks, the body is read before send
+    returns, and the response carries a RequestEvent with the time spent waiting
+    for the rate limiter and on the network, the body size and the retries.
+    """
+
+    def __init__(
+        self,
+        rate_limiter: Optional[RateLimitGovernor] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        connection_pool: Optional[ConnectionPool] = None,
+        cache: Optional[ResponseCache] = None,
+        instrumentation: Optional[Instrumentation] = None,
+        **kwargs,
+    ):
+        self.rate_limiter = rate_limiter
+        self.retry_policy = retry_policy
+        self.connection_pool = connection_pool
+        self.cache = cache
+        self.instrumentation = instrumentation
+        if retry_policy is not None:
+            kwargs["max_retries"] = retry_policy.urllib3_retry()
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, connections, maxsize, block=False, **pool_kwargs):
+        if self.connection_pool is None:
+            return super().init_poolmanager(
+                connections, maxsize, block=block, **pool_kwargs
+            )
+        self._pool_connections = self.connection_pool.pool_connections
+        self._pool_maxsize = self.connection_pool.pool_maxsize
+        self._pool_block = self.connection_pool.pool_block
+        self.poolmanager = self.connection_pool.poolmanager
+
+    def close(self):
+        """
+        Close the proxy connections of this adapter. A ConnectionPool is left open
+        for the other sessions using it, see ConnectionPool.close().
+        """
+        if self.connection_pool is None:
+            return super().close()
+        for proxy in self.proxy_manager.values():
+            proxy.clear()
+
+    def send(self, request: requests.PreparedRequest, **kwargs) -> requests.Response:
+        if self.instrumentation is None or not self.instrumentation.hooks:
+            return self._send_cached(request, **kwargs)
+        started = time.perf_counter()
+        response = self._send_cached(request, **kwargs)
+        if not kwargs.get("stream"):
+            response.content
+        retries = getattr(response.raw, "retries", None)
+        self.instrumentation.track(
+            response,
+            network_seconds=time.perf_counter() - started,
+            wait_seconds=getattr(response, "rate_limit_wait", 0.0),
+            retries=len(getattr(retries, "history", ()))
+            + getattr(response, "rate_limit_retries", 0),
+        )
+        return response
+
+    def _send_cached(
+        self, request: requests.PreparedRequest, **kwargs
+    ) -> requests.Response:
+        if self.connection_pool is not None:
+            if kwargs.get("timeout") is None:
+                kwargs["timeout"] = self.connection_pool.timeout
+            if not self.connection_pool.keep_alive:
+                request.headers["Connection"] = "close"
+        if self.cache is None or request.method != "GET":
+            return self._send(request, **kwargs)
+        key = get_cache_key(request.url, request.headers.get("Authorization"))
+        entry = self.cache.get(key)
+        if entry is not None:
+            request.headers["If-None-Match"] = entry.etag
+        response = self._send(request, **kwargs)
+        return complete_conditional_response(
+            cache=self.cache, key=key, entry=entry, response=response
+        )
+
+    def _send(self, request: requests.PreparedRequest, **kwargs) -> requests.Response:
+        if self.rate_limiter is None:
+            return super().send(request, **kwargs)
+        attempt = 0
+        waited = 0.0
+        while True:
+            wait = self.rate_limiter.reserve()
+            if wait:
+                time.sleep(wait)
+                waited = waited + wait
+            response = super().send(request, **kwargs)
+            self.rate_limiter.update(response.headers, response.status_code)
+            if response.status_code != 429 or attempt >= self.rate_limiter.max_retries:
+                response.rate_limit_wait = waited
+                response.rate_limit_retries = attempt
+                return response
+            attempt = attempt + 1
+            response.close()
@@ -1,152 +1,376 @@
 #!/usr/bin/python
 # coding: utf-8
+import functools
 import logging
 import os
 import pickle
-from typing import Union, Any
+import time
+from base64 import b64encode
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+    get_args,
+    get_origin,
+)
 
-from sqlalchemy.engine import reflection
 import requests
+from pydantic import BaseModel, ValidationError
+from pydantic_core import PydanticUndefined
+
+from gitlab_api.decoders import check_decode_options, decode_json, get_decode_option
+from gitlab_api.exceptions import (
+    AuthError,
+    UnauthorizedError,
+    ParameterError,
+    MissingParameterError,
+)
+from gitlab_api.gitlab_response_models import Response, get_type_adapter
 
-from gitlab_api.gitlab_response_models import Response
+# Fields of response models that are never written to the database
+UNMAPPED_FIELDS = ("json_output", "raw_output", "status_code", "headers", "message")
 
 logging.basicConfig(
     level=logging.ERROR, format="%(asctime)s - %(levelname)s - %(message)s"
 )
 
 
-def process_response(response: requests.Response) -> Union[Response, requests.Response]:
-    try:
-        response.raise_for_status()
-    except Exception as response_error:
-        logging.error(f"Response Error: {response_error}")
-    status_code = response.status_code
-    raw_output = response.content
-    headers = response.headers
-    try:
-        response = response.json()
-    except Exception as response_error:
-        logging.error(f"JSON Conversion Error: {response_error}")
-    try:
-        response = Response(
-            data=response,
-            status_code=status_code,
-            raw_output=raw_output,
-            json_output=response,
-            headers=headers,
+def build_auth_headers(
+    token: str = None, username: str = None, password: str = None
+) -> Dict[str, str]:
+    """
+    Request headers authenticating with a token, or with basic auth credentials.
+
+    Raises:
+        MissingParameterError: If neither a token nor a username and password are given.
+    """
+    if token:
+        return {
+            "Authorization": f"Bearer {token}",
+            "Content-Type": "application/json",
+        }
+    elif username and password:
+        user_pass = f"{username}:{password}".encode()
+        user_pass_encoded = b64encode(user_pass).decode()
+        return {
+            "Authorization": f"Basic {user_pass_encoded}",
+            "Content-Type": "application/json",
+        }
+    raise MissingParameterError
+
+
+def check_auth_response(response: requests.Response):
+    """
+    Raise the matching error when the credentials check request was refused.
+    """
+    if response.status_code == 403:
+        print(f"Unauthorized Error: {response.content}")
+        raise UnauthorizedError
+    elif response.status_code == 401:
+        print(f"Authentication Error: {response.content}")
+        raise AuthError
+    elif response.status_code == 404:
+        print(f"Parameter Error: {response.content}")
+        raise ParameterError
+
+
+def process_response(
+    response: requests.Response,
+    response_model: Any = None,
+    model_fallback: bool = False,
+    retain: Optional[str] = None,
+    validate: Union[bool, str, None] = None,
+    fields: Optional[Iterable[str]] = None,
+) -> Union[Response, requests.Response]:
+    """
+    Convert a requests Response into a Response model.
+
+    Args:
+        response: The HTTP response returned by the session.
+        response_model: The model the endpoint returns, e.g. ``Project`` or ``List[Project]``.
+            The payload is validated directly against it with a cached TypeAdapter.
+            When omitted, the payload is matched by trying every known model in turn.
+        model_fallback: Fall back to trying every known model when the payload does
+            not validate against ``response_model``.
+        retain: What the Response keeps besides the validated ``data``, headers and
+            status: "all" keeps the decoded payload in ``json_output`` and the body
+            in ``raw_output``, "json" only the former, "raw" only the latter and
+            "models" neither. Unless the payload is kept, a payload with a
+            ``response_model`` is validated straight from the body bytes, without
+            building the intermediate tree of lists and dictionaries. Defaults to
+            the retain option of the Api call being made, or "all".
+        validate: False skips validation, leaving the decoded dictionaries in
+            ``data``, and "construct" builds the items of ``response_model`` with
+            ``model_construct``, without running validators or converting values:
+            nested objects and timestamps stay as decoded. Defaults to the validate
+            option of the Api call being made, or True.
+        fields: Names of the fields to keep from each item of the payload, dropping
+            the others before validation. The decoded payload kept in
+            ``json_output`` is projected as well. Defaults to the fields option of the
+            Api call being made, or every field.
+
+    Returns:
+        Response: The response model, or the original response if it could not be decoded.
+
+    Bodies are decoded with the JSON decoder chosen by set_json_decoder().
+
+    Responses measured by the client's Instrumentation emit their RequestEvent
+    once decoded, with the time spent parsing and validating them. Parsing counts
+    as validation for bodies validated straight from bytes.
+    """
+    options = check_decode_options(
+        retain=retain or get_decode_option("retain", "all"),
+        validate=get_decode_option("validate", True) if validate is None else validate,
+        fields=fields or get_decode_option("fields"),
+    )
+    instrumentation = getattr(response, "instrumentation", None)
+    if instrumentation is None:
+        return _decode_response(
+            response=response,
+            response_model=response_model,
+            model_fallback=model_fallback,
+            **options,
         )
-    except Exception as response_error:
-        logging.error(f"Response Model Application Error: {response_error}")
+    event = response.request_event
+    started = time.perf_counter()
+    decoded = _decode_response(
+        response=response,
+        response_model=response_model,
+        model_fallback=model_fallback,
+        event=event,
+        **options,
+    )
+    event.validation_seconds = time.perf_counter() - started - event.parse_seconds
+    instrumentation.emit(event)
+    return decoded
 
-    return response
 
+def _project(payload: Any, fields: Tuple[str, ...]) -> Any:
+    """
+    Keep only fields of the dictionary, or of each dictionary in the list, payload.
+    """
+    if isinstance(payload, dict):
+        return {field: payload[field] for field in fields if field in payload}
+    return [
+        (
+            {field: item[field] for field in fields if field in item}
+            if isinstance(item, dict)
+            else item
+        )
+        for item in payload
+    ]
 
-def remove_none_values(dictionary: dict) -> dict:
-    dictionary.pop("json_output", None)
-    dictionary.pop("raw_output", None)
-    dictionary.pop("status_code", None)
-    dictionary.pop("headers", None)
-    dictionary.pop("message", None)
-    return {k: v for k, v in dictionary.items() if v is not None}
 
+@functools.lru_cache(maxsize=None)
+def _construct_template(model: Any) -> Optional[Tuple[Dict[str, Any], Dict[str, str]]]:
+    """
+    The defaults of model, and the field each payload key (name or alias) sets, to
+    build instances as model_construct does without walking every field each time.
+    None when model_construct is needed: a field with a default factory, a mutable
+    default or an alias choice, private attributes, extra fields kept or post-init.
+    """
+    if (
+        model.__private_attributes__
+        or model.__pydantic_post_init__
+        or model.model_config.get("extra") == "allow"
+    ):
+        return None
+    defaults = {}
+    names = {}
+    for name, field in model.model_fields.items():
+        if field.default_factory is not None or isinstance(
+            field.default, (list, dict, set)
+        ):
+            return None
+        if field.default is not PydanticUndefined:
+            defaults[name] = field.default
+        names[name] = name
+        for alias in (field.alias, field.validation_alias):
+            if alias is None:
+                continue
+            if not isinstance(alias, str):
+                return None
+            names[alias] = name
+    return defaults, names
 
-def is_pydantic(obj: object):
-    """Checks whether an object is pydantic."""
-    if hasattr(obj, "Meta") and hasattr(obj.Meta, "orm_model"):
-        logging.debug(f"\nPydantic True for {obj}")
-        return True
-    else:
-        logging.debug(f"\nPydantic False for {obj}")
-        return False
+
+def _construct_model(model: Any, item: dict) -> Any:
+    template = _construct_template(model)
+    if template is None:
+        return model.model_construct(**item)
+    defaults, names = template
+    values = dict(defaults)
+    fields_set = set()
+    for key, value in item.items():
+        name = names.get(key)
+        if name is not None:
+            values[name] = value
+            fields_set.add(name)
+    instance = model.__new__(model)
+    object.__setattr__(instance, "__dict__", values)
+    object.__setattr__(instance, "__pydantic_fields_set__", fields_set)
+    object.__setattr__(instance, "__pydantic_extra__", None)
+    object.__setattr__(instance, "__pydantic_private__", None)
+    return instance
 
 
-def pydantic_to_sqlalchemy(schema):
+def _construct(payload: Any, response_model: Any) -> Any:
     """
-    Iterates through pydantic schema and parses nested schemas
-    to a dictionary containing SQLAlchemy models.
-    Only works if nested schemas have specified the Meta.orm_model.
+    Build the models of response_model, a model or a list of models, from payload
+    as model_construct does. Payloads of other response models are left as they are.
     """
-    logging.debug(f"\n\nSchema: {schema}")
-    parsed_schema = dict(schema)
-    parsed_schema = remove_none_values(dictionary=parsed_schema)
+    model = response_model
+    if get_origin(response_model) in (list, List):
+        (model,) = get_args(response_model)
+    if not (isinstance(model, type) and issubclass(model, BaseModel)):
+        return payload
+    if isinstance(payload, dict):
+        return _construct_model(model, payload)
+    return [
+        _construct_model(model, item) if isinstance(item, dict) else item
+        for item in payload
+    ]
+
 
-    logging.debug(f"\n\nCleaned Schema: {parsed_schema}")
-    for key, value in parsed_schema.items():
-        if not value:
-            continue
-        logging.debug(f"\n\n\nKEY: {key} VALUE: {value}")
+def _decode_response(
+    response: requests.Response,
+    response_model: Any = None,
+    model_fallback: bool = False,
+    retain: str = "all",
+    validate: Union[bool, str] = True,
+    fields: Optional[Tuple[str, ...]] = None,
+    event: Any = None,
+) -> Union[Response, requests.Response]:
+    try:
+        response.raise_for_status()
+    except Exception as response_error:
+        logging.error(f"Response Error: {response_error}")
+    status_code = response.status_code
+    raw_output = response.content
+    headers = response.headers
+    keep_json = retain in ("all", "json")
+    context = None
+    if (
+        response_model is not None
+        and not keep_json
+        and validate is True
+        and fields is None
+    ):
         try:
-            if isinstance(value, list) and len(value) and is_pydantic(value[0]):
-                logging.debug(f"\n\nUpdating: {key} {parsed_schema[key]}")
-                parsed_schemas = []
-                for item in value:
-                    logging.debug(f"\nGoing through Item: {item} in Value: {value}")
-                    new_schema = pydantic_to_sqlalchemy(item)
-                    logging.debug(
-                        f"\nNew schema: {new_schema}\n\tFor Model: {item.Meta.orm_model}"
-                    )
-                    new_model = item.Meta.orm_model(**new_schema)
-                    logging.debug(
-                        f"\nNew model: {new_model}\n\tFor Item: {item}"  # \n\tIn Value: {value}"
-                    )
-                    parsed_schemas.append(new_model)
-                parsed_schema[key] = parsed_schemas
-            elif is_pydantic(value):
-                logging.debug(f"\n\nUpdating Nonlist: {key} {value}")
-                new_model = value.Meta.orm_model(**pydantic_to_sqlalchemy(value))
-                logging.debug(
-                    f"\n\nNew Model: {new_model} for schema: {parsed_schema} in key: {key} of value: {value}"
-                )
-                parsed_schema[key] = new_model
-                logging.debug(f"\n\nFinished Updated Nonlist: {key} {value}")
-        except AttributeError as e:
-            logging.debug(
-                f"\n\nFound nested Pydantic model in {schema.__class__} but Meta.orm_model was not specified.\nExact Error: {e}"
-            )
-            raise (
-                f"\n\nFound nested Pydantic model in {schema.__class__} but Meta.orm_model was not specified.\nExact Error: {e}"
+            data = get_type_adapter(response_model).validate_json(raw_output)
+            context = {"model_fallback": False}
+        except ValidationError:
+            # Decoded below, to log the error and apply model_fallback as usual
+            pass
+    if context is None:
+        started = time.perf_counter()
+        try:
+            response = decode_json(raw_output)
+            if fields is not None and isinstance(response, (list, dict)):
+                response = _project(response, fields)
+        except Exception as response_error:
+            logging.error(f"JSON Conversion Error: {response_error}")
+        if event is not None:
+            event.parse_seconds = time.perf_counter() - started
+        data = response
+    if context is None and validate is not True and isinstance(response, (list, dict)):
+        if validate == "construct" and response_model is not None:
+            data = _construct(response, response_model)
+        context = {"model_fallback": False}
+    if (
+        context is None
+        and response_model is not None
+        and isinstance(response, (list, dict))
+    ):
+        try:
+            data = get_type_adapter(response_model).validate_python(response)
+            context = {"model_fallback": False}
+        except ValidationError as validation_error:
+            logging.error(
+                f"{getattr(response_model, '__name__', response_model)} "
+                f"Validation Error: {validation_error.error_count()} errors"
             )
-    logging.debug(f"\n\nReturning parsed schema: {parsed_schema}")
-    return parsed_schema
+            context = {"model_fallback": model_fallback}
+    values = {
+        "data": data,
+        "status_code": status_code,
+        "raw_output": raw_output if retain in ("all", "raw") else None,
+        "json_output": response if keep_json else None,
+        "headers": headers,
+    }
+    if context == {"model_fallback": False}:
+        # The data was validated against the declared model, or deliberately left
+        # unvalidated, so the Response model, a union of every model, is neither
+        # validated nor built for it
+        values["headers"] = dict(headers)
+        response = Response.model_construct(**values)
+    else:
+        try:
+            response = Response.model_validate(values, context=context)
+        except Exception as response_error:
+            logging.error(f"Response Model Application Error: {response_error}")
+            return response
+    return response
 
 
-def upsert(model: Any, session):
-    if not model or "data" not in model:
-        logging.debug(f"No data in model: {model}")
-        return
+def get_next_page(
+    response: requests.Response, url: str, params: Optional[Dict] = None
+) -> Tuple[Optional[str], Optional[Dict]]:
+    """
+    Determine the request for the page following a paginated response.
 
-    data = model["data"]
-    item_ids = [item.id for item in data if item.id]
-    existing_items = (
-        session.query(data[0].__class__)
-        .filter(data[0].__class__.id.in_(item_ids))
-        .all()
-    )
-    existing_items_map = {item.id: item for item in existing_items}
+    GitLab sends a ``Link`` header with ``rel="next"`` for both offset and keyset
+    pagination, and ``X-Next-Page`` for offset pagination. The Link url already
+    carries every query parameter, so no params are returned alongside it.
 
-    for item in data:
-        logging.debug(f"Going through Item: {item}")
-        if item.id and item.id in existing_items_map:
-            existing_model = existing_items_map[item.id]
-            logging.debug(f"Found Existing Model: {existing_model}")
-            for attr, value in vars(item).items():
-                setattr(existing_model, attr, value)
-            session.merge(existing_model)
-        else:
-            session.merge(item)
+    Returns:
+        The url and params of the next page, or (None, None) on the last page.
+    """
+    next_link = response.links.get("next", {}).get("url")
+    if next_link:
+        return next_link, None
+    next_page = response.headers.get("X-Next-Page")
+    if next_page:
+        next_params = dict(params) if params else {}
+        next_params["page"] = int(next_page)
+        return url, next_params
+    return None, None
+
+
+def get_total_pages(response: requests.Response) -> Optional[int]:
+    """
+    Number of pages reported by an offset paginated response.
+
+    GitLab omits ``X-Total-Pages`` for keyset pagination and for collections of
+    more than 10,000 items, in which case None is returned.
+    """
+    total_pages = response.headers.get("X-Total-Pages")
+    if not total_pages or not response.headers.get("X-Page"):
+        return None
+    try:
+        return int(total_pages)
+    except ValueError:
+        return None
 
-    session.commit()
 
+def remove_none_values(dictionary: dict) -> dict:
+    for field in UNMAPPED_FIELDS:
+        dictionary.pop(field, None)
+    return {k: v for k, v in dictionary.items() if v is not None}
 
-def create_table(db_instance, engine):
-    inspector = reflection.Inspector.from_engine(engine)
-    table_name = db_instance.__table__.name
 
-    if not inspector.has_table(table_name):
-        db_instance.__table__.create(engine)
-        logging.debug(f"Table {table_name} created.")
+def is_pydantic(obj: object):
+    """Checks whether an object is pydantic."""
+    if hasattr(obj, "Meta") and hasattr(obj.Meta, "orm_model"):
+        logging.debug("\nPydantic True for %s", obj)
+        return True
     else:
-        logging.debug(f"Table {table_name} already exists.")
+        logging.debug("\nPydantic False for %s", obj)
+        return False
 
 
 def save_model(model: Any, file_name: str = "model", file_path: str = ".") -> str:
@@ -160,3 +384,28 @@ def load_model(file: str) -> Any:
     with open(file, "rb") as model_file:
         model = pickle.load(model_file)
     return model
+
+
+# Moved to gitlab_api.orm, which imports SQLAlchemy on first use only
+_ORM_ATTRIBUTES = (
+    "UPSERT_DIALECTS",
+    "pydantic_to_sqlalchemy",
+    "get_flattener",
+    "flatten",
+    "upsert",
+    "create_table",
+    "_orm_model",
+    "_Flattener",
+    "_UpsertPlan",
+    "_models",
+    "_bulk_write",
+    "_merge",
+)
+
+
+def __getattr__(name: str) -> Any:
+    if name in _ORM_ATTRIBUTES:
+        from gitlab_api import orm
+
+        return getattr(orm, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
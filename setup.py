@@ -32,6 +32,10 @@
     packages=["gitlab_api"],
     include_package_data=True,
     install_requires=[str(requirement.requirement) for requirement in requirements],
+    extras_require={
+        "async": ["httpx>=0.23.0", "greenlet>=1.1.0"],
+        "orjson": ["orjson>=3.6.0"],
+    },
     py_modules=["gitlab_api"],
     package_data={"gitlab_api": ["gitlab_api"]},
     classifiers=[
@@ -0,0 +1,319 @@
+import os
+import sys
+from typing import List
+
+import pytest
+from conftest import reason
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+try:
+    import gitlab_api
+    from gitlab_api.exceptions import ParameterError
+    from gitlab_api.gitlab_response_models import Project, User
+    from benchmarks.stub_server import StubGitLabServer
+except ImportError:
+    skip = True
+else:
+    skip = False
+
+
+reason = "do not run on MacOS or windows OR dependency is not installed OR " + reason
+
+
+@pytest.fixture(scope="module")
+def server():
+    with StubGitLabServer() as stub_server:
+        yield stub_server
+
+
+@pytest.fixture
+def client(server):
+    client = gitlab_api.Api(url=server.url, token="token")
+    server.reset()
+    return client
+
+
+@pytest.mark.skipif(
+    sys.platform in ["darwin"] or skip,
+    reason=reason,
+)
+def test_get_projects_all_pages(server, client):
+    response = client.get_projects()
+    assert response.status_code == 200
+    assert len(response.data) == 250
+    assert [project.id for project in response.data] == list(range(1, 251))
+    assert len(server.requests_for("/projects")) == 3
+
+
+@pytest.mark.skipif(
+    sys.platform in ["darwin"] or skip,
+    reason=reason,
+)
+def test_get_projects_max_pages(server, client):
+    response = client.get_projects(per_page=50, max_pages=2)
+    assert len(response.data) == 100
+    assert len(server.requests_for("/projects")) == 2
+
+
+@pytest.mark.skipif(
+    sys.platform in ["darwin"] or skip,
+    reason=reason,
+)
+def test_iter_pages(server, client):
+    pages = list(
+        client.iter_pages(
+            path="/projects", params={"per_page": 100}, response_model=List[Project]
+        )
+    )
+    assert [len(page.data) for page in pages] == [100, 100, 50]
+    assert [page.headers["X-Page"] for page in pages] == ["1", "2", "3"]
+
+
+@pytest.mark.skipif(
+    sys.platform in ["darwin"] or skip,
+    reason=reason,
+)
+def test_iter_items_stops_early(server, client):
+    items = client.iter_items(
+        path="/users", params={"per_page": 10}, response_model=List[User]
+    )
+    first_items = [next(items) for _ in range(15)]
+    assert all(isinstance(user, User) for user in first_items)
+    assert len(server.requests_for("/users")) == 2
+
+
+@pytest.mark.skipif(
+    sys.platform in ["darwin"] or skip,
+    reason=reason,
+)
+def test_get_list_endpoints(server, client):
+    assert len(client.get_project_jobs(project_id=1).data) == 230
+    assert len(client.get_merge_requests().data) == 150
+    assert len(client.get_users().data) == 120
+
+
+@pytest.mark.skipif(
+    sys.platform in ["darwin"] or skip,
+    reason=reason,
+)
+def test_get_nested_projects_by_group(server, client):
+    response = client.get_nested_projects_by_group(group_id=2)
+    assert len(response.data) == 155
+    assert all(isinstance(project, Project) for project in response.data)
+
+
+@pytest.mark.skipif(
+    sys.platform in ["darwin"] or skip,
+    reason=reason,
+)
+def test_get_projects_concurrently(server):
+    client = gitlab_api.Api(url=server.url, token="token", max_workers=4)
+    server.reset()
+    response = client.get_projects(per_page=20)
+    client.close()
+    assert [project.id for project in response.data] == list(range(1, 251))
+    assert len(server.requests_for("/projects")) == 13
+    pages = [
+        int(request["query"]["page"])
+        for request in server.requests_for("/projects")[1:]
+    ]
+    assert sorted(pages) == list(range(2, 14))
+
+
+@pytest.mark.skipif(
+    sys.platform in ["darwin"] or skip,
+    reason=reason,
+)
+def test_get_project_jobs_concurrently_max_pages(server, client):
+    response = client.get_project_jobs(
+        project_id=1, per_page=20, max_pages=5, max_workers=3
+    )
+    assert [job.id for job in response.data] == list(range(1, 101))
+    assert len(server.requests_for("/projects/1/jobs")) == 5
+
+
+@pytest.mark.skipif(
+    sys.platform in ["darwin"] or skip,
+    reason=reason,
+)
+def test_concurrency_cap():
+    with StubGitLabServer(latency=0.02) as slow_server:
+        client = gitlab_api.Api(
+            url=slow_server.url, token="token", max_workers=16, max_concurrency=3
+        )
+        slow_server.reset()
+        response = client.get_users(per_page=10)
+        client.close()
+        assert [user.id for user in response.data] == list(range(1, 121))
+        assert slow_server.max_in_flight == 3
+
+
+@pytest.mark.skipif(
+    sys.platform in ["darwin"] or skip,
+    reason=reason,
+)
+def test_get_projects_keyset(server, client):
+    response = client.get_projects(
+        pagination="keyset", order_by="id", sort="asc", per_page=100
+    )
+    assert [project.id for project in response.data] == list(range(1, 251))
+    requests = server.requests_for("/projects")
+    assert len(requests) == 3
+    assert requests[0]["query"]["pagination"] == "keyset"
+    assert [request["query"].get("id_after") for request in requests] == [
+        None,
+        "100",
+        "200",
+    ]
+
+
+@pytest.mark.skipif(
+    sys.platform in ["darwin"] or skip,
+    reason=reason,
+)
+def test_get_project_jobs_and_users_keyset(server):
+    client = gitlab_api.Api(url=server.url, token="token", max_workers=4)
+    server.reset()
+    jobs = client.get_project_jobs(project_id=1, pagination="keyset", per_page=50)
+    users = client.get_users(pagination="keyset", sort="asc", per_page=50)
+    client.close()
+    assert [job.id for job in jobs.data] == list(range(230, 0, -1))
+    assert [user.id for user in users.data] == list(range(1, 121))
+    assert server.requests_for("/projects/1/jobs")[0]["query"]["order_by"] == "id"
+    assert len(server.requests_for("/projects/1/jobs")) == 5
+    assert len(server.requests_for("/users")) == 3
+
+
+@pytest.mark.skipif(
+    sys.platform in ["darwin"] or skip,
+    reason=reason,
+)
+def test_keyset_parameters():
+    project = gitlab_api.ProjectModel(pagination="keyset")
+    assert project.api_parameters["pagination"] == "keyset"
+    assert project.api_parameters["order_by"] == "id"
+    job = gitlab_api.JobModel(project_id=1, pagination="KEYSET", sort="desc")
+    assert job.api_parameters["order_by"] == "id"
+    assert job.api_parameters["sort"] == "desc"
+    with pytest.raises(ValueError):
+        gitlab_api.UserModel(pagination="cursor")
+
+
+@pytest.mark.skipif(
+    sys.platform in ["darwin"] or skip,
+    reason=reason,
+)
+def test_single_page_listing_single_request(server, client):
+    response = client.get_nested_projects_by_group(group_id=4)
+    assert len(response.data) == 5
+    assert len(server.requests_for("/groups/4/projects")) == 1
+    assert len(server.requests_for("/groups/4")) == 1
+
+
+@pytest.mark.skipif(
+    sys.platform in ["darwin"] or skip,
+    reason=reason,
+)
+def test_get_total_projects_in_group(server, client):
+    response = client.get_total_projects_in_group(group_id=3, per_page=50)
+    assert response.headers["X-Total"] == "120"
+    assert response.headers["X-Total-Pages"] == "3"
+    assert len(response.json()) == 50
+    requests = server.requests_for("/groups/3/projects")
+    assert len(requests) == 1
+    assert requests[0]["query"]["per_page"] == "50"
+
+
+@pytest.mark.skipif(
+    sys.platform in ["darwin"] or skip,
+    reason=reason,
+)
+def test_get_group_project_count(server, client):
+    assert client.get_group_project_count(group_id=3) == 120
+    requests = server.requests_for("/groups/3/projects")
+    assert len(requests) == 1
+    assert requests[0]["query"]["per_page"] == "1"
+
+    # Groups too large for GitLab to count are counted page by page
+    server.reset()
+    server.max_counted = 100
+    try:
+        assert client.get_group_project_count(group_id=3) == 120
+        assert len(server.requests_for("/groups/3/projects")) == 3
+    finally:
+        server.max_counted = 10000
+    assert client.get_group_project_count(group_id=99) is None
+
+
+@pytest.mark.skipif(
+    sys.platform in ["darwin"] or skip,
+    reason=reason,
+)
+def test_auth_check_requests_single_item(server):
+    server.reset()
+    gitlab_api.Api(url=server.url, token="token")
+    requests = server.requests_for("/projects")
+    assert len(requests) == 1
+    assert requests[0]["query"]["per_page"] == "1"
+
+
+@pytest.mark.skipif(
+    sys.platform in ["darwin"] or skip,
+    reason=reason,
+)
+def test_retain(server):
+    client = gitlab_api.Api(url=server.url, token="token", retain="models")
+    project = client.get_project(project_id=7)
+    assert project.data.id == 7
+    assert project.json_output is None and project.raw_output is None
+
+    project = client.get_project(project_id=7, retain="json")
+    assert project.json_output["id"] == 7 and project.raw_output is None
+
+    pages = list(
+        client.iter_pages(
+            path="/projects",
+            params={"per_page": 100},
+            response_model=List[Project],
+            retain="raw",
+        )
+    )
+    assert [len(page.data) for page in pages] == [100, 100, 50]
+    assert all(page.json_output is None and page.raw_output for page in pages)
+
+    projects = client.get_projects()
+    assert len(projects.data) == 250
+    assert projects.json_output is None and projects.raw_output is None
+    client.close()
+
+    with pytest.raises(ParameterError):
+        gitlab_api.Api(url=server.url, token="token", retain="body")
+
+
+@pytest.mark.skipif(
+    sys.platform in ["darwin"] or skip,
+    reason=reason,
+)
+def test_validate_and_fields(server):
+    client = gitlab_api.Api(url=server.url, token="token", validate=False)
+    jobs = client.get_project_jobs(project_id=1, fields=["id", "name", "status"])
+    assert len(jobs.data) == 230
+    assert [set(job) for job in jobs.data] == [{"id", "name", "status"}] * 230
+
+    projects = client.get_projects(validate="construct", fields=["id", "name"])
+    assert [project.id for project in projects.data] == list(range(1, 251))
+    assert all(isinstance(project, Project) for project in projects.data)
+    assert projects.data[0].path is None
+
+    # The groups it walks are validated whatever the options
+    nested = client.get_nested_projects_by_group(group_id=2, fields=["id"])
+    assert len(nested.data) == 155
+    assert all(set(project) == {"id"} for project in nested.data)
+
+    project = client.get_project(project_id=7, validate=True)
+    assert isinstance(project.data, Project) and project.data.id == 7
+    client.close()
+
+    with pytest.raises(ParameterError):
+        gitlab_api.Api(url=server.url, token="token", validate="none")
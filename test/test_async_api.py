@@ -0,0 +1,151 @@
+import asyncio
+import os
+import sys
+from typing import List
+
+import pytest
+from conftest import reason
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+try:
+    import httpx  # noqa: F401
+    import greenlet  # noqa: F401
+    import gitlab_api
+    from gitlab_api import AsyncApi
+    from gitlab_api.gitlab_response_models import Project, User
+    from benchmarks.stub_server import StubGitLabServer
+except ImportError:
+    skip = True
+else:
+    skip = False
+
+
+reason = "do not run on MacOS or windows OR dependency is not installed OR " + reason
+
+
+@pytest.fixture(scope="module")
+def server():
+    with StubGitLabServer() as stub_server:
+        yield stub_server
+
+
+def run(coroutine):
+    return asyncio.run(coroutine)
+
+
+@pytest.mark.skipif(
+    sys.platform in ["darwin"] or skip,
+    reason=reason,
+)
+def test_async_matches_sync(server):
+    client = gitlab_api.Api(url=server.url, token="token")
+
+    async def fetch():
+        async with AsyncApi(url=server.url, token="token") as async_client:
+            return (
+                await async_client.get_projects(per_page=50),
+                await async_client.get_project(project_id=7),
+            )
+
+    projects, project = run(fetch())
+    for async_response, sync_response in (
+        (projects, client.get_projects(per_page=50)),
+        (project, client.get_project(project_id=7)),
+    ):
+        async_response.headers.pop("Date")
+        sync_response.headers.pop("Date")
+        assert async_response.model_dump() == sync_response.model_dump()
+    assert isinstance(project.data, Project)
+
+
+@pytest.mark.skipif(
+    sys.platform in ["darwin"] or skip,
+    reason=reason,
+)
+def test_async_gather(server):
+    async def fetch():
+        async with AsyncApi(url=server.url, token="token") as async_client:
+            return await asyncio.gather(
+                async_client.get_projects(),
+                async_client.get_users(max_workers=4),
+                async_client.get_project_jobs(project_id=1),
+                async_client.get_nested_projects_by_group(group_id=2),
+            )
+
+    projects, users, jobs, nested = run(fetch())
+    assert [project.id for project in projects.data] == list(range(1, 251))
+    assert [user.id for user in users.data] == list(range(1, 121))
+    assert len(jobs.data) == 230
+    assert len(nested.data) == 155
+
+
+@pytest.mark.skipif(
+    sys.platform in ["darwin"] or skip,
+    reason=reason,
+)
+def test_async_iter_items_stops_early(server):
+    async def fetch():
+        async with AsyncApi(url=server.url, token="token") as async_client:
+            server.reset()
+            users = []
+            async for user in async_client.iter_items(
+                path="/users", params={"per_page": 10}, response_model=List[User]
+            ):
+                users.append(user)
+                if len(users) == 15:
+                    break
+            return users
+
+    users = run(fetch())
+    assert [user.id for user in users] == list(range(1, 16))
+    assert len(server.requests_for("/users")) == 2
+
+
+@pytest.mark.skipif(
+    sys.platform in ["darwin"] or skip,
+    reason=reason,
+)
+def test_async_concurrency_cap():
+    async def fetch(url):
+        async with AsyncApi(
+            url=url, token="token", max_workers=16, max_concurrency=3
+        ) as async_client:
+            return await async_client.get_users(per_page=10)
+
+    with StubGitLabServer(latency=0.02) as slow_server:
+        users = run(fetch(slow_server.url))
+        assert [user.id for user in users.data] == list(range(1, 121))
+        assert slow_server.max_in_flight == 3
+
+
+@pytest.mark.skipif(
+    sys.platform in ["darwin"] or skip,
+    reason=reason,
+)
+def test_async_retain(server):
+    async def fetch():
+        async with AsyncApi(url=server.url, token="token") as async_client:
+            return await asyncio.gather(
+                async_client.get_project(project_id=7, retain="models"),
+                async_client.get_projects(retain="models"),
+                async_client.get_project(project_id=7),
+            )
+
+    project, projects, full_project = run(fetch())
+    assert project.data.id == 7 and project.json_output is None
+    assert len(projects.data) == 250 and projects.raw_output is None
+    assert full_project.json_output["id"] == 7 and full_project.raw_output
+
+
+@pytest.mark.skipif(
+    sys.platform in ["darwin"] or skip,
+    reason=reason,
+)
+def test_async_has_no_hooks(server):
+    # AsyncApi requests are not instrumented
+    async_client = AsyncApi(url=server.url, token="token")
+    assert not hasattr(async_client, "add_hook")
+    assert not hasattr(async_client, "remove_hook")
+    assert hasattr(async_client, "get_project")
+    run(async_client.close())
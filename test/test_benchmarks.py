@@ -0,0 +1,179 @@
+"""
+End-to-end throughput of the client against the local stand-in server, decoding
+and database upsert, measured with pytest-benchmark.
+
+Usage:
+    python -m pytest test/test_benchmarks.py --benchmark-only
+    python -m pytest test/test_benchmarks.py --benchmark-only --benchmark-json=benchmarks.json
+"""
+
+import os
+import sys
+from typing import List
+
+import pytest
+from conftest import reason
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+try:
+    import gitlab_api
+    from benchmarks.bench_decode import build_response
+    from benchmarks.payloads import make_page
+    from benchmarks.stub_server import StubGitLabServer
+    from gitlab_api.database import bootstrap_schema, create_sqlite_engine
+    from gitlab_api.gitlab_response_models import Job, Response, get_type_adapter
+    from gitlab_api.orm import upsert
+    from gitlab_api.utils import process_response
+    from sqlalchemy.orm import Session
+except ImportError:
+    skip = True
+else:
+    skip = False
+
+try:
+    import pytest_benchmark  # noqa: F401
+except ImportError:
+    skip = True
+
+
+reason = "do not run on MacOS or windows OR dependency is not installed OR " + reason
+
+ROUNDS = 5
+
+
+@pytest.fixture(scope="module")
+def server():
+    with StubGitLabServer() as stub_server:
+        yield stub_server
+
+
+@pytest.fixture(scope="module")
+def slow_server():
+    with StubGitLabServer(latency=0.01) as stub_server:
+        yield stub_server
+
+
+def run(benchmark, function, items: int):
+    """
+    Benchmark function, recording the items it returns per second.
+    """
+    result = benchmark.pedantic(function, rounds=ROUNDS, warmup_rounds=1)
+    benchmark.extra_info["items"] = items
+    if benchmark.stats is not None:
+        benchmark.extra_info["items_per_second"] = items / benchmark.stats.stats.mean
+    return result
+
+
+@pytest.mark.skipif(
+    sys.platform in ["darwin"] or skip,
+    reason=reason,
+)
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_get_projects(benchmark, server, max_workers):
+    client = gitlab_api.Api(url=server.url, token="token", max_workers=max_workers)
+    response = run(benchmark, client.get_projects, items=250)
+    assert len(response.data) == 250
+    client.close()
+
+
+@pytest.mark.skipif(
+    sys.platform in ["darwin"] or skip,
+    reason=reason,
+)
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_get_projects_with_latency(benchmark, slow_server, max_workers):
+    client = gitlab_api.Api(url=slow_server.url, token="token", max_workers=max_workers)
+    response = run(benchmark, lambda: client.get_projects(per_page=20), items=250)
+    assert len(response.data) == 250
+    client.close()
+
+
+@pytest.mark.skipif(
+    sys.platform in ["darwin"] or skip,
+    reason=reason,
+)
+def test_get_project_jobs(benchmark, server):
+    client = gitlab_api.Api(url=server.url, token="token")
+    response = run(benchmark, lambda: client.get_project_jobs(project_id=1), items=230)
+    assert len(response.data) == 230
+    client.close()
+
+
+@pytest.mark.skipif(
+    sys.platform in ["darwin"] or skip,
+    reason=reason,
+)
+def test_get_nested_projects_by_group(benchmark, server):
+    client = gitlab_api.Api(url=server.url, token="token")
+    response = run(
+        benchmark,
+        lambda: client.get_nested_projects_by_group(group_id=2),
+        items=155,
+    )
+    assert len(response.data) == 155
+    client.close()
+
+
+@pytest.mark.skipif(
+    sys.platform in ["darwin"] or skip,
+    reason=reason,
+)
+@pytest.mark.parametrize(
+    "kind, model_name",
+    [("job", "Job"), ("merge_request", "MergeRequest"), ("project", "Project")],
+)
+@pytest.mark.parametrize("retain", ["all", "models"])
+def test_decode_page(benchmark, kind, model_name, retain):
+    http_response = build_response(make_page(kind, count=100))
+    response_model = List[getattr(gitlab_api, model_name)]
+    response = run(
+        benchmark,
+        lambda: process_response(
+            response=http_response, response_model=response_model, retain=retain
+        ),
+        items=100,
+    )
+    assert len(response.data) == 100
+    assert (response.json_output is not None) == (retain == "all")
+
+
+@pytest.mark.skipif(
+    sys.platform in ["darwin"] or skip,
+    reason=reason,
+)
+@pytest.mark.parametrize("validate", [True, "construct", False])
+@pytest.mark.parametrize("fields", [None, ["id", "name", "status", "duration"]])
+def test_decode_page_unvalidated(benchmark, validate, fields):
+    http_response = build_response(make_page("job", count=100))
+    response = run(
+        benchmark,
+        lambda: process_response(
+            response=http_response,
+            response_model=List[Job],
+            retain="models",
+            validate=validate,
+            fields=fields,
+        ),
+        items=100,
+    )
+    assert len(response.data) == 100
+
+
+@pytest.mark.skipif(
+    sys.platform in ["darwin"] or skip,
+    reason=reason,
+)
+def test_upsert_jobs(benchmark):
+    engine = create_sqlite_engine()
+    bootstrap_schema(engine)
+    jobs = get_type_adapter(List[Job]).validate_python(make_page("job", count=500))
+    response = Response(data=jobs, status_code=200)
+
+    def write():
+        with Session(engine) as session:
+            return upsert(response, session)
+
+    written = run(benchmark, write, items=500)
+    assert written["tables"]["jobs"] == 500
+    engine.dispose()
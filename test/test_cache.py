@@ -0,0 +1,181 @@
+import asyncio
+import os
+import sys
+
+import pytest
+from conftest import reason
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+try:
+    import gitlab_api
+    from gitlab_api.cache import CacheEntry, DiskCache, MemoryCache
+    from benchmarks.stub_server import StubGitLabServer
+except ImportError:
+    skip = True
+else:
+    skip = False
+
+try:
+    import httpx  # noqa: F401
+    import greenlet  # noqa: F401
+except ImportError:
+    skip_async = True
+else:
+    skip_async = False
+
+
+reason = "do not run on MacOS or windows OR dependency is not installed OR " + reason
+
+
+@pytest.fixture(scope="module")
+def server():
+    with StubGitLabServer() as stub_server:
+        yield stub_server
+
+
+def entry(size: int) -> "CacheEntry":
+    return CacheEntry(etag='W/"etag"', content=b"x" * size, headers={})
+
+
+@pytest.mark.skipif(
+    sys.platform in ["darwin"] or skip,
+    reason=reason,
+)
+def test_memory_cache_evicts_least_recently_used():
+    cache = MemoryCache(max_entries=2)
+    cache.set("a", entry(1))
+    cache.set("b", entry(1))
+    assert cache.get("a") is not None
+    cache.set("c", entry(1))
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.get("c") is not None
+    assert len(cache) == 2
+
+
+@pytest.mark.skipif(
+    sys.platform in ["darwin"] or skip,
+    reason=reason,
+)
+def test_memory_cache_size_bound():
+    cache = MemoryCache(max_bytes=10)
+    cache.set("a", entry(4))
+    cache.set("b", entry(4))
+    cache.set("c", entry(4))
+    assert cache.get("a") is None
+    assert cache.size == 8
+    cache.set("d", entry(11))
+    assert cache.get("d") is None
+    assert cache.size == 8
+
+
+@pytest.mark.skipif(
+    sys.platform in ["darwin"] or skip,
+    reason=reason,
+)
+def test_disk_cache_round_trip(tmp_path):
+    cache = DiskCache(directory=str(tmp_path), max_entries=2)
+    cache.set("a", entry(3))
+    assert cache.get("a").content == b"xxx"
+    cache.set("b", entry(3))
+    cache.set("c", entry(3))
+    assert len(os.listdir(tmp_path)) == 2
+    cache.delete("c")
+    cache.clear()
+    assert cache.get("b") is None
+
+
+@pytest.mark.skipif(
+    sys.platform in ["darwin"] or skip,
+    reason=reason,
+)
+def test_not_modified_served_from_cache(server):
+    client = gitlab_api.Api(url=server.url, token="token", cache=MemoryCache())
+    server.reset()
+    first = client.get_project(project_id=7)
+    assert server.not_modified == 0
+    second = client.get_project(project_id=7)
+    assert server.not_modified == 1
+    assert second.status_code == 200
+    assert second.data == first.data
+
+    # Every hit is decoded again, so callers never share models
+    second.data.name = "changed"
+    second.data.namespace.name = "changed"
+    third = client.get_project(project_id=7)
+    client.close()
+    assert server.not_modified == 2
+    assert third.data == first.data
+    assert third.data.namespace is not second.data.namespace
+    requests = server.requests_for("/projects/7")
+    assert "If-None-Match" not in requests[0]["headers"]
+    assert requests[1]["headers"]["If-None-Match"] == first.headers["ETag"]
+
+
+@pytest.mark.skipif(
+    sys.platform in ["darwin"] or skip,
+    reason=reason,
+)
+def test_cached_pages_are_not_modified_by_pagination(server):
+    client = gitlab_api.Api(url=server.url, token="token", cache=MemoryCache())
+    server.reset()
+    first = client.get_projects()
+    second = client.get_projects()
+    client.close()
+    assert len(first.data) == 250
+    assert len(second.data) == 250
+    assert server.not_modified == len(server.requests_for("/projects")) // 2
+
+
+@pytest.mark.skipif(
+    sys.platform in ["darwin"] or skip,
+    reason=reason,
+)
+def test_disk_cache_shared_across_clients(server, tmp_path):
+    client = gitlab_api.Api(
+        url=server.url, token="token", cache=DiskCache(directory=str(tmp_path))
+    )
+    first = client.get_group(group_id=2)
+    client.close()
+    server.reset()
+    client = gitlab_api.Api(
+        url=server.url, token="token", cache=DiskCache(directory=str(tmp_path))
+    )
+    second = client.get_group(group_id=2)
+    client.close()
+    assert server.not_modified == 2
+    assert second.data == first.data
+
+
+@pytest.mark.skipif(
+    sys.platform in ["darwin"] or skip,
+    reason=reason,
+)
+def test_cache_keyed_by_credentials(server):
+    cache = MemoryCache()
+    client = gitlab_api.Api(url=server.url, token="token", cache=cache)
+    other_client = gitlab_api.Api(url=server.url, token="other", cache=cache)
+    server.reset()
+    client.get_project(project_id=3)
+    other_client.get_project(project_id=3)
+    client.close()
+    other_client.close()
+    assert server.not_modified == 0
+
+
+@pytest.mark.skipif(
+    sys.platform in ["darwin"] or skip or skip_async,
+    reason=reason,
+)
+def test_async_not_modified_served_from_cache(server):
+    async def fetch():
+        async with gitlab_api.AsyncApi(
+            url=server.url, token="token", cache=MemoryCache()
+        ) as client:
+            return [await client.get_project(project_id=9) for _ in range(2)]
+
+    server.reset()
+    first, second = asyncio.run(fetch())
+    assert server.not_modified == 1
+    assert second.data == first.data
@@ -0,0 +1,112 @@
+import os
+import socket
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from conftest import reason
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+try:
+    import requests
+    import gitlab_api
+    from gitlab_api.transport import ConnectionPool
+    from benchmarks.stub_server import StubGitLabServer
+except ImportError:
+    skip = True
+else:
+    skip = False
+
+
+reason = "do not run on MacOS or windows OR dependency is not installed OR " + reason
+
+
+@pytest.fixture(scope="module")
+def server():
+    with StubGitLabServer() as stub_server:
+        yield stub_server
+
+
+def fetch_projects(clients, threads: int = 8, count: int = 64):
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        return list(
+            executor.map(
+                lambda number: clients[number % len(clients)].get_project(
+                    project_id=number % 250 + 1
+                ),
+                range(count),
+            )
+        )
+
+
+@pytest.mark.skipif(
+    sys.platform in ["darwin"] or skip,
+    reason=reason,
+)
+def test_pool_reuses_connections(server):
+    client = gitlab_api.Api(url=server.url, token="token", pool_maxsize=8)
+    server.reset()
+    responses = fetch_projects([client])
+    client.close()
+    assert all(response.status_code == 200 for response in responses)
+    assert server.connections <= 8
+
+
+@pytest.mark.skipif(
+    sys.platform in ["darwin"] or skip,
+    reason=reason,
+)
+def test_shared_connection_pool(server):
+    pool = ConnectionPool(pool_maxsize=8)
+    clients = [
+        gitlab_api.Api(url=server.url, token="token", connection_pool=pool)
+        for _ in range(2)
+    ]
+    server.reset()
+    fetch_projects(clients)
+    for client in clients:
+        client.close()
+    assert server.connections <= 8
+    assert clients[0].connection_pool is clients[1].connection_pool
+    assert clients[0].get_project(project_id=1).status_code == 200
+    pool.close()
+
+
+@pytest.mark.skipif(
+    sys.platform in ["darwin"] or skip,
+    reason=reason,
+)
+def test_keep_alive_disabled(server):
+    client = gitlab_api.Api(url=server.url, token="token", keep_alive=False)
+    server.reset()
+    for project_id in range(1, 6):
+        client.get_project(project_id=project_id)
+    client.close()
+    assert server.connections == 5
+
+
+@pytest.mark.skipif(
+    sys.platform in ["darwin"] or skip,
+    reason=reason,
+)
+def test_keep_alive_socket_options():
+    pool = ConnectionPool(keep_alive=True, keep_alive_interval=30)
+    assert (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1) in pool.socket_options
+    pool = ConnectionPool(keep_alive=False)
+    assert (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1) not in pool.socket_options
+
+
+@pytest.mark.skipif(
+    sys.platform in ["darwin"] or skip,
+    reason=reason,
+)
+def test_timeout():
+    with StubGitLabServer() as slow_server:
+        client = gitlab_api.Api(
+            url=slow_server.url, token="token", timeout=0.2, retry=False
+        )
+        slow_server.latency = 1
+        with pytest.raises(requests.exceptions.Timeout):
+            client.get_project(project_id=1)
+        client.close()
@@ -0,0 +1,190 @@
+import os
+import sys
+from typing import List
+
+import pytest
+from conftest import reason
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+try:
+    from sqlalchemy import event, inspect, select
+    from sqlalchemy.orm import Session
+    from gitlab_api import upsert
+    from gitlab_api.database import (
+        apply_indexes,
+        bootstrap_schema,
+        create_sqlite_engine,
+        schema_fingerprint,
+    )
+    from gitlab_api.orm import create_table
+    from gitlab_api.gitlab_db_models import (
+        BaseDBModel,
+        EvidenceDBModel,
+        JobDBModel,
+        ProjectDBModel,
+        SchemaStateDBModel,
+    )
+    from gitlab_api.gitlab_response_models import Project, Response, get_type_adapter
+    from benchmarks.payloads import make_page
+except ImportError:
+    skip = True
+else:
+    skip = False
+
+
+reason = "do not run on MacOS or windows OR dependency is not installed OR " + reason
+
+
+@pytest.mark.skipif(
+    sys.platform in ["darwin"] or skip,
+    reason=reason,
+)
+def test_sqlite_file_uses_wal(tmp_path):
+    engine = create_sqlite_engine(str(tmp_path / "gitlab.db"))
+    with engine.connect() as connection:
+        assert connection.exec_driver_sql("PRAGMA journal_mode").scalar() == "wal"
+        assert connection.exec_driver_sql("PRAGMA synchronous").scalar() == 1
+        assert connection.exec_driver_sql("PRAGMA busy_timeout").scalar() == 30000
+    engine.dispose()
+
+
+@pytest.mark.skipif(
+    sys.platform in ["darwin"] or skip,
+    reason=reason,
+)
+def test_schema_on_sqlite():
+    engine = create_sqlite_engine()
+    BaseDBModel.metadata.create_all(engine)
+    projects = get_type_adapter(List[Project]).validate_python(
+        make_page("project", count=2)
+    )
+    with Session(engine) as session:
+        upsert(model=Response(data=projects, status_code=200), session=session)
+    with Session(engine) as session:
+        row = session.execute(
+            select(ProjectDBModel.topics, ProjectDBModel.path).where(
+                ProjectDBModel.id == 2
+            )
+        ).one()
+    assert row.path == "project-2"
+    assert [topic["topic"] for topic in row.topics] == [
+        "example",
+        "disapora client",
+    ]
+    engine.dispose()
+
+
+@pytest.mark.skipif(
+    sys.platform in ["darwin"] or skip,
+    reason=reason,
+)
+def test_dates_bind_on_sqlite():
+    engine = create_sqlite_engine()
+    EvidenceDBModel.__table__.create(engine)
+    dates = {
+        1: "2024-01-02T03:04:05.1Z",
+        2: "2024-01-02T03:04:05.12+00:00",
+        3: "2024-01-02T03:04:05.12345Z",
+    }
+    with Session(engine) as session:
+        for evidence_id, date in dates.items():
+            session.add(EvidenceDBModel(id=evidence_id, collected_at=date))
+        session.commit()
+        rows = session.execute(
+            select(EvidenceDBModel.collected_at).order_by(EvidenceDBModel.id)
+        ).scalars()
+        assert [date.microsecond for date in rows] == [100000, 120000, 123450]
+    engine.dispose()
+
+
+@pytest.mark.skipif(
+    sys.platform in ["darwin"] or skip,
+    reason=reason,
+)
+def test_foreign_keys_are_indexed():
+    for table in BaseDBModel.metadata.tables.values():
+        indexed = {index.columns[0].name for index in table.indexes}
+        indexed.add(table.primary_key.columns[0].name)
+        for column in table.columns:
+            if column.foreign_keys and not column.primary_key:
+                assert column.name in indexed, f"{table.name}.{column.name}"
+
+
+@pytest.mark.skipif(
+    sys.platform in ["darwin"] or skip,
+    reason=reason,
+)
+def test_apply_indexes():
+    engine = create_sqlite_engine()
+    BaseDBModel.metadata.create_all(engine)
+    assert apply_indexes(engine) == []
+    with engine.begin() as connection:
+        connection.exec_driver_sql("DROP INDEX ix_jobs_status")
+        connection.exec_driver_sql(
+            "DROP INDEX ix_merge_requests_project_id_state_updated_at"
+        )
+    assert sorted(apply_indexes(engine)) == [
+        "ix_jobs_status",
+        "ix_merge_requests_project_id_state_updated_at",
+    ]
+    assert apply_indexes(engine) == []
+    indexes = {
+        index["name"]: index["column_names"]
+        for index in inspect(engine).get_indexes("merge_requests")
+    }
+    assert indexes["ix_merge_requests_project_id_state_updated_at"] == [
+        "project_id",
+        "state",
+        "updated_at",
+    ]
+    engine.dispose()
+
+
+@pytest.mark.skipif(
+    sys.platform in ["darwin"] or skip,
+    reason=reason,
+)
+def test_bootstrap_schema():
+    engine = create_sqlite_engine()
+    created = bootstrap_schema(engine)
+    assert sorted(created["tables"]) == sorted(BaseDBModel.metadata.tables)
+    assert created["indexes"] == []
+
+    statements = []
+    event.listen(
+        engine,
+        "before_cursor_execute",
+        lambda connection, cursor, statement, *args: statements.append(statement),
+    )
+    assert bootstrap_schema(engine) == {"tables": [], "indexes": []}
+    assert [statement for statement in statements if "SAVEPOINT" not in statement] == [
+        statements[1]
+    ]
+    assert "schema_state" in statements[1]
+
+    with engine.begin() as connection:
+        connection.exec_driver_sql("DROP TABLE sync_state")
+        connection.exec_driver_sql("DROP INDEX ix_jobs_status")
+        connection.exec_driver_sql("UPDATE schema_state SET fingerprint = 'old'")
+    assert bootstrap_schema(engine) == {
+        "tables": ["sync_state"],
+        "indexes": ["ix_jobs_status"],
+    }
+    with engine.connect() as connection:
+        assert connection.execute(
+            select(SchemaStateDBModel.fingerprint)
+        ).scalar() == schema_fingerprint(engine.dialect)
+    engine.dispose()
+
+
+@pytest.mark.skipif(
+    sys.platform in ["darwin"] or skip,
+    reason=reason,
+)
+def test_create_table():
+    engine = create_sqlite_engine()
+    create_table(JobDBModel, engine)
+    create_table(JobDBModel, engine)
+    assert inspect(engine).get_table_names() == ["jobs"]
+    engine.dispose()
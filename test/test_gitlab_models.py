@@ -1,10 +1,13 @@
 #!/usr/bin/python
 # coding: utf-8
 
+import json
 import os
 import sys
+from typing import List
 
 import pytest
+import requests
 from conftest import reason
 
 sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
@@ -30,7 +33,12 @@
     )
     from gitlab_api.gitlab_response_models import (
         Response,
+        Pipeline,
+        Project,
     )
+    from gitlab_api.decoders import get_json_decoder, set_json_decoder
+    from gitlab_api.exceptions import ParameterError
+    from gitlab_api.utils import process_response
 
 except ImportError:
     skip = True
@@ -13695,6 +13703,223 @@ def test_contributor_response_1():
     assert response.data[0].base_type == "Contributor"
 
 
+def build_http_response(payload, status_code=200):
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = json.dumps(payload).encode()
+    response.headers["Content-Type"] = "application/json"
+    return response
+
+
+@pytest.mark.skipif(
+    sys.platform in ["darwin"] or skip,
+    reason=reason,
+)
+def test_typed_response_1():
+    example_data = [
+        {
+            "id": 47,
+            "iid": 12,
+            "project_id": 1,
+            "status": "pending",
+            "source": "push",
+            "ref": "new-pipeline",
+            "sha": "a91957a858320c0e17f3a0eca7cfacbff50ea29a",
+            "name": "Build pipeline",
+            "web_url": "https://example.com/foo/bar/pipelines/47",
+            "created_at": "2016-08-11T11:28:34.085Z",
+            "updated_at": "2016-08-11T11:32:35.169Z",
+        },
+    ]
+    response = process_response(
+        response=build_http_response(example_data), response_model=List[Pipeline]
+    )
+    assert response.status_code == 200
+    assert isinstance(response.data[0], Pipeline)
+    assert response.json_output == example_data
+
+
+@pytest.mark.skipif(
+    sys.platform in ["darwin"] or skip,
+    reason=reason,
+)
+def test_typed_response_2():
+    # Payload does not match the declared model
+    example_data = [
+        {
+            "id": 47,
+            "status": "pending",
+            "source": "push",
+            "ref": "new-pipeline",
+            "sha": "a91957a858320c0e17f3a0eca7cfacbff50ea29a",
+        },
+    ]
+    response = process_response(
+        response=build_http_response(example_data), response_model=List[Project]
+    )
+    assert response.data == example_data
+    response = process_response(
+        response=build_http_response(example_data),
+        response_model=List[Project],
+        model_fallback=True,
+    )
+    assert response.data[0].base_type == "Pipeline"
+
+
+@pytest.mark.skipif(
+    sys.platform in ["darwin"] or skip,
+    reason=reason,
+)
+def test_typed_response_3():
+    # Typed responses are constructed without validating the Response model again
+    example_data = [{"id": 4, "name": "project", "path": "project"}]
+    http_response = build_http_response(example_data)
+    http_response.headers["X-Total"] = "1"
+    response = process_response(response=http_response, response_model=List[Project])
+    validated = Response.model_validate(
+        {
+            "data": response.data,
+            "status_code": 200,
+            "raw_output": http_response.content,
+            "json_output": example_data,
+            "headers": http_response.headers,
+        },
+        context={"model_fallback": False},
+    )
+    assert response == validated
+    assert response.headers == {"Content-Type": "application/json", "X-Total": "1"}
+    assert type(response.headers) is dict
+
+
+@pytest.mark.skipif(
+    sys.platform in ["darwin"] or skip,
+    reason=reason,
+)
+def test_typed_response_4():
+    # Unless the payload is retained the body is validated straight from bytes
+    example_data = [{"id": 4, "name": "project", "path": "project"}]
+    kept = process_response(
+        response=build_http_response(example_data), response_model=List[Project]
+    )
+    for retain, json_output, raw_output in (
+        ("all", example_data, kept.raw_output),
+        ("json", example_data, None),
+        ("raw", None, kept.raw_output),
+        ("models", None, None),
+    ):
+        response = process_response(
+            response=build_http_response(example_data),
+            response_model=List[Project],
+            retain=retain,
+        )
+        assert response.data == kept.data
+        assert response.json_output == json_output
+        assert response.raw_output == raw_output
+    response = process_response(
+        response=build_http_response([{"id": 47, "sha": "a91957a8"}]),
+        response_model=List[Project],
+        retain="models",
+        model_fallback=True,
+    )
+    assert response.data[0].base_type == "Pipeline"
+    assert response.json_output is None
+    with pytest.raises(ParameterError):
+        process_response(response=build_http_response(example_data), retain="none")
+
+
+@pytest.mark.skipif(
+    sys.platform in ["darwin"] or skip,
+    reason=reason,
+)
+def test_typed_response_5():
+    # Payloads left unvalidated, or built with model_construct, and projected
+    example_data = [
+        {
+            "id": 4,
+            "name": "project",
+            "created_at": "2013-09-30T13:46:02Z",
+            "tag_list": ["example"],
+            "_links": {"self": "https://gitlab.example.com/api/v4/projects/4"},
+        }
+    ]
+    response = process_response(
+        response=build_http_response(example_data),
+        response_model=List[Project],
+        validate=False,
+    )
+    assert response.data == example_data
+    response = process_response(
+        response=build_http_response(example_data),
+        response_model=List[Project],
+        validate="construct",
+    )
+    (project,) = response.data
+    assert isinstance(project, Project)
+    assert project.created_at == "2013-09-30T13:46:02Z"
+    assert project.additional_links == example_data[0]["_links"]
+    assert project.description is None
+    assert project.model_fields_set == {
+        "id",
+        "name",
+        "created_at",
+        "tag_list",
+        "additional_links",
+    }
+    constructed = Project.model_construct(**example_data[0])
+    assert project.__dict__ == constructed.__dict__
+    for validate in (True, "construct", False):
+        response = process_response(
+            response=build_http_response(example_data),
+            response_model=List[Project],
+            validate=validate,
+            fields=["id", "name", "status"],
+        )
+        assert response.json_output == [{"id": 4, "name": "project"}]
+        (project,) = response.data
+        if validate is False:
+            assert project == {"id": 4, "name": "project"}
+        else:
+            assert project.id == 4 and project.created_at is None
+            assert project.model_fields_set == {"id", "name"}
+    with pytest.raises(ParameterError):
+        process_response(response=build_http_response(example_data), validate="no")
+    with pytest.raises(ParameterError):
+        process_response(response=build_http_response(example_data), fields="id")
+
+
+@pytest.mark.skipif(
+    sys.platform in ["darwin"] or skip,
+    reason=reason,
+)
+def test_json_decoders():
+    body = json.dumps([{"id": 4, "name": "Ünïcode", "tags": [1.5, None, True]}])
+    for name in ("json", "orjson", "msgspec"):
+        try:
+            decoder = get_json_decoder(name)
+        except ImportError:
+            continue
+        assert decoder(body.encode()) == json.loads(body)
+    assert get_json_decoder() is not None
+    with pytest.raises(ValueError):
+        get_json_decoder("yaml")
+
+    decoded = []
+
+    def decoder(content: bytes):
+        decoded.append(content)
+        return json.loads(content)
+
+    set_json_decoder(decoder)
+    try:
+        response = process_response(
+            response=build_http_response([{"id": 4}]), response_model=List[Project]
+        )
+    finally:
+        set_json_decoder()
+    assert decoded == [b'[{"id": 4}]']
+    assert response.data[0].id == 4
+
+
 if __name__ == "__main__":
     test_branch_model()
     test_commit_model()
@@ -13871,3 +14096,5 @@ def test_contributor_response_1():
     test_wiki_response_4()
     test_wiki_response_5()
     test_contributor_response_1()
+    test_typed_response_1()
+    test_typed_response_2()
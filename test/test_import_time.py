@@ -0,0 +1,109 @@
+import os
+import subprocess
+import sys
+
+import pytest
+from conftest import reason
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+try:
+    # The package must import, the import times are measured in subprocesses
+    import gitlab_api  # noqa: F401
+    from benchmarks.bench_import import STATEMENTS, measure
+except ImportError:
+    skip = True
+else:
+    skip = False
+
+
+reason = "do not run on MacOS or windows OR dependency is not installed OR " + reason
+
+DATABASE_MODULES = {"sqlalchemy", "gitlab_api.gitlab_db_models", "gitlab_api.orm"}
+
+
+@pytest.mark.skipif(
+    sys.platform in ["darwin"] or skip,
+    reason=reason,
+)
+def test_package_import_is_lazy():
+    modules = set(measure(STATEMENTS["package"])["modules"])
+    assert "gitlab_api" in modules
+    assert modules.isdisjoint(
+        [
+            "pydantic",
+            "requests",
+            "gitlab_api.gitlab_api",
+            "gitlab_api.gitlab_response_models",
+        ]
+    )
+    assert DATABASE_MODULES.isdisjoint(modules)
+
+
+@pytest.mark.skipif(
+    sys.platform in ["darwin"] or skip,
+    reason=reason,
+)
+def test_api_client_does_not_import_database():
+    modules = set(measure(STATEMENTS["api client"])["modules"])
+    assert "gitlab_api.gitlab_response_models" in modules
+    assert DATABASE_MODULES.isdisjoint(modules)
+
+
+@pytest.mark.skipif(
+    sys.platform in ["darwin"] or skip,
+    reason=reason,
+)
+def test_lazy_attributes():
+    import gitlab_api.incremental
+
+    for name in gitlab_api.__all__:
+        assert getattr(gitlab_api, name) is not None, name
+    assert gitlab_api.sync is gitlab_api.incremental.sync
+    assert set(gitlab_api.__all__) <= set(dir(gitlab_api))
+    assert gitlab_api.Project.Meta.orm_model is gitlab_api.ProjectDBModel
+    with pytest.raises(AttributeError):
+        gitlab_api.NotAnAttribute
+
+
+@pytest.mark.skipif(
+    sys.platform in ["darwin"] or skip,
+    reason=reason,
+)
+def test_import_time(record_property):
+    lazy = min(measure(STATEMENTS["package"])["seconds"] for _ in range(3))
+    client = min(measure(STATEMENTS["api client"])["seconds"] for _ in range(3))
+    everything = min(measure(STATEMENTS["everything"])["seconds"] for _ in range(3))
+    record_property("import_package_seconds", lazy)
+    record_property("import_api_client_seconds", client)
+    record_property("import_everything_seconds", everything)
+    assert lazy < everything / 10
+    assert client < everything
+
+
+@pytest.mark.skipif(
+    sys.platform in ["darwin"] or skip,
+    reason=reason,
+)
+def test_deferred_build():
+    code = """
+from typing import List
+from gitlab_api.gitlab_response_models import (
+    DEFER_BUILD, Job, Project, Response, get_type_adapter, warm_up
+)
+assert DEFER_BUILD
+assert not Project.__pydantic_complete__ and not Response.__pydantic_complete__
+warm_up(Project, List[Project], response=False)
+assert Project.__pydantic_complete__ and not Response.__pydantic_complete__
+assert get_type_adapter.cache_info().currsize == 2
+assert Project(id=1).id == 1
+assert Job.model_validate({"id": 2}).id == 2
+warm_up()
+assert Response.__pydantic_complete__
+"""
+    subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=os.path.join(os.path.dirname(__file__), ".."),
+        env=dict(os.environ, GITLAB_API_DEFER_BUILD="1"),
+        check=True,
+    )
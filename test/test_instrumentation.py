@@ -0,0 +1,194 @@
+import os
+import sys
+
+import pytest
+from conftest import reason
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+try:
+    import gitlab_api
+    from gitlab_api.cache import MemoryCache
+    from gitlab_api.instrumentation import (
+        HistogramAggregator,
+        RequestEvent,
+        prometheus_text,
+        url_template,
+    )
+    from gitlab_api.retry import RetryPolicy
+    from benchmarks.stub_server import StubGitLabServer
+except ImportError:
+    skip = True
+else:
+    skip = False
+
+
+reason = "do not run on MacOS or windows OR dependency is not installed OR " + reason
+
+
+@pytest.fixture(scope="module")
+def server():
+    with StubGitLabServer() as stub_server:
+        yield stub_server
+
+
+def make_event(method: str, seconds: float, response_bytes: int, retries: int = 0):
+    event = RequestEvent(
+        verb="GET",
+        url="http://gitlab/api/v4/projects/1",
+        status_code=200,
+        network_seconds=seconds,
+        response_bytes=response_bytes,
+        retries=retries,
+    )
+    event.method = method
+    event.url_template = "/projects/{project_id}"
+    event.parse_seconds = seconds / 10
+    event.validation_seconds = seconds / 5
+    return event
+
+
+@pytest.mark.skipif(
+    sys.platform in ["darwin"] or skip,
+    reason=reason,
+)
+def test_url_template():
+    assert (
+        url_template(
+            "/projects/7/repository/branches/feature/login",
+            {"project_id": 7, "branch": "feature/login"},
+        )
+        == "/projects/{project_id}/repository/branches/{branch}"
+    )
+    assert (
+        url_template(
+            "/projects/1/merge_requests/1/notes", {"project_id": 1, "merge_id": 1}
+        )
+        == "/projects/{project_id}/merge_requests/{merge_id}/notes"
+    )
+    assert (
+        url_template("/projects/group%2Fproject/jobs/42") == "/projects/{id}/jobs/{id}"
+    )
+    assert url_template("/projects", {"per_page": 100, "archived": True}) == "/projects"
+
+
+@pytest.mark.skipif(
+    sys.platform in ["darwin"] or skip,
+    reason=reason,
+)
+def test_api_emits_request_events(server):
+    events = []
+    client = gitlab_api.Api(
+        url=server.url, token="token", max_workers=4, hooks=[events.append]
+    )
+    response = client.get_project(project_id=7)
+    assert response.data.id == 7
+    (event,) = events
+    assert event.method == "get_project"
+    assert event.verb == "GET"
+    assert event.url_template == "/projects/{project_id}"
+    assert event.status_code == 200
+    assert event.response_bytes == len(response.raw_output) > 0
+    assert event.network_seconds > 0 and event.parse_seconds > 0
+    assert event.validation_seconds > 0
+    assert event.retries == 0 and event.page is None
+
+    events.clear()
+    projects = client.get_projects()
+    assert len(projects.data) == 250
+    assert [event.page for event in events] == [1, 2, 3]
+    assert {(event.method, event.url_template) for event in events} == {
+        ("get_projects", "/projects")
+    }
+
+    events.clear()
+    pages = list(client.iter_pages(path="/projects/1/jobs", params={"per_page": 50}))
+    assert len(pages) == len(events) == 5
+    assert {(event.method, event.url_template) for event in events} == {
+        ("iter_pages", "/projects/{id}/jobs")
+    }
+    client.close()
+
+
+@pytest.mark.skipif(
+    sys.platform in ["darwin"] or skip,
+    reason=reason,
+)
+def test_request_event_retries_and_cache(server):
+    events = []
+    client = gitlab_api.Api(
+        url=server.url,
+        token="token",
+        retry_policy=RetryPolicy(backoff_factor=0.01, jitter=0.01),
+        cache=MemoryCache(),
+    )
+    client.add_hook(events.append)
+    server.fail("/projects/7", status=502)
+    client.get_project(project_id=7)
+    client.get_project(project_id=7)
+    assert [event.retries for event in events] == [1, 0]
+    assert [event.from_cache for event in events] == [False, True]
+    assert events[1].response_bytes == 0
+    assert events[1].parse_seconds > 0
+
+    client.remove_hook(events.append)
+    client.get_project(project_id=7)
+    assert len(events) == 2
+    client.close()
+
+
+@pytest.mark.skipif(
+    sys.platform in ["darwin"] or skip,
+    reason=reason,
+)
+def test_failing_hook_does_not_fail_request(server):
+    def failing_hook(event):
+        raise RuntimeError("hook failed")
+
+    client = gitlab_api.Api(url=server.url, token="token", hooks=[failing_hook])
+    assert client.get_project(project_id=7).data.id == 7
+    client.close()
+
+
+@pytest.mark.skipif(
+    sys.platform in ["darwin"] or skip,
+    reason=reason,
+)
+def test_histogram_aggregator():
+    histograms = HistogramAggregator(latency_buckets=[0.1, 1.0], size_buckets=[1000])
+    histograms(make_event("get_project", 0.05, 500))
+    histograms(make_event("get_project", 0.5, 5000, retries=2))
+    histograms(make_event("get_branch", 2.0, 100))
+    key = ("get_project", "GET", "/projects/{project_id}", "200")
+    series = histograms.series()[key]
+    assert series["latency"]["network"]["buckets"] == [
+        ("0.1", 1),
+        ("1.0", 2),
+        ("+Inf", 2),
+    ]
+    assert series["latency"]["network"]["sum"] == pytest.approx(0.55)
+    assert series["size"]["buckets"] == [("1000", 1), ("+Inf", 2)]
+    assert series["retries"] == 2
+
+    summary = histograms.summary()
+    assert [row["method"] for row in summary] == ["get_branch", "get_project"]
+    assert summary[1]["count"] == 2
+    assert summary[1]["network_seconds"] == pytest.approx(0.275)
+    assert summary[1]["bytes"] == 2750
+
+    text = prometheus_text(histograms)
+    labels = (
+        'method="get_project",verb="GET",'
+        'url_template="/projects/{project_id}",status="200"'
+    )
+    assert "# TYPE gitlab_api_request_duration_seconds histogram" in text
+    assert (
+        f'gitlab_api_request_duration_seconds_bucket{{{labels},phase="network",le="1.0"}} 2'
+        in text
+    )
+    parse_count = f'gitlab_api_request_duration_seconds_count{{{labels},phase="parse"}}'
+    assert f"{parse_count} 2" in text
+    assert f'gitlab_api_response_size_bytes_bucket{{{labels},le="+Inf"}} 2' in text
+    assert f"gitlab_api_request_retries_total{{{labels}}} 2" in text
+    histograms.reset()
+    assert histograms.series() == {}
@@ -0,0 +1,194 @@
+import os
+import sys
+from typing import List
+
+import pytest
+from conftest import reason
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+try:
+    from sqlalchemy import Column, Identity, Integer, String, func, select
+    from sqlalchemy.orm import declarative_base
+    from gitlab_api import copy_load
+    from gitlab_api.gitlab_db_models import (
+        JobDBModel,
+        LabelDBModel,
+        MergeRequestDBModel,
+        merge_request_assignees,
+        merge_request_labels,
+        project_shared_with_groups,
+    )
+    from gitlab_api.gitlab_response_models import (
+        Job,
+        MergeRequest,
+        Project,
+        Response,
+        get_type_adapter,
+    )
+    from benchmarks.payloads import make_page
+except ImportError:
+    skip = True
+else:
+    skip = False
+
+
+reason = "do not run on MacOS or windows OR dependency is not installed OR " + reason
+
+
+def job_pages(count: int, per_page: int):
+    jobs = get_type_adapter(List[Job]).validate_python(make_page("job", count=count))
+    for start in range(0, count, per_page):
+        yield Response(data=jobs[start : start + per_page], status_code=200)
+
+
+@pytest.mark.skipif(
+    sys.platform in ["darwin"] or skip,
+    reason=reason,
+)
+def test_copy_load_streams_pages(database_session):
+    consumed = []
+
+    def pages():
+        for page in job_pages(count=30, per_page=5):
+            consumed.append(page)
+            yield page
+
+    statistics = copy_load(pages=pages(), session=database_session, batch_size=10)
+    assert len(consumed) == 6
+    assert statistics["tables"]["jobs"] == 30
+    assert statistics["rows_per_second"] > 0
+    assert statistics["tables"]["users"] == 1
+    assert statistics["duplicates"]["users"] == 29
+    assert (
+        database_session.execute(select(func.count()).select_from(JobDBModel)).scalar()
+        == 30
+    )
+    job = database_session.execute(
+        select(
+            JobDBModel.base_type,
+            JobDBModel.pipeline_id,
+            JobDBModel.artifacts_file_id,
+        ).where(JobDBModel.id == 1)
+    ).one()
+    assert job.base_type == "Job"
+    assert None not in tuple(job)
+
+
+@pytest.mark.skipif(
+    sys.platform in ["darwin"] or skip,
+    reason=reason,
+)
+def test_copy_load_accepts_items(database_session):
+    items = (job for page in job_pages(count=4, per_page=4) for job in page.data)
+    statistics = copy_load(pages=items, session=database_session)
+    assert statistics["tables"]["jobs"] == 4
+
+
+@pytest.mark.skipif(
+    sys.platform in ["darwin"] or skip,
+    reason=reason,
+)
+def test_copy_load_merges_into_existing_rows(database_session):
+    def merge_request(merge_request_id: int) -> "MergeRequestDBModel":
+        return MergeRequestDBModel(
+            id=merge_request_id,
+            title=f"Merge request {merge_request_id}",
+            labels=[LabelDBModel(id=1, name="bug")],
+        )
+
+    copy_load(pages=[[merge_request(1), merge_request(2)]], session=database_session)
+    statistics = copy_load(
+        pages=[{"data": [MergeRequestDBModel(id=1, state="merged"), merge_request(2)]}],
+        session=database_session,
+    )
+    assert statistics["tables"]["merge_requests"] == 2
+    rows = database_session.execute(
+        select(
+            MergeRequestDBModel.id,
+            MergeRequestDBModel.title,
+            MergeRequestDBModel.state,
+        ).order_by(MergeRequestDBModel.id)
+    ).all()
+    assert [tuple(row) for row in rows] == [
+        (1, "Merge request 1", "merged"),
+        (2, "Merge request 2", None),
+    ]
+    assert sorted(database_session.execute(select(merge_request_labels)).all()) == [
+        (1, 1),
+        (2, 1),
+    ]
+
+
+@pytest.mark.skipif(
+    sys.platform in ["darwin"] or skip,
+    reason=reason,
+)
+def test_copy_load_replaces_association_links(database_session):
+    def merge_request(assignees: list) -> "MergeRequest":
+        return MergeRequest(
+            id=1,
+            assignees=[
+                {"id": user_id, "username": f"user{user_id}"} for user_id in assignees
+            ],
+        )
+
+    def project(group_ids: list) -> "Project":
+        return Project(
+            id=1,
+            name="project",
+            shared_with_groups=[
+                {"group_id": group_id, "group_name": f"group{group_id}"}
+                for group_id in group_ids
+            ],
+        )
+
+    copy_load(
+        pages=[[merge_request([1, 2]), project([5, 6])]], session=database_session
+    )
+    # The same models again, in a later batch of the same load
+    copy_load(
+        pages=[[merge_request([1, 2])], [merge_request([1]), project([5])]],
+        session=database_session,
+        batch_size=1,
+    )
+    assert database_session.execute(select(merge_request_assignees)).all() == [(1, 1)]
+    assert database_session.execute(select(project_shared_with_groups)).all() == [
+        (1, 5)
+    ]
+
+
+@pytest.mark.skipif(
+    sys.platform in ["darwin"] or skip,
+    reason=reason,
+)
+def test_copy_load_generated_keys(database_session):
+    # An identity column, whose key comes from no column default the staging
+    # table could copy
+    Base = declarative_base()
+
+    class Event(Base):
+        __tablename__ = "copy_load_events"
+        id = Column(Integer, Identity(), primary_key=True)
+        name = Column(String, nullable=False)
+
+    engine = database_session.get_bind()
+    Base.metadata.create_all(engine)
+    try:
+        statistics = copy_load(
+            pages=[
+                [Event(name="first"), Event(name="second")],
+                [Event(id=10, name="tenth")],
+            ],
+            session=database_session,
+        )
+        assert statistics["tables"]["copy_load_events"] == 3
+        rows = database_session.execute(
+            select(Event.id, Event.name).order_by(Event.name)
+        ).all()
+        assert [name for _, name in rows] == ["first", "second", "tenth"]
+        assert None not in [event_id for event_id, _ in rows]
+        assert 10 in [event_id for event_id, _ in rows]
+    finally:
+        database_session.rollback()
+        Base.metadata.drop_all(engine)
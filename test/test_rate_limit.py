@@ -0,0 +1,101 @@
+import asyncio
+import os
+import sys
+import time
+
+import pytest
+from conftest import reason
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+try:
+    import gitlab_api
+    from gitlab_api.rate_limit import RateLimitGovernor
+    from benchmarks.stub_server import StubGitLabServer
+except ImportError:
+    skip = True
+else:
+    skip = False
+
+try:
+    import httpx  # noqa: F401
+    import greenlet  # noqa: F401
+except ImportError:
+    skip_async = True
+else:
+    skip_async = False
+
+
+reason = "do not run on MacOS or windows OR dependency is not installed OR " + reason
+
+
+@pytest.mark.skipif(
+    sys.platform in ["darwin"] or skip,
+    reason=reason,
+)
+def test_governor_paces_configured_rate():
+    governor = RateLimitGovernor(rate=10, burst=1)
+    assert governor.reserve() == 0
+    assert governor.reserve() == pytest.approx(0.1, abs=0.01)
+    assert governor.reserve() == pytest.approx(0.2, abs=0.01)
+    assert governor.metrics()["waits"] == 2
+
+
+@pytest.mark.skipif(
+    sys.platform in ["darwin"] or skip,
+    reason=reason,
+)
+def test_governor_follows_server_budget():
+    governor = RateLimitGovernor()
+    assert governor.reserve() == 0
+    reset = str(int(time.time()) + 10)
+    governor.update(
+        {"RateLimit-Limit": "600", "RateLimit-Remaining": "0", "RateLimit-Reset": reset}
+    )
+    metrics = governor.metrics()
+    assert metrics["limit"] == 600
+    assert metrics["remaining"] == 0
+    assert governor.reserve() > 8
+
+
+@pytest.mark.skipif(
+    sys.platform in ["darwin"] or skip,
+    reason=reason,
+)
+def test_governor_waits_for_retry_after():
+    governor = RateLimitGovernor()
+    governor.update({"Retry-After": "2"}, status_code=429)
+    assert governor.reserve() == pytest.approx(2, abs=0.05)
+    assert governor.metrics()["throttled"] == 1
+
+
+@pytest.mark.skipif(
+    sys.platform in ["darwin"] or skip,
+    reason=reason,
+)
+def test_api_retries_rate_limited_requests():
+    with StubGitLabServer(rate_limit=10) as server:
+        client = gitlab_api.Api(url=server.url, token="token", max_workers=4)
+        response = client.get_users(per_page=10)
+        client.close()
+        assert [user.id for user in response.data] == list(range(1, 121))
+        metrics = client.rate_limiter.metrics()
+        assert metrics["limit"] == 10
+        assert metrics["throttled"] == server.throttled
+
+
+@pytest.mark.skipif(
+    sys.platform in ["darwin"] or skip or skip_async,
+    reason=reason,
+)
+def test_async_api_retries_rate_limited_requests():
+    async def fetch(url):
+        async with gitlab_api.AsyncApi(
+            url=url, token="token", max_workers=4
+        ) as async_client:
+            return await async_client.get_users(per_page=10), async_client
+
+    with StubGitLabServer(rate_limit=10) as server:
+        response, async_client = asyncio.run(fetch(server.url))
+        assert [user.id for user in response.data] == list(range(1, 121))
+        assert async_client.rate_limiter.metrics()["limit"] == 10
@@ -0,0 +1,154 @@
+import asyncio
+import os
+import sys
+
+import pytest
+from conftest import reason
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+try:
+    import gitlab_api
+    from gitlab_api.retry import RetryPolicy
+    from benchmarks.stub_server import StubGitLabServer
+except ImportError:
+    skip = True
+else:
+    skip = False
+
+try:
+    import httpx  # noqa: F401
+    import greenlet  # noqa: F401
+except ImportError:
+    skip_async = True
+else:
+    skip_async = False
+
+
+reason = "do not run on MacOS or windows OR dependency is not installed OR " + reason
+
+
+@pytest.fixture(scope="module")
+def server():
+    with StubGitLabServer() as stub_server:
+        yield stub_server
+
+
+def fast_policy(max_retries: int = 3) -> "RetryPolicy":
+    return RetryPolicy(max_retries=max_retries, backoff_factor=0.01, jitter=0.01)
+
+
+@pytest.mark.skipif(
+    sys.platform in ["darwin"] or skip,
+    reason=reason,
+)
+def test_retry_policy_idempotency():
+    policy = RetryPolicy()
+    assert policy.is_retryable("GET", status_code=502)
+    assert policy.is_retryable("put", status_code=503)
+    assert not policy.is_retryable("POST", status_code=502)
+    assert not policy.is_retryable("GET", status_code=404)
+    assert policy.is_retryable("POST", connect=True)
+    retry = policy.urllib3_retry()
+    assert retry.is_retry("GET", 503)
+    assert not retry.is_retry("POST", 503)
+    assert not retry.is_retry("GET", 429, has_retry_after=True)
+
+
+@pytest.mark.skipif(
+    sys.platform in ["darwin"] or skip,
+    reason=reason,
+)
+def test_retry_policy_backoff():
+    policy = RetryPolicy(backoff_factor=1, backoff_max=5, jitter=0)
+    assert [policy.get_backoff(number) for number in range(1, 6)] == [
+        0,
+        2,
+        4,
+        5,
+        5,
+    ]
+    assert policy.get_backoff(2, retry_after="7") == 7
+    jittered = RetryPolicy(backoff_factor=1, jitter=0.5).get_backoff(2)
+    assert 2 <= jittered <= 2.5
+
+
+@pytest.mark.skipif(
+    sys.platform in ["darwin"] or skip,
+    reason=reason,
+)
+def test_api_retries_server_errors(server):
+    policy = fast_policy()
+    client = gitlab_api.Api(url=server.url, token="token", retry_policy=policy)
+    server.fail("/projects/7", status=502)
+    server.fail("/projects/7", status=503)
+    response = client.get_project(project_id=7)
+    assert response.status_code == 200
+    assert response.data.id == 7
+    assert policy.metrics()["retries"] == 2
+    assert policy.metrics()["retries_by_reason"] == {"502": 1, "503": 1}
+
+
+@pytest.mark.skipif(
+    sys.platform in ["darwin"] or skip,
+    reason=reason,
+)
+def test_api_retries_dropped_connections(server):
+    policy = fast_policy()
+    client = gitlab_api.Api(
+        url=server.url, token="token", retry_policy=policy, max_workers=4
+    )
+    server.fail("/users", status=0, times=2)
+    response = client.get_users(per_page=10)
+    client.close()
+    assert [user.id for user in response.data] == list(range(1, 121))
+    assert policy.metrics()["retries"] == 2
+
+
+@pytest.mark.skipif(
+    sys.platform in ["darwin"] or skip,
+    reason=reason,
+)
+def test_api_retries_exhausted(server):
+    policy = fast_policy(max_retries=2)
+    client = gitlab_api.Api(url=server.url, token="token", retry_policy=policy)
+    server.fail("/projects/8", status=503, times=3)
+    response = client.get_project(project_id=8)
+    assert response.status_code == 503
+    assert policy.metrics()["retries"] == 2
+    assert policy.metrics()["exhausted"] == 1
+
+
+@pytest.mark.skipif(
+    sys.platform in ["darwin"] or skip,
+    reason=reason,
+)
+def test_api_without_retry(server):
+    client = gitlab_api.Api(url=server.url, token="token", retry=False)
+    server.fail("/projects/9", status=502)
+    assert client.get_project(project_id=9).status_code == 502
+    assert client.get_project(project_id=9).status_code == 200
+
+
+@pytest.mark.skipif(
+    sys.platform in ["darwin"] or skip or skip_async,
+    reason=reason,
+)
+def test_async_api_retries(server):
+    policy = fast_policy()
+
+    async def fetch():
+        async with gitlab_api.AsyncApi(
+            url=server.url, token="token", retry_policy=policy
+        ) as async_client:
+            server.fail("/projects/7", status=502)
+            server.fail("/users", status=0)
+            return await asyncio.gather(
+                async_client.get_project(project_id=7),
+                async_client.get_users(per_page=50),
+            )
+
+    project, users = asyncio.run(fetch())
+    assert project.data.id == 7
+    assert len(users.data) == 120
+    assert policy.metrics()["retries"] == 2
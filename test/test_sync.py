@@ -0,0 +1,246 @@
+import os
+import sys
+from typing import List
+
+import pytest
+from conftest import reason
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+try:
+    from sqlalchemy import func, select
+    import gitlab_api
+    from gitlab_api import copy_load, sync
+    from gitlab_api.exceptions import MissingParameterError, ParameterError
+    from gitlab_api.gitlab_db_models import (
+        MergeRequestDBModel,
+        PipelineDBModel,
+        SyncStateDBModel,
+    )
+    from gitlab_api.gitlab_input_models import PipelineModel, ProjectModel
+    from gitlab_api.gitlab_response_models import Project
+    from benchmarks.payloads import make_page
+    from benchmarks.stub_server import StubGitLabServer
+except ImportError:
+    skip = True
+else:
+    skip = False
+
+
+reason = "do not run on MacOS or windows OR dependency is not installed OR " + reason
+
+
+def timestamped(kind: str, count: int, field: str = "updated_at") -> list:
+    items = make_page(kind, count=count)
+    for item in items:
+        item[field] = f"2024-01-{item['id']:02d}T12:00:00+00:00"
+    return items
+
+
+@pytest.fixture
+def server():
+    collections = {
+        "/projects/1/merge_requests": timestamped("merge_request", 12),
+        "/projects/1/pipelines": timestamped("pipeline", 5),
+        "/projects": timestamped("project", 4, field="last_activity_at"),
+    }
+    with StubGitLabServer(collections=collections) as stub_server:
+        yield stub_server
+
+
+@pytest.fixture
+def client(server):
+    client = gitlab_api.Api(url=server.url, token="token", max_workers=1)
+    yield client
+    client.close()
+
+
+@pytest.mark.skipif(
+    sys.platform in ["darwin"] or skip,
+    reason=reason,
+)
+def test_sync_fetches_only_changes(server, client, database_session):
+    statistics = sync(
+        client=client,
+        session=database_session,
+        resource="merge_requests",
+        project_id=1,
+        per_page=5,
+    )
+    assert statistics["tables"]["merge_requests"] == 12
+    assert statistics["watermark"].isoformat() == "2024-01-12T12:00:00+00:00"
+    state = database_session.get(SyncStateDBModel, "projects/1/merge_requests")
+    assert state.rows == statistics["rows"]
+
+    server.reset()
+    statistics = sync(
+        client=client,
+        session=database_session,
+        resource="merge_requests",
+        project_id=1,
+    )
+    request = server.requests_for("/projects/1/merge_requests")[0]
+    assert request["query"]["updated_after"] == "2024-01-12T12:00:00+00:00"
+    assert statistics["tables"]["merge_requests"] == 1
+
+    changed = server.collections["/projects/1/merge_requests"][2]
+    changed["updated_at"] = "2024-02-01T08:00:00+00:00"
+    changed["title"] = "Changed"
+    statistics = sync(
+        client=client,
+        session=database_session,
+        resource="merge_requests",
+        project_id=1,
+    )
+    assert statistics["tables"]["merge_requests"] == 2
+    assert statistics["watermark"].isoformat() == "2024-02-01T08:00:00+00:00"
+    assert (
+        database_session.execute(
+            select(MergeRequestDBModel.title).where(MergeRequestDBModel.id == 3)
+        ).scalar()
+        == "Changed"
+    )
+
+    statistics = sync(
+        client=client,
+        session=database_session,
+        resource="merge_requests",
+        project_id=1,
+        full=True,
+    )
+    assert statistics["tables"]["merge_requests"] == 12
+    assert (
+        database_session.execute(
+            select(func.count()).select_from(MergeRequestDBModel)
+        ).scalar()
+        == 12
+    )
+
+
+@pytest.mark.skipif(
+    sys.platform in ["darwin"] or skip,
+    reason=reason,
+)
+def test_sync_keeps_watermark_of_incomplete_runs(server, client, database_session):
+    sync(client=client, session=database_session, resource="pipelines", project_id=1)
+    server.collections["/projects/1/pipelines"][0]["updated_at"] = "2024-03-01T00:00:00"
+    server.fail("/projects/1/pipelines", status=404)
+    statistics = sync(
+        client=client, session=database_session, resource="pipelines", project_id=1
+    )
+    assert statistics["rows"] == 0
+    assert statistics["watermark"].isoformat() == "2024-01-05T12:00:00+00:00"
+    statistics = sync(
+        client=client, session=database_session, resource="pipelines", project_id=1
+    )
+    assert statistics["watermark"].isoformat() == "2024-03-01T00:00:00+00:00"
+    assert (
+        database_session.execute(
+            select(func.count()).select_from(PipelineDBModel)
+        ).scalar()
+        == 5
+    )
+    with pytest.raises(MissingParameterError):
+        sync(client=client, session=database_session, resource="pipelines")
+
+
+@pytest.mark.skipif(
+    sys.platform in ["darwin"] or skip,
+    reason=reason,
+)
+def test_sync_keeps_watermark_of_runs_cut_by_max_pages(
+    server, client, database_session
+):
+    server.collections["/projects/1/merge_requests"].reverse()
+    statistics = sync(
+        client=client,
+        session=database_session,
+        resource="merge_requests",
+        project_id=1,
+        per_page=5,
+        max_pages=2,
+    )
+    request = server.requests_for("/projects/1/merge_requests")[0]
+    assert request["query"]["order_by"] == "updated_at"
+    assert request["query"]["sort"] == "asc"
+    assert statistics["tables"]["merge_requests"] == 10
+    assert statistics["watermark"] is None
+    assert database_session.get(SyncStateDBModel, "projects/1/merge_requests") is None
+    assert sorted(
+        database_session.execute(select(MergeRequestDBModel.id)).scalars()
+    ) == list(range(1, 11))
+
+    statistics = sync(
+        client=client,
+        session=database_session,
+        resource="merge_requests",
+        project_id=1,
+        per_page=5,
+        max_pages=3,
+    )
+    assert statistics["watermark"].isoformat() == "2024-01-12T12:00:00+00:00"
+    with pytest.raises(ParameterError):
+        sync(
+            client=client,
+            session=database_session,
+            resource="merge_requests",
+            project_id=1,
+            order_by="created_at",
+        )
+
+
+@pytest.mark.skipif(
+    sys.platform in ["darwin"] or skip,
+    reason=reason,
+)
+@pytest.mark.parametrize("validate", [False, "construct"])
+def test_sync_validates_pages(server, client, database_session, validate):
+    expected = sync(client=client, session=database_session, resource="projects")
+    unvalidated_client = gitlab_api.Api(
+        url=server.url, token="token", max_workers=1, validate=validate
+    )
+    statistics = sync(
+        client=unvalidated_client,
+        session=database_session,
+        resource="projects",
+        full=True,
+    )
+    assert statistics["tables"] == expected["tables"]
+    assert statistics["rows"] == expected["rows"] > 4
+    assert statistics["watermark"] == expected["watermark"]
+    unvalidated_client.close()
+
+
+@pytest.mark.skipif(
+    sys.platform in ["darwin"] or skip,
+    reason=reason,
+)
+@pytest.mark.parametrize("validate", [False, "construct"])
+def test_copy_load_rejects_unvalidated_pages(
+    server, client, database_session, validate
+):
+    pages = client.iter_pages(
+        path="/projects", response_model=List[Project], validate=validate
+    )
+    with pytest.raises(ParameterError):
+        copy_load(pages=pages, session=database_session)
+
+
+@pytest.mark.skipif(
+    sys.platform in ["darwin"] or skip,
+    reason=reason,
+)
+def test_sync_filter_parameters():
+    project = ProjectModel(last_activity_after="2024-01-01T00:00:00Z", per_page=100)
+    assert project.api_parameters == {
+        "last_activity_after": "2024-01-01T00:00:00Z",
+        "per_page": 100,
+    }
+    pipeline = PipelineModel(
+        project_id=1, updated_after="2024-01-01T00:00:00Z", order_by="updated_at"
+    )
+    assert pipeline.api_parameters == {
+        "per_page": 100,
+        "updated_after": "2024-01-01T00:00:00Z",
+        "order_by": "updated_at",
+    }
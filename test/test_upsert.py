@@ -0,0 +1,311 @@
+import os
+import sys
+from typing import List
+
+import pytest
+from conftest import reason
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+try:
+    from sqlalchemy import func, select
+    from gitlab_api import flatten, pydantic_to_sqlalchemy, upsert
+    from gitlab_api.gitlab_db_models import (
+        JobDBModel,
+        LabelDBModel,
+        MergeRequestDBModel,
+        TimeStatsDBModel,
+        UserDBModel,
+        merge_request_assignees,
+        merge_request_labels,
+        merge_request_reviewers,
+        project_shared_with_groups,
+    )
+    from gitlab_api.gitlab_response_models import (
+        Job,
+        MergeRequest,
+        Project,
+        Response,
+        get_type_adapter,
+    )
+    from gitlab_api.utils import _UpsertPlan
+    from benchmarks.payloads import make_page
+except ImportError:
+    skip = True
+else:
+    skip = False
+
+
+reason = "do not run on MacOS or windows OR dependency is not installed OR " + reason
+
+
+def merge_request(merge_request_id: int) -> "MergeRequestDBModel":
+    return MergeRequestDBModel(
+        id=merge_request_id,
+        title=f"Merge request {merge_request_id}",
+        labels=[LabelDBModel(id=1, name="bug"), LabelDBModel(id=2, name="backend")],
+        assignees=[UserDBModel(id=5, username="assignee")],
+        author=UserDBModel(id=6, username="author"),
+        time_stats=TimeStatsDBModel(time_estimate=3600),
+    )
+
+
+@pytest.mark.skipif(
+    sys.platform in ["darwin"] or skip,
+    reason=reason,
+)
+def test_upsert_writes_related_and_association_rows(database_session):
+    statistics = upsert(
+        model={"data": [merge_request(1), merge_request(2)]}, session=database_session
+    )
+    assert statistics["tables"] == {
+        "users": 2,
+        "labels": 2,
+        "time_stats": 2,
+        "merge_requests": 2,
+        "merge_request_assignees": 2,
+        "merge_request_labels": 4,
+    }
+    assert statistics["rows"] == 14
+    assert statistics["rows_per_second"] > 0
+    assert sorted(database_session.execute(select(merge_request_labels)).all()) == [
+        (1, 1),
+        (1, 2),
+        (2, 1),
+        (2, 2),
+    ]
+    assert sorted(database_session.execute(select(merge_request_assignees)).all()) == [
+        (1, 5),
+        (2, 5),
+    ]
+    rows = database_session.execute(
+        select(
+            MergeRequestDBModel.id,
+            MergeRequestDBModel.author_id,
+            MergeRequestDBModel.time_stats_id,
+        ).order_by(MergeRequestDBModel.id)
+    ).all()
+    assert [(row.id, row.author_id) for row in rows] == [(1, 6), (2, 6)]
+    assert rows[0].time_stats_id != rows[1].time_stats_id
+
+
+@pytest.mark.skipif(
+    sys.platform in ["darwin"] or skip,
+    reason=reason,
+)
+def test_upsert_updates_only_set_columns(database_session):
+    upsert(model={"data": [merge_request(1)]}, session=database_session)
+    upsert(
+        model={"data": [MergeRequestDBModel(id=1, state="merged")]},
+        session=database_session,
+    )
+    upsert(model={"data": [merge_request(1)]}, session=database_session)
+    row = database_session.execute(
+        select(
+            MergeRequestDBModel.title,
+            MergeRequestDBModel.state,
+            MergeRequestDBModel.author_id,
+        )
+    ).one()
+    assert tuple(row) == ("Merge request 1", "merged", 6)
+    assert (
+        database_session.execute(
+            select(func.count()).select_from(merge_request_labels)
+        ).scalar()
+        == 2
+    )
+
+
+@pytest.mark.skipif(
+    sys.platform in ["darwin"] or skip,
+    reason=reason,
+)
+def test_upsert_replaces_association_links(database_session):
+    def links(table) -> list:
+        return sorted(database_session.execute(select(table)).all())
+
+    upsert(model={"data": [merge_request(1)]}, session=database_session)
+    shrunk = MergeRequestDBModel(id=1, labels=[LabelDBModel(id=2, name="backend")])
+    upsert(model={"data": [shrunk]}, session=database_session)
+    assert links(merge_request_labels) == [(1, 2)]
+    assert links(merge_request_assignees) == [(1, 5)]
+
+    def pydantic_merge_request(assignees: list, **values) -> "MergeRequest":
+        return MergeRequest(
+            id=1,
+            assignees=[
+                {"id": user_id, "username": f"user{user_id}"} for user_id in assignees
+            ],
+            **values,
+        )
+
+    upsert(model=pydantic_merge_request([1, 2]), session=database_session)
+    assert links(merge_request_assignees) == [(1, 1), (1, 2)]
+    upsert(model=pydantic_merge_request([1]), session=database_session)
+    assert links(merge_request_assignees) == [(1, 1)]
+    # Collections left unset keep their links, empty ones lose them
+    upsert(model=MergeRequest(id=1, reviewers=[]), session=database_session)
+    assert links(merge_request_assignees) == [(1, 1)]
+    upsert(model=pydantic_merge_request([]), session=database_session)
+    assert links(merge_request_assignees) == []
+    assert links(merge_request_reviewers) == []
+
+
+@pytest.mark.skipif(
+    sys.platform in ["darwin"] or skip,
+    reason=reason,
+)
+def test_upsert_project_shared_with_groups(database_session):
+    def project(group_ids: list) -> "Project":
+        return Project(
+            id=1,
+            name="project",
+            shared_with_groups=[
+                {"group_id": group_id, "group_name": f"group{group_id}"}
+                for group_id in group_ids
+            ],
+        )
+
+    upsert(model=project([5, 6]), session=database_session)
+    upsert(model=project([5, 6]), session=database_session)
+    upsert(model=project([5]), session=database_session)
+    assert database_session.execute(select(project_shared_with_groups)).all() == [
+        (1, 5)
+    ]
+
+
+@pytest.mark.skipif(
+    sys.platform in ["darwin"] or skip,
+    reason=reason,
+)
+def test_upsert_jobs_in_batches(database_session):
+    jobs = get_type_adapter(List[Job]).validate_python(make_page("job", count=25))
+    model = pydantic_to_sqlalchemy(schema=Response(data=jobs, status_code=200))
+    statistics = upsert(model=model, session=database_session, batch_size=4)
+    assert statistics["tables"]["jobs"] == 25
+    assert (
+        database_session.execute(select(func.count()).select_from(JobDBModel)).scalar()
+        == 25
+    )
+    job = database_session.execute(
+        select(JobDBModel.pipeline_id, JobDBModel.user_id).where(JobDBModel.id == 1)
+    ).one()
+    assert None not in tuple(job)
+
+
+@pytest.mark.skipif(
+    sys.platform in ["darwin"] or skip,
+    reason=reason,
+)
+def test_upsert_without_data(database_session):
+    assert upsert(model={"data": []}, session=database_session) is None
+
+
+@pytest.mark.skipif(
+    sys.platform in ["darwin"] or skip,
+    reason=reason,
+)
+def test_flatten_matches_sqlalchemy_models():
+    jobs = get_type_adapter(List[Job]).validate_python(make_page("job", count=5))
+    response = Response(data=jobs, status_code=200)
+    plan = _UpsertPlan()
+    for job in pydantic_to_sqlalchemy(schema=response)["data"]:
+        plan.add(job)
+    rows = {}
+    for table in plan.tables():
+        plan.resolve(table)
+        rows[table.name] = plan.rows.get(table, []) + plan.association_rows(table)
+    flattened = flatten(response)
+    assert flattened == rows
+    assert list(flattened) == list(rows)
+    assert len(flattened["jobs"]) == 5
+    assert len(flattened["users"]) == 1
+    assert flattened["jobs"][0]["user_id"] == flattened["users"][0]["id"]
+
+
+@pytest.mark.skipif(
+    sys.platform in ["darwin"] or skip,
+    reason=reason,
+)
+def test_upsert_response_model(database_session):
+    merge_requests = get_type_adapter(List[MergeRequest]).validate_python(
+        make_page("merge_request", count=3)
+    )
+    statistics = upsert(
+        model=Response(data=merge_requests, status_code=200),
+        session=database_session,
+    )
+    assert statistics["tables"]["merge_requests"] == 3
+    assert statistics["tables"]["merge_request_labels"] == 6
+    rows = database_session.execute(
+        select(MergeRequestDBModel.id, MergeRequestDBModel.author_id).order_by(
+            MergeRequestDBModel.id
+        )
+    ).all()
+    assert [row.id for row in rows] == [1, 2, 3]
+    assert None not in [row.author_id for row in rows]
+
+
+@pytest.mark.skipif(
+    sys.platform in ["darwin"] or skip,
+    reason=reason,
+)
+def test_upsert_identity_map_skips_written_rows(database_session):
+    identity_map = {}
+    first = upsert(
+        model={"data": [merge_request(1), merge_request(2)]},
+        session=database_session,
+        identity_map=identity_map,
+    )
+    assert first["tables"]["users"] == 2
+    assert first["duplicates"]["users"] == 2
+    second = upsert(
+        model={"data": [merge_request(3)]},
+        session=database_session,
+        identity_map=identity_map,
+    )
+    assert second["tables"]["users"] == 0
+    assert second["tables"]["labels"] == 0
+    assert second["duplicates"] == {"labels": 2, "users": 2}
+    renamed = merge_request(4)
+    renamed.author = UserDBModel(id=6, username="renamed")
+    third = upsert(
+        model={"data": [renamed]}, session=database_session, identity_map=identity_map
+    )
+    assert third["tables"]["users"] == 1
+    rows = database_session.execute(
+        select(MergeRequestDBModel.id, MergeRequestDBModel.author_id).order_by(
+            MergeRequestDBModel.id
+        )
+    ).all()
+    assert [tuple(row) for row in rows] == [(1, 6), (2, 6), (3, 6), (4, 6)]
+    assert (
+        database_session.execute(
+            select(UserDBModel.username).where(UserDBModel.id == 6)
+        ).scalar()
+        == "renamed"
+    )
+    assert (
+        database_session.execute(
+            select(func.count()).select_from(merge_request_labels)
+        ).scalar()
+        == 8
+    )
+
+
+@pytest.mark.skipif(
+    sys.platform in ["darwin"] or skip,
+    reason=reason,
+)
+def test_pydantic_to_sqlalchemy_identity_map():
+    jobs = get_type_adapter(List[Job]).validate_python(make_page("job", count=3))
+    identity_map = {}
+    models = [
+        pydantic_to_sqlalchemy(
+            schema=Response(data=[job], status_code=200), identity_map=identity_map
+        )["data"][0]
+        for job in jobs
+    ]
+    assert models[0].user is models[1].user is models[2].user
+    assert models[0].pipeline is models[2].pipeline
+    assert models[0] is not models[1]